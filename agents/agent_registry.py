@@ -0,0 +1,204 @@
+"""
+agent_registry.py
+
+Pluggable agent registry for the synergy conductor.
+Agents are declared with a cost class that decides where they run:
+ - 'inline'  : cheap threshold logic, called directly in the conductor thread
+ - 'thread'  : I/O-bound or GIL-releasing work, run on a shared thread pool
+ - 'process' : CPU-heavy work (indicators, model inference), run on a
+               shared process pool (fn must be a picklable top-level function)
+Pooled agents run concurrently, each with its own deadline; an agent that
+misses its deadline or raises counts as an abstention (no vote) instead of
+stalling the cycle. A running pool call cannot be cancelled, so a pooled
+agent whose previous call is still in flight is not resubmitted: it
+abstains ("busy") until that call finishes, and a few stalled agents can
+hold at most one worker each. Inline agents cannot be interrupted either;
+one that overruns its deadline still abstains for that cycle.
+Per-agent latency is recorded for every evaluation.
+Agents that are plain price thresholds declare the "strategy" parameter
+they read (threshold=...), which lets the conductor compile them into
+its decision table (see decision_table.py).
+"""
+
+import time
+from concurrent.futures import TimeoutError
+
+from .machiavelli_agent import machiavelli_agent_logic, machiavelli_agent_batch
+from .tywin_agent import tywin_agent_logic, tywin_agent_batch
+from .wick_agent import wick_agent_logic, wick_agent_batch
+from .ozymandias_agent import ozymandias_agent_logic, ozymandias_agent_batch
+from core.log_core.log_core import get_logger
+
+logger = get_logger("AgentRegistry")
+
+COST_CLASSES = ("inline", "thread", "process")
+DEFAULT_DEADLINE_S = 0.25
+
+# name -> spec dict (insertion order is evaluation order)
+AGENT_REGISTRY = {}
+
+# name -> {"calls", "abstentions", "busy", "total_s", "max_s", "last_s"}
+agent_latency_stats = {}
+
+# name -> the agent's last pooled call (a Future), possibly still running
+_in_flight = {}
+
+# Bumped on every register/unregister so compiled decision tables can tell they are stale
+_registry_version = 0
+
+_thread_pool = None
+_process_pool = None
+
+def register_agent(name: str, fn, cost_class: str = "inline", deadline_s: float = DEFAULT_DEADLINE_S,
+                   batch_fn=None, threshold: str = None):
+    """
+    Register (or replace) an agent.
+    fn(market_data) -> 'BUY' / 'HOLD' / ...; batch_fn(sol_prices) -> bool BUY
+    mask, used by the vectorized conductor when present.
+    threshold: for agents that vote BUY exactly while sol_price is below a
+    "strategy" parameter, that parameter's name.
+    """
+    global _registry_version
+    if cost_class not in COST_CLASSES:
+        raise ValueError(f"Unknown cost class '{cost_class}' for agent '{name}'")
+    AGENT_REGISTRY[name] = {
+        "name": name,
+        "fn": fn,
+        "cost_class": cost_class,
+        "deadline_s": deadline_s,
+        "batch_fn": batch_fn,
+        "threshold": threshold
+    }
+    agent_latency_stats[name] = {"calls": 0, "abstentions": 0, "busy": 0, "total_s": 0.0, "max_s": 0.0,
+                                 "last_s": 0.0}
+    _registry_version += 1
+
+def unregister_agent(name: str):
+    global _registry_version
+    AGENT_REGISTRY.pop(name, None)
+    agent_latency_stats.pop(name, None)
+    _registry_version += 1
+
+def registry_version() -> int:
+    return _registry_version
+
+def _get_pool(cost_class: str):
+    global _thread_pool, _process_pool
+    # Executors are imported on first use: the default agents are all inline
+    from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+    if cost_class == "thread":
+        if _thread_pool is None:
+            _thread_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="agent")
+        return _thread_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor()
+    return _process_pool
+
+def shutdown_agent_pools():
+    global _thread_pool, _process_pool
+    for pool in (_thread_pool, _process_pool):
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+    _in_flight.clear()
+    _thread_pool = None
+    _process_pool = None
+
+def _timed_call(fn, market_data):
+    """Runs inside the worker so the latency excludes queueing in the pool."""
+    t0 = time.perf_counter()
+    signal = fn(market_data)
+    return signal, time.perf_counter() - t0
+
+def _record(name: str, latency: float, abstained: bool):
+    stats = agent_latency_stats[name]
+    stats["calls"] += 1
+    stats["last_s"] = latency
+    stats["total_s"] += latency
+    if latency > stats["max_s"]:
+        stats["max_s"] = latency
+    if abstained:
+        stats["abstentions"] += 1
+
+def evaluate_agents(market_data: dict):
+    """
+    Run every registered agent on market_data.
+    Returns (signals, latencies): {name: signal or None if abstained} and
+    {name: seconds}.
+    """
+    signals = {}
+    latencies = {}
+    pending = []
+
+    start = time.perf_counter()
+    for spec in AGENT_REGISTRY.values():
+        if spec["cost_class"] != "inline":
+            name = spec["name"]
+            previous = _in_flight.get(name)
+            if previous is not None and not previous.done():
+                # Still running from an earlier cycle: don't queue another call behind it
+                agent_latency_stats[name]["busy"] += 1
+                logger.debug("Agent %s is still busy with an earlier call. Abstaining.", name)
+                signals[name], latencies[name] = None, 0.0
+                continue
+            future = _get_pool(spec["cost_class"]).submit(_timed_call, spec["fn"], market_data)
+            _in_flight[name] = future
+            pending.append((spec, future))
+
+    for spec in AGENT_REGISTRY.values():
+        if spec["cost_class"] == "inline":
+            name = spec["name"]
+            try:
+                signals[name], latencies[name] = _timed_call(spec["fn"], market_data)
+            except Exception as e:
+                logger.warning("Agent %s failed: %s. Abstaining.", name, e)
+                signals[name], latencies[name] = None, 0.0
+                continue
+            if latencies[name] > spec["deadline_s"]:
+                logger.warning("Agent %s overran its %ss deadline (%.3fs). Abstaining.",
+                               name, spec["deadline_s"], latencies[name])
+                signals[name] = None
+
+    for spec, future in pending:
+        name = spec["name"]
+        remaining = start + spec["deadline_s"] - time.perf_counter()
+        try:
+            signals[name], latencies[name] = future.result(timeout=max(0.0, remaining))
+        except TimeoutError:
+            future.cancel()
+            logger.warning("Agent %s missed its %ss deadline. Abstaining.", name, spec["deadline_s"])
+            signals[name], latencies[name] = None, time.perf_counter() - start
+        except Exception as e:
+            logger.warning("Agent %s failed: %s. Abstaining.", name, e)
+            signals[name], latencies[name] = None, time.perf_counter() - start
+
+    for name, latency in latencies.items():
+        _record(name, latency, signals[name] is None)
+    return signals, latencies
+
+def agent_latency_report() -> dict:
+    """Per-agent calls, abstentions (of which busy: skipped while a call was in flight) and mean/max/last latency in ms."""
+    report = {}
+    for name, stats in agent_latency_stats.items():
+        calls = stats["calls"]
+        report[name] = {
+            "calls": calls,
+            "abstentions": stats["abstentions"],
+            "busy": stats["busy"],
+            "mean_ms": stats["total_s"] / calls * 1000 if calls else 0.0,
+            "max_ms": stats["max_s"] * 1000,
+            "last_ms": stats["last_s"] * 1000
+        }
+    return report
+
+def register_default_agents():
+    """The four Phase 2 archetypes: cheap threshold logic, so inline."""
+    register_agent("machiavelli", machiavelli_agent_logic, "inline", batch_fn=machiavelli_agent_batch,
+                   threshold="machiavelli_buy_below")
+    register_agent("tywin", tywin_agent_logic, "inline", batch_fn=tywin_agent_batch,
+                   threshold="tywin_buy_below")
+    register_agent("wick", wick_agent_logic, "inline", batch_fn=wick_agent_batch,
+                   threshold="wick_buy_below")
+    register_agent("ozymandias", ozymandias_agent_logic, "inline", batch_fn=ozymandias_agent_batch,
+                   threshold="ozymandias_buy_below")
+
+register_default_agents()
@@ -0,0 +1,198 @@
+"""
+decision_table.py
+
+Precomputed conductor decisions for price-only market data.
+When every registered agent is a "buy below" threshold agent and the
+market data carries no SCORING_ENGINE features, the conductor's decision
+depends only on sol_price and the emotional state:
+ - agent majority: count of thresholds above the price
+ - score floor: the level score is below score_floor outside a band
+   around ideal_price
+ - EGO_CORE overlay per emotional state
+All of these are step functions of the price. compile_decision_table()
+collects every step (the agent thresholds and the two price edges of the
+score floor) into one sorted breakpoint list, and stores the final
+decision for each interval between breakpoints and each emotional state.
+Breakpoints where no decision changes are dropped, and a decision is then
+one bisect over a handful of floats.
+
+With SCORING_ENGINE features (the live loop's market data) the score floor
+depends on more than the price, so only the feature-free part compiles:
+the table also keeps the agent majority on its own breakpoints.
+agents_buy() answers it with one bisect; the conductor then scores the
+features only when the agents vote BUY, and applies the floor and the
+EGO_CORE overlay on top.
+
+The breakpoints are exact, not approximate. Agents vote on
+`sol_price < threshold`, so each interval includes its left breakpoint
+and a price equal to a threshold lands on the same side as in the agents.
+The score-floor edges are found by stepping through neighbouring floats
+with the scoring formula itself, so rounding in the score cannot move a
+decision.
+
+DecisionTableCache recompiles lazily whenever the strategy snapshot
+(strategy and scoring parameters, see strategy_params.py) or the agent
+registry changes, and swaps the new table in with one reference
+assignment.
+"""
+
+import math
+from bisect import bisect_right
+
+import numpy as np
+
+from . import agent_registry
+from .strategy_params import strategy
+from core.decisions.decisions import DECISION_CODES, DECISION_DTYPE, DECISION_LABELS
+from core.ego_core.ego_core import EMOTIONAL_STATES, apply_emotional_overlay_batch
+from core.scoring_engine import scoring_engine
+from core.log_core.log_core import get_logger
+
+logger = get_logger("DecisionTable")
+
+_MAX_EDGE_STEPS = 200
+
+class DecisionTable:
+    """Immutable compiled decision table; build with compile_decision_table()."""
+
+    __slots__ = ("breakpoints", "rows", "neutral", "agent_breakpoints", "agent_buy")
+
+    def __init__(self, breakpoints: tuple, codes: np.ndarray, agent_breakpoints: tuple = (),
+                 agent_buy: tuple = (False,)):
+        """
+        codes: (emotional state, interval) DECISION_CODES, states in
+        EMOTIONAL_STATES order. agent_buy: the agent majority per interval
+        of agent_breakpoints.
+        """
+        self.breakpoints = breakpoints
+        self.rows = {state: tuple(DECISION_LABELS[c] for c in codes[i].tolist())
+                     for i, state in enumerate(EMOTIONAL_STATES)}
+        self.neutral = self.rows["neutral"]
+        self.agent_breakpoints = agent_breakpoints
+        self.agent_buy = agent_buy
+
+    def __len__(self):
+        return len(self.breakpoints) + 1
+
+    def decide(self, sol_price: float, emotional_state: str = "neutral") -> str:
+        """synergy_conductor_run's decision for {"sol_price": sol_price}."""
+        return self.rows.get(emotional_state, self.neutral)[bisect_right(self.breakpoints, sol_price)]
+
+    def agents_buy(self, sol_price: float) -> bool:
+        """True if at least half of the agents vote BUY at sol_price (before the score floor)."""
+        return self.agent_buy[bisect_right(self.agent_breakpoints, sol_price)]
+
+def _edge(predicate, x: float, right_value: bool) -> float:
+    """
+    Smallest float where the monotone `predicate` takes its right-hand
+    value, near x (the edge computed in real arithmetic): bracket x, then
+    bisect down to adjacent floats.
+    """
+    lo = hi = x
+    step = 1e-12 * max(1.0, abs(x))
+    for _ in range(_MAX_EDGE_STEPS):
+        if predicate(hi) != right_value:
+            hi = x + step
+        elif predicate(lo) == right_value:
+            lo = x - step
+        else:
+            break
+        step *= 2
+    else:
+        raise ValueError(f"Score floor edge near {x} not found")
+    while True:
+        mid = (lo + hi) / 2
+        if not lo < mid < hi:
+            return hi
+        if predicate(mid) == right_value:
+            hi = mid
+        else:
+            lo = mid
+
+def compile_decision_table(params, scoring_params: dict = None, registry: dict = None):
+    """
+    Decision table for strategy `params`, or None if some registered agent
+    is not a threshold agent (the conductor then evaluates agents as usual).
+    """
+    scoring_params = scoring_engine.SCORING_PARAMS if scoring_params is None else scoring_params
+    registry = agent_registry.AGENT_REGISTRY if registry is None else registry
+    if any(spec["threshold"] is None for spec in registry.values()):
+        return None
+    thresholds = [float(params[spec["threshold"]]) for spec in registry.values()]
+    floor = float(params["score_floor"])
+    ideal = float(scoring_params["ideal_price"])
+    penalty = float(scoring_params["level_penalty"])
+    if not all(math.isfinite(v) for v in thresholds + [floor, ideal, penalty]):
+        raise ValueError("Strategy thresholds and scoring parameters must be finite")
+
+    def forced_hold(price: float) -> bool:
+        return scoring_engine.level_score(price, scoring_params) < floor
+
+    breakpoints = set(thresholds)
+    # The level score falls below the floor more than (100 - floor) / penalty from ideal_price
+    if penalty > 0 and 0 < floor <= 100:
+        reach = (100 - floor) / penalty
+        breakpoints.add(_edge(forced_hold, ideal - reach, False))
+        breakpoints.add(_edge(forced_hold, ideal + reach, True))
+    breakpoints = tuple(sorted(breakpoints))
+
+    def majority(price: float) -> bool:
+        return sum(price < t for t in thresholds) * 2 >= len(thresholds)
+
+    samples = _samples(breakpoints)
+    final_buy = np.array([majority(price) and not forced_hold(price) for price in samples], dtype=bool)
+
+    codes = np.zeros((len(EMOTIONAL_STATES), len(samples)), dtype=DECISION_DTYPE)
+    for i, state in enumerate(EMOTIONAL_STATES):
+        buy, buy_more = apply_emotional_overlay_batch(final_buy, state)
+        codes[i][buy] = DECISION_CODES["BUY"]
+        codes[i][buy_more] = DECISION_CODES["BUY_MORE"]
+
+    # Drop breakpoints where no state's decision changes (e.g. 30 -> 40: HOLD on both sides)
+    changes = np.flatnonzero((codes[:, 1:] != codes[:, :-1]).any(axis=0))
+    keep = np.concatenate(([0], changes + 1))
+
+    # The agent majority alone, on the threshold breakpoints where it flips
+    agent_breakpoints = tuple(sorted(set(thresholds)))
+    votes = [majority(price) for price in _samples(agent_breakpoints)]
+    flips = [i for i in range(1, len(votes)) if votes[i] != votes[i - 1]]
+    return DecisionTable(tuple(breakpoints[i] for i in changes), codes[:, keep],
+                         tuple(agent_breakpoints[i - 1] for i in flips),
+                         tuple(votes[i] for i in [0] + flips))
+
+def _samples(breakpoints: tuple) -> list:
+    """One price per interval: just below the first breakpoint, then each breakpoint."""
+    return [math.nextafter(breakpoints[0], -math.inf) if breakpoints else 0.0] + list(breakpoints)
+
+class DecisionTableCache:
+    """The table for the live strategy, recompiled when any of its inputs change."""
+
+    def __init__(self, params_source=strategy):
+        self.params_source = params_source
+        self.compiles = 0
+        self._compiled = (None, None, None)     # snapshot, registry version, table: swapped as one tuple
+
+    def table(self, snapshot: tuple = None):
+        """
+        Current DecisionTable, or None when the agents cannot be compiled.
+        snapshot: the (params, scoring) pair the caller decides with
+        (default: the source's current one).
+        """
+        if snapshot is None:
+            snapshot = self.params_source.snapshot()
+        version = agent_registry.registry_version()
+        compiled = self._compiled
+        if compiled[0] is snapshot and compiled[1] == version:
+            return compiled[2]
+        try:
+            table = compile_decision_table(*snapshot)
+        except ValueError as e:
+            logger.warning("Decision table not compiled (%s); evaluating agents directly.", e)
+            table = None
+        self._compiled = (snapshot, version, table)
+        self.compiles += 1
+        if table is not None:
+            logger.debug("Compiled decision table: %d breakpoints %s", len(table.breakpoints), table.breakpoints)
+        return table
+
+decision_tables = DecisionTableCache()
@@ -6,13 +6,24 @@ Focus on stealth, infiltration, alpha gathering for early entries.
 Phase 2: We'll just produce a mock signal based on sol_price for demonstration.
 """
 
+import numpy as np
+
+from .strategy_params import strategy
+
 def machiavelli_agent_logic(market_data: dict):
     """
     Returns a basic 'buy' or 'hold' signal.
-    E.g., if sol_price < 20, then 'buy', else 'hold'.
+    E.g., if sol_price < machiavelli_buy_below (20 by default), then 'buy', else 'hold'.
     """
     sol_price = market_data.get("sol_price", 0)
-    if sol_price < 20:
+    if sol_price < strategy.current()["machiavelli_buy_below"]:
         return "BUY"
     else:
         return "HOLD"
+
+def machiavelli_agent_batch(sol_prices):
+    """
+    Vectorized machiavelli_agent_logic: boolean mask of 'BUY' ticks
+    for a NumPy array of sol_prices.
+    """
+    return np.asarray(sol_prices, dtype=np.float64) < strategy.current()["machiavelli_buy_below"]
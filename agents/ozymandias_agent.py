@@ -6,13 +6,24 @@ Long-term empire building.
 Phase 2: Minimal signal logic.
 """
 
+import numpy as np
+
+from .strategy_params import strategy
+
 def ozymandias_agent_logic(market_data: dict):
     """
     Let's pretend Ozymandias always invests 10% of capital,
-    but for simplicity, we just return 'BUY' if sol_price < 30.
+    but for simplicity, we just return 'BUY' if sol_price < ozymandias_buy_below (30 by default).
     """
     sol_price = market_data.get("sol_price", 0)
-    if sol_price < 30:
+    if sol_price < strategy.current()["ozymandias_buy_below"]:
         return "BUY"
     else:
         return "HOLD"
+
+def ozymandias_agent_batch(sol_prices):
+    """
+    Vectorized ozymandias_agent_logic: boolean mask of 'BUY' ticks
+    for a NumPy array of sol_prices.
+    """
+    return np.asarray(sol_prices, dtype=np.float64) < strategy.current()["ozymandias_buy_below"]
@@ -0,0 +1,108 @@
+"""
+strategy_params.py
+
+Decision thresholds for the conductor, read from the "strategy" section of
+config/parameters.json instead of hard-coded in the agents:
+    <agent>_buy_below   an agent votes BUY while sol_price is below it
+    score_floor         a SCORING_ENGINE score below it forces HOLD
+The watcher re-reads parameters.json when it changes on disk, checking
+the file's mtime at most every reload_interval_s. A change builds a
+fresh, read-only params mapping and the matching "scoring" section, and
+publishes both as one (params, scoring) snapshot with one reference
+assignment. A reader that takes snapshot() once per decision scores and
+thresholds from the same file version and never sees a half-applied
+config. scoring_engine.SCORING_PARAMS is rebound afterwards, for callers
+that score outside a decision.
+"""
+
+import os
+import threading
+import time
+from types import MappingProxyType
+
+from config.config_loader import PARAMETERS_PATH, load_parameters
+from core.scoring_engine import scoring_engine
+from core.log_core.log_core import get_logger
+
+logger = get_logger("StrategyParams")
+
+DEFAULTS = {
+    "machiavelli_buy_below": 20.0,
+    "tywin_buy_below": 15.0,
+    "wick_buy_below": 25.0,
+    "ozymandias_buy_below": 30.0,
+    "score_floor": 20.0,
+    "reload_interval_s": 1.0        # 0 checks the file on every read, None never reloads
+}
+
+class StrategyParams:
+    """Current "strategy" parameters, hot-reloaded from parameters.json."""
+
+    def __init__(self, path: str = PARAMETERS_PATH, reload_interval_s: float = None, clock=time.monotonic):
+        self.path = path
+        self.clock = clock
+        self.reloads = 0
+        self._reload_lock = threading.Lock()
+        self._mtime = self._stat()
+        self._snapshot = self._load()
+        if reload_interval_s is None:
+            reload_interval_s = self._snapshot[0]["reload_interval_s"]
+        self.reload_interval_s = reload_interval_s
+        self._next_check = clock() + (reload_interval_s or 0.0)
+
+    def _stat(self):
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _load(self) -> tuple:
+        params = MappingProxyType({**DEFAULTS, **load_parameters("strategy", path=self.path)})
+        scoring = scoring_engine.merge_scoring_params(load_parameters("scoring", path=self.path))
+        return params, scoring
+
+    def snapshot(self) -> tuple:
+        """
+        The live (strategy params, scoring params) pair, from one file
+        version (checks the file for changes when the interval is due).
+        """
+        if self.reload_interval_s is not None and self.clock() >= self._next_check:
+            self._next_check = self.clock() + self.reload_interval_s
+            self.check()
+        return self._snapshot
+
+    def current(self) -> MappingProxyType:
+        """The live strategy parameters alone (see snapshot())."""
+        return self.snapshot()[0]
+
+    def check(self) -> bool:
+        """Reload now if the file changed; returns True if new parameters were swapped in."""
+        if self._stat() == self._mtime:
+            return False
+        # One thread reloads; the others keep using the current parameters meanwhile
+        if not self._reload_lock.acquire(blocking=False):
+            return False
+        try:
+            return self._reload()
+        finally:
+            self._reload_lock.release()
+
+    def _reload(self) -> bool:
+        mtime = self._stat()
+        if mtime == self._mtime:
+            return False
+        try:
+            snapshot = self._load()
+        except (ValueError, OSError) as e:
+            # Likely caught mid-write: keep the old parameters and retry on the next check
+            logger.warning("Could not reload %s (%s); keeping the current strategy.", self.path, e)
+            return False
+        self._mtime = mtime
+        self._snapshot = snapshot
+        scoring_engine.SCORING_PARAMS = snapshot[1]
+        self.reloads += 1
+        logger.info("Strategy reloaded from %s.", self.path)
+        return True
+
+strategy = StrategyParams()
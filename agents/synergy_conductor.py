@@ -2,20 +2,42 @@
 synergy_conductor.py
 
 Now includes a scoring step from SCORING_ENGINE in deciding final action.
+Agents come from agent_registry, which runs pooled agents concurrently
+with per-agent deadlines.
+
+With only threshold agents registered, decisions come from a compiled
+decision table (see decision_table.py):
+ - price-only market data (no SCORING_ENGINE features): the whole
+   decision is one bisect
+ - market data with features (what main.py passes): the agent majority is
+   one bisect, and the multi-factor score is only computed when the agents
+   vote BUY. A HOLD majority is HOLD whatever the score and the mood.
+Each decision takes one strategy snapshot (thresholds and scoring
+parameters from the same config version).
+
+Passing a MarketSnapshot (a whole token universe) instead of the
+single-symbol dict evaluates every symbol in one vectorized pass and
+returns ranked decisions.
 """
 
-from .machiavelli_agent import machiavelli_agent_logic
-from .tywin_agent import tywin_agent_logic
-from .wick_agent import wick_agent_logic
-from .ozymandias_agent import ozymandias_agent_logic
-from core.ego_core.ego_core import apply_emotional_overlay
+import numpy as np
+
+from .agent_registry import AGENT_REGISTRY, evaluate_agents
+from .decision_table import decision_tables
+from .strategy_params import strategy
+from core.decisions.decisions import DECISION_CODES, DECISION_DTYPE, DECISION_LABELS
+from core.ego_core.ego_core import apply_emotional_overlay, apply_emotional_overlay_batch
 
 # NEW import
-from core.scoring_engine.scoring_engine import compute_score
+from core.scoring_engine.scoring_engine import FEATURE_KEYS, compute_score, compute_score_batch
+from pipelines.market_snapshot import MarketSnapshot
+from core.log_core.log_core import get_logger
+
+logger = get_logger("SynergyConductor")
 
 def synergy_conductor_init():
     """Initialize synergy conductor (placeholder)."""
-    print("[SynergyConductor] Initialized.")
+    logger.info("Initialized.")
 
 def synergy_conductor_run(market_data: dict, emotional_state: str = "neutral"):
     """
@@ -24,40 +46,143 @@ def synergy_conductor_run(market_data: dict, emotional_state: str = "neutral"):
     2) Also compute a SCORING_ENGINE score. 
     3) Final decision depends on both the agent majority AND the scoring result.
     4) Then apply EGO_CORE overlay.
+
+    With a MarketSnapshot, returns synergy_conductor_run_universe's ranked
+    decisions for every symbol instead of a single decision string.
     """
+    if isinstance(market_data, MarketSnapshot):
+        return synergy_conductor_run_universe(market_data, emotional_state)
 
-    # Agent signals
-    signals = []
-    signals.append(machiavelli_agent_logic(market_data))
-    signals.append(tywin_agent_logic(market_data))
-    signals.append(wick_agent_logic(market_data))
-    signals.append(ozymandias_agent_logic(market_data))
-
-    buy_count = signals.count("BUY")
-    # hold_count = signals.count("HOLD")  # not strictly needed now
-
-    # Basic agent-based decision
-    if buy_count >= 2:
-        agent_decision = "BUY"
+    snapshot = strategy.snapshot()
+    params, scoring = snapshot
+    table = decision_tables.table(snapshot)
+    if table is not None:
+        sol_price = market_data.get("sol_price", 0)
+        # Price-only data: the compiled table holds the whole decision below
+        if market_data.keys().isdisjoint(FEATURE_KEYS):
+            return table.decide(sol_price, emotional_state)
+        # With features only the agent majority is compiled; no BUY majority, no score needed
+        agent_decision = "BUY" if table.agents_buy(sol_price) else "HOLD"
+        if agent_decision == "HOLD":
+            return agent_decision
     else:
-        agent_decision = "HOLD"
+        # Agent signals (None = abstained: missed its deadline or failed)
+        signals, _ = evaluate_agents(market_data)
+
+        buy_count = sum(1 for signal in signals.values() if signal == "BUY")
+        # hold_count = signals.count("HOLD")  # not strictly needed now
+
+        # Basic agent-based decision: BUY votes from at least half of the
+        # registered agents (2 of 4); abstentions never count as BUY
+        if buy_count * 2 >= len(signals):
+            agent_decision = "BUY"
+        else:
+            agent_decision = "HOLD"
 
     # SCORING_ENGINE step
-    score = compute_score(market_data)
-    print(f"[SynergyConductor] SCORING_ENGINE score: {score:.2f}")
+    score = compute_score(market_data, scoring)
+    logger.debug("SCORING_ENGINE score: %.2f", score)
 
-    # If score > 50, we lean buy, else lean hold
-    if score > 50:
-        final_decision = "BUY" if agent_decision == "BUY" else "HOLD"
+    # Even if agents want to buy, a score below the floor overrides to HOLD;
+    # otherwise follow the agents (a score above 50 also just follows them)
+    if score < params["score_floor"]:
+        final_decision = "HOLD"
     else:
-        # Even if agents want to buy, if score < 20 let's override to HOLD
-        # or you can pick your own logic
-        if score < 20:
-            final_decision = "HOLD"
-        else:
-            final_decision = agent_decision
+        final_decision = agent_decision
 
     # EGO_CORE overlay
     final_decision = apply_emotional_overlay(final_decision, emotional_state)
 
     return final_decision
+
+def synergy_conductor_run_batch(sol_prices, emotional_states="neutral", features: dict = None):
+    """
+    Batch/vectorized synergy_conductor_run over a whole price series.
+    sol_prices: 1-D array of prices; emotional_states: one state or an
+    array of states aligned with sol_prices; features: optional
+    SCORING_ENGINE features ({name: array}) aligned with sol_prices.
+    Returns an int8 array of DECISION_CODES, identical tick-for-tick to
+    calling synergy_conductor_run per tick (no per-tick prints).
+    """
+    sol_prices = np.asarray(sol_prices, dtype=np.float64)
+    decisions, _ = _decide_batch(sol_prices, emotional_states, lambda i: {"sol_price": float(sol_prices[i])},
+                                 features)
+    return decisions
+
+def _decide_batch(prices, emotional_states, row_fn, features: dict = None, params=None, scoring: dict = None):
+    """
+    Shared vectorized decision step over a price array (ticks of one
+    symbol, or symbols of one tick). row_fn(i) builds the market_data dict
+    for agents that only have scalar logic; features feed the
+    multi-factor SCORING_ENGINE score. params / scoring: "strategy" and
+    scoring parameters to decide with instead of the live snapshot, e.g.
+    a PATCH_CORE candidate. Threshold agents vote against params[threshold].
+    Returns (decision codes, scores).
+    """
+    if params is None:
+        params, live_scoring = strategy.snapshot()
+        scoring = live_scoring if scoring is None else scoring
+
+    # Agent signals
+    buy_count = np.zeros(prices.shape, dtype=np.int32)
+    for spec in AGENT_REGISTRY.values():
+        if spec["threshold"] is not None:
+            buy_count += prices < params[spec["threshold"]]
+        elif spec["batch_fn"] is not None:
+            buy_count += spec["batch_fn"](prices)
+        else:
+            buy_count += np.fromiter(
+                (spec["fn"](row_fn(i)) == "BUY" for i in range(len(prices))),
+                dtype=bool, count=len(prices)
+            )
+    agent_buy = buy_count * 2 >= len(AGENT_REGISTRY)
+
+    # SCORING_ENGINE step: score > 50 follows the agents, a score below the
+    # floor (20 by default) forces HOLD, anything in between also follows the agents.
+    score = compute_score_batch(prices, features, scoring)
+    final_buy = agent_buy & ~(score < params["score_floor"])
+
+    # EGO_CORE overlay
+    buy, buy_more = apply_emotional_overlay_batch(final_buy, emotional_states)
+
+    decisions = np.full(prices.shape, DECISION_CODES["HOLD"], dtype=DECISION_DTYPE)
+    decisions[buy] = DECISION_CODES["BUY"]
+    decisions[buy_more] = DECISION_CODES["BUY_MORE"]
+    return decisions, score
+
+# Ranking priority per decision code: BUY_MORE first, then BUY, SELL, HOLD
+DECISION_PRIORITY = np.array([0, 2, 3, 1], dtype=np.int8)
+
+def synergy_conductor_run_universe(snapshot: MarketSnapshot, emotional_state="neutral",
+                                   top_k: int = None) -> dict:
+    """
+    Evaluate every symbol of a MarketSnapshot in one vectorized pass.
+    emotional_state: one state for the whole universe or an array aligned
+    with the snapshot's symbols. Feature columns added by
+    FeatureEngine.update_snapshot() feed the SCORING_ENGINE score.
+    Returns ranked columns - strongest actions first, ties broken by
+    SCORING_ENGINE score (descending), then by snapshot order:
+        {"symbol", "decision" (int8 codes), "score", "price"}
+    top_k keeps only the k best symbols (partial sort, much cheaper than
+    ranking a large universe in full). Use decode_decisions() for labels.
+    """
+    prices = snapshot.price
+    decisions, score = _decide_batch(prices, emotional_state, snapshot.row, snapshot.columns)
+    # Scores are 0-100, so priority * 1000 + score orders by action then score
+    key = DECISION_PRIORITY[decisions] * 1000.0 + score
+    np.negative(key, out=key)
+    if top_k is not None and top_k < len(key):
+        order = np.argpartition(key, top_k)[:top_k]
+        order = order[np.lexsort((order, key[order]))]
+    else:
+        order = np.argsort(key, kind="stable")
+    return {
+        "symbol": snapshot.symbols[order],
+        "decision": decisions[order],
+        "score": score[order],
+        "price": prices[order]
+    }
+
+def decode_decisions(decision_codes):
+    """Map an array of DECISION_CODES back to decision strings."""
+    return np.asarray(DECISION_LABELS, dtype=object)[np.asarray(decision_codes)]
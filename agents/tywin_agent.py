@@ -6,13 +6,24 @@ Focus on defensive, conservative strategy.
 Phase 2: Minimal signal logic.
 """
 
+import numpy as np
+
+from .strategy_params import strategy
+
 def tywin_agent_logic(market_data: dict):
     """
     If sol_price is too high, Tywin might stay out (HOLD).
     If sol_price is relatively low, Tywin might do a small 'BUY'.
     """
     sol_price = market_data.get("sol_price", 0)
-    if sol_price < 15:
+    if sol_price < strategy.current()["tywin_buy_below"]:
         return "BUY"
     else:
         return "HOLD"
+
+def tywin_agent_batch(sol_prices):
+    """
+    Vectorized tywin_agent_logic: boolean mask of 'BUY' ticks
+    for a NumPy array of sol_prices.
+    """
+    return np.asarray(sol_prices, dtype=np.float64) < strategy.current()["tywin_buy_below"]
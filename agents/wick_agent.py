@@ -6,13 +6,24 @@ Aggressive sniper approach.
 Phase 2: Minimal signal logic, just for demonstration.
 """
 
+import numpy as np
+
+from .strategy_params import strategy
+
 def wick_agent_logic(market_data: dict):
     """
-    If sol_price < 25, let's say Wick is still in for a BUY.
+    If sol_price < wick_buy_below (25 by default), let's say Wick is still in for a BUY.
     Otherwise, Wick might SELL (or for now, just 'HOLD').
     """
     sol_price = market_data.get("sol_price", 0)
-    if sol_price < 25:
+    if sol_price < strategy.current()["wick_buy_below"]:
         return "BUY"
     else:
         return "HOLD"
+
+def wick_agent_batch(sol_prices):
+    """
+    Vectorized wick_agent_logic: boolean mask of 'BUY' ticks
+    for a NumPy array of sol_prices.
+    """
+    return np.asarray(sol_prices, dtype=np.float64) < strategy.current()["wick_buy_below"]
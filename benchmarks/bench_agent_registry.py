@@ -0,0 +1,84 @@
+"""
+bench_agent_registry.py
+
+Cycle time of synergy_conductor_run with heavier agents registered:
+sequential (everything inline) versus thread/process pools, and stalled
+agents that are turned into abstentions by their deadline. A stalled
+agent keeps abstaining ("busy") while its earlier call is still running
+instead of piling more calls onto the pool, so the cycle time of the
+other agents stays flat.
+
+Run from the repo root:
+    python -m benchmarks.bench_agent_registry [n_cycles]
+"""
+
+import sys
+import time
+
+from agents.agent_registry import (
+    register_agent,
+    unregister_agent,
+    agent_latency_report,
+    shutdown_agent_pools
+)
+from agents.synergy_conductor import synergy_conductor_run
+from core.log_core.log_core import quiet
+
+def io_agent(market_data):
+    """Stands in for an agent waiting on an external service."""
+    time.sleep(0.02)
+    return "BUY" if market_data.get("sol_price", 0) < 22 else "HOLD"
+
+def cpu_agent(market_data):
+    """Stands in for indicator computation / model inference."""
+    acc = 0.0
+    for i in range(300_000):
+        acc += (i % 7) * 1e-6
+    return "BUY" if market_data.get("sol_price", 0) + acc * 0 < 21 else "HOLD"
+
+def stalled_agent(market_data):
+    time.sleep(1.0)
+    return "BUY"
+
+def run_cycles(n_cycles):
+    t0 = time.perf_counter()
+    with quiet():
+        for i in range(n_cycles):
+            synergy_conductor_run({"sol_price": 18.0 + i % 6}, "neutral")
+    return (time.perf_counter() - t0) / n_cycles * 1000
+
+def main(n_cycles: int = 20):
+    heavy = [("io_1", io_agent, "thread"), ("io_2", io_agent, "thread"),
+             ("cpu_1", cpu_agent, "process"), ("cpu_2", cpu_agent, "process")]
+
+    for name, fn, _ in heavy:
+        register_agent(name, fn, "inline", deadline_s=1.0)
+    print(f"[Bench] sequential (all inline):   {run_cycles(n_cycles):7.1f} ms/cycle")
+
+    for name, fn, cost_class in heavy:
+        register_agent(name, fn, cost_class, deadline_s=1.0)
+    run_cycles(1)  # warm the pools
+    print(f"[Bench] pooled (thread + process): {run_cycles(n_cycles):7.1f} ms/cycle")
+
+    stalled = [f"stalled_{i}" for i in range(3)]
+    for name in stalled:
+        register_agent(name, stalled_agent, "thread", deadline_s=0.1)
+    print(f"[Bench] pooled + 3 stalled agents: {run_cycles(n_cycles):7.1f} ms/cycle (deadline 100 ms)")
+
+    for name, stats in agent_latency_report().items():
+        print(f"[Bench]   {name:12s} calls={stats['calls']:3d} abstained={stats['abstentions']:3d} "
+              f"busy={stats['busy']:3d} mean={stats['mean_ms']:8.2f}ms max={stats['max_ms']:8.2f}ms")
+
+    report = agent_latency_report()
+    # Each stalled agent occupies at most one worker, so the I/O agents never abstain
+    ok = all(report[name]["abstentions"] == 0 for name in ("io_1", "io_2")) and \
+        all(report[name]["busy"] > 0 for name in stalled)
+
+    for name in [h[0] for h in heavy] + stalled:
+        unregister_agent(name)
+    shutdown_agent_pools()
+    print(f"\n[Bench] {'OK' if ok else 'FAILED'}")
+    return ok
+
+if __name__ == "__main__":
+    sys.exit(0 if main(int(sys.argv[1]) if len(sys.argv) > 1 else 20) else 1)
@@ -0,0 +1,68 @@
+"""
+bench_async_pipeline.py
+
+Latency/throughput benchmark for AsyncMarketDataPipeline against the local
+stub price server: sequential quote latency (p50/p99) for 'first' and
+'median' modes with one slow source, plus concurrent quotes/second over
+the pooled session.
+
+Run from the repo root:
+    python -m benchmarks.bench_async_pipeline [n_quotes]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+
+from pipelines.async_data_pipeline import AsyncMarketDataPipeline
+from benchmarks.stub_price_server import start_stub_server, stub_sources
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+async def bench_latency(base_url, mode, n_quotes):
+    async with AsyncMarketDataPipeline(stub_sources(base_url), latency_budget=0.5, mode=mode) as pipeline:
+        latencies = []
+        for _ in range(n_quotes):
+            quote = await pipeline.fetch_quote()
+            latencies.append(quote["latency_s"] * 1000)
+    print(f"[Bench] mode={mode:6s} p50={statistics.median(latencies):.2f}ms "
+          f"p99={percentile(latencies, 99):.2f}ms max={max(latencies):.2f}ms")
+
+async def bench_throughput(base_url, n_quotes, concurrency=50):
+    async with AsyncMarketDataPipeline(stub_sources(base_url), latency_budget=2.0, pool_size=100) as pipeline:
+        t0 = time.perf_counter()
+        for start in range(0, n_quotes, concurrency):
+            batch = min(concurrency, n_quotes - start)
+            await asyncio.gather(*(pipeline.fetch_quote() for _ in range(batch)))
+        elapsed = time.perf_counter() - t0
+        print(f"[Bench] throughput: {n_quotes / elapsed:,.0f} quotes/s "
+              f"({n_quotes * len(pipeline.sources) / elapsed:,.0f} source requests/s), "
+              f"misses={pipeline.stats['misses']}")
+
+async def bench_stream(base_url, n_ticks=20, interval=0.01):
+    async with AsyncMarketDataPipeline(stub_sources(base_url), latency_budget=0.5, mode="first") as pipeline:
+        t0 = time.perf_counter()
+        received = [tick async for tick in pipeline.stream_ticks(interval=interval, max_ticks=n_ticks)]
+        elapsed = time.perf_counter() - t0
+    print(f"[Bench] stream: {len(received)} ticks at {interval * 1000:.0f}ms interval in {elapsed:.3f}s")
+
+async def main(n_quotes: int):
+    # One deliberately slow source: 'first' should not wait for it, 'median' should
+    runner, base_url = await start_stub_server(delays={"coinbase": 0.02})
+    try:
+        await bench_latency(base_url, "first", n_quotes)
+        await bench_latency(base_url, "median", n_quotes)
+        fast_runner, fast_url = await start_stub_server()
+        try:
+            await bench_throughput(fast_url, n_quotes * 10)
+            await bench_stream(fast_url)
+        finally:
+            await fast_runner.cleanup()
+    finally:
+        await runner.cleanup()
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 200))
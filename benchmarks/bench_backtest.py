@@ -0,0 +1,48 @@
+"""
+bench_backtest.py
+
+Replays a synthetic recorded tick file through the backtest engine and
+reports ticks/second for the vectorized and per-tick decision paths.
+
+Run from the repo root:
+    python -m benchmarks.bench_backtest [n_ticks]
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+from pipelines.backtest_engine import write_tick_file, run_backtest_file, print_report
+
+def make_tick_file(path: str, n_ticks: int, seed: int = 11):
+    """Random-walk prices around the agent thresholds, rare whale alerts."""
+    rng = np.random.default_rng(seed)
+    timestamps = 1_700_000_000.0 + np.arange(n_ticks, dtype=np.float64)
+    sol_prices = np.clip(22.0 + np.cumsum(rng.normal(0.0, 0.05, n_ticks)), 1.0, None)
+    whale_alerts = rng.random(n_ticks) < 1e-6
+    write_tick_file(path, timestamps, sol_prices, whale_alerts)
+
+def main(n_ticks: int = 1_000_000):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ticks.csv")
+        make_tick_file(path, n_ticks)
+
+        print("[Bench] vectorized decisions:")
+        vec = run_backtest_file(path, halt_on_kill_switch=False)
+        print_report(vec)
+
+        print(f"\n[Bench] per-tick synergy_conductor_run ({n_ticks} ticks):")
+        scalar = run_backtest_file(path, halt_on_kill_switch=False, vectorized=False)
+        print_report(scalar)
+
+        same = (vec["pnl_total"] == scalar["pnl_total"]
+                and vec["trade_counts"] == scalar["trade_counts"]
+                and vec["kill_switch_trips"] == scalar["kill_switch_trips"])
+        print(f"\n[Bench] vectorized == per-tick: {same}")
+        return same
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    sys.exit(0 if main(n) else 1)
@@ -0,0 +1,179 @@
+"""
+bench_decision_table.py
+
+Compiled decision table vs. calling the four agents one by one:
+  - decisions match the per-agent path (agents, score floor, EGO_CORE
+    overlay) for random prices, every breakpoint and its neighbouring
+    floats, in every emotional state
+  - with SCORING_ENGINE features (main.py's path: agent majority from the
+    table, score on top) synergy_conductor_run matches the per-agent path
+  - decisions/second: agents one by one, DecisionTable.decide, and
+    synergy_conductor_run (table plus the reload check); the vectorized
+    synergy_conductor_run_batch is shown for reference
+  - hot reload: threshold edits in a copy of parameters.json are picked
+    up without a restart, while reader threads keep deciding. Every
+    decision a reader sees must come from one whole table, old or new.
+
+Run from the repo root:
+    python -m benchmarks.bench_decision_table [n_lookups]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+from agents.agent_registry import AGENT_REGISTRY
+from agents.decision_table import DecisionTableCache, compile_decision_table, decision_tables
+from agents.strategy_params import StrategyParams
+from agents.synergy_conductor import synergy_conductor_run, synergy_conductor_run_batch, decode_decisions
+from config.config_loader import PARAMETERS_PATH
+from core.ego_core.ego_core import apply_emotional_overlay
+from core.scoring_engine.scoring_engine import FEATURE_KEYS, compute_score
+from core.log_core.log_core import quiet
+
+STATES = ("neutral", "rage", "fear", "calm")
+
+def agents_one_by_one(market_data: dict, emotional_state: str, score_floor: float) -> str:
+    """The conductor's rule with every agent called in turn (the pre-table path)."""
+    buy_count = 0
+    for spec in AGENT_REGISTRY.values():
+        if spec["fn"](market_data) == "BUY":
+            buy_count += 1
+    decision = "BUY" if buy_count * 2 >= len(AGENT_REGISTRY) else "HOLD"
+    if compute_score(market_data) < score_floor:
+        decision = "HOLD"
+    return apply_emotional_overlay(decision, emotional_state)
+
+def probe_prices(table, n: int, seed: int = 24) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    edges = np.array(table.breakpoints + (15.0, 20.0, 25.0, 30.0, 40.0, 0.0))
+    return np.concatenate([rng.uniform(-10.0, 60.0, n), edges,
+                           np.nextafter(edges, -np.inf), np.nextafter(edges, np.inf)])
+
+def feature_rows(prices: np.ndarray, seed: int = 31) -> list:
+    """Market data with features spread around each price, so the score lands on both sides of the floor."""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for p in prices.tolist():
+        row = {"sol_price": p}
+        for key in FEATURE_KEYS:
+            row[key] = abs(p) * rng.uniform(0.8, 1.2) if key != "zscore" else rng.normal(0.0, 2.0)
+        row["volatility"] = rng.uniform(0.0, 0.1)
+        rows.append(row)
+    return rows
+
+def write_config(path: str, params: dict):
+    """Atomic replace, as a config deploy would; the explicit mtime avoids coarse-clock ties."""
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(params, f)
+    write_config.mtime_ns += 1_000_000
+    os.utime(tmp, ns=(write_config.mtime_ns, write_config.mtime_ns))
+    os.replace(tmp, path)
+write_config.mtime_ns = time.time_ns()
+
+def hot_reload(n_swaps: int = 40) -> bool:
+    with open(PARAMETERS_PATH, "r", encoding="utf-8") as f:
+        base = json.load(f)
+    variants = [dict(base["strategy"]), dict(base["strategy"], wick_buy_below=27.5, score_floor=35.0)]
+    ok = True
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "parameters.json")
+        write_config(path, base)
+        source = StrategyParams(path, reload_interval_s=0.0)
+        cache = DecisionTableCache(source)
+        expected = [compile_decision_table({**source.current(), **v}) for v in variants]
+        prices = probe_prices(expected[0], 200)
+        answers = [tuple(t.decide(float(p), s) for s in STATES for p in prices) for t in expected]
+        ok &= answers[0] != answers[1]
+
+        torn = []
+        stop = threading.Event()
+
+        def reader():
+            while not stop.is_set():
+                table = cache.table()
+                seen = tuple(table.decide(float(p), s) for s in STATES for p in prices)
+                if seen not in answers:
+                    torn.append(seen)
+
+        readers = [threading.Thread(target=reader) for _ in range(2)]
+        with quiet():
+            for t in readers:
+                t.start()
+            reload_ms = []
+            for i in range(1, n_swaps + 1):
+                write_config(path, dict(base, strategy=variants[i % 2]))
+                t0 = time.perf_counter()
+                while cache.table().decide(27.0) != expected[i % 2].decide(27.0):
+                    time.sleep(0.0001)
+                reload_ms.append((time.perf_counter() - t0) * 1000)
+            stop.set()
+            for t in readers:
+                t.join()
+
+        ok &= not torn and source.reloads == n_swaps
+        print(f"\n[Bench] hot reload: {n_swaps} config edits, {source.reloads} reloads, {cache.compiles} compiles, "
+              f"visible after {np.median(reload_ms):.2f} ms median (reload interval 0 s); "
+              f"torn reads: {len(torn)}")
+    return ok
+
+def main(n_lookups: int = 200_000):
+    ok = True
+    table = decision_tables.table()
+    floor = StrategyParams().current()["score_floor"]
+    print(f"[Bench] table: {len(table.breakpoints)} breakpoints {table.breakpoints}")
+
+    prices = probe_prices(table, 20_000)
+    with quiet():
+        mismatches = sum(table.decide(float(p), s) != agents_one_by_one({"sol_price": float(p)}, s, floor)
+                         for s in STATES for p in prices)
+    ok &= mismatches == 0
+    print(f"[Bench] {len(prices) * len(STATES):,} probes (random prices + breakpoint neighbours): "
+          f"{mismatches} mismatches vs. agents one by one")
+
+    rows = feature_rows(prices)
+    with quiet():
+        mismatches = sum(synergy_conductor_run(d, s) != agents_one_by_one(d, s, floor)
+                         for s in STATES for d in rows)
+    ok &= mismatches == 0
+    print(f"[Bench] {len(rows) * len(STATES):,} probes with features: "
+          f"{mismatches} mismatches vs. agents one by one")
+
+    rng = np.random.default_rng(7)
+    lookups = rng.uniform(0.0, 45.0, n_lookups).tolist()
+    states = [STATES[i] for i in rng.integers(0, len(STATES), n_lookups).tolist()]
+    rows = [{"sol_price": p} for p in lookups]
+    with quiet():
+        t0 = time.perf_counter()
+        slow = [agents_one_by_one(d, s, floor) for d, s in zip(rows, states)]
+        agents_s = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        fast = [table.decide(p, s) for p, s in zip(lookups, states)]
+        table_s = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        run = [synergy_conductor_run(d, s) for d, s in zip(rows, states)]
+        run_s = time.perf_counter() - t0
+    ok &= slow == fast == run
+    print(f"[Bench] agents one by one:      {n_lookups / agents_s:12,.0f} decisions/s")
+    print(f"[Bench] DecisionTable.decide:   {n_lookups / table_s:12,.0f} decisions/s ({agents_s / table_s:.1f}x)")
+    print(f"[Bench] synergy_conductor_run:  {n_lookups / run_s:12,.0f} decisions/s ({agents_s / run_s:.1f}x)")
+
+    t0 = time.perf_counter()
+    batch = synergy_conductor_run_batch(np.array(lookups), np.array(states))
+    batch_s = time.perf_counter() - t0
+    ok &= list(decode_decisions(batch)) == fast
+    print(f"[Bench] synergy_conductor_run_batch: {n_lookups / batch_s:,.0f} decisions/s "
+          f"(vectorized, for whole series; matches the table: {list(decode_decisions(batch)) == fast})")
+
+    ok &= hot_reload()
+    print(f"\n[Bench] {'OK' if ok else 'FAILED'}")
+    return ok
+
+if __name__ == "__main__":
+    sys.exit(0 if main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000) else 1)
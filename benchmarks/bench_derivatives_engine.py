@@ -0,0 +1,106 @@
+"""
+bench_derivatives_engine.py
+
+Exercises DERIVATIVES_ENGINE against the local SimulatedPerpVenue:
+ 1. per-tick risk batch (funding, margin ratio, liquidation price, distance)
+    for 10 .. 100k positions, vectorized update() vs a per-position loop;
+ 2. a scenario where a sharp SOL-PERP rally pushes a leveraged short
+    towards liquidation and the kill switch's liquidation_distance rule trips.
+
+Run from the repo root:
+    python -m benchmarks.bench_derivatives_engine [n_ticks]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+import core.derivatives_engine.derivatives_engine as derivatives
+from core.derivatives_engine.derivatives_engine import DerivativesEngine
+from core.derivatives_engine.sim_perp_venue import SimulatedPerpVenue
+from core.reflection_engine.trade_history import TradeHistory
+import security.kill_switch as kill_switch
+from security.kill_switch import check_kill_switch_conditions
+from security.kill_switch_rules import KillSwitchEngine
+from core.log_core.log_core import quiet
+
+MARKETS = {f"PERP{i}": 10.0 + i for i in range(50)}
+
+def build(n_positions: int, rng):
+    venue = SimulatedPerpVenue(MARKETS, seed=3)
+    engine = DerivativesEngine(venue, maintenance_margin=0.05, leverage=5.0)
+    for _ in range(n_positions):
+        market = venue.markets[rng.integers(len(venue.markets))]
+        size = rng.uniform(0.5, 5.0) * (1 if rng.random() < 0.5 else -1)
+        engine.open_long(market, size) if size > 0 else engine.open_short(market, -size)
+    return venue, engine
+
+def loop_update(engine, marks, funding_index):
+    mm = engine.maintenance_margin
+    best = float("inf")
+    for pid in range(engine.n_slots):
+        if not engine.active[pid]:
+            continue
+        size = float(engine.size[pid])
+        mark = float(marks[engine.market[pid]])
+        funding = -size * (float(funding_index[engine.market[pid]]) - float(engine.funding_at_open[pid]))
+        base = float(engine.collateral[pid]) + funding
+        liq = (size * float(engine.entry_price[pid]) - base) / (size - abs(size) * mm)
+        distance = (1 if size > 0 else -1) * (mark - liq) / mark
+        best = min(best, distance)
+    return best
+
+def bench_batch(n_ticks: int):
+    rng = np.random.default_rng(1)
+    print(f"{'positions':>10} {'update() us':>12} {'loop us':>10} {'speedup':>8}")
+    for n_positions in (10, 100, 1_000, 10_000, 100_000):
+        venue, engine = build(n_positions, rng)
+        t0 = time.perf_counter()
+        for _ in range(n_ticks):
+            venue.step(1 / 3600)
+            engine.update()
+        vec_us = (time.perf_counter() - t0) / n_ticks * 1e6
+
+        loop_ticks = max(1, n_ticks // max(1, n_positions // 100))
+        t0 = time.perf_counter()
+        for _ in range(loop_ticks):
+            best = loop_update(engine, venue.mark_prices(), venue.funding_indices())
+        loop_us = (time.perf_counter() - t0) / loop_ticks * 1e6
+
+        assert abs(best - engine.update()) < 1e-9
+        print(f"{n_positions:>10} {vec_us:>12.1f} {loop_us:>10.1f} {loop_us / vec_us:>7.1f}x")
+
+def liquidation_scenario():
+    venue = SimulatedPerpVenue({"SOL-PERP": 20.0}, funding_rate_per_hour=-0.001, volatility=0.0)
+    engine = DerivativesEngine(venue, maintenance_margin=0.05, leverage=5.0)
+    derivatives.derivatives_engine = engine
+    # The rule is opt-in in parameters.json; enable it for this scenario
+    kill_switch.kill_switch_engine = KillSwitchEngine(
+        [{"name": "liquidation_distance", "type": "liquidation_distance", "min_distance": 0.05}])
+    history = TradeHistory(capacity=1_000, pnl_windows=(5,))
+
+    pid = engine.open_short("SOL-PERP", 10.0)
+    print(f"\n[Scenario] short 10 SOL-PERP @ {engine.entry_price[pid]:.2f}, collateral {engine.collateral[pid]:.2f}")
+    for tick in range(1, 200):
+        venue.step(1.0, shocks=np.array([0.005]))   # +0.5% per hour, shorts pay funding
+        distance = engine.update()
+        history.append(float(tick), "HOLD", float(venue.marks[0]), 0.0)
+        with quiet():
+            halted = check_kill_switch_conditions(history)
+        if halted:
+            print(f"[Scenario] tick {tick}: mark {venue.marks[0]:.2f}, liq {engine.liq_price[pid]:.2f}, "
+                  f"margin ratio {engine.margin_ratio[pid]:.3f}, funding {engine.funding[pid]:.2f}, "
+                  f"distance {distance:.2%} -> KILL_SWITCH tripped")
+            break
+    else:
+        raise AssertionError("kill switch never tripped")
+    pnl = engine.close_short("SOL-PERP")
+    print(f"[Scenario] close_short realized {pnl:.2f}; {engine.snapshot()}")
+
+def main(n_ticks: int = 200):
+    bench_batch(n_ticks)
+    liquidation_scenario()
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,88 @@
+"""
+bench_event_bus.py
+
+Alert-to-reaction latency: a producer thread publishes whale alerts at random
+moments; compare a consumer that polls a shared flag once per cycle (the old
+main.py pattern, scaled down to a 0.5s cycle) with blocking and asyncio
+event-bus subscribers.
+
+Run from the repo root:
+    python -m benchmarks.bench_event_bus [n_alerts]
+"""
+
+import asyncio
+import random
+import statistics
+import sys
+import threading
+import time
+
+from core.concurrency_manager.event_bus import EventBus, event_latency
+
+POLL_CYCLE_S = 0.5
+
+def summarize(label, latencies):
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(f"[Bench] {label:22s} p50={statistics.median(ordered) * 1000:8.3f}ms "
+          f"p99={p99 * 1000:8.3f}ms max={ordered[-1] * 1000:8.3f}ms")
+
+def producer(publish, n_alerts, seed=3):
+    rng = random.Random(seed)
+    for _ in range(n_alerts):
+        time.sleep(rng.uniform(0.01, 0.05))
+        publish()
+
+def bench_polling(n_alerts):
+    pending = []   # alert times, appended by the producer, drained once per cycle
+    latencies = []
+
+    t = threading.Thread(target=producer, args=(lambda: pending.append(time.perf_counter()), n_alerts))
+    t.start()
+    while t.is_alive() or pending:
+        now = time.perf_counter()
+        while pending:
+            latencies.append(now - pending.pop(0))
+        time.sleep(POLL_CYCLE_S)
+    summarize(f"polling ({POLL_CYCLE_S}s cycle)", latencies)
+
+def bench_thread_subscriber(n_alerts):
+    bus = EventBus()
+    sub = bus.subscribe("whale_alert")
+    latencies = []
+    t = threading.Thread(target=producer, args=(lambda: bus.publish("whale_alert", {"whale_alert": True}), n_alerts))
+    t.start()
+    while len(latencies) < n_alerts:
+        event = sub.get(timeout=1.0)
+        if event is not None:
+            latencies.append(event_latency(event))
+    t.join()
+    summarize("bus: thread subscriber", latencies)
+
+async def bench_async_subscriber(n_alerts):
+    bus = EventBus()
+    sub = bus.subscribe_async("whale_alert")
+    latencies = []
+    t = threading.Thread(target=producer, args=(lambda: bus.publish("whale_alert", {"whale_alert": True}), n_alerts))
+    t.start()
+    async for event in sub:
+        latencies.append(event_latency(event))
+        if len(latencies) == n_alerts:
+            break
+    t.join()
+    summarize("bus: asyncio subscriber", latencies)
+
+def bench_publish_cost(n_events=200_000):
+    bus = EventBus()
+    bus.subscribe("whale_alert", maxlen=1024)
+    t0 = time.perf_counter()
+    for _ in range(n_events):
+        bus.publish("whale_alert", None)
+    print(f"[Bench] publish cost (1 subscriber): {(time.perf_counter() - t0) / n_events * 1e6:.2f} us/event")
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    bench_polling(n)
+    bench_thread_subscriber(n)
+    asyncio.run(bench_async_subscriber(n))
+    bench_publish_cost()
@@ -0,0 +1,130 @@
+"""
+bench_indicators.py
+
+Streaming FeatureEngine vs. recomputing the same features over their
+windows every tick, across universe sizes. Also checks:
+  - streaming features (with missing ticks) match a from-scratch
+    recomputation over each symbol's observed history
+  - warm_up() from history matches replaying it tick by tick
+and reports the multi-factor compute_score_batch cost per tick.
+
+Run from the repo root:
+    python -m benchmarks.bench_indicators [n_ticks]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from core.scoring_engine.features import FeatureEngine, FEATURE_NAMES
+from core.scoring_engine.scoring_engine import compute_score_batch
+
+FAST, SLOW, WINDOW = 12, 26, 50
+
+def random_walk(n_ticks: int, n_symbols: int, rng, gap_fraction: float = 0.0):
+    prices = 20.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, (n_ticks, n_symbols)), axis=0))
+    volumes = rng.lognormal(10.0, 1.0, (n_ticks, n_symbols))
+    if gap_fraction:
+        prices[rng.random(prices.shape) < gap_fraction] = np.nan
+    return prices, volumes
+
+def reference_features(prices, volumes) -> dict:
+    """
+    Features of every symbol recomputed from scratch: EMAs over all its
+    observations, rolling features over the observations in the last WINDOW
+    ticks (returns are between consecutive observations).
+    """
+    ref = {name: np.full(prices.shape[1], np.nan) for name in FEATURE_NAMES}
+    recent = np.arange(len(prices)) >= len(prices) - WINDOW
+    for j in range(prices.shape[1]):
+        seen = ~np.isnan(prices[:, j])
+        p, v, in_window = prices[seen, j], volumes[seen, j], recent[seen]
+        for name, span in (("ema_fast", FAST), ("ema_slow", SLOW)):
+            alpha = 2.0 / (span + 1.0)
+            ema = p[0]
+            for x in p[1:]:
+                ema += alpha * (x - ema)
+            ref[name][j] = ema
+        window = p[in_window]
+        ref["zscore"][j] = (p[-1] - window.mean()) / window.std()
+        ref["volatility"][j] = np.diff(np.log(p))[in_window[1:]].std()
+        ref["vwap"][j] = (window * v[in_window]).sum() / v[in_window].sum()
+    return ref
+
+def max_rel_error(a: dict, b: dict) -> float:
+    return max(float(np.max(np.abs(a[k] - b[k]) / np.maximum(np.abs(b[k]), 1e-12))) for k in FEATURE_NAMES)
+
+def check_correctness(rng) -> bool:
+    n_ticks, n_symbols = 3_000, 40
+    prices, volumes = random_walk(n_ticks, n_symbols, rng, gap_fraction=0.2)
+    engine = FeatureEngine(FAST, SLOW, WINDOW)
+    engine.register_symbols(range(n_symbols))
+    for t in range(n_ticks):
+        engine.update(prices[t], volumes[t])
+    streaming_err = max_rel_error(engine.features(), reference_features(prices, volumes))
+
+    clean, clean_volumes = random_walk(n_ticks, n_symbols, rng)
+    replayed = FeatureEngine(FAST, SLOW, WINDOW)
+    replayed.register_symbols(range(n_symbols))
+    for t in range(n_ticks):
+        replayed.update(clean[t], clean_volumes[t])
+    warmed = FeatureEngine(FAST, SLOW, WINDOW)
+    warmed.warm_up(clean, clean_volumes, symbols=range(n_symbols))
+    warm_up_err = max_rel_error(warmed.features(), replayed.features())
+
+    print(f"[Bench] streaming vs. recomputed: max rel. error {streaming_err:.2e}")
+    print(f"[Bench] warm_up vs. replay:       max rel. error {warm_up_err:.2e}")
+    return streaming_err < 1e-8 and warm_up_err < 1e-8
+
+def recompute_tick(history, volume_history):
+    """Naive per-tick features: rescan the last SLOW*4 / WINDOW ticks of every symbol."""
+    p = history[-WINDOW:]
+    v = volume_history[-WINDOW:]
+    features = {}
+    for name, span in (("ema_fast", FAST), ("ema_slow", SLOW)):
+        alpha = 2.0 / (span + 1.0)
+        tail = history[-4 * span:]
+        weights = alpha * (1.0 - alpha) ** np.arange(len(tail) - 1, -1, -1)
+        features[name] = weights @ tail / weights.sum()
+    features["zscore"] = (p[-1] - p.mean(axis=0)) / p.std(axis=0)
+    features["volatility"] = np.diff(np.log(history[-WINDOW - 1:]), axis=0).std(axis=0)
+    features["vwap"] = (p * v).sum(axis=0) / v.sum(axis=0)
+    return features
+
+def main(n_ticks: int = 200):
+    rng = np.random.default_rng(18)
+    ok = check_correctness(rng)
+
+    print(f"\n{'symbols':>8} {'streaming us/tick':>18} {'recompute us/tick':>18} {'speedup':>8} {'score us/tick':>14}")
+    for n_symbols in (1, 100, 1_000, 10_000, 100_000):
+        prices, volumes = random_walk(n_ticks + 4 * SLOW, n_symbols, rng)
+        engine = FeatureEngine(FAST, SLOW, WINDOW, initial_capacity=n_symbols)
+        engine.register_symbols(range(n_symbols))
+        engine.warm_up(prices[:4 * SLOW], volumes[:4 * SLOW])
+        live = prices[4 * SLOW:]
+
+        t0 = time.perf_counter()
+        for t in range(n_ticks):
+            features = engine.update(live[t], volumes[4 * SLOW + t])
+        stream_us = (time.perf_counter() - t0) / n_ticks * 1e6
+
+        t0 = time.perf_counter()
+        for t in range(n_ticks):
+            end = 4 * SLOW + t + 1
+            recompute_tick(prices[:end], volumes[:end])
+        recompute_us = (time.perf_counter() - t0) / n_ticks * 1e6
+
+        t0 = time.perf_counter()
+        for t in range(n_ticks):
+            compute_score_batch(live[t], features)
+        score_us = (time.perf_counter() - t0) / n_ticks * 1e6
+
+        print(f"{n_symbols:>8} {stream_us:>18.1f} {recompute_us:>18.1f} "
+              f"{recompute_us / stream_us:>7.1f}x {score_us:>14.1f}")
+
+    print(f"\n[Bench] {'OK' if ok else 'FAILED: features diverge from the reference'}")
+    return ok
+
+if __name__ == "__main__":
+    sys.exit(0 if main(int(sys.argv[1]) if len(sys.argv) > 1 else 200) else 1)
@@ -0,0 +1,65 @@
+"""
+bench_kill_switch.py
+
+Per-cycle cost of check_kill_switch_conditions with 1 vs 50 incremental
+rules, next to the old "slice the last 5 trades and sum them" check.
+
+Run from the repo root:
+    python -m benchmarks.bench_kill_switch [n_cycles]
+"""
+
+import random
+import sys
+import time
+
+import security.kill_switch as kill_switch
+from security.kill_switch import check_kill_switch_conditions
+from security.kill_switch_rules import KillSwitchEngine
+from core.reflection_engine.trade_history import TradeHistory
+from core.log_core.log_core import quiet
+
+def fifty_rules():
+    """50 loose limits across every rule type, so nothing trips mid-benchmark."""
+    rules = []
+    for i in range(20):
+        rules.append({"name": f"pnl_{i}", "type": "window_pnl", "window": 5 + i * 25, "min_pnl": -1e12})
+    for i in range(10):
+        rules.append({"name": f"dd_{i}", "type": "drawdown", "max_drawdown": 1e12})
+    for i in range(10):
+        rules.append({"name": f"streak_{i}", "type": "loss_streak", "max_streak": 10**9})
+    for i in range(5):
+        rules.append({"name": f"exp_{i}", "type": "exposure", "symbol": "SOL", "max_abs_exposure": 1e15})
+    for i in range(5):
+        rules.append({"name": f"rate_{i}", "type": "trade_rate", "window_s": 10.0 * (i + 1), "max_trades": 10**9})
+    return rules
+
+def old_check(trade_history):
+    recent_trades = trade_history[-5:] if len(trade_history) >= 5 else trade_history
+    return sum(t["profit_loss"] for t in recent_trades) < -50
+
+def time_cycles(check, history, n_cycles):
+    rng = random.Random(5)
+    elapsed = 0.0
+    for i in range(n_cycles):
+        pnl = rng.choice((5.0, -10.0, 2.5, -1.0))
+        decision = "BUY" if pnl > 0 else "HOLD"
+        if isinstance(history, list):
+            history.append({"timestamp": float(i), "decision": decision, "sol_price": 20.0, "profit_loss": pnl})
+        else:
+            history.append(float(i), decision, 20.0, pnl)
+        t0 = time.perf_counter()
+        check(history)
+        elapsed += time.perf_counter() - t0
+    return elapsed / n_cycles * 1e6
+
+def main(n_cycles: int = 100_000):
+    print(f"[Bench] old list slice + sum (1 rule):    {time_cycles(old_check, [], n_cycles):.2f} us/cycle")
+
+    with quiet():
+        for label, specs in (("1 rule", kill_switch.DEFAULT_RULES), ("50 rules", fifty_rules())):
+            kill_switch.kill_switch_engine = KillSwitchEngine(specs)
+            us = time_cycles(check_kill_switch_conditions, TradeHistory(capacity=10_000, pnl_windows=(5,)), n_cycles)
+            print(f"[Bench] incremental engine ({label}):{' ' * (10 - len(label))}{us:.2f} us/cycle")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
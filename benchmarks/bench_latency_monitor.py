@@ -0,0 +1,77 @@
+"""
+bench_latency_monitor.py
+
+1. Overhead per call of an instrumented no-op stage: plain call vs
+   LatencyMonitor disabled (instrument() returns the function) vs enabled,
+   and the begin()/end() pair in both states.
+2. Accuracy of HdrHistogram percentiles against exact NumPy percentiles on
+   a heavy-tailed (lognormal) latency sample.
+3. The local HTTP endpoint returns the same snapshot.
+
+Run from the repo root:
+    python -m benchmarks.bench_latency_monitor [n_calls]
+"""
+
+import json
+import sys
+import time
+import urllib.request
+
+import numpy as np
+
+from core.latency_monitor.latency_monitor import LatencyMonitor
+from core.latency_monitor.hdr_histogram import HdrHistogram
+
+def stage(x):
+    return x
+
+def per_call_ns(fn, n_calls: int) -> float:
+    t0 = time.perf_counter_ns()
+    for i in range(n_calls):
+        fn(i)
+    return (time.perf_counter_ns() - t0) / n_calls
+
+def begin_end_ns(monitor: LatencyMonitor, n_calls: int) -> float:
+    begin, end = monitor.begin, monitor.end
+    t0 = time.perf_counter_ns()
+    for i in range(n_calls):
+        t = begin()
+        stage(i)
+        end("stage", t)
+    return (time.perf_counter_ns() - t0) / n_calls
+
+def main(n_calls: int = 1_000_000):
+    plain = per_call_ns(stage, n_calls)
+    disabled = LatencyMonitor(enabled=False)
+    enabled = LatencyMonitor(enabled=True)
+    print(f"[Bench] plain call:            {plain:7.1f} ns")
+    print(f"[Bench] instrument (disabled): {per_call_ns(disabled.instrument(stage), n_calls) - plain:+7.1f} ns overhead")
+    print(f"[Bench] instrument (enabled):  {per_call_ns(enabled.instrument(stage), n_calls) - plain:+7.1f} ns overhead")
+    print(f"[Bench] begin/end (disabled):  {begin_end_ns(disabled, n_calls) - plain:+7.1f} ns overhead")
+    print(f"[Bench] begin/end (enabled):   {begin_end_ns(enabled, n_calls) - plain:+7.1f} ns overhead")
+
+    rng = np.random.default_rng(4)
+    samples = (rng.lognormal(np.log(200_000), 1.0, 200_000)).astype(np.int64)   # ~200 us median, long tail
+    hist = HdrHistogram()
+    for value in samples.tolist():
+        hist.record(value)
+    quantiles = (0.5, 0.9, 0.99, 0.999)
+    exact = np.percentile(samples, [q * 100 for q in quantiles], method="inverted_cdf")
+    print(f"\n[Bench] histogram: {hist.n_buckets} buckets, {hist.counts.nbytes / 1024:.1f} KB, {hist.total} samples")
+    worst = 0.0
+    for q, approx, true in zip(quantiles, hist.percentiles(quantiles), exact):
+        error = (approx - true) / true
+        worst = max(worst, abs(error))
+        print(f"[Bench]   p{q * 100:g}: hdr {approx / 1000:9.1f} us  exact {true / 1000:9.1f} us  error {error:+.3%}")
+    assert worst <= 1 / hist.half, "percentile error above the configured precision"
+
+    enabled.histograms["stage"].merge(hist)
+    host, port = enabled.serve_http(0)
+    with urllib.request.urlopen(f"http://{host}:{port}/latency", timeout=5) as reply:
+        served = json.loads(reply.read())["stages"]
+    enabled.stop()
+    assert served == enabled.snapshot()
+    print(f"\n[Bench] GET /latency -> {served['stage']}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
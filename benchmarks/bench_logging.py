@@ -0,0 +1,99 @@
+"""
+bench_logging.py
+
+Cycle time of the decision path (synergy_conductor_run + mock
+execute_trade) when stdout is a slow pipe, for:
+  - before: every message formatted and written synchronously by the caller
+    (what print() did), including the per-cycle score line
+  - after:  queue-backed logging at INFO (score line filtered out, the rest
+    written by the background writer thread)
+  - after:  queue-backed logging at WARNING (everything filtered)
+plus the raw per-call cost of a filtered vs an enqueued log call.
+
+The pipe's reader drains only ~64 KB/s, so a synchronous writer stalls as
+soon as the OS pipe buffer fills.
+
+Run from the repo root:
+    python -m benchmarks.bench_logging [n_cycles]
+"""
+
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+import pipelines.execution_engine as execution_engine
+from agents.synergy_conductor import synergy_conductor_run
+from core.log_core.log_core import configure_logging, get_logger, log_stats, shutdown_logging
+
+def slow_pipe(bytes_per_s: int = 64 * 1024):
+    """Writable text stream whose reader drains at most bytes_per_s."""
+    read_fd, write_fd = os.pipe()
+    fast_forward = threading.Event()
+
+    def drain():
+        chunk = 4096
+        while True:
+            data = os.read(read_fd, chunk)
+            if not data:
+                return
+            if not fast_forward.is_set():
+                time.sleep(len(data) / bytes_per_s)
+
+    threading.Thread(target=drain, daemon=True).start()
+    return os.fdopen(write_fd, "w", buffering=1), fast_forward
+
+def run_cycles(n_cycles: int):
+    latencies = np.empty(n_cycles)
+    market_data = {"sol_price": 12.0}
+    for i in range(n_cycles):
+        t0 = time.perf_counter()
+        decision = synergy_conductor_run(market_data, "rage")
+        execution_engine.execute_trade(decision)
+        latencies[i] = time.perf_counter() - t0
+    return latencies * 1e6
+
+def per_call_ns(fn, n_calls: int = 200_000) -> float:
+    t0 = time.perf_counter_ns()
+    for i in range(n_calls):
+        fn("value %s", i)
+    return (time.perf_counter_ns() - t0) / n_calls
+
+def main(n_cycles: int = 20_000):
+    execution_engine.MODE = "mock"
+    scenarios = (
+        ("before: synchronous writes", {"sync": True, "level": "DEBUG"}),
+        ("after: queue, INFO", {"level": "INFO", "queue_size": 10_000}),
+        ("after: queue, WARNING", {"level": "WARNING", "queue_size": 10_000})
+    )
+    results = []
+    for label, params in scenarios:
+        stream, fast_forward = slow_pipe()
+        configure_logging(params, stream=stream)
+        log_stats["dropped"] = 0
+        cycle_us = run_cycles(n_cycles)
+        dropped = log_stats["dropped"]
+        results.append((label, cycle_us, dropped))
+        fast_forward.set()
+        shutdown_logging()
+        stream.close()
+
+    print(f"[Bench] {n_cycles} cycles, stdout = pipe drained at 64 KB/s")
+    print(f"{'scenario':<28} {'mean us':>9} {'p50 us':>9} {'p99 us':>9} {'max us':>10} {'dropped':>8}")
+    for label, cycle_us, dropped in results:
+        print(f"{label:<28} {cycle_us.mean():>9.1f} {np.percentile(cycle_us, 50):>9.1f} "
+              f"{np.percentile(cycle_us, 99):>9.1f} {cycle_us.max():>10.1f} {dropped:>8}")
+
+    devnull = open(os.devnull, "w")
+    configure_logging({"level": "INFO", "queue_size": 1_000_000}, stream=devnull)
+    logger = get_logger("Bench")
+    print(f"\n[Bench] print() to /dev/null:  {per_call_ns(lambda m, i: print(f'[Bench] value {i}', file=devnull)):7.0f} ns/call")
+    print(f"[Bench] filtered logger.debug: {per_call_ns(logger.debug):7.0f} ns/call")
+    print(f"[Bench] enqueued logger.info:  {per_call_ns(logger.info):7.0f} ns/call (incl. background write)")
+    shutdown_logging()
+    devnull.close()
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
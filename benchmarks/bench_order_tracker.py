@@ -0,0 +1,58 @@
+"""
+bench_order_tracker.py
+
+Trading-loop cost of placing an order: the old blocking pattern (submit,
+sleep 2s, check) versus OrderTracker.submit, with confirmations tracked in
+the background against the local fake RPC server (signatures confirm after
+a few status polls).
+
+Run from the repo root:
+    python -m benchmarks.bench_order_tracker [n_orders]
+"""
+
+import sys
+import time
+
+from pipelines.order_tracker import OrderTracker
+from security.rpc_session import RpcSession
+from benchmarks.fake_rpc_server import start_fake_rpc_server
+
+PUBKEY = "FakePubkey1111111111111111111111111111111111"
+OLD_CONFIRM_SLEEP_S = 2.0
+
+def main(n_orders: int = 200):
+    server, url, state = start_fake_rpc_server(confirm_after=2)
+    rpc = RpcSession(url)
+    fills = []
+
+    tracker = OrderTracker(
+        submit_fn=lambda decision: rpc.request_airdrop(PUBKEY, 10**9),
+        status_fn=rpc.get_signature_statuses,
+        on_fill=fills.append,
+        poll_initial_s=0.05,
+        timeout_s=5.0
+    )
+
+    t0 = time.perf_counter()
+    for i in range(n_orders):
+        tracker.submit("BUY" if i % 2 else "SELL")
+    loop_us = (time.perf_counter() - t0) / n_orders * 1e6
+    peak_in_flight = tracker.stats()["queued"] + tracker.stats()["in_flight"]
+
+    tracker.close(timeout=30)
+    stats = tracker.stats()
+    server.shutdown()
+
+    print(f"[Bench] old blocking execute:   >= {OLD_CONFIRM_SLEEP_S * 1000:.0f} ms of loop time per order")
+    print(f"[Bench] OrderTracker.submit:    {loop_us:.1f} us of loop time per order")
+    print(f"[Bench] orders pending right after submitting: {peak_in_flight}")
+    print(f"[Bench] fills: {len(fills)}, confirmed={stats['confirmed']} timeouts={stats['timeouts']} "
+          f"failed={stats['failed']} submit_errors={stats['submit_errors']}")
+    if stats["confirm_p50_s"] is None:
+        print("[Bench] confirmation latency: no order confirmed")
+    else:
+        print(f"[Bench] confirmation latency p50={stats['confirm_p50_s'] * 1000:.1f}ms "
+              f"max={stats['confirm_max_s'] * 1000:.1f}ms")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,84 @@
+"""
+bench_param_optimizer.py
+
+ParamOptimizer over a synthetic trade history:
+  - serial (workers=0) vs process-pool search of every candidate
+    (results must be identical)
+  - the same search again: every run is a cache hit
+  - a tight time budget: partial ranking returned on time, late chunks
+    cached in the background
+plus the suggested patch and its evidence.
+
+Run from the repo root:
+    python -m benchmarks.bench_param_optimizer [n_ticks]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from core.patch_core.param_optimizer import build_param_optimizer, DEFAULTS
+from config.config_loader import load_parameters
+
+def make_history(n_ticks: int, seed: int = 19) -> dict:
+    rng = np.random.default_rng(seed)
+    prices = 20.0 + np.cumsum(rng.normal(0.0, 0.05, n_ticks))
+    prices += 4.0 * np.sin(np.arange(n_ticks) / 150.0)
+    return {"timestamp": 1.7e9 + 3.0 * np.arange(n_ticks), "sol_price": prices}
+
+def main(n_ticks: int = 2000):
+    config = {**DEFAULTS, **load_parameters("patch_core").get("optimizer", {})}
+    history = make_history(n_ticks)
+    ok = True
+
+    serial = build_param_optimizer({**config, "workers": 0})
+    t0 = time.perf_counter()
+    serial_patch = serial.optimize(history, budget_s=600.0)
+    serial_s = time.perf_counter() - t0
+
+    pooled = build_param_optimizer({**config, "workers": None})
+    pooled._get_pool().submit(int).result()     # start the workers outside the timing
+    t0 = time.perf_counter()
+    pooled_patch = pooled.optimize(history, budget_s=600.0)
+    pooled_s = time.perf_counter() - t0
+    same = [r["objective"] for r in serial_patch["ranked"]] == [r["objective"] for r in pooled_patch["ranked"]]
+    ok &= same and serial_patch["param_changes"] == pooled_patch["param_changes"]
+
+    t0 = time.perf_counter()
+    cached_patch = pooled.optimize(history, budget_s=600.0)
+    cached_s = time.perf_counter() - t0
+    ok &= cached_patch["cache_hits"] == cached_patch["candidates"]
+
+    budget_s = serial_s / 10
+    tight = build_param_optimizer({**config, "workers": None})
+    tight._get_pool().submit(int).result()
+    t0 = time.perf_counter()
+    tight_patch = tight.optimize(history, budget_s=budget_s)
+    tight_s = time.perf_counter() - t0
+    ok &= tight_s < budget_s + 0.1
+    time.sleep(serial_s + 0.5)          # let late chunks finish into the cache
+    late_patch = tight.optimize(history, budget_s=600.0)
+
+    n = serial_patch["candidates"]
+    print(f"[Bench] history: {n_ticks} ticks, {n} candidates")
+    print(f"[Bench] serial search:        {serial_s * 1000:8.1f} ms ({serial_s / n * 1000:.2f} ms/replay)")
+    print(f"[Bench] process pool search:  {pooled_s * 1000:8.1f} ms (results identical: {same})")
+    print(f"[Bench] repeat (memoized):    {cached_s * 1000:8.1f} ms ({cached_patch['cache_hits']} cache hits)")
+    print(f"[Bench] {budget_s * 1000:.0f} ms budget:          {tight_s * 1000:8.1f} ms, "
+          f"{tight_patch['evaluated']}/{n} ranked, {tight_patch['timed_out']} over budget; "
+          f"next request: {late_patch['cache_hits']} cache hits")
+    print(f"\n[Bench] suggestion: {serial_patch['param_changes'] or 'keep current parameters'}")
+    print(f"[Bench] {serial_patch['reason']}")
+    for label in ("baseline", "best"):
+        m = serial_patch[label]
+        print(f"[Bench]   {label:<8} objective {m['objective']:9.2f}  pnl {m['pnl']:9.2f}  "
+              f"max drawdown {m['max_drawdown']:8.2f}  trades {m['trades']:5d}  halted at {m['halted_at']}")
+
+    for optimizer in (pooled, tight):
+        optimizer.shutdown()
+    print(f"\n[Bench] {'OK' if ok else 'FAILED'}")
+    return ok
+
+if __name__ == "__main__":
+    sys.exit(0 if main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000) else 1)
@@ -0,0 +1,64 @@
+"""
+bench_position_manager.py
+
+Mark-to-market time against position count: one vectorized
+PositionManager.mark_to_market pass vs. a per-position Python loop over
+dict positions (the shape a naive book would use).
+
+Run from the repo root:
+    python -m benchmarks.bench_position_manager [n_rounds]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from pipelines.position_manager import PositionManager
+
+def build_book(n_symbols: int, rng):
+    book = PositionManager()
+    prices = rng.uniform(1.0, 500.0, n_symbols)
+    quantities = rng.choice((-3.0, -1.0, 1.0, 2.0, 5.0), n_symbols)
+    for i in range(n_symbols):
+        book.apply_fill(f"SYM{i}", quantities[i], prices[i])
+    return book, prices
+
+def loop_mark(positions, prices):
+    total = 0.0
+    for i, pos in enumerate(positions):
+        pos["unrealized"] = pos["qty"] * (prices[i] - pos["avg_price"])
+        total += pos["unrealized"]
+    return total
+
+def main(n_rounds: int = 200):
+    rng = np.random.default_rng(12)
+    print(f"{'positions':>10} {'vectorized us':>14} {'+exposure us':>13} {'dict loop us':>13} {'speedup':>8}")
+    for n_symbols in (10, 100, 1_000, 10_000, 100_000):
+        book, prices = build_book(n_symbols, rng)
+        ticks = [prices * rng.normal(1.0, 0.001, n_symbols) for _ in range(8)]
+        positions = [book.position(s) for s in book.symbols]
+        tick_lists = [t.tolist() for t in ticks]
+
+        t0 = time.perf_counter()
+        for r in range(n_rounds):
+            book.mark_to_market(ticks[r % 8])
+        vec_us = (time.perf_counter() - t0) / n_rounds * 1e6
+
+        t0 = time.perf_counter()
+        for r in range(n_rounds):
+            book.mark_to_market(ticks[r % 8])
+            book.exposure()
+        exp_us = (time.perf_counter() - t0) / n_rounds * 1e6
+
+        loop_rounds = max(1, n_rounds // max(1, n_symbols // 1000))
+        t0 = time.perf_counter()
+        for r in range(loop_rounds):
+            loop_mark(positions, tick_lists[r % 8])
+        loop_us = (time.perf_counter() - t0) / loop_rounds * 1e6
+
+        assert abs(book.mark_to_market(ticks[0]) - loop_mark(positions, tick_lists[0])) < 1e-6 * n_symbols
+        print(f"{n_symbols:>10} {vec_us:>14.1f} {exp_us:>13.1f} {loop_us:>13.1f} {loop_us / vec_us:>7.1f}x")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,62 @@
+"""
+bench_quote_cache.py
+
+Shows the saving of the shared QuoteCache: many threads (and asyncio tasks)
+asking for the same symbol with a slow fetch behind it. Reports fetches
+actually made vs lookups, plus hit/miss/coalesce counters.
+
+Run from the repo root:
+    python -m benchmarks.bench_quote_cache
+"""
+
+import asyncio
+import threading
+import time
+
+from pipelines.quote_cache import QuoteCache
+
+FETCH_DELAY_S = 0.05
+
+def bench_threads(n_threads: int = 16, calls_per_thread: int = 50):
+    cache = QuoteCache(ttl_s=0.2, max_staleness_s=5.0)
+    fetches = [0]
+
+    def slow_fetch():
+        fetches[0] += 1
+        time.sleep(FETCH_DELAY_S)
+        return {"sol_price": 20.0, "timestamp": time.time()}
+
+    def worker():
+        for _ in range(calls_per_thread):
+            cache.get("SOL", slow_fetch)
+            time.sleep(0.005)
+
+    t0 = time.perf_counter()
+    threads = [threading.Thread(target=worker) for _ in range(n_threads)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - t0
+
+    lookups = n_threads * calls_per_thread
+    print(f"[Bench] threads: {lookups} lookups -> {fetches[0]} fetches in {elapsed:.2f}s "
+          f"(uncached would need {lookups * FETCH_DELAY_S:.1f}s of fetches)")
+    print(f"[Bench] threads stats: {cache.snapshot_stats()}")
+
+async def bench_asyncio(n_tasks: int = 200):
+    cache = QuoteCache(ttl_s=0.2, max_staleness_s=5.0)
+    fetches = [0]
+
+    async def slow_fetch():
+        fetches[0] += 1
+        await asyncio.sleep(FETCH_DELAY_S)
+        return {"sol_price": 20.0, "timestamp": time.time()}
+
+    await asyncio.gather(*(cache.aget("SOL", slow_fetch) for _ in range(n_tasks)))
+    print(f"[Bench] asyncio: {n_tasks} concurrent lookups -> {fetches[0]} fetches")
+    print(f"[Bench] asyncio stats: {cache.snapshot_stats()}")
+
+if __name__ == "__main__":
+    bench_threads()
+    asyncio.run(bench_asyncio())
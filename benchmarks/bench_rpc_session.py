@@ -0,0 +1,108 @@
+"""
+bench_rpc_session.py
+
+Per-order overhead of the execution path against the local fake RPC server:
+the old pattern (load_keypair re-reads/parses the keyfile, fresh HTTP
+connection per call, separate balance call) versus the shipped path:
+get_wallet()'s cached keypair + the pooled get_rpc_session() with balance
+and status batched into one round trip. Also checks the caching itself:
+  - get_wallet / get_solana_client return the same object on every call
+  - a keyfile that fails to load raises and is not cached; the next call
+    retries it
+  - without a keyfile, every call gets the same ephemeral key
+
+Needs solders / solana installed (the wallet functions import them).
+
+Run from the repo root:
+    python -m benchmarks.bench_rpc_session [n_orders]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+import requests
+from solders.keypair import Keypair
+
+from security.rpc_session import get_rpc_session, close_rpc_sessions
+from security.secure_wallet import load_keypair, get_wallet, get_solana_client, clear_wallet_cache
+from benchmarks.fake_rpc_server import start_fake_rpc_server
+from core.log_core.log_core import quiet
+
+def old_order(url: str, keyfile: str):
+    pubkey = str(load_keypair(keyfile).pubkey())
+    sig = requests.post(url, json={"jsonrpc": "2.0", "id": 1, "method": "requestAirdrop",
+                                   "params": [pubkey, 10**9]}, timeout=5).json()["result"]
+    requests.post(url, json={"jsonrpc": "2.0", "id": 2, "method": "getBalance",
+                             "params": [pubkey]}, timeout=5).json()
+    return sig
+
+def new_order(url: str, keyfile: str):
+    pubkey = str(get_wallet(keyfile).pubkey())
+    rpc = get_rpc_session(url=url)
+    sig = rpc.request_airdrop(pubkey, 10**9)
+    rpc.balance_and_statuses(pubkey, [sig])
+    return sig
+
+def write_keyfile(path: str, secret):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(secret, f)
+
+def check_caching(tmp: str) -> bool:
+    """Cached objects are reused; a broken keyfile raises and is retried; a missing one pins one key."""
+    ok = get_solana_client("devnet") is get_solana_client("devnet")
+
+    secret = list(bytes(Keypair()))
+    keyfile = os.path.join(tmp, "flaky.json")
+    with open(keyfile, "w", encoding="utf-8") as f:
+        f.write("[1, 2,")   # caught mid-write
+    try:
+        get_wallet(keyfile)
+        ok = False
+    except ValueError:
+        pass
+    write_keyfile(keyfile, secret)
+    second = get_wallet(keyfile)
+    ok &= bytes(second) == bytes(secret) and get_wallet(keyfile) is second
+
+    missing = os.path.join(tmp, "missing.json")
+    with quiet():
+        ephemeral = get_wallet(missing)
+    ok &= get_wallet(missing) is ephemeral
+    print(f"[Bench] caching: client reused, failed keyfile read raised then retried, "
+          f"loaded key reused, one ephemeral key without a keyfile: {ok}")
+    return ok
+
+def main(n_orders: int = 300):
+    server, url, state = start_fake_rpc_server()
+    with tempfile.TemporaryDirectory() as tmp:
+        keyfile = os.path.join(tmp, "id.json")
+        write_keyfile(keyfile, list(bytes(Keypair())))
+
+        t0 = time.perf_counter()
+        for _ in range(n_orders):
+            old_order(url, keyfile)
+        old_ms = (time.perf_counter() - t0) / n_orders * 1000
+
+        clear_wallet_cache()
+        requests_before = state.requests
+        t0 = time.perf_counter()
+        for _ in range(n_orders):
+            new_order(url, keyfile)
+        new_ms = (time.perf_counter() - t0) / n_orders * 1000
+        close_rpc_sessions()
+
+        ok = check_caching(tmp)
+
+    server.shutdown()
+    print(f"[Bench] old per-order overhead:    {old_ms:.3f} ms (keyfile parse, 2 HTTP requests, new connection each)")
+    print(f"[Bench] pooled + batched overhead: {new_ms:.3f} ms "
+          f"({(state.requests - requests_before) / n_orders:.0f} HTTP requests per order on reused connections)")
+    print(f"[Bench] speedup: {old_ms / new_ms:.1f}x")
+    print(f"\n[Bench] {'OK' if ok else 'FAILED'}")
+    return ok
+
+if __name__ == "__main__":
+    sys.exit(0 if main(int(sys.argv[1]) if len(sys.argv) > 1 else 300) else 1)
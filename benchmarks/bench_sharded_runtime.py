@@ -0,0 +1,116 @@
+"""
+bench_sharded_runtime.py
+
+ShardedRuntime throughput against one in-process StrategyShard over the
+same universe:
+  - every tick's per-symbol decisions match the single-process run
+    (features and decisions are per symbol, so sharding must not change
+    them)
+  - ticks/s and symbol-decisions/s for 1, 2, 4, ... workers, and the
+    efficiency against the single in-process run (what sharding buys
+    over not sharding, transport included) as well as against 1 worker
+    (scaling alone). Efficiency is only checked for worker counts the
+    machine has cores for.
+  - transport overhead per tick: wall time minus the time workers spent
+    in their shard's step()
+
+Run from the repo root:
+    python -m benchmarks.bench_sharded_runtime [n_symbols] [n_ticks]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+from core.concurrency_manager.sharded_runtime import ShardedRuntime, StrategyShard
+from pipelines.market_snapshot import MarketSnapshot
+
+# Loose limits: the rules run every tick but never halt a shard, so work per tick stays constant
+KILL_SWITCH_RULES = [
+    {"name": "pnl_last_20", "type": "window_pnl", "window": 20, "min_pnl": -1e15},
+    {"name": "drawdown", "type": "drawdown", "max_drawdown": 1e15},
+    {"name": "loss_streak", "type": "loss_streak", "max_streak": 1_000_000}
+]
+MIN_EFFICIENCY = 0.7
+INLINE_RUNS = 3
+
+def make_universe(n_symbols: int, n_ticks: int, seed: int = 25) -> tuple:
+    rng = np.random.default_rng(seed)
+    symbols = np.array([f"TOKEN{i}" for i in range(n_symbols)], dtype=object)
+    start = rng.uniform(10.0, 35.0, n_symbols)
+    prices = start * np.exp(np.cumsum(rng.normal(0.0, 0.01, (n_ticks, n_symbols)), axis=0))
+    volumes = rng.lognormal(8.0, 1.0, (n_ticks, n_symbols))
+    return symbols, prices, volumes
+
+def run_inline(symbols, prices, volumes) -> tuple:
+    shard = StrategyShard(symbols, kill_switch_rules=KILL_SWITCH_RULES)
+    decisions = np.empty(prices.shape, dtype=np.int8)
+    t0 = time.perf_counter()
+    for t in range(len(prices)):
+        decisions[t] = shard.step(1.7e9 + t, prices[t], volumes[t])[0]
+    return time.perf_counter() - t0, decisions
+
+def run_sharded(symbols, prices, volumes, n_workers: int) -> tuple:
+    runtime = ShardedRuntime(symbols, n_workers, slots=32,
+                             shard_params={"kill_switch_rules": KILL_SWITCH_RULES})
+    snapshots = [MarketSnapshot(symbols, prices[t], 1.7e9 + t, volume=volumes[t]) for t in range(len(prices))]
+    results = []
+    with runtime:
+        t0 = time.perf_counter()
+        for snapshot in snapshots:
+            runtime.publish(snapshot)
+            results.extend(runtime.collect())
+        runtime.wait_idle(timeout=600.0)
+        results.extend(runtime.collect())
+        elapsed = time.perf_counter() - t0
+        report = runtime.snapshot()
+    decisions = np.array([r["decisions"] for r in results])
+    return elapsed, decisions, report
+
+def main(n_symbols: int = 50_000, n_ticks: int = 200):
+    ok = True
+    cpus = os.cpu_count() or 1
+    symbols, prices, volumes = make_universe(n_symbols, n_ticks)
+    # Median of a few in-process runs: one run alone is too noisy to judge sharding against
+    runs = [run_inline(symbols, prices, volumes) for _ in range(INLINE_RUNS)]
+    inline_s, expected = float(np.median([elapsed for elapsed, _ in runs])), runs[0][1]
+    inline_rate = n_ticks / inline_s
+    print(f"[Bench] {n_symbols:,} symbols x {n_ticks} ticks, {cpus} CPU(s)")
+    print(f"[Bench] single process:  {inline_rate:8.1f} ticks/s  "
+          f"({n_ticks * n_symbols / inline_s / 1e6:.2f}M decisions/s)")
+
+    counts = [1]
+    while counts[-1] < max(2, cpus):
+        counts.append(counts[-1] * 2)
+    base = None
+    print(f"\n{'workers':>8} {'ticks/s':>9} {'M decisions/s':>14} {'vs inline':>10} {'vs 1 worker':>12} "
+          f"{'overhead us/tick':>17} {'publisher blocked':>18} {'match':>6}")
+    for n_workers in counts:
+        elapsed, decisions, report = run_sharded(symbols, prices, volumes, n_workers)
+        match = decisions.shape == expected.shape and np.array_equal(decisions, expected)
+        ok &= match
+        rate = n_ticks / elapsed
+        base = base or rate
+        efficiency = rate / (base * n_workers)
+        inline_efficiency = rate / (inline_rate * n_workers)
+        # Wall time not spent stepping shards (workers run in parallel: use the busiest one)
+        overhead_us = (elapsed - max(report["busy_ms"]) / 1000) / n_ticks * 1e6
+        checked = n_workers <= cpus
+        if checked:
+            ok &= efficiency >= MIN_EFFICIENCY and inline_efficiency >= MIN_EFFICIENCY
+        mark = '' if checked else '*'
+        print(f"{n_workers:>8} {rate:>9.1f} {rate * n_symbols / 1e6:>14.2f} "
+              f"{inline_efficiency:>9.0%}{mark} {efficiency:>11.0%}{mark} {overhead_us:>17.0f} "
+              f"{report['blocked_s']:>17.2f}s {str(match):>6}")
+    if counts[-1] > cpus:
+        print(f"\n[Bench] * more workers than CPUs: efficiency reported, not checked "
+              f"(needs >= {MIN_EFFICIENCY:.0%} where cores are available)")
+
+    print(f"\n[Bench] {'OK' if ok else 'FAILED'}")
+    return ok
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    sys.exit(0 if main(*args) else 1)
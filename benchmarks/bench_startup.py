@@ -0,0 +1,75 @@
+"""
+bench_startup.py
+
+Startup-time guard for main.py and the backtest harness.
+Each target is imported in a fresh interpreter under `python -X importtime`
+(OBLIVION_MODE=mock), reporting the median cumulative import time and the
+slowest modules. It fails (exit code 1) if a target exceeds its time budget
+or if any module of the Solana / HTTP stack was imported at startup.
+
+Run from the repo root:
+    python -m benchmarks.bench_startup [n_runs] [budget_ms]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TARGETS = ("main", "pipelines.backtest_engine")
+
+# Must only be imported once a code path actually needs them
+FORBIDDEN_AT_STARTUP = ("solana", "solders", "requests", "urllib3", "aiohttp", "asyncio")
+
+PROBE = (
+    "import sys, {target}; "
+    "print(','.join(sorted({{m.split('.')[0] for m in sys.modules}} & set({forbidden!r}))))"
+)
+
+def run_importtime(target: str):
+    """One cold import; returns (cumulative us per module, self us per module, forbidden modules loaded)."""
+    env = dict(os.environ, OBLIVION_MODE="mock")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE.format(target=target, forbidden=FORBIDDEN_AT_STARTUP)],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    cumulative, self_us = {}, {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, total, name = (field.strip() for field in line[len("import time:"):].split("|"))
+        cumulative[name] = int(total)
+        self_us[name] = int(own)
+    loaded = [m for m in proc.stdout.strip().split(",") if m]
+    return cumulative, self_us, loaded
+
+def main(n_runs: int = 5, budget_ms: float = 300.0) -> bool:
+    ok = True
+    for target in TARGETS:
+        totals = []
+        for _ in range(n_runs):
+            cumulative, self_us, loaded = run_importtime(target)
+            totals.append(cumulative[target] / 1000)
+
+        slowest = sorted(self_us.items(), key=lambda kv: kv[1], reverse=True)[:5]
+        median_ms = statistics.median(totals)
+        print(f"[Bench] import {target}: median {median_ms:.1f} ms over {n_runs} cold runs "
+              f"(min {min(totals):.1f}, max {max(totals):.1f})")
+        print("[Bench]   slowest modules (self): "
+              + ", ".join(f"{name} {us / 1000:.1f}ms" for name, us in slowest))
+
+        if loaded:
+            print(f"[Bench]   FAIL: imported at startup: {', '.join(loaded)}")
+            ok = False
+        if median_ms > budget_ms:
+            print(f"[Bench]   FAIL: over the {budget_ms:.0f} ms budget")
+            ok = False
+    print(f"[Bench] {'OK' if ok else 'FAILED'}")
+    return ok
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    budget = float(sys.argv[2]) if len(sys.argv) > 2 else 300.0
+    sys.exit(0 if main(runs, budget) else 1)
@@ -0,0 +1,62 @@
+"""
+bench_synergy_batch.py
+
+Compares ticks/second of the scalar synergy_conductor_run path against
+synergy_conductor_run_batch, and checks both give the same decisions.
+
+Run from the repo root:
+    python -m benchmarks.bench_synergy_batch [n_ticks]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from agents.synergy_conductor import (
+    synergy_conductor_run,
+    synergy_conductor_run_batch,
+    decode_decisions
+)
+from core.log_core.log_core import quiet
+
+EMOTIONAL_STATES = np.array(["neutral", "rage", "fear"])
+
+def make_series(n_ticks: int, seed: int = 7):
+    """Random prices around the agent thresholds plus random emotional states."""
+    rng = np.random.default_rng(seed)
+    prices = rng.uniform(0.0, 45.0, n_ticks)
+    states = EMOTIONAL_STATES[rng.integers(0, len(EMOTIONAL_STATES), n_ticks)]
+    return prices, states
+
+def run_scalar(prices, states):
+    # Silence the per-tick logging so we time the decision path, not the terminal
+    with quiet():
+        return [
+            synergy_conductor_run({"sol_price": float(p)}, str(s))
+            for p, s in zip(prices, states)
+        ]
+
+def main(n_ticks: int = 200_000):
+    prices, states = make_series(n_ticks)
+
+    t0 = time.perf_counter()
+    scalar = run_scalar(prices, states)
+    scalar_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    batch = synergy_conductor_run_batch(prices, states)
+    batch_s = time.perf_counter() - t0
+
+    mismatches = int(np.count_nonzero(decode_decisions(batch) != np.asarray(scalar, dtype=object)))
+
+    print(f"[Bench] ticks:        {n_ticks}")
+    print(f"[Bench] scalar path:  {n_ticks / scalar_s:,.0f} ticks/s ({scalar_s:.3f}s)")
+    print(f"[Bench] batch path:   {n_ticks / batch_s:,.0f} ticks/s ({batch_s:.3f}s)")
+    print(f"[Bench] speedup:      {scalar_s / batch_s:,.1f}x")
+    print(f"[Bench] mismatches:   {mismatches}")
+    return mismatches == 0
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    sys.exit(0 if main(n) else 1)
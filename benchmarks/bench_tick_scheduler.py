@@ -0,0 +1,142 @@
+"""
+bench_tick_scheduler.py
+
+TickScheduler vs. the old "do the work, then sleep N seconds" loop:
+  - cadence under variable cycle work: drift of the cycle start times
+    from the ideal grid, start jitter, missed deadlines
+  - overload (work longer than the interval): stale ticks dropped,
+    backpressure stretching the interval, then recovery
+  - an event-bus alert during the wait starts a cycle immediately
+  - a burst of alerts is coalesced into one cycle on the latest alert,
+    and alert cycles are limited to one per interval
+
+Run from the repo root:
+    python -m benchmarks.bench_tick_scheduler [n_cycles]
+"""
+
+import sys
+import threading
+import time
+
+import numpy as np
+
+from core.concurrency_manager.event_bus import EventBus, event_latency
+from core.concurrency_manager.tick_scheduler import TickScheduler
+from core.log_core.log_core import quiet as quiet_logging
+
+INTERVAL_S = 0.02
+
+def busy(seconds: float):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+def sleep_after_loop(work_s) -> np.ndarray:
+    starts = []
+    for w in work_s:
+        starts.append(time.perf_counter())
+        busy(w)
+        time.sleep(INTERVAL_S)
+    return np.array(starts)
+
+def scheduled_loop(scheduler: TickScheduler, work_s) -> np.ndarray:
+    starts = []
+    scheduler.start()
+    for w in work_s:
+        tick = scheduler.wait()
+        starts.append(tick.started)
+        busy(w)
+        scheduler.done(tick)
+    return np.array(starts)
+
+def drift_ms(starts: np.ndarray) -> float:
+    """How far the last cycle started behind the ideal grid."""
+    return (starts[-1] - starts[0] - INTERVAL_S * (len(starts) - 1)) * 1000
+
+def main(n_cycles: int = 200):
+    ok = True
+    rng = np.random.default_rng(23)
+    work = rng.uniform(0.002, 0.012, n_cycles)      # variable work, always inside the interval
+
+    old = sleep_after_loop(work)
+    scheduler = TickScheduler(INTERVAL_S, deadline_s=0.015)
+    new = scheduled_loop(scheduler, work)
+    snap = scheduler.snapshot()
+    ok &= abs(drift_ms(new)) < INTERVAL_S * 1000 and snap["dropped_ticks"] == 0
+    print(f"[Bench] {n_cycles} cycles, {INTERVAL_S * 1000:.0f} ms interval, 2-12 ms of work per cycle")
+    print(f"[Bench] sleep-after loop:  mean period {np.diff(old).mean() * 1000:6.2f} ms, "
+          f"drift {drift_ms(old):9.1f} ms")
+    print(f"[Bench] TickScheduler:     mean period {np.diff(new).mean() * 1000:6.2f} ms, "
+          f"drift {drift_ms(new):9.1f} ms, jitter p50 {snap['jitter_p50_us']:.0f} us "
+          f"p99 {snap['jitter_p99_us']:.0f} us, missed deadlines {snap['missed_deadlines']}")
+
+    # Overload: 30 ms of work per 20 ms tick, then back to 5 ms
+    scheduler = TickScheduler(INTERVAL_S, backoff=2.0, max_interval_s=0.08, lag_trigger=3, recover_after=5)
+    with quiet_logging():
+        overload = scheduled_loop(scheduler, [0.03] * 20)
+        stretched = scheduler.current_interval
+        steps = scheduler.stats["backpressure_steps"]
+        dropped = scheduler.stats["dropped_ticks"]
+        for _ in range(10):
+            tick = scheduler.wait()
+            busy(0.005)
+            scheduler.done(tick)
+    recovered = scheduler.current_interval
+    tail_period = np.diff(overload[-5:]).mean() * 1000
+    ok &= steps >= 1 and stretched > INTERVAL_S and recovered == INTERVAL_S
+    print(f"\n[Bench] overload (30 ms work): {dropped} stale ticks dropped, {steps} backpressure step(s), "
+          f"interval {INTERVAL_S * 1000:.0f} -> {stretched * 1000:.0f} ms "
+          f"(steady period {tail_period:.1f} ms); after recovery {recovered * 1000:.0f} ms")
+
+    # Event wake-up: an alert published mid-wait starts a cycle right away
+    bus = EventBus()
+    sub = bus.subscribe("whale_alert")
+    scheduler = TickScheduler(1.0)
+    scheduler.start()
+    scheduler.done(scheduler.wait(sub.get))         # first tick fires immediately
+    timer = threading.Timer(0.1, bus.publish, args=("whale_alert", {"whale_alert": True}))
+    timer.start()
+    t0 = time.perf_counter()
+    tick = scheduler.wait(sub.get)
+    waited_ms = (time.perf_counter() - t0) * 1000
+    latency_ms = event_latency(tick.event) * 1000
+    scheduler.done(tick)
+    ok &= tick.event is not None and waited_ms < 500
+    print(f"\n[Bench] alert during a 1 s wait: cycle started after {waited_ms:.1f} ms, "
+          f"{latency_ms:.2f} ms after publish (event cycles: {scheduler.stats['event_cycles']})")
+
+    # Alert storm: 100 alerts every 10 ms for 0.3 s against a 0.1 s interval
+    scheduler = TickScheduler(0.1)
+    scheduler.start()
+
+    def storm():
+        for i in range(30):
+            for j in range(100):
+                bus.publish("whale_alert", {"whale_alert": True, "seq": i * 100 + j})
+            time.sleep(0.01)
+
+    storm_thread = threading.Thread(target=storm)
+    storm_thread.start()
+    starts, seqs = [], []
+    t0 = time.perf_counter()
+    while time.perf_counter() - t0 < 0.5:
+        tick = scheduler.wait(sub.get, sub.poll)
+        if tick.unscheduled:
+            starts.append(tick.started)
+        if tick.event is not None:
+            seqs.append(tick.event["payload"]["seq"])
+        scheduler.done(tick)
+    storm_thread.join()
+    gaps = np.diff(starts)
+    rate_limited = len(gaps) == 0 or gaps.min() >= 0.1 - 1e-6
+    ok &= rate_limited and seqs == sorted(seqs) and scheduler.stats["coalesced_events"] > 0
+    print(f"[Bench] 3,000-alert storm over 0.3 s: {len(starts)} event cycles + "
+          f"{scheduler.stats['cycles'] - len(starts)} scheduled, {scheduler.stats['coalesced_events']:,} alerts "
+          f"coalesced; min gap between event cycles {gaps.min() * 1000 if len(gaps) else float('nan'):.0f} ms "
+          f"(interval 100 ms)")
+
+    print(f"\n[Bench] {'OK' if ok else 'FAILED'}")
+    return ok
+
+if __name__ == "__main__":
+    sys.exit(0 if main(int(sys.argv[1]) if len(sys.argv) > 1 else 200) else 1)
@@ -0,0 +1,112 @@
+"""
+bench_tick_source.py
+
+Tick feeds at machine speed:
+  - MarketSimulator chunk generation (ticks/s) and determinism (same seed
+    -> identical ticks)
+  - binary tick file write + zero-copy memmap load vs. the CSV format
+  - per-tick fetch() from the simulated and recorded feeds, and through
+    data_pipeline.fetch_sol_price
+  - a backtest replayed straight from the binary file
+
+Run from the repo root:
+    python -m benchmarks.bench_tick_source [n_ticks]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+import pipelines.data_pipeline as data_pipeline
+from pipelines.backtest_engine import load_tick_file, write_tick_file, run_backtest_file
+from pipelines.tick_source import (
+    MarketSimulator,
+    SimulatedTickSource,
+    RecordedTickSource,
+    write_tick_records
+)
+from core.log_core.log_core import quiet as quiet_logging
+
+CHUNK = 65536
+
+def generate(n_ticks: int, seed: int = 21) -> np.ndarray:
+    simulator = MarketSimulator(seed=seed)
+    return np.concatenate([simulator.generate(min(CHUNK, n_ticks - start))
+                           for start in range(0, n_ticks, CHUNK)])
+
+def fetch_rate(fetch, n: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(n):
+        fetch()
+    return n / (time.perf_counter() - t0)
+
+def main(n_ticks: int = 2_000_000):
+    ok = True
+    t0 = time.perf_counter()
+    ticks = generate(n_ticks)
+    gen_rate = n_ticks / (time.perf_counter() - t0)
+    same = np.array_equal(ticks, generate(n_ticks)) and not np.array_equal(ticks, generate(n_ticks, seed=22))
+    ok &= same and gen_rate >= 100_000
+    prices = ticks["sol_price"]
+    dumps = int(ticks["whale_alert"].sum())
+    print(f"[Bench] simulator: {n_ticks:,} ticks at {gen_rate:12,.0f} ticks/s (deterministic: {same})")
+    print(f"[Bench]   price {prices.min():.2f}..{prices.max():.2f} (median {np.median(prices):.2f}), "
+          f"{dumps} whale dumps, {np.count_nonzero(np.abs(np.diff(np.log(prices))) > 0.02)} jumps > 2%")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bin_path = os.path.join(tmp, "ticks.bin")
+        csv_path = os.path.join(tmp, "ticks.csv")
+        t0 = time.perf_counter()
+        write_tick_records(bin_path, ticks)
+        bin_write_s = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        timestamps, sol_prices, whale_alerts = load_tick_file(bin_path)
+        bin_load_s = time.perf_counter() - t0
+        round_trip = (np.array_equal(sol_prices, prices) and np.array_equal(timestamps, ticks["timestamp"])
+                      and np.array_equal(whale_alerts, ticks["whale_alert"] != 0))
+        ok &= round_trip
+
+        n_csv = min(n_ticks, 200_000)
+        t0 = time.perf_counter()
+        write_tick_file(csv_path, ticks["timestamp"][:n_csv], prices[:n_csv], ticks["whale_alert"][:n_csv])
+        csv_write_s = (time.perf_counter() - t0) * n_ticks / n_csv
+        t0 = time.perf_counter()
+        load_tick_file(csv_path)
+        csv_load_s = (time.perf_counter() - t0) * n_ticks / n_csv
+        csv_mb = os.path.getsize(csv_path) / 1e6 * n_ticks / n_csv
+        print(f"\n[Bench] binary file: {os.path.getsize(bin_path) / 1e6:6.1f} MB, write {bin_write_s * 1000:8.1f} ms, "
+              f"load {bin_load_s * 1000:8.2f} ms (round trip exact: {round_trip})")
+        print(f"[Bench] CSV file:    {csv_mb:6.1f} MB, write {csv_write_s * 1000:8.1f} ms, "
+              f"load {csv_load_s * 1000:8.1f} ms (extrapolated from {n_csv:,} ticks)")
+
+        recorded = RecordedTickSource(bin_path)
+        batch = recorded.next_batch()
+        zero_copy = np.shares_memory(batch, recorded.records)
+        ok &= zero_copy
+        n_fetch = min(n_ticks, 500_000)
+        sim_rate = fetch_rate(SimulatedTickSource(MarketSimulator()).fetch, n_fetch)
+        rec_rate = fetch_rate(RecordedTickSource(bin_path).fetch, n_fetch)
+        data_pipeline.TICK_SOURCE, data_pipeline.tick_source = "simulated", None
+        pipeline_rate = fetch_rate(data_pipeline.fetch_sol_price, n_fetch)
+        data_pipeline.TICK_SOURCE, data_pipeline.tick_source = "live", None
+        del batch, recorded
+        print(f"\n[Bench] recorded next_batch() is a zero-copy memmap view: {zero_copy}")
+        print(f"[Bench] fetch() simulated:          {sim_rate:12,.0f} ticks/s")
+        print(f"[Bench] fetch() recorded:           {rec_rate:12,.0f} ticks/s")
+        print(f"[Bench] data_pipeline.fetch_sol_price: {pipeline_rate:9,.0f} ticks/s (simulated source)")
+
+        n_backtest = min(n_ticks, 200_000)
+        backtest_path = os.path.join(tmp, "backtest.bin")
+        write_tick_records(backtest_path, ticks[:n_backtest])
+        with quiet_logging():
+            report = run_backtest_file(backtest_path, halt_on_kill_switch=False)
+        print(f"\n[Bench] backtest from binary file: {report['cycles']:,} ticks at {report['ticks_per_s']:,.0f} ticks/s")
+
+    print(f"\n[Bench] {'OK' if ok else 'FAILED'}")
+    return ok
+
+if __name__ == "__main__":
+    sys.exit(0 if main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000) else 1)
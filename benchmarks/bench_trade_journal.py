@@ -0,0 +1,55 @@
+"""
+bench_trade_journal.py
+
+Hot-path cost of TradeJournal.write versus the old open/append/close per
+trade line, plus mmap scan/filter and markdown conversion throughput.
+
+Run from the repo root:
+    python -m benchmarks.bench_trade_journal [n_records]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from core.reflection_engine.trade_journal import TradeJournal, JournalReader, journal_to_markdown
+
+def old_style_append(path: str, n: int):
+    for i in range(n):
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(f"Time: {1.7e9 + i}, Decision: HOLD, Price: 20.5, PnL: -10.0\n")
+
+def main(n_records: int = 1_000_000):
+    with tempfile.TemporaryDirectory() as tmp:
+        n_old = min(n_records, 20_000)
+        t0 = time.perf_counter()
+        old_style_append(os.path.join(tmp, "old.md"), n_old)
+        old_us = (time.perf_counter() - t0) / n_old * 1e6
+        print(f"[Bench] open/append per trade:  {old_us:.2f} us/record ({n_old} records)")
+
+        path = os.path.join(tmp, "journal.bin")
+        journal = TradeJournal(path)
+        decisions = ("BUY", "HOLD", "BUY_MORE")
+        t0 = time.perf_counter()
+        for i in range(n_records):
+            journal.write(1.7e9 + i, decisions[i % 3], 20.0 + (i % 100) * 0.1, 5.0 if i % 3 != 1 else -10.0)
+        hot_s = time.perf_counter() - t0
+        journal.close()
+        total_s = time.perf_counter() - t0
+        print(f"[Bench] TradeJournal.write:      {hot_s / n_records * 1e6:.2f} us/record on the hot path "
+              f"({total_s:.2f}s until fully on disk, stats={journal.stats})")
+
+        t0 = time.perf_counter()
+        reader = JournalReader(path)
+        losses = reader.filter(decision="HOLD", start=1.7e9 + n_records // 2, max_pnl=0.0)
+        scan_s = time.perf_counter() - t0
+        print(f"[Bench] mmap filter:             {len(reader)} records scanned, {len(losses)} matched "
+              f"in {scan_s * 1000:.1f}ms")
+
+        t0 = time.perf_counter()
+        n = journal_to_markdown(path, os.path.join(tmp, "journal.md"))
+        print(f"[Bench] markdown conversion:     {n} records in {time.perf_counter() - t0:.2f}s")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,130 @@
+"""
+bench_trade_store.py
+
+TradeStore (SQLite, WAL) as the history grows to millions of trades:
+  - TradeStore.write cost on the hot path and batched commit throughput
+  - restart: open the store and restore the recent window into
+    trade_history, vs. parsing the full markdown reflection log
+    (restart must stay flat as the history grows)
+  - indexed range queries by time, decision and PnL, checked against
+    the same filters over the generated arrays
+
+Run from the repo root:
+    python -m benchmarks.bench_trade_store [n_trades]
+"""
+
+import os
+import re
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+import core.reflection_engine.reflection_engine as reflection_engine
+from core.reflection_engine.reflection_engine import restore_trade_history, reflection_engine_reset, trade_history
+from core.reflection_engine.trade_store import TradeStore
+
+DECISIONS = np.array(["HOLD", "BUY", "BUY_MORE", "SELL"])
+RESTORE_WINDOW = 1000
+MD_LINE = re.compile(r"Time: ([^,]+), Decision: ([^,]+), Price: ([^,]+), PnL: (.+)")
+
+def make_trades(n: int, seed: int = 22) -> dict:
+    rng = np.random.default_rng(seed)
+    return {
+        "timestamp": 1.7e9 + np.arange(n, dtype=np.float64),
+        "decision": DECISIONS[rng.integers(0, len(DECISIONS), n)],
+        "sol_price": 20.0 + np.cumsum(rng.normal(0.0, 0.05, n)),
+        "profit_loss": rng.normal(0.0, 30.0, n)
+    }
+
+def parse_markdown(path: str) -> int:
+    """The pre-store restart path: parse every line of the reflection log."""
+    history = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            m = MD_LINE.match(line)
+            if m:
+                history.append({"timestamp": float(m[1]), "decision": m[2],
+                                "sol_price": float(m[3]), "profit_loss": float(m[4])})
+    return len(history)
+
+def timed_restart(path: str) -> tuple:
+    t0 = time.perf_counter()
+    reflection_engine.trade_store = TradeStore(path)
+    reflection_engine_reset()
+    restored = restore_trade_history(RESTORE_WINDOW)
+    elapsed = time.perf_counter() - t0
+    reflection_engine.trade_store.close()
+    reflection_engine.trade_store = None
+    return elapsed, restored
+
+def main(n_trades: int = 1_000_000):
+    ok = True
+    trades = make_trades(n_trades)
+    columns = [trades[k].tolist() for k in ("timestamp", "decision", "sol_price", "profit_loss")]
+    checkpoints = sorted({min(n, n_trades) for n in (10_000, 100_000, n_trades)})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "trades.sqlite")
+        md_path = os.path.join(tmp, "reflection_logs.md")
+        print(f"{'trades':>10} {'write us/trade':>15} {'commit s':>9} {'restart ms':>11} {'markdown parse ms':>18}")
+        written = 0
+        restarts = []
+        for checkpoint in checkpoints:
+            store = TradeStore(path)
+            t0 = time.perf_counter()
+            for ts, decision, price, pnl in zip(*(c[written:checkpoint] for c in columns)):
+                store.write(ts, decision, price, pnl)
+            hot_s = time.perf_counter() - t0
+            store.close()
+            commit_s = time.perf_counter() - t0
+            with open(md_path, "a", encoding="utf-8") as f:
+                f.writelines(f"Time: {ts}, Decision: {decision}, Price: {price}, PnL: {pnl}\n"
+                             for ts, decision, price, pnl in zip(*(c[written:checkpoint] for c in columns)))
+            count = checkpoint - written
+            written = checkpoint
+
+            restart_s, restored = min(timed_restart(path) for _ in range(3))
+            ok &= restored == min(RESTORE_WINDOW, checkpoint)
+            ok &= np.array_equal(trade_history.columns()["profit_loss"], trades["profit_loss"][written - restored:written])
+            t0 = time.perf_counter()
+            parsed = parse_markdown(md_path)
+            md_s = time.perf_counter() - t0
+            ok &= parsed == written
+            restarts.append(restart_s)
+            print(f"{written:>10,} {hot_s / count * 1e6:>15.2f} {commit_s:>9.2f} {restart_s * 1000:>11.2f} {md_s * 1000:>18.1f}")
+
+        # Restart must not grow with the history (allow noise on a busy machine)
+        ok &= restarts[-1] < 5 * restarts[0] + 0.005
+        pnl_total = TradeStore(path).totals()["pnl_total"]
+        ok &= abs(pnl_total - float(np.sum(trades["profit_loss"]))) < 1e-6 * n_trades
+
+        store = TradeStore(path)
+        ts, decision, pnl = trades["timestamp"], trades["decision"], trades["profit_loss"]
+        last_hour = ts[-1] - 3600
+        day_start = ts[0] + (ts[-1] - ts[0]) / 2
+        queries = [
+            ("last hour", {"start": last_hour}, ts >= last_hour),
+            ("SELL in one day", {"decision": "SELL", "start": day_start, "end": day_start + 86400},
+             (decision == "SELL") & (ts >= day_start) & (ts < day_start + 86400)),
+            ("PnL <= -100", {"max_pnl": -100.0}, pnl <= -100.0),
+            ("BUY, PnL >= 90, last hour", {"decision": "BUY", "min_pnl": 90.0, "start": last_hour},
+             (decision == "BUY") & (pnl >= 90.0) & (ts >= last_hour))
+        ]
+        print()
+        for label, kwargs, mask in queries:
+            t0 = time.perf_counter()
+            rows = store.query(**kwargs)
+            query_ms = (time.perf_counter() - t0) * 1000
+            match = np.array_equal(rows["profit_loss"], pnl[mask])
+            ok &= match
+            print(f"[Bench] query {label:<26} {len(rows):>7,} rows in {query_ms:8.2f} ms (matches: {match})")
+        store.close()
+        print(f"[Bench] store file: {os.path.getsize(path) / 1e6:.1f} MB for {n_trades:,} trades")
+
+    print(f"\n[Bench] {'OK' if ok else 'FAILED'}")
+    return ok
+
+if __name__ == "__main__":
+    sys.exit(0 if main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000) else 1)
@@ -0,0 +1,73 @@
+"""
+bench_universe.py
+
+Per-tick cost of screening a token universe with synergy_conductor_run on
+a columnar MarketSnapshot, against calling it once per symbol with the
+legacy single-symbol dict. The snapshot path pays its Python overhead once
+per tick, so cost per symbol falls as the universe grows.
+
+Run from the repo root:
+    python -m benchmarks.bench_universe [n_ticks]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from agents.synergy_conductor import synergy_conductor_run, synergy_conductor_run_universe, decode_decisions
+from pipelines.market_snapshot import MarketSnapshot
+from core.log_core.log_core import quiet
+
+def make_snapshot(n_symbols: int, rng) -> MarketSnapshot:
+    return MarketSnapshot(
+        [f"TOKEN{i}" for i in range(n_symbols)],
+        rng.uniform(0.0, 45.0, n_symbols),
+        volume=rng.lognormal(12.0, 2.0, n_symbols)
+    )
+
+def per_symbol(snapshot: MarketSnapshot, emotional_state: str):
+    with quiet():
+        return [synergy_conductor_run(snapshot.row(i), emotional_state) for i in range(len(snapshot))]
+
+def main(n_ticks: int = 50):
+    rng = np.random.default_rng(21)
+    print(f"{'symbols':>8} {'snapshot us/tick':>17} {'ns/symbol':>10} {'top-100 us/tick':>16} "
+          f"{'per-symbol us/tick':>19} {'speedup':>8}")
+    for n_symbols in (1, 10, 100, 1_000, 10_000, 100_000):
+        snapshot = make_snapshot(n_symbols, rng)
+
+        t0 = time.perf_counter()
+        for _ in range(n_ticks):
+            ranked = synergy_conductor_run(snapshot, "rage")
+        snap_us = (time.perf_counter() - t0) / n_ticks * 1e6
+
+        t0 = time.perf_counter()
+        for _ in range(n_ticks):
+            top = synergy_conductor_run_universe(snapshot, "rage", top_k=100)
+        top_us = (time.perf_counter() - t0) / n_ticks * 1e6
+        assert np.array_equal(top["symbol"], ranked["symbol"][:100])
+
+        loop_cell = "-"
+        speedup = "-"
+        if n_symbols <= 10_000:
+            loop_ticks = max(1, n_ticks // max(1, n_symbols // 100))
+            t0 = time.perf_counter()
+            for _ in range(loop_ticks):
+                scalar = per_symbol(snapshot, "rage")
+            loop_us = (time.perf_counter() - t0) / loop_ticks * 1e6
+            loop_cell = f"{loop_us:.1f}"
+            speedup = f"{loop_us / snap_us:.1f}x"
+
+            # Same decision for every symbol, just ranked
+            by_symbol = dict(zip(ranked["symbol"], decode_decisions(ranked["decision"])))
+            assert all(by_symbol[s] == d for s, d in zip(snapshot.symbols, scalar))
+
+        print(f"{n_symbols:>8} {snap_us:>17.1f} {snap_us / n_symbols * 1000:>10.1f} {top_us:>16.1f} "
+              f"{loop_cell:>19} {speedup:>8}")
+
+    top = decode_decisions(ranked["decision"][:3])
+    print(f"\n[Bench] top of the last ranking: {list(zip(ranked['symbol'][:3], top, ranked['score'][:3].round(1)))}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
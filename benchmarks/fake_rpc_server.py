@@ -0,0 +1,94 @@
+"""
+fake_rpc_server.py
+
+Local fake Solana JSON-RPC server (HTTP/1.1 keep-alive, single and batch
+requests) for exercising RpcSession and the execution path offline.
+Supports requestAirdrop, getBalance, getSignatureStatuses, getLatestBlockhash.
+Airdrops are credited immediately; a signature reports 'confirmed' once
+`confirm_after` status queries have been made for it.
+"""
+
+import itertools
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+class FakeRpcState:
+    def __init__(self, confirm_after: int = 0):
+        self.lock = threading.Lock()
+        self.balances = {}
+        self.signatures = {}   # signature -> status queries seen
+        self.confirm_after = confirm_after
+        self.sig_ids = itertools.count(1)
+        self.requests = 0
+
+    def handle(self, req: dict) -> dict:
+        method = req.get("method")
+        params = req.get("params") or []
+        with self.lock:
+            if method == "requestAirdrop":
+                pubkey, lamports = params[0], params[1]
+                self.balances[pubkey] = self.balances.get(pubkey, 0) + lamports
+                sig = f"fakesig{next(self.sig_ids)}"
+                self.signatures[sig] = 0
+                result = sig
+            elif method == "getBalance":
+                result = {"context": {"slot": 1}, "value": self.balances.get(params[0], 0)}
+            elif method == "getSignatureStatuses":
+                statuses = []
+                for sig in params[0]:
+                    if sig not in self.signatures:
+                        statuses.append(None)
+                        continue
+                    self.signatures[sig] += 1
+                    confirmed = self.signatures[sig] > self.confirm_after
+                    statuses.append({
+                        "slot": 1,
+                        "confirmations": None if confirmed else 0,
+                        "err": None,
+                        "confirmationStatus": "confirmed" if confirmed else "processed"
+                    })
+                result = {"context": {"slot": 1}, "value": statuses}
+            elif method == "getLatestBlockhash":
+                result = {"context": {"slot": 1}, "value": {"blockhash": "fakeblockhash", "lastValidBlockHeight": 100}}
+            else:
+                return {"jsonrpc": "2.0", "id": req.get("id"),
+                        "error": {"code": -32601, "message": f"Method not found: {method}"}}
+        return {"jsonrpc": "2.0", "id": req.get("id"), "result": result}
+
+def _make_handler(state: FakeRpcState):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            # Headers and body go out in separate writes; avoid Nagle stalls on keep-alive
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            with state.lock:
+                state.requests += 1
+            if isinstance(body, list):
+                reply = [state.handle(req) for req in body]
+            else:
+                reply = state.handle(body)
+            data = json.dumps(reply).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+    return Handler
+
+def start_fake_rpc_server(confirm_after: int = 0, host: str = "127.0.0.1", port: int = 0):
+    """Start in a daemon thread; returns (server, url, state). Stop with server.shutdown()."""
+    state = FakeRpcState(confirm_after)
+    server = ThreadingHTTPServer((host, port), _make_handler(state))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}", state
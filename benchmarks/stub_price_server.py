@@ -0,0 +1,60 @@
+"""
+stub_price_server.py
+
+Local stub HTTP price server for exercising the async data pipeline
+without the network. Serves CoinGecko/Binance/Coinbase-shaped payloads
+with a configurable delay and failure rate per source.
+"""
+
+import asyncio
+import random
+
+from aiohttp import web
+
+def stub_sources(base_url: str):
+    """Price-source list (same shape as DEFAULT_PRICE_SOURCES) pointing at the stub."""
+    return [
+        {"name": "coingecko", "url": f"{base_url}/coingecko", "params": {}, "path": ["solana", "usd"]},
+        {"name": "binance", "url": f"{base_url}/binance", "params": {}, "path": ["price"]},
+        {"name": "coinbase", "url": f"{base_url}/coinbase", "params": {}, "path": ["data", "amount"]}
+    ]
+
+async def start_stub_server(price: float = 20.0, delays=None, fail_rate: float = 0.0,
+                            host: str = "127.0.0.1", port: int = 0, prices=None, statuses=None):
+    """
+    Start the stub server on an ephemeral port.
+    delays: optional {source_name: seconds} added before each response.
+    prices: optional {source_name: price} overriding `price` per source.
+    statuses: optional {source_name: HTTP status} a source always fails with.
+    Returns (runner, base_url); call `await runner.cleanup()` to stop it.
+    """
+    delays = delays or {}
+    prices = prices or {}
+    statuses = statuses or {}
+    payloads = {
+        "coingecko": lambda p: {"solana": {"usd": p}},
+        "binance": lambda p: {"symbol": "SOLUSDT", "price": f"{p:.2f}"},
+        "coinbase": lambda p: {"data": {"base": "SOL", "currency": "USD", "amount": f"{p:.2f}"}}
+    }
+
+    def make_handler(name):
+        async def handler(request):
+            if delays.get(name):
+                await asyncio.sleep(delays[name])
+            if name in statuses:
+                return web.Response(status=statuses[name])
+            if fail_rate and random.random() < fail_rate:
+                return web.Response(status=503)
+            return web.json_response(payloads[name](prices.get(name, price)))
+        return handler
+
+    app = web.Application()
+    for name in payloads:
+        app.router.add_get(f"/{name}", make_handler(name))
+
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    bound_port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://{host}:{bound_port}"
@@ -0,0 +1,27 @@
+"""
+config_loader.py
+
+Reads config/parameters.json so modules can take their tunables from one
+place instead of hard-coding them.
+"""
+
+import json
+import os
+
+PARAMETERS_PATH = os.path.join(os.path.dirname(__file__), "parameters.json")
+
+def load_parameters(section: str = None, default=None, path: str = PARAMETERS_PATH):
+    """
+    Return the parsed parameters.json (or one top-level section of it).
+    Missing file or section returns `default` (an empty dict if not given).
+    """
+    if default is None:
+        default = {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            params = json.load(f)
+    except FileNotFoundError:
+        return default
+    if section is None:
+        return params
+    return params.get(section, default)
@@ -4,43 +4,70 @@ concurrency_manager.py
 Phase 5: Minimal concurrency scaffolding using Python threading.
 We spawn a background thread for GodAwareness scanning while the main thread
 executes synergy and reflection loops.
+
+Alerts are pushed to the shared event bus (topic WHALE_ALERT_TOPIC) so the
+trading loop reacts as soon as one is published instead of polling.
 """
 
 import threading
-import time
 
-from core.god_awareness.god_awareness import scan_for_whale_activity
+from core.god_awareness.god_awareness import scan_for_whale_activity, whale_alerts_enabled
+from core.concurrency_manager.event_bus import event_bus
+from core.log_core.log_core import get_logger
+
+logger = get_logger("ConcurrencyManager")
+
+WHALE_ALERT_TOPIC = "whale_alert"
+
+# Seconds between whale scans
+SCAN_INTERVAL_S = 5.0
 
-# Shared variable to store the latest whale alert
+# Shared variable to store the latest whale alert.
+# Updated in place, so modules that imported it by name see new alerts.
 latest_whale_alert = {
     "whale_alert": False,
     "info": ""
 }
 
+_stop_event = threading.Event()
+
 def concurrency_manager_init():
     """Initialize concurrency manager (placeholder)."""
-    print("[ConcurrencyManager] Initialized.")
+    logger.info("Initialized.")
 
-def god_awareness_thread_func():
+def god_awareness_thread_func(interval_s: float = SCAN_INTERVAL_S):
     """
-    Background thread function that periodically scans for whale activity.
+    Background thread function that periodically scans for whale activity
+    and publishes every alert on the event bus.
     """
-    global latest_whale_alert
-    while True:
+    while not _stop_event.is_set():
         alert = scan_for_whale_activity()
+        latest_whale_alert.update(alert)
         if alert["whale_alert"]:
-            print(f"[GodAwareness Thread] ALERT: {alert['info']}")
-            latest_whale_alert = alert
-        else:
-            latest_whale_alert = alert
+            logger.warning("GodAwareness thread ALERT: %s", alert["info"])
+            event_bus.publish(WHALE_ALERT_TOPIC, alert)
 
-        # Sleep before scanning again
-        time.sleep(5)
+        # Sleep before scanning again (wakes early on stop)
+        _stop_event.wait(interval_s)
 
-def start_god_awareness_thread():
+def start_god_awareness_thread(interval_s: float = SCAN_INTERVAL_S):
     """
     Create and start the background thread for God Awareness scanning.
+    Returns None (no thread) when whale alerts are disabled.
     """
-    t = threading.Thread(target=god_awareness_thread_func, daemon=True)
+    if not whale_alerts_enabled():
+        logger.info("GodAwareness thread not started: no transfer source.")
+        return None
+    _stop_event.clear()
+    t = threading.Thread(target=god_awareness_thread_func, args=(interval_s,), daemon=True)
     t.start()
-    print("[ConcurrencyManager] GodAwareness thread started (daemon).")
+    logger.info("GodAwareness thread started (daemon).")
+    return t
+
+def stop_god_awareness_thread():
+    """Ask the GodAwareness thread to exit after its current scan."""
+    _stop_event.set()
+
+def subscribe_whale_alerts():
+    """Blocking event-bus subscription to whale alerts for the trading loop."""
+    return event_bus.subscribe(WHALE_ALERT_TOPIC)
@@ -0,0 +1,148 @@
+"""
+event_bus.py
+
+Thread-safe publish/subscribe event bus.
+Producers (e.g. the GodAwareness whale scanner) publish from any thread;
+consumers either block on a Subscription (threads), await an
+AsyncSubscription (asyncio) or register a callback. Each event carries its
+publish time (time.perf_counter) so consumers can measure alert-to-decision
+latency.
+
+Event shape: {"topic": str, "payload": any, "published_at": float}
+
+asyncio is imported only when an async subscription is created.
+"""
+
+import threading
+import time
+from collections import deque
+
+class Subscription:
+    """
+    Blocking, bounded per-subscriber inbox. When full, the oldest event is
+    dropped (a consumer cares about the latest alerts, not a stale backlog).
+    """
+
+    def __init__(self, bus, topic: str, maxlen: int = 1024):
+        self.bus = bus
+        self.topic = topic
+        self._events = deque(maxlen=maxlen)
+        self._cond = threading.Condition()
+        self.dropped = 0
+
+    def _deliver(self, event: dict):
+        with self._cond:
+            if len(self._events) == self._events.maxlen:
+                self.dropped += 1
+            self._events.append(event)
+            self._cond.notify()
+
+    def get(self, timeout: float = None):
+        """Next event, waiting up to timeout seconds; None on timeout."""
+        with self._cond:
+            if not self._events:
+                self._cond.wait(timeout)
+            if self._events:
+                return self._events.popleft()
+            return None
+
+    def poll(self):
+        """Next event if one is pending, else None (never blocks)."""
+        with self._cond:
+            if self._events:
+                return self._events.popleft()
+            return None
+
+    def close(self):
+        self.bus.unsubscribe(self)
+
+class AsyncSubscription:
+    """asyncio inbox; events published from any thread are handed to the loop."""
+
+    def __init__(self, bus, topic: str, loop, maxsize: int = 1024):
+        import asyncio
+
+        self.bus = bus
+        self.topic = topic
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=maxsize)
+        self.dropped = 0
+
+    def _put(self, event: dict):
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(event)
+
+    def _deliver(self, event: dict):
+        self.loop.call_soon_threadsafe(self._put, event)
+
+    async def get(self):
+        return await self.queue.get()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        return await self.queue.get()
+
+    def close(self):
+        self.bus.unsubscribe(self)
+
+class _CallbackSubscription:
+    def __init__(self, bus, topic: str, callback):
+        self.bus = bus
+        self.topic = topic
+        self._deliver = callback
+
+    def close(self):
+        self.bus.unsubscribe(self)
+
+class EventBus:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = {}   # topic -> tuple of subscriptions (copy-on-write)
+        self.stats = {"published": 0, "delivered": 0}
+
+    def _add(self, sub):
+        with self._lock:
+            self._subscribers[sub.topic] = self._subscribers.get(sub.topic, ()) + (sub,)
+        return sub
+
+    def subscribe(self, topic: str, maxlen: int = 1024) -> Subscription:
+        """Blocking subscription for a consumer thread."""
+        return self._add(Subscription(self, topic, maxlen))
+
+    def subscribe_async(self, topic: str, loop=None, maxsize: int = 1024) -> AsyncSubscription:
+        """asyncio subscription bound to `loop` (default: the running loop)."""
+        if loop is None:
+            import asyncio
+            loop = asyncio.get_running_loop()
+        return self._add(AsyncSubscription(self, topic, loop, maxsize))
+
+    def subscribe_callback(self, topic: str, callback):
+        """callback(event) runs synchronously in the publisher's thread."""
+        return self._add(_CallbackSubscription(self, topic, callback))
+
+    def unsubscribe(self, sub):
+        with self._lock:
+            subs = self._subscribers.get(sub.topic, ())
+            self._subscribers[sub.topic] = tuple(s for s in subs if s is not sub)
+
+    def publish(self, topic: str, payload=None) -> dict:
+        """Publish from any thread; returns the event that was delivered."""
+        event = {"topic": topic, "payload": payload, "published_at": time.perf_counter()}
+        subs = self._subscribers.get(topic, ())
+        for sub in subs:
+            sub._deliver(event)
+        with self._lock:
+            self.stats["published"] += 1
+            self.stats["delivered"] += len(subs)
+        return event
+
+def event_latency(event: dict) -> float:
+    """Seconds since the event was published."""
+    return time.perf_counter() - event["published_at"]
+
+# Process-wide bus shared by producers and the trading loop
+event_bus = EventBus()
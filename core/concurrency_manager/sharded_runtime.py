@@ -0,0 +1,415 @@
+"""
+sharded_runtime.py
+
+Multi-process strategy runtime over a token universe.
+The universe is split into contiguous symbol shards, one per worker
+process. Each worker runs its own strategy over its shard: its own
+conductor (and strategy hot reload), emotional state, streaming
+features, positions, trade history and kill switch. No worker shares
+interpreter state, so evaluation is not bound to one core by the GIL.
+
+- Broadcast: the feeder (the process that owns the runtime) writes each
+  MarketSnapshot into one slot of a shared-memory board, a ring of
+  `slots` snapshots, and then publishes its sequence number through the
+  board's Fence (see shm_arrays.py), which orders it after the slot's
+  data on any CPU. Workers read
+  their shard of the slot through NumPy views of the shared block, with
+  no pickling and no copies. Idle workers sleep on a semaphore, and the
+  feeder only posts to workers that flagged themselves as waiting. The
+  semaphore timeout (poll_interval_s) bounds a missed wake-up.
+- Results: each worker writes its decision codes into its own columns of
+  the board's decisions row for the slot. It then pushes one summary
+  record (seq, buys, PnL, halted) into its own SPSC ring.
+  collect() drains the rings and returns each tick once every worker has
+  reported it; it raises if a worker process has died.
+- Backpressure: a slot is reused only after its tick is collected. With
+  block_when_full, publish() waits for the slowest worker; otherwise the
+  snapshot is dropped and counted.
+
+Snapshots must keep the runtime's symbol order (same universe every tick).
+Configured in config/parameters.json under "sharded_runtime".
+"""
+
+import multiprocessing
+import os
+import time
+from collections import deque
+
+import numpy as np
+
+from config.config_loader import load_parameters
+from core.concurrency_manager.shm_arrays import Fence, SharedArrays, SpscRing, ring_spec
+from core.decisions.decisions import DECISION_CODES, DECISION_DTYPE, DECISION_LABELS, DECISION_UNITS
+from core.log_core.log_core import get_logger
+
+logger = get_logger("ShardedRuntime")
+
+DEFAULTS = {
+    "workers": None,                # None: one per CPU
+    "slots": 64,
+    "ring_size": 1024,
+    "columns": ["price", "volume"],
+    "emotional_states": ["neutral"],    # cycled over the workers
+    "start_method": "spawn",
+    "poll_interval_s": 0.0005,
+    "start_timeout_s": 60.0,
+    "block_when_full": True,
+    "history_capacity": 10000
+}
+
+# Perp liquidation distance is read from the feeder's DERIVATIVES_ENGINE, which shards do not run
+SHARD_EXCLUDED_RULES = ("liquidation_distance",)
+
+RESULT_DTYPE = np.dtype([
+    ("seq", "<u8"),
+    ("pnl", "<f8"),
+    ("busy_ns", "<u8"),
+    ("buys", "<u4"),
+    ("buy_more", "<u4"),
+    ("halted", "u1")
+])
+
+def board_spec(n_symbols: int, n_workers: int, slots: int, columns) -> dict:
+    spec = {
+        "published": ((1,), np.uint64),
+        "stop": ((1,), np.uint8),
+        "ready": ((n_workers,), np.uint8),
+        "waiting": ((n_workers,), np.uint8),
+        "timestamp": ((slots,), np.float64),
+        "whale_alert": ((slots,), np.uint8),
+        "decisions": ((slots, n_symbols), DECISION_DTYPE)
+    }
+    for column in columns:
+        spec[f"col_{column}"] = ((slots, n_symbols), np.float64)
+    return spec
+
+class StrategyShard:
+    """
+    One worker's strategy state over its symbols. step() mirrors a
+    main.py cycle for a whole shard: features, conductor, mark-to-market,
+    fill, then the reflection history and kill switch. A tripped kill
+    switch halts the shard, which then holds every symbol.
+    """
+
+    def __init__(self, symbols, emotional_state: str = "neutral", feature_params: dict = None,
+                 kill_switch_rules=None, history_capacity: int = 10000, name: str = "shard"):
+        # Imported here: the feeder process never needs the strategy stack
+        from agents.synergy_conductor import synergy_conductor_run_batch
+        from core.reflection_engine.trade_history import TradeHistory
+        from core.scoring_engine.features import build_feature_engine
+        from security.kill_switch_rules import KillSwitchEngine
+
+        self._run_batch = synergy_conductor_run_batch
+        self._labels = DECISION_LABELS
+        self._buy, self._buy_more = DECISION_CODES["BUY"], DECISION_CODES["BUY_MORE"]
+        self._units = np.array([DECISION_UNITS.get(label, 0.0) for label in DECISION_LABELS])
+        self.name = name
+        self.features = build_feature_engine(feature_params)
+        self.features.register_symbols(symbols)
+        self.emotional_state = emotional_state
+        self.position = np.zeros(len(symbols))
+        self.last_price = np.full(len(symbols), np.nan)
+        self.history = TradeHistory(history_capacity)
+        if kill_switch_rules is None:
+            kill_switch_rules = load_parameters("kill_switch").get("rules", [])
+        self.kill_switch = KillSwitchEngine(
+            [spec for spec in kill_switch_rules if spec.get("type") not in SHARD_EXCLUDED_RULES])
+        self.halted = False
+
+    def step(self, timestamp: float, prices: np.ndarray, volumes: np.ndarray = None,
+             whale_alert: bool = False) -> tuple:
+        """One tick; returns (decision codes, PnL, buys, buy_more)."""
+        features = self.features.update(prices, volumes)
+        if whale_alert:
+            self.emotional_state = "fear"
+        if self.halted:
+            codes = np.zeros(len(prices), dtype=DECISION_DTYPE)
+        else:
+            codes = self._run_batch(prices, self.emotional_state, features)
+
+        # Mark the positions held since the previous tick, then fill (as main.py)
+        moved = np.nan_to_num(prices - self.last_price)
+        pnl = float(self.position @ moved)
+        np.copyto(self.last_price, prices, where=np.isfinite(prices))
+        self.position += self._units[codes]
+
+        buys = int(np.count_nonzero(codes == self._buy))
+        buy_more = int(np.count_nonzero(codes == self._buy_more))
+        decision = self._labels[self._buy_more if buy_more else self._buy if buys else 0]
+        price = float(np.nanmean(prices)) if len(prices) else 0.0
+        self.history.append(timestamp, decision, price, pnl)
+        self.kill_switch.on_trade(timestamp, decision, price, pnl, self.name)
+        if not self.halted and self.kill_switch.tripped_rules():
+            self.halted = True
+            logger.warning("%s halted by kill switch: %s", self.name,
+                           ", ".join(rule.describe() for rule in self.kill_switch.tripped_rules()))
+        return codes, pnl, buys, buy_more
+
+def _worker_main(worker: int, board_handle: tuple, board_fence: Fence, ring_handle: tuple,
+                 ring_fence: Fence, lo: int, hi: int, symbols, shard_params: dict, columns,
+                 wakeup, poll_interval_s: float):
+    """Worker process: step the shard for every published tick, in order."""
+    board = SharedArrays.attach(board_handle)
+    ring = SpscRing(SharedArrays.attach(ring_handle), ring_fence)
+    shard = StrategyShard(symbols, name=f"shard-{worker}", **shard_params)
+    slots = len(board["timestamp"])
+    published, stop, waiting = board["published"], board["stop"], board["waiting"]
+    prices = board[f"col_{columns[0]}"]
+    volumes = board["col_volume"] if "volume" in columns else None
+    board["ready"][worker] = 1
+
+    seen = 0
+    while True:
+        # One fenced load per batch: every slot up to `latest` is fully written
+        latest = board_fence.load(published)
+        if latest == seen:
+            if stop[0]:
+                break
+            waiting[worker] = 1
+            if board_fence.load(published) == seen and not stop[0]:
+                wakeup.acquire(timeout=poll_interval_s)
+            waiting[worker] = 0
+            continue
+        for seq in range(seen + 1, latest + 1):
+            slot = seq % slots
+            t0 = time.perf_counter_ns()
+            codes, pnl, buys, buy_more = shard.step(
+                float(board["timestamp"][slot]),
+                prices[slot, lo:hi],
+                None if volumes is None else volumes[slot, lo:hi],
+                bool(board["whale_alert"][slot])
+            )
+            board["decisions"][slot, lo:hi] = codes
+            record = (seq, pnl, time.perf_counter_ns() - t0, buys, buy_more, shard.halted)
+            while not ring.push(record):
+                if stop[0]:
+                    return
+                time.sleep(poll_interval_s)
+            seen = seq
+
+class ShardedRuntime:
+    """
+    Feeder and aggregator for n_workers strategy processes.
+        runtime.start()
+        runtime.publish(snapshot)    # MarketSnapshot over `symbols`, in order
+        runtime.collect()            # completed ticks, oldest first
+        runtime.stop()
+    """
+
+    def __init__(self, symbols, n_workers: int = None, slots: int = 64, ring_size: int = 1024,
+                 columns=("price", "volume"), emotional_states=("neutral",), shard_params: dict = None,
+                 start_method: str = "spawn", poll_interval_s: float = 0.0005,
+                 start_timeout_s: float = 60.0, block_when_full: bool = True):
+        self.symbols = np.asarray(symbols, dtype=object)
+        n_workers = (os.cpu_count() or 1) if n_workers is None else n_workers
+        self.n_workers = max(1, min(n_workers, len(self.symbols)))
+        if "price" not in columns:
+            raise ValueError("Sharded runtime columns must include 'price'")
+        self.columns = ["price"] + [c for c in columns if c != "price"]
+        self.slots = slots
+        self.ring_size = ring_size
+        self.emotional_states = list(emotional_states)
+        self.shard_params = dict(shard_params or {})
+        self.poll_interval_s = poll_interval_s
+        self.start_timeout_s = start_timeout_s
+        self.block_when_full = block_when_full
+        self._ctx = multiprocessing.get_context(start_method)
+        bounds = np.linspace(0, len(self.symbols), self.n_workers + 1).astype(int)
+        self.shards = list(zip(bounds[:-1].tolist(), bounds[1:].tolist()))
+
+        self.board = None
+        self._board_fence = None
+        self.rings = []
+        self.processes = []
+        self._wakeups = []
+        self.published = 0
+        self.collected = 0
+        self._completed = deque()
+        self.stats = {"published": 0, "collected": 0, "dropped": 0, "blocked_s": 0.0}
+
+    # ─── Lifecycle ───────────────────────────────────────────────────────
+    def start(self):
+        """Create the shared blocks, spawn the workers and wait until they are ready."""
+        n = len(self.symbols)
+        self.board = SharedArrays(board_spec(n, self.n_workers, self.slots, self.columns))
+        self._board_fence = Fence(self._ctx)
+        self.rings = [SpscRing(SharedArrays(ring_spec(RESULT_DTYPE, self.ring_size)), Fence(self._ctx))
+                      for _ in self.shards]
+        self._last_seq = np.zeros(self.n_workers, dtype=np.int64)
+        self._pnl = np.zeros(self.slots)
+        self._buys = np.zeros(self.slots, dtype=np.int64)
+        self._buy_more = np.zeros(self.slots, dtype=np.int64)
+        self._halted = np.zeros(self.slots, dtype=np.int64)
+        self._busy_ns = np.zeros(self.n_workers, dtype=np.int64)
+
+        for worker, (lo, hi) in enumerate(self.shards):
+            wakeup = self._ctx.Semaphore(0)
+            params = {"emotional_state": self.emotional_states[worker % len(self.emotional_states)],
+                      **self.shard_params}
+            process = self._ctx.Process(
+                target=_worker_main, name=f"StrategyWorker-{worker}", daemon=True,
+                args=(worker, self.board.handle(), self._board_fence, self.rings[worker].arrays.handle(),
+                      self.rings[worker].fence, lo, hi, self.symbols[lo:hi].tolist(), params,
+                      self.columns, wakeup, self.poll_interval_s)
+            )
+            process.start()
+            self._wakeups.append(wakeup)
+            self.processes.append(process)
+
+        deadline = time.monotonic() + self.start_timeout_s
+        while not self.board["ready"].all():
+            self._check_workers()
+            if time.monotonic() > deadline:
+                self.stop()
+                raise RuntimeError(f"Strategy workers not ready after {self.start_timeout_s}s")
+            time.sleep(0.01)
+        logger.info("Started %d strategy workers over %d symbols (%d-slot board, %.1f MB shared).",
+                    self.n_workers, n, self.slots, self.board.shm.size / 1e6)
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the workers and free the shared memory (uncollected ticks are discarded)."""
+        if self.board is None:
+            return
+        self.board["stop"][0] = 1
+        for wakeup in self._wakeups:
+            wakeup.release()
+        for process in self.processes:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        for arrays in [ring.arrays for ring in self.rings] + [self.board]:
+            arrays.close()
+            arrays.unlink()
+        self.board = None
+        self._board_fence = None
+        self.rings = []
+        self.processes = []
+        self._wakeups = []
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _check_workers(self):
+        dead = [p.name for p in self.processes if not p.is_alive()]
+        if dead:
+            raise RuntimeError(f"Strategy worker(s) exited: {', '.join(dead)}")
+
+    # ─── Feeder ──────────────────────────────────────────────────────────
+    def publish(self, snapshot, whale_alert: bool = False):
+        """
+        Broadcast one MarketSnapshot to every worker. Returns its sequence
+        number, or None if it was dropped (board full, block_when_full off).
+        """
+        if len(snapshot) != len(self.symbols):
+            raise ValueError(f"Snapshot has {len(snapshot)} symbols, runtime has {len(self.symbols)}")
+        seq = self.published + 1
+        if seq - self.collected > self.slots:
+            self._drain()
+            if seq - self.collected > self.slots:
+                if not self.block_when_full:
+                    self.stats["dropped"] += 1
+                    return None
+                t0 = time.perf_counter()
+                while seq - self.collected > self.slots:
+                    self._check_workers()
+                    time.sleep(self.poll_interval_s)
+                    self._drain()
+                self.stats["blocked_s"] += time.perf_counter() - t0
+
+        board = self.board
+        slot = seq % self.slots
+        for column in self.columns:
+            values = snapshot.columns.get(column)
+            if values is None:
+                board[f"col_{column}"][slot].fill(np.nan)
+            else:
+                board[f"col_{column}"][slot] = values
+        board["timestamp"][slot] = snapshot.timestamp
+        board["whale_alert"][slot] = whale_alert
+        self._pnl[slot] = 0.0
+        self._buys[slot] = self._buy_more[slot] = self._halted[slot] = 0
+        # Data first, then the sequence number that makes it visible
+        self._board_fence.store(board["published"], seq)
+        self.published = seq
+        self.stats["published"] += 1
+        for worker in np.flatnonzero(board["waiting"]).tolist():
+            self._wakeups[worker].release()
+        return seq
+
+    # ─── Aggregator ──────────────────────────────────────────────────────
+    def _drain(self):
+        for worker, ring in enumerate(self.rings):
+            records = ring.pop_all()
+            if not len(records):
+                continue
+            # One worker reports each tick once, and never more than `slots` ticks ahead
+            slot = (records["seq"] % self.slots).astype(np.intp)
+            self._pnl[slot] += records["pnl"]
+            self._buys[slot] += records["buys"]
+            self._buy_more[slot] += records["buy_more"]
+            self._halted[slot] += records["halted"]
+            self._busy_ns[worker] += int(records["busy_ns"].sum())
+            self._last_seq[worker] = int(records["seq"][-1])
+
+        complete = int(self._last_seq.min())
+        for seq in range(self.collected + 1, complete + 1):
+            slot = seq % self.slots
+            self._completed.append({
+                "seq": seq,
+                "timestamp": float(self.board["timestamp"][slot]),
+                "decisions": self.board["decisions"][slot].copy(),
+                "buys": int(self._buys[slot]),
+                "buy_more": int(self._buy_more[slot]),
+                "pnl": float(self._pnl[slot]),
+                "halted_workers": int(self._halted[slot])
+            })
+        if complete > self.collected:
+            self.stats["collected"] += complete - self.collected
+            self.collected = complete
+
+    def collect(self) -> list:
+        """
+        Ticks every worker has finished since the last call, oldest first:
+        {"seq", "timestamp", "decisions" (DECISION_CODES per symbol),
+         "buys", "buy_more", "pnl", "halted_workers"}.
+        Raises RuntimeError if a worker process has exited.
+        """
+        if self.board is not None:
+            self._check_workers()
+            self._drain()
+        completed = list(self._completed)
+        self._completed.clear()
+        return completed
+
+    def wait_idle(self, timeout: float = 10.0) -> bool:
+        """Block until every published tick is collected (results stay queued for collect())."""
+        deadline = time.monotonic() + timeout
+        while True:
+            self._drain()
+            if self.collected >= self.published:
+                return True
+            self._check_workers()
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(self.poll_interval_s)
+
+    def snapshot(self) -> dict:
+        """Counters plus each worker's busy time (ms spent in its shard's step())."""
+        report = dict(self.stats, workers=self.n_workers, in_flight=self.published - self.collected)
+        if self.board is not None:
+            report["busy_ms"] = (self._busy_ns / 1e6).round(1).tolist()
+        return report
+
+def build_sharded_runtime(symbols, params: dict = None, shard_params: dict = None) -> ShardedRuntime:
+    """Runtime configured from the "sharded_runtime" section of config/parameters.json."""
+    params = {**DEFAULTS, **(params if params is not None else load_parameters("sharded_runtime"))}
+    shard_params = {"history_capacity": params["history_capacity"], **(shard_params or {})}
+    return ShardedRuntime(symbols, params["workers"], params["slots"], params["ring_size"],
+                          params["columns"], params["emotional_states"], shard_params,
+                          params["start_method"], params["poll_interval_s"],
+                          params["start_timeout_s"], params["block_when_full"])
@@ -0,0 +1,154 @@
+"""
+shm_arrays.py
+
+NumPy arrays over multiprocessing.shared_memory for the sharded runtime.
+- SharedArrays: a set of named, fixed-shape arrays laid out in one
+  SharedMemory block. Every array starts on a 64-byte boundary, so
+  counters written by different processes never share a cache line.
+  Another process attaches by (name, spec) and gets views over the same
+  memory: no pickling and no copies.
+- SpscRing: a single-producer / single-consumer ring of structured
+  records. The producer owns `head`, the consumer owns `tail`, and each
+  only ever writes its own counter. push() writes the record before
+  advancing head, and pop_all() reads records before advancing tail.
+  Plain stores to shared memory carry no ordering guarantee across
+  processes (and none at all on weakly ordered CPUs such as ARM), so
+  every counter load and store goes through a shared Fence: its lock's
+  release publishes the writes before it, and its acquire makes them
+  visible to the reader. Uncontended, that is an atomic operation in
+  user space, not a syscall; each side takes it once per push or drain,
+  never per record.
+
+Counters are uint64 and only grow; slot = counter % capacity.
+"""
+
+import multiprocessing
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from core.log_core.log_core import get_logger
+
+logger = get_logger("SharedArrays")
+
+CACHE_LINE = 64
+
+def _layout(spec: dict) -> tuple:
+    """({field: offset}, total size) for spec = {field: (shape, dtype)}."""
+    offsets = {}
+    size = 0
+    for field, (shape, dtype) in spec.items():
+        size = -(-size // CACHE_LINE) * CACHE_LINE
+        offsets[field] = size
+        size += int(np.prod(shape, dtype=np.int64)) * np.dtype(dtype).itemsize
+    return offsets, max(size, 1)
+
+class Fence:
+    """
+    Cross-process ordering point: a multiprocessing lock around counter
+    loads and stores. Everything written before store() is visible to any
+    process whose load() returns the stored value.
+    """
+
+    def __init__(self, ctx=None):
+        self._lock = (ctx or multiprocessing).Lock()
+
+    def load(self, counter: np.ndarray) -> int:
+        with self._lock:
+            return int(counter[0])
+
+    def store(self, counter: np.ndarray, value: int):
+        with self._lock:
+            counter[0] = value
+
+class SharedArrays:
+    """
+    Named arrays in one shared memory block. name=None creates the block
+    (zero-filled); a name attaches to an existing one with the same spec.
+    """
+
+    def __init__(self, spec: dict, name: str = None):
+        offsets, size = _layout(spec)
+        self.spec = spec
+        self.shm = SharedMemory(name=name, create=name is None, size=size)
+        self.name = self.shm.name
+        self.arrays = {
+            field: np.ndarray(shape, dtype=dtype, buffer=self.shm.buf, offset=offsets[field])
+            for field, (shape, dtype) in spec.items()
+        }
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self.arrays[field]
+
+    def handle(self) -> tuple:
+        """(spec, name): what another process needs to attach."""
+        return self.spec, self.name
+
+    @classmethod
+    def attach(cls, handle: tuple):
+        spec, name = handle
+        return cls(spec, name)
+
+    def close(self):
+        self.arrays = {}
+        try:
+            self.shm.close()
+        except BufferError:
+            # Views handed out are still alive; the mapping goes away with the process
+            logger.debug("Shared block %s still has live views; left mapped.", self.name)
+
+    def unlink(self):
+        """Free the block (creator only, after every process is done with it)."""
+        self.shm.unlink()
+
+def ring_spec(dtype: np.dtype, capacity: int) -> dict:
+    """SharedArrays spec for an SpscRing of `capacity` records."""
+    if capacity < 1 or capacity & (capacity - 1):
+        raise ValueError(f"Ring capacity must be a power of two, got {capacity}")
+    return {
+        "head": ((1,), np.uint64),
+        "tail": ((1,), np.uint64),
+        "records": ((capacity,), dtype)
+    }
+
+class SpscRing:
+    """
+    Ring over SharedArrays built from ring_spec(); one producer, one
+    consumer. Both ends must share the same Fence (pass it to the other
+    process along with the arrays' handle).
+    """
+
+    def __init__(self, arrays: SharedArrays, fence: Fence):
+        self.arrays = arrays
+        self.fence = fence
+        self._head = arrays["head"]
+        self._tail = arrays["tail"]
+        self.records = arrays["records"]
+        self.capacity = len(self.records)
+        self._mask = self.capacity - 1
+
+    def __len__(self):
+        return self.fence.load(self._head) - self.fence.load(self._tail)
+
+    def push(self, record) -> bool:
+        """Producer: append one record (a tuple in dtype order); False if the ring is full."""
+        head = int(self._head[0])
+        if head - self.fence.load(self._tail) >= self.capacity:
+            return False
+        self.records[head & self._mask] = record
+        self.fence.store(self._head, head + 1)
+        return True
+
+    def pop_all(self) -> np.ndarray:
+        """Consumer: every record pushed so far, oldest first (a copy; the slots are released)."""
+        tail = int(self._tail[0])
+        head = self.fence.load(self._head)
+        if head == tail:
+            return self.records[:0].copy()
+        start, n = tail & self._mask, head - tail
+        if start + n <= self.capacity:
+            records = self.records[start:start + n].copy()
+        else:
+            records = np.concatenate((self.records[start:], self.records[:start + n - self.capacity]))
+        self.fence.store(self._tail, head)
+        return records
@@ -0,0 +1,240 @@
+"""
+tick_scheduler.py
+
+Deadline-driven cycle scheduler for the main trading loop.
+Cycles fire on a fixed clock grid (t0, t0 + interval, t0 + 2 * interval,
+...) instead of "sleep N seconds after each cycle", so the cadence does
+not drift with how long fetch and execution take.
+
+- Stale ticks are dropped, not queued. When the loop comes back late,
+  it runs the most recent tick that is due, and the older ones only
+  count as dropped.
+- Every cycle has a deadline (scheduled time + deadline_s). Missed
+  deadlines, start jitter (actual minus scheduled start) and cycle
+  durations are tracked in fixed-memory HdrHistograms.
+- Backpressure: after lag_trigger consecutive cycles that ran into the
+  next tick, the interval is stretched by `backoff` (up to
+  max_interval_s). After recover_after on-time cycles short enough for
+  the smaller interval, it shrinks back toward the configured interval.
+  While stretched, `lagging` is True so the loop can shed optional work.
+- wait() can take a blocking wait function (e.g. an event-bus
+  Subscription.get). An event that arrives before the next tick starts
+  an immediate, unscheduled cycle and leaves the grid unchanged. With a
+  drain function (e.g. Subscription.poll), a burst of pending events is
+  coalesced into one cycle that sees the latest of them. At most one
+  event cycle starts per interval; an event that comes sooner waits for
+  that, or rides the next scheduled tick if it comes first. Event cycles
+  count toward backpressure like scheduled ones.
+
+Configured in config/parameters.json under "scheduler".
+"""
+
+import time
+
+from config.config_loader import load_parameters
+from core.latency_monitor.hdr_histogram import HdrHistogram
+from core.log_core.log_core import get_logger
+
+logger = get_logger("TickScheduler")
+
+DEFAULTS = {
+    "interval_s": 0.5,
+    "deadline_s": None,         # default: the interval
+    "cycles": None,             # None: run until stopped
+    "backoff": 2.0,
+    "max_interval_s": 4.0,
+    "lag_trigger": 3,
+    "recover_after": 10,
+    "spin_s": 0.0
+}
+
+class Tick:
+    """
+    One cycle: its scheduled start, actual start and the event it carries
+    (if any). unscheduled: the event started it off the clock grid.
+    """
+
+    __slots__ = ("index", "scheduled", "started", "deadline", "event", "unscheduled")
+
+    def __init__(self, index: int, scheduled: float, started: float, deadline: float, event=None,
+                 unscheduled: bool = False):
+        self.index = index
+        self.scheduled = scheduled
+        self.started = started
+        self.deadline = deadline
+        self.event = event
+        self.unscheduled = unscheduled
+
+class TickScheduler:
+    """
+    spin_s: sleep until spin_s before a tick, then busy-wait, trading CPU
+    for lower start jitter (0 disables).
+    """
+
+    def __init__(self, interval_s: float = 0.5, deadline_s: float = None, backoff: float = 2.0,
+                 max_interval_s: float = None, lag_trigger: int = 3, recover_after: int = 10,
+                 spin_s: float = 0.0, clock=time.perf_counter, sleep=time.sleep):
+        if interval_s <= 0:
+            raise ValueError(f"Scheduler interval must be > 0, got {interval_s}")
+        self.interval_s = interval_s
+        self.deadline_s = interval_s if deadline_s is None else deadline_s
+        self.backoff = backoff
+        self.max_interval_s = max(interval_s, max_interval_s if max_interval_s is not None else interval_s)
+        self.lag_trigger = lag_trigger
+        self.recover_after = recover_after
+        self.spin_s = spin_s
+        self.clock = clock
+        self.sleep = sleep
+        self.current_interval = interval_s
+        self.jitter = HdrHistogram()            # ns
+        self.durations = HdrHistogram()         # ns
+        self.stats = {
+            "cycles": 0,
+            "event_cycles": 0,
+            "missed_deadlines": 0,
+            "dropped_ticks": 0,
+            "coalesced_events": 0,
+            "backpressure_steps": 0
+        }
+        self._next = None
+        self._last_event_cycle = None
+        self._late_streak = 0
+        self._on_time_streak = 0
+
+    @property
+    def lagging(self) -> bool:
+        """True while backpressure has stretched the interval."""
+        return self.current_interval > self.interval_s
+
+    def start(self):
+        """Put the first tick on the clock now."""
+        self._next = self.clock()
+
+    def wait(self, wait_fn=None, drain_fn=None) -> Tick:
+        """
+        Block until the next tick is due and return it. wait_fn(timeout)
+        is called instead of sleeping. If it returns something other than
+        None, that event starts an unscheduled cycle (at most one per
+        interval). drain_fn() returns the next pending event or None
+        without blocking; events it returns replace the one in hand, so a
+        cycle sees the latest. A scheduled tick carries the latest pending
+        event too.
+        """
+        if self._next is None:
+            self.start()
+        event = None
+        now = self.clock()
+        while now < self._next:
+            if wait_fn is None:
+                self._sleep_until(self._next)
+                break
+            if event is not None:
+                ready = self._next_event_cycle()
+                if now >= ready:
+                    return self._event_tick(event)
+                timeout = min(self._next, ready) - now
+            else:
+                timeout = self._next - now
+            new = wait_fn(timeout)
+            if new is not None:
+                if event is not None:
+                    self.stats["coalesced_events"] += 1
+                event = self._drain(new, drain_fn)
+            now = self.clock()
+        # Late: every tick older than the latest due one is stale
+        stale = int((self.clock() - self._next) // self.current_interval)
+        if stale > 0:
+            self.stats["dropped_ticks"] += stale
+            self._next += stale * self.current_interval
+
+        scheduled = self._next
+        self._next = scheduled + self.current_interval
+        if drain_fn is not None:
+            event = self._drain(event, drain_fn)
+        started = self.clock()
+        self.jitter.record(int((started - scheduled) * 1e9))
+        return Tick(self.stats["cycles"], scheduled, started, scheduled + self.deadline_s, event)
+
+    def _next_event_cycle(self) -> float:
+        """Earliest start for the next unscheduled cycle (one per interval)."""
+        if self._last_event_cycle is None:
+            return float("-inf")
+        return self._last_event_cycle + self.current_interval
+
+    def _event_tick(self, event) -> Tick:
+        started = self.clock()
+        self._last_event_cycle = started
+        self.stats["event_cycles"] += 1
+        return Tick(self.stats["cycles"], started, started, started + self.deadline_s, event, unscheduled=True)
+
+    def _drain(self, event, drain_fn):
+        """The latest of event and everything drain_fn still has pending."""
+        if drain_fn is None:
+            return event
+        while True:
+            new = drain_fn()
+            if new is None:
+                return event
+            if event is not None:
+                self.stats["coalesced_events"] += 1
+            event = new
+
+    def _sleep_until(self, target: float):
+        remaining = target - self.clock() - self.spin_s
+        if remaining > 0:
+            self.sleep(remaining)
+        while self.clock() < target:
+            pass
+
+    def done(self, tick: Tick) -> bool:
+        """Close a cycle; returns True if it met its deadline."""
+        end = self.clock()
+        self.stats["cycles"] += 1
+        self.durations.record(int((end - tick.started) * 1e9))
+        on_time = end <= tick.deadline
+        if not on_time:
+            self.stats["missed_deadlines"] += 1
+
+        # Backpressure: cycles that run into the next tick mean execution lags
+        # the clock (an unscheduled cycle also lags if it delays the next tick)
+        late = end > tick.scheduled + self.current_interval
+        if tick.unscheduled:
+            late = late or end > self._next
+        if late:
+            self._late_streak += 1
+            self._on_time_streak = 0
+            if self._late_streak >= self.lag_trigger and self.current_interval < self.max_interval_s:
+                self.current_interval = min(self.current_interval * self.backoff, self.max_interval_s)
+                self._next = max(self._next, tick.scheduled + self.current_interval)
+                self.stats["backpressure_steps"] += 1
+                self._late_streak = 0
+                logger.warning("Cycles lag the clock; interval stretched to %.3fs.", self.current_interval)
+        else:
+            self._late_streak = 0
+            # Only cycles that would fit the shorter interval count toward recovery
+            if end - tick.started <= self.current_interval / self.backoff:
+                self._on_time_streak += 1
+            else:
+                self._on_time_streak = 0
+            if self._on_time_streak >= self.recover_after and self.lagging:
+                self.current_interval = max(self.current_interval / self.backoff, self.interval_s)
+                self._on_time_streak = 0
+                logger.info("Cycles on time again; interval back to %.3fs.", self.current_interval)
+        return on_time
+
+    def snapshot(self) -> dict:
+        """Counters plus start jitter and cycle duration percentiles (microseconds)."""
+        report = dict(self.stats, interval_s=self.current_interval)
+        for name, hist in (("jitter", self.jitter), ("duration", self.durations)):
+            p50, p99 = hist.percentiles((0.5, 0.99))
+            report[f"{name}_p50_us"] = p50 / 1000
+            report[f"{name}_p99_us"] = p99 / 1000
+            report[f"{name}_max_us"] = hist.max / 1000
+        return report
+
+def build_tick_scheduler(params: dict = None) -> TickScheduler:
+    """Scheduler configured from the "scheduler" section of config/parameters.json."""
+    params = {**DEFAULTS, **(params if params is not None else load_parameters("scheduler"))}
+    return TickScheduler(params["interval_s"], params["deadline_s"], params["backoff"],
+                         params["max_interval_s"], params["lag_trigger"], params["recover_after"],
+                         params["spin_s"])
@@ -0,0 +1,32 @@
+"""
+decisions.py
+
+Decision labels and their compact integer codes, shared by the agents
+(synergy conductor, decision table) and the core columnar stores (trade
+history, sharded runtime) so neither side has to import the other.
+Codes are an index into DECISION_LABELS and are stored as DECISION_DTYPE.
+
+Also the position semantics of each decision (DECISION_UNITS), used by
+the position book, the kill-switch rules and the replays.
+"""
+
+import numpy as np
+
+DECISION_LABELS = ("HOLD", "BUY", "BUY_MORE", "SELL")
+DECISION_CODES = {label: code for code, label in enumerate(DECISION_LABELS)}
+
+# Code storage type; MAX_DECISION_LABELS is how many labels it can index
+DECISION_DTYPE = np.int8
+MAX_DECISION_LABELS = int(np.iinfo(DECISION_DTYPE).max) + 1
+
+# Position units implied by each decision (HOLD: none)
+DECISION_UNITS = {"BUY": 1.0, "BUY_MORE": 2.0, "SELL": -1.0}
+
+# "REVERT_<decision>" undoes a fill that was booked but never confirmed
+REVERSAL_PREFIX = "REVERT_"
+
+def position_units(decision: str) -> float:
+    """Units a decision adds to the position, including reversals of unfilled orders."""
+    if decision.startswith(REVERSAL_PREFIX):
+        return -DECISION_UNITS.get(decision[len(REVERSAL_PREFIX):], 0.0)
+    return DECISION_UNITS.get(decision, 0.0)
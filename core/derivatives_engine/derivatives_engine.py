@@ -1,8 +1,222 @@
 """
 derivatives_engine.py
 
-Phase 7 – scaffold only.
+Phase 7 – perp positions with margin, funding and liquidation monitoring.
+Every open position (isolated margin) occupies a slot in a set of NumPy
+columns: market id, signed size, entry price, collateral and the venue's
+funding index at open. update() re-computes, in one vectorized batch for
+all positions:
+
+ - accrued funding     = -size * (funding_index_now - funding_index_at_open)
+ - equity              = collateral + size * (mark - entry) + accrued funding
+ - margin ratio        = equity / (|size| * mark)
+ - liquidation price   = mark at which equity == |size| * mark * maintenance
+ - distance to liq.    = relative adverse move from mark to liquidation price
+
+The minimum distance is cached after each update, so the KILL_SWITCH can
+poll it in O(1) (see the "liquidation_distance" rule).
+
+Orders go to a venue object (fill / mark_prices / funding_indices); the
+only one shipped is the local SimulatedPerpVenue - no live protocol.
 """
 
+import numpy as np
+
+from config.config_loader import load_parameters
+from .sim_perp_venue import SimulatedPerpVenue
+from core.log_core.log_core import get_logger
+
+logger = get_logger("DerivativesEngine")
+
+DEFAULTS = {
+    "venue": "simulated",
+    "maintenance_margin": 0.05,
+    "leverage": 3.0,
+    "markets": {"SOL-PERP": 20.0}
+}
+
+class DerivativesEngine:
+    def __init__(self, venue=None, maintenance_margin: float = 0.05, leverage: float = 3.0,
+                 initial_capacity: int = 64):
+        self.venue = venue
+        self.maintenance_margin = maintenance_margin
+        self.leverage = leverage
+        self.capacity = 0
+        self._free = []                 # reusable slots of closed positions
+        self.n_slots = 0                # high-water mark of used slots
+        self.closed_pnl = 0.0
+        self.min_distance = np.inf      # cached by update()
+        self._alloc(max(1, initial_capacity))
+
+    def _alloc(self, capacity: int):
+        n = self.n_slots
+        float_columns = ("size", "entry_price", "collateral", "funding_at_open",
+                         "mark", "funding", "equity", "margin_ratio", "liq_price", "distance")
+        for name in float_columns:
+            column = np.zeros(capacity, dtype=np.float64)
+            if self.capacity:
+                column[:n] = getattr(self, name)[:n]
+            setattr(self, name, column)
+        market = np.zeros(capacity, dtype=np.int64)
+        active = np.zeros(capacity, dtype=bool)
+        if self.capacity:
+            market[:n] = self.market[:n]
+            active[:n] = self.active[:n]
+        self.market = market
+        self.active = active
+        self.distance[n:] = np.inf
+        self.capacity = capacity
+
+    # ─── Opening / closing ───────────────────────────────────────────────
+    def open_position(self, market_id: int, size: float, entry_price: float,
+                      collateral: float, funding_index: float = 0.0) -> int:
+        """Book a filled position; returns its position id (slot)."""
+        if self._free:
+            pid = self._free.pop()
+        else:
+            if self.n_slots == self.capacity:
+                self._alloc(self.capacity * 2)
+            pid = self.n_slots
+            self.n_slots += 1
+        self.market[pid] = market_id
+        self.size[pid] = size
+        self.entry_price[pid] = entry_price
+        self.collateral[pid] = collateral
+        self.funding_at_open[pid] = funding_index
+        self.mark[pid] = entry_price
+        self.active[pid] = True
+        return pid
+
+    def close_position(self, pid: int, exit_price: float, funding_index: float = None) -> float:
+        """Close a position; returns its realized PnL (price move + funding)."""
+        if not self.active[pid]:
+            raise ValueError(f"Position {pid} is not open")
+        if funding_index is None:
+            funding = self.funding[pid]
+        else:
+            funding = -self.size[pid] * (funding_index - self.funding_at_open[pid])
+        pnl = float(self.size[pid] * (exit_price - self.entry_price[pid]) + funding)
+        self.active[pid] = False
+        self.size[pid] = 0.0
+        self.distance[pid] = np.inf
+        self._free.append(pid)
+        self.closed_pnl += pnl
+        return pnl
+
+    def open_short(self, symbol: str, size: float, collateral: float = None) -> int:
+        """Market-sell `size` units of a perp on the venue; collateral defaults to notional / leverage."""
+        return self._open_on_venue(symbol, -abs(size), collateral)
+
+    def open_long(self, symbol: str, size: float, collateral: float = None) -> int:
+        return self._open_on_venue(symbol, abs(size), collateral)
+
+    def _open_on_venue(self, symbol: str, size: float, collateral: float):
+        venue = self._require_venue()
+        market_id = venue.market_id(symbol)
+        price = venue.fill(symbol, size)
+        if collateral is None:
+            collateral = abs(size) * price / self.leverage
+        return self.open_position(market_id, size, price, collateral, venue.funding_indices()[market_id])
+
+    def close_short(self, symbol: str) -> float:
+        """Buy back every open short on `symbol`; returns total realized PnL."""
+        venue = self._require_venue()
+        market_id = venue.market_id(symbol)
+        pnl = 0.0
+        for pid in np.flatnonzero(self.active & (self.market == market_id) & (self.size < 0)):
+            price = venue.fill(symbol, -self.size[pid])
+            pnl += self.close_position(pid, price, venue.funding_indices()[market_id])
+        return pnl
+
+    def advance(self, dt_hours: float):
+        """
+        Move a simulated venue forward by dt_hours (marks move, funding
+        accrues). Live venues move on their own, so this is a no-op there.
+        """
+        step = getattr(self.venue, "step", None)
+        if step is not None and dt_hours > 0:
+            step(dt_hours)
+
+    def _require_venue(self):
+        if self.venue is None:
+            raise RuntimeError("DerivativesEngine has no venue attached")
+        return self.venue
+
+    # ─── Per-tick risk batch ─────────────────────────────────────────────
+    def update(self, mark_prices=None, funding_indices=None) -> float:
+        """
+        Re-compute funding, equity, margin ratio, liquidation price and
+        distance to liquidation for every open position, against per-market
+        vectors (defaults: the venue's current marks and funding indices).
+        Returns the minimum distance to liquidation (inf with no positions).
+        """
+        if mark_prices is None:
+            mark_prices = self._require_venue().mark_prices()
+        if funding_indices is None:
+            funding_indices = self._require_venue().funding_indices()
+        n = self.n_slots
+        if n == 0:
+            self.min_distance = np.inf
+            return self.min_distance
+
+        active = self.active[:n]
+        market = self.market[:n]
+        size = self.size[:n]
+        abs_size = np.abs(size)
+        mark = np.take(mark_prices, market, out=self.mark[:n])
+        funding = np.multiply(-size, np.take(funding_indices, market) - self.funding_at_open[:n],
+                              out=self.funding[:n])
+        # Collateral plus funding, i.e. equity excluding the price move
+        base = self.collateral[:n] + funding
+        equity = np.add(base, size * (mark - self.entry_price[:n]), out=self.equity[:n])
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            np.divide(equity, abs_size * mark, out=self.margin_ratio[:n])
+            # size * (p - entry) + base = |size| * p * mm  =>  solve for p
+            np.divide(size * self.entry_price[:n] - base,
+                      size - abs_size * self.maintenance_margin, out=self.liq_price[:n])
+            distance = np.divide(np.sign(size) * (mark - self.liq_price[:n]), mark, out=self.distance[:n])
+        distance[~active] = np.inf
+        np.maximum(self.liq_price[:n], 0.0, out=self.liq_price[:n])
+
+        self.min_distance = float(distance.min())
+        return self.min_distance
+
+    def distance_to_liquidation(self) -> float:
+        """Cached minimum relative distance to liquidation over all open positions (from the last update)."""
+        return self.min_distance
+
+    def liquidatable(self) -> np.ndarray:
+        """Position ids whose equity is at or below maintenance margin at the last update."""
+        n = self.n_slots
+        return np.flatnonzero(self.active[:n] & (self.distance[:n] <= 0.0))
+
+    def open_positions(self) -> int:
+        return int(np.count_nonzero(self.active[:self.n_slots]))
+
+    def snapshot(self) -> dict:
+        n = self.n_slots
+        active = self.active[:n]
+        return {
+            "open_positions": int(np.count_nonzero(active)),
+            "equity": float(self.equity[:n][active].sum()),
+            "accrued_funding": float(self.funding[:n][active].sum()),
+            "closed_pnl": self.closed_pnl,
+            "min_distance_to_liquidation": self.min_distance
+        }
+
+def build_derivatives_engine(params: dict = None) -> DerivativesEngine:
+    """Engine configured from the "derivatives" section of config/parameters.json."""
+    params = {**DEFAULTS, **(params if params is not None else load_parameters("derivatives"))}
+    venue = None
+    if params["venue"] == "simulated":
+        venue = SimulatedPerpVenue(params["markets"])
+    return DerivativesEngine(venue, params["maintenance_margin"], params["leverage"])
+
+# Process-wide engine (polled by the kill switch)
+derivatives_engine = build_derivatives_engine()
+
 def derivatives_engine_init():
-    print("[DerivativesEngine] Placeholder init — Phase 7 scaffold loaded.")
+    venue = type(derivatives_engine.venue).__name__ if derivatives_engine.venue else "none"
+    logger.info("Initialized — venue: %s, maintenance margin %.1f%%.",
+                venue, derivatives_engine.maintenance_margin * 100)
@@ -5,9 +5,20 @@ Phase 3: Minimal demonstration of EGO_CORE.
 Incorporates an 'emotional' factor that might alter final synergy decisions.
 """
 
+import numpy as np
+
+from core.log_core.log_core import get_logger
+
+logger = get_logger("EGO_CORE")
+
+# States the overlay tells apart; any other state leaves decisions unchanged, like "neutral"
+EMOTIONAL_STATES = ("neutral", "rage", "fear")
+# int8 codes for recorded states (TradeHistory); unknown states record as "neutral"
+EMOTIONAL_STATE_CODES = {state: code for code, state in enumerate(EMOTIONAL_STATES)}
+
 def ego_core_init():
     """Initialize EGO_CORE (placeholder)."""
-    print("[EGO_CORE] Initialized.")
+    logger.info("Initialized.")
 
 def apply_emotional_overlay(decision: str, emotional_state: str):
     """
@@ -16,11 +27,26 @@ def apply_emotional_overlay(decision: str, emotional_state: str):
     If 'fear', we might downgrade a BUY to HOLD.
     """
     if emotional_state == "rage" and decision == "BUY":
-        print("[EGO_CORE] RAGE state: Amplifying BUY decision (placeholder).")
+        logger.info("RAGE state: Amplifying BUY decision (placeholder).")
         # A real scenario might increase buy size or reduce hold thresholds.
         return "BUY_MORE"  # A custom signal
     elif emotional_state == "fear" and decision == "BUY":
-        print("[EGO_CORE] FEAR state: Changing BUY to HOLD.")
+        logger.info("FEAR state: Changing BUY to HOLD.")
         return "HOLD"
     else:
         return decision
+
+def apply_emotional_overlay_batch(buy_mask, emotional_states):
+    """
+    Vectorized apply_emotional_overlay for the batch conductor.
+    buy_mask marks ticks whose pre-overlay decision is BUY; emotional_states
+    is a single state or an array of states aligned with buy_mask.
+    Returns (buy_mask, buy_more_mask) after the overlay (no prints).
+    """
+    buy_mask = np.asarray(buy_mask, dtype=bool)
+    emotional_states = np.asarray(emotional_states)
+
+    rage = buy_mask & (emotional_states == "rage")
+    fear = buy_mask & (emotional_states == "fear")
+    # RAGE turns BUY into BUY_MORE, FEAR turns BUY into HOLD
+    return buy_mask & ~rage & ~fear, rage
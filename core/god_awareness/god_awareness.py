@@ -1,42 +1,121 @@
 """
 god_awareness.py
 
-Phase 5: Introduce a basic GOD_AWARENESS module that
-monitors (simulated) whale or suspicious activity. In a future phase,
-we can connect real on-chain watchers or aggregator APIs.
-
-Potential checks:
-- Large wallet movements
-- Sudden token dumps
-- Suspicious contract calls
+Phase 5: GOD_AWARENESS module that monitors whale or suspicious activity.
+Each scan feeds the next batch of wallet transfers through WhaleDetector
+(see whale_detector.py). It flags large single transfers and wallets that
+accumulate or dump fast, using fixed-memory sliding-window sketches.
+
+Transfers come from the "god_awareness" section of config/parameters.json:
+- "replay": a recorded transfer file in logs/ (see transfer_stream.py),
+  the default. Without the recording there is no transfer source and
+  whale alerts are disabled: fabricated whales must not drive the live
+  loop's "fear" state.
+- "synthetic": seeded simulated traffic with planted whales, only when
+  configured explicitly (benchmarks, demos)
+In a future phase, we can connect real on-chain watchers or aggregator APIs.
 """
 
-import time
-import random
+import os
+
+from config.config_loader import load_parameters
+from .transfer_stream import SyntheticTransfers, TransferReplay
+from .whale_detector import build_whale_detector, describe_alert
+from core.log_core.log_core import get_logger
+
+logger = get_logger("GodAwareness")
+
+LOGS_DIR = os.path.join(os.path.dirname(__file__), "../../logs")
+
+DEFAULTS = {
+    "source": "replay",
+    "transfer_file": "transfers.bin",
+    "batch_size": 10000,
+    "loop": True,
+    "synthetic": {},
+    "detector": {}
+}
+
+_params = {**DEFAULTS, **load_parameters("god_awareness")}
+
+# Process-wide detector; the transfer source is opened on first use
+whale_detector = build_whale_detector(_params["detector"])
+transfer_source = None
+_source_opened = False
+
+def build_transfer_source(params: dict = None):
+    """
+    TransferReplay of the configured recording, SyntheticTransfers when
+    "source" is "synthetic", or None (whale alerts disabled) when the
+    recording is missing.
+    """
+    params = {**DEFAULTS, **(params if params is not None else load_parameters("god_awareness"))}
+    if params["source"] == "synthetic":
+        logger.warning("Synthetic transfers: whale alerts are simulated.")
+        return SyntheticTransfers(batch_size=params["batch_size"], **params["synthetic"])
+    if params["source"] != "replay":
+        raise ValueError(f"Unknown transfer source: {params['source']}")
+    path = os.path.join(LOGS_DIR, params["transfer_file"])
+    if not os.path.exists(path):
+        logger.warning("Transfer recording %s not found; whale alerts disabled.", path)
+        return None
+    return TransferReplay(path, params["batch_size"], params["loop"])
+
+def get_transfer_source():
+    """The process-wide transfer source (None: whale alerts disabled)."""
+    global transfer_source, _source_opened
+    if not _source_opened:
+        transfer_source = build_transfer_source(_params)
+        _source_opened = True
+    return transfer_source
+
+def whale_alerts_enabled() -> bool:
+    return get_transfer_source() is not None
 
 def god_awareness_init():
-    """Initialize God Awareness (placeholder)."""
-    print("[GodAwareness] Initialized.")
+    """Initialize God Awareness and open the transfer source."""
+    source = get_transfer_source()
+    if source is None:
+        logger.info("Initialized — no transfer source, whale alerts disabled.")
+        return
+    logger.info("Initialized — %s transfers, %.1f MB of sketches.",
+                type(source).__name__, whale_detector.nbytes / 1e6)
 
 def scan_for_whale_activity():
     """
-    Simulate scanning for big wallet moves.
-    Returns a dict with 'whale_alert' = True/False, 'info' with details, etc.
-    In real usage, we'd query an on-chain data source or event aggregator.
+    Feed the next batch of transfers through the whale detector.
+    Returns a dict with 'whale_alert' = True/False, 'info' with details and
+    'alerts' with the detector's alert dicts.
     """
-    # For demonstration, randomly decide if there's suspicious activity.
-    # In the future: connect to actual Solana analytics or mempool watchers.
-    suspicious_chance = random.random()
-    if suspicious_chance < 0.2:
+    source = get_transfer_source()
+    if source is None:
         return {
-            "whale_alert": True,
-            "info": "Detected large wallet dumping tokens"
+            "whale_alert": False,
+            "info": "No transfer source (whale alerts disabled)",
+            "alerts": []
+        }
+    batch = source.next_batch()
+    if batch is None:
+        return {
+            "whale_alert": False,
+            "info": "Transfer replay finished",
+            "alerts": []
         }
-    else:
+    alerts = whale_detector.process(batch)
+    if not alerts:
         return {
             "whale_alert": False,
-            "info": "No suspicious whale moves"
+            "info": "No suspicious whale moves",
+            "alerts": []
         }
+    info = "; ".join(describe_alert(alert) for alert in alerts[:3])
+    if len(alerts) > 3:
+        info += f" (+{len(alerts) - 3} more)"
+    return {
+        "whale_alert": True,
+        "info": info,
+        "alerts": alerts
+    }
 
 def handle_whale_alert():
     """
@@ -44,4 +123,4 @@ def handle_whale_alert():
     or raise risk in SCORING_ENGINE, or trip kill switches if extreme.
     """
     # For now, we just log. We'll integrate with synergy or reflection in main.py.
-    print("[GodAwareness] Whale alert! Possibly reduce positions or raise caution.")
+    logger.warning("Whale alert! Possibly reduce positions or raise caution.")
@@ -0,0 +1,159 @@
+"""
+sketches.py
+
+Fixed-memory streaming sketches for GOD_AWARENESS.
+ - SlidingCountMin  weighted Count-Min sketch over a sliding time window
+ - HeavyHitters     the `capacity` heaviest keys in that window
+
+Keys are uint64 wallet ids and weights are non-negative transfer amounts.
+Everything is batch-oriented: add() folds a whole batch in with a few
+vector operations per sketch row, with no Python loop over events.
+
+The window is split into `buckets` sub-sketches (a ring). Events go into
+the bucket of their timestamp. When time moves past a bucket boundary,
+the oldest bucket is cleared and reused, so the window covers the last
+buckets - 1 full buckets plus the current one. A running window sum is
+rebuilt from the buckets on every rotation, so expiry never drifts.
+
+Count-Min never underestimates. With width w and depth d, an estimate
+exceeds the true windowed total by more than e / w * (total window weight)
+with probability at most exp(-d). HeavyHitters keeps a bounded candidate
+table in the spirit of Space-Saving: a key enters when its estimate beats
+the smallest tracked one, and the table is re-ranked from the sketch on
+every batch, so keys that go quiet age out with the window.
+"""
+
+import numpy as np
+
+_ADD_AT_MAX = 4096      # batches up to this size use np.add.at, larger ones bincount
+
+class SlidingCountMin:
+    def __init__(self, window_s: float, buckets: int = 6, width: int = 2 ** 14,
+                 depth: int = 4, seed: int = 0):
+        if width < 2 or width & (width - 1):
+            raise ValueError(f"Count-Min width must be a power of two, got {width}")
+        if buckets < 1 or depth < 1 or window_s <= 0:
+            raise ValueError("Count-Min needs window_s > 0, buckets >= 1 and depth >= 1")
+        self.window_s = float(window_s)
+        self.bucket_s = self.window_s / buckets
+        self.n_buckets = buckets
+        self.width = width
+        self.depth = depth
+        self.buckets = np.zeros((buckets, depth, width))
+        self.window = np.zeros((depth, width))
+        self.epoch = None           # bucket number (timestamp // bucket_s) being filled
+
+        # Multiply-add-shift hashing: one odd multiplier and offset per row
+        rng = np.random.default_rng(seed)
+        self._mul = (rng.integers(0, 2 ** 63, depth, dtype=np.uint64) << np.uint64(1)) | np.uint64(1)
+        self._offset = rng.integers(0, 2 ** 63, depth, dtype=np.uint64)
+        self._shift = np.uint64(64 - (width.bit_length() - 1))
+        self._row = np.arange(depth)[:, None]
+
+    def _columns(self, keys) -> np.ndarray:
+        """(depth, n) sketch columns of n keys."""
+        keys = np.asarray(keys, dtype=np.uint64)
+        return ((self._mul[:, None] * keys + self._offset[:, None]) >> self._shift).astype(np.intp)
+
+    def advance(self, epoch: int):
+        """Move the window forward to bucket number `epoch`, expiring old buckets."""
+        if self.epoch is None:
+            self.epoch = epoch
+            return
+        steps = epoch - self.epoch
+        if steps <= 0:
+            return
+        if steps >= self.n_buckets:
+            self.buckets[:] = 0.0
+        else:
+            for k in range(1, steps + 1):
+                self.buckets[(self.epoch + k) % self.n_buckets] = 0.0
+        self.epoch = epoch
+        np.sum(self.buckets, axis=0, out=self.window)
+
+    def add(self, times, keys, weights):
+        """
+        Fold in a batch of events in time order. Events older than the
+        current bucket are counted in it (late arrivals are not dropped).
+        """
+        times = np.asarray(times, dtype=np.float64)
+        if not len(times):
+            return
+        keys = np.asarray(keys, dtype=np.uint64)
+        weights = np.asarray(weights, dtype=np.float64)
+        epochs = np.floor_divide(times, self.bucket_s).astype(np.int64)
+        splits = np.flatnonzero(epochs[1:] != epochs[:-1]) + 1
+        starts = np.concatenate(([0], splits))
+        ends = np.concatenate((splits, [len(times)]))
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            self.advance(int(epochs[start]))
+            self._add(keys[start:end], weights[start:end])
+
+    def _add(self, keys, weights):
+        columns = self._columns(keys)
+        bucket = self.buckets[self.epoch % self.n_buckets]
+        if len(keys) <= _ADD_AT_MAX:
+            np.add.at(bucket, (self._row, columns), weights)
+            np.add.at(self.window, (self._row, columns), weights)
+            return
+        for r in range(self.depth):
+            counts = np.bincount(columns[r], weights, minlength=self.width)
+            bucket[r] += counts
+            self.window[r] += counts
+
+    def estimate(self, keys) -> np.ndarray:
+        """Windowed total per key (never below the true total)."""
+        if not len(keys):
+            return np.zeros(0)
+        return self.window[self._row, self._columns(keys)].min(axis=0)
+
+    def total(self) -> float:
+        """Total weight in the window (exact)."""
+        return float(self.window[0].sum())
+
+    @property
+    def nbytes(self) -> int:
+        return self.buckets.nbytes + self.window.nbytes
+
+class HeavyHitters:
+    """The `capacity` keys with the largest windowed totals, with their estimates."""
+
+    def __init__(self, window_s: float, capacity: int = 256, **sketch_params):
+        if capacity < 1:
+            raise ValueError(f"HeavyHitters capacity must be >= 1, got {capacity}")
+        self.sketch = SlidingCountMin(window_s, **sketch_params)
+        self.capacity = capacity
+        self.keys = np.zeros(0, dtype=np.uint64)
+        self.estimates = np.zeros(0)
+
+    def add(self, times, keys, weights):
+        keys = np.asarray(keys, dtype=np.uint64)
+        self.sketch.add(times, keys, weights)
+        if not len(keys):
+            return
+        # Re-rank the tracked keys (the window may have moved), then admit
+        # batch keys that beat the smallest of them
+        tracked = self.sketch.estimate(self.keys)
+        floor = tracked.min() if len(self.keys) >= self.capacity else 0.0
+        entrants = keys[self.sketch.estimate(keys) > floor]
+        candidates = np.unique(np.concatenate((self.keys, entrants)))
+        estimates = self.sketch.estimate(candidates)
+        if len(candidates) > self.capacity:
+            keep = np.argpartition(estimates, len(candidates) - self.capacity)[-self.capacity:]
+            candidates, estimates = candidates[keep], estimates[keep]
+        live = estimates > 0.0
+        self.keys, self.estimates = candidates[live], estimates[live]
+
+    def refresh(self):
+        """Re-read the tracked estimates, e.g. after advance() with no new events."""
+        self.estimates = self.sketch.estimate(self.keys)
+
+    def top(self, k: int = None):
+        """(keys, estimates) of the k heaviest tracked keys, heaviest first."""
+        order = np.argsort(self.estimates, kind="stable")[::-1][:k]
+        return self.keys[order], self.estimates[order]
+
+    @property
+    def nbytes(self) -> int:
+        # Candidate arrays are bounded by capacity; count them at full size
+        return self.sketch.nbytes + self.capacity * (self.keys.itemsize + self.estimates.itemsize)
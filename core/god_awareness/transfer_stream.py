@@ -0,0 +1,180 @@
+"""
+transfer_stream.py
+
+Transfer sources for GOD_AWARENESS.
+- Recorded transfer files: a 16-byte header (magic, version, record size)
+  followed by fixed-width little-endian records (timestamp, source wallet,
+  destination wallet, amount). Wallets are uint64 ids (wallet_id() hashes
+  an address). The layout matches the trade journal's.
+- TransferReplay: memory-maps a recording and hands it out in batches,
+  optionally looping with timestamps shifted forward.
+- SyntheticTransfers: a seeded generator of retail traffic with planted
+  whales (single large transfers, fast accumulation, dumping), used when
+  no recording is configured and by the benchmarks.
+
+Record a synthetic file from the repo root:
+    python -m core.god_awareness.transfer_stream logs/transfers.bin 1000000
+"""
+
+import hashlib
+import os
+import struct
+import sys
+
+import numpy as np
+
+MAGIC = b"OBVT"
+VERSION = 1
+HEADER = struct.Struct("<4sHH8x")     # magic, version, record size
+HEADER_SIZE = HEADER.size
+
+TRANSFER_DTYPE = np.dtype([
+    ("timestamp", "<f8"),
+    ("source", "<u8"),
+    ("dest", "<u8"),
+    ("amount", "<f8")
+])
+
+def wallet_id(address: str) -> int:
+    """Stable 64-bit id of a wallet address."""
+    return int.from_bytes(hashlib.blake2b(address.encode("utf-8"), digest_size=8).digest(), "little")
+
+def write_transfer_file(path: str, transfers: np.ndarray, append: bool = False) -> int:
+    """
+    Write (or append) a TRANSFER_DTYPE array to a recording.
+    Returns the number of records written.
+    """
+    transfers = np.ascontiguousarray(transfers, dtype=TRANSFER_DTYPE)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    new_file = not append or not os.path.exists(path) or os.path.getsize(path) == 0
+    with open(path, "wb" if new_file else "ab") as f:
+        if new_file:
+            f.write(HEADER.pack(MAGIC, VERSION, TRANSFER_DTYPE.itemsize))
+        f.write(transfers.tobytes())
+    return len(transfers)
+
+def read_transfer_file(path: str) -> np.ndarray:
+    """Zero-copy, memory-mapped view of a recording."""
+    with open(path, "rb") as f:
+        magic, version, record_size = HEADER.unpack(f.read(HEADER_SIZE))
+    if magic != MAGIC or record_size != TRANSFER_DTYPE.itemsize:
+        raise ValueError(f"{path} is not a v{VERSION} transfer recording")
+    # Ignore a trailing partial record (e.g. crash mid-write)
+    count = (os.path.getsize(path) - HEADER_SIZE) // TRANSFER_DTYPE.itemsize
+    if not count:
+        return np.zeros(0, dtype=TRANSFER_DTYPE)
+    return np.memmap(path, dtype=TRANSFER_DTYPE, mode="r", offset=HEADER_SIZE, shape=(count,))
+
+class TransferReplay:
+    """Batches of a recording, in file order."""
+
+    def __init__(self, path: str, batch_size: int = 65536, loop: bool = False):
+        self.path = path
+        self.records = read_transfer_file(path)
+        self.batch_size = batch_size
+        self.loop = loop
+        self.pos = 0
+        self.passes = 0
+        if len(self.records):
+            # Loops continue the clock one mean inter-arrival after the last record
+            first, last = float(self.records["timestamp"][0]), float(self.records["timestamp"][-1])
+            self._span = last - first + (last - first) / max(len(self.records) - 1, 1)
+        else:
+            self._span = 0.0
+
+    def __len__(self):
+        return len(self.records)
+
+    def next_batch(self):
+        """The next batch (a TRANSFER_DTYPE array), or None at the end of the recording."""
+        if self.pos >= len(self.records):
+            if not self.loop or not len(self.records):
+                return None
+            self.pos = 0
+            self.passes += 1
+        batch = self.records[self.pos:self.pos + self.batch_size]
+        self.pos += len(batch)
+        if self.passes:
+            batch = np.array(batch)
+            batch["timestamp"] += self.passes * self._span
+        return batch
+
+    def __iter__(self):
+        while True:
+            batch = self.next_batch()
+            if batch is None:
+                return
+            yield batch
+
+class SyntheticTransfers:
+    """
+    Seeded transfer generator: events_per_s retail transfers between
+    n_wallets wallets (lognormal amounts), plus planted whales. Each batch
+    plants one whale with probability whale_chance. A whale is one of:
+      large_transfer  a single transfer of large_amount or more
+      accumulating    burst_transfers transfers into one wallet, summing
+                      to about burst_amount
+      dumping         the same burst out of one wallet
+    `planted` lists (kind, wallet, first timestamp) of every whale so far.
+    """
+
+    KINDS = ("large_transfer", "accumulating", "dumping")
+
+    def __init__(self, seed: int = 20, n_wallets: int = 1_000_000, events_per_s: float = 2000.0,
+                 batch_size: int = 10000, whale_chance: float = 0.2, large_amount: float = 20000.0,
+                 burst_amount: float = 40000.0, burst_transfers: int = 50, start: float = 1.7e9):
+        self.rng = np.random.default_rng(seed)
+        self.wallets = self.rng.integers(0, 2 ** 64, n_wallets, dtype=np.uint64, endpoint=False)
+        self.events_per_s = events_per_s
+        self.batch_size = batch_size
+        self.whale_chance = whale_chance
+        self.large_amount = large_amount
+        self.burst_amount = burst_amount
+        self.burst_transfers = burst_transfers
+        self.clock = start
+        self.planted = []
+
+    def next_batch(self, n: int = None) -> np.ndarray:
+        n = self.batch_size if n is None else n
+        rng = self.rng
+        span = n / self.events_per_s
+        batch = np.empty(n, dtype=TRANSFER_DTYPE)
+        batch["timestamp"] = self.clock + span * rng.random(n)
+        batch["source"] = self.wallets[rng.integers(0, len(self.wallets), n)]
+        batch["dest"] = self.wallets[rng.integers(0, len(self.wallets), n)]
+        batch["amount"] = rng.lognormal(1.0, 1.5, n)
+        if rng.random() < self.whale_chance:
+            self._plant(batch, self.KINDS[rng.integers(len(self.KINDS))])
+        batch.sort(order="timestamp", kind="stable")
+        self.clock += span
+        return batch
+
+    def _plant(self, batch: np.ndarray, kind: str):
+        rng = self.rng
+        whale = rng.integers(0, 2 ** 64, dtype=np.uint64, endpoint=False)
+        if kind == "large_transfer":
+            rows = rng.integers(0, len(batch), 1)
+            batch["source"][rows] = whale
+            batch["amount"][rows] = self.large_amount * (1.0 + rng.random())
+        else:
+            # Individually unremarkable transfers (well below large_amount)
+            rows = rng.choice(len(batch), min(self.burst_transfers, len(batch)), replace=False)
+            batch["dest" if kind == "accumulating" else "source"][rows] = whale
+            batch["amount"][rows] = self.burst_amount / len(rows) * rng.uniform(0.9, 1.1, len(rows))
+        self.planted.append((kind, int(whale), float(batch["timestamp"][rows].min())))
+
+    def __iter__(self):
+        while True:
+            yield self.next_batch()
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("usage: python -m core.god_awareness.transfer_stream <out.bin> <n_transfers>")
+        sys.exit(2)
+    out, total = sys.argv[1], int(sys.argv[2])
+    source = SyntheticTransfers()
+    written = 0
+    while written < total:
+        written += write_transfer_file(out, source.next_batch(min(source.batch_size, total - written)),
+                                       append=written > 0)
+    print(f"[TransferStream] Wrote {written} transfers ({len(source.planted)} planted whales) to {out}")
@@ -0,0 +1,131 @@
+"""
+whale_detector.py
+
+Streaming whale detection for GOD_AWARENESS in fixed memory.
+WhaleDetector consumes batches of transfers (transfer_stream.TRANSFER_DTYPE)
+and raises three kinds of alert:
+ - large_transfer  one transfer of at least large_transfer
+ - accumulating    a wallet received at least accumulation_threshold
+                   within the sliding window
+ - dumping         a wallet sent at least dump_threshold within the window
+
+Windowed inflow and outflow per wallet come from two HeavyHitters
+sketches (see sketches.py), so memory does not grow with the number of
+wallets. Count-Min only overestimates, so a real whale is never missed.
+An innocent wallet is flagged only when its estimate error is larger
+than the gap to the threshold. A wallet re-alerts for the same kind only
+after cooldown_s of stream time.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+from config.config_loader import load_parameters
+from .sketches import HeavyHitters
+
+DEFAULTS = {
+    "window_s": 300.0,
+    "buckets": 6,
+    "width": 16384,
+    "depth": 4,
+    "candidates": 256,
+    "large_transfer": 10000.0,
+    "accumulation_threshold": 25000.0,
+    "dump_threshold": 25000.0,
+    "cooldown_s": 300.0,
+    "max_tracked_alerts": 4096,
+    "seed": 20
+}
+
+class WhaleDetector:
+    def __init__(self, window_s: float = 300.0, buckets: int = 6, width: int = 16384, depth: int = 4,
+                 candidates: int = 256, large_transfer: float = 10000.0,
+                 accumulation_threshold: float = 25000.0, dump_threshold: float = 25000.0,
+                 cooldown_s: float = 300.0, max_tracked_alerts: int = 4096, seed: int = 20):
+        sketch = {"buckets": buckets, "width": width, "depth": depth}
+        self.inflow = HeavyHitters(window_s, candidates, seed=seed, **sketch)
+        self.outflow = HeavyHitters(window_s, candidates, seed=seed + 1, **sketch)
+        self.large_transfer = large_transfer
+        self.accumulation_threshold = accumulation_threshold
+        self.dump_threshold = dump_threshold
+        self.cooldown_s = cooldown_s
+        self.max_tracked_alerts = max_tracked_alerts
+        self._last_alert = OrderedDict()    # (kind, wallet) -> stream time of its last alert
+        self.stats = {
+            "events": 0,
+            "batches": 0,
+            "alerts": 0,
+            "suppressed": 0
+        }
+
+    def process(self, transfers) -> list:
+        """
+        Fold in a batch of transfers (in time order) and return the new
+        alerts: dicts with kind, wallet (hex id), amount and timestamp.
+        """
+        n = len(transfers)
+        if not n:
+            return []
+        times = transfers["timestamp"]
+        amounts = transfers["amount"]
+        self.inflow.add(times, transfers["dest"], amounts)
+        self.outflow.add(times, transfers["source"], amounts)
+        self.stats["events"] += n
+        self.stats["batches"] += 1
+
+        alerts = []
+        for i in np.flatnonzero(amounts >= self.large_transfer).tolist():
+            self._alert(alerts, "large_transfer", int(transfers["source"][i]),
+                        float(amounts[i]), float(times[i]))
+        now = float(times[-1])
+        for kind, hitters, threshold in (("accumulating", self.inflow, self.accumulation_threshold),
+                                         ("dumping", self.outflow, self.dump_threshold)):
+            hot = hitters.estimates >= threshold
+            for wallet, estimate in zip(hitters.keys[hot].tolist(), hitters.estimates[hot].tolist()):
+                self._alert(alerts, kind, wallet, estimate, now)
+        return alerts
+
+    def _alert(self, alerts: list, kind: str, wallet: int, amount: float, timestamp: float):
+        key = (kind, wallet)
+        last = self._last_alert.get(key)
+        if last is not None and timestamp - last < self.cooldown_s:
+            self.stats["suppressed"] += 1
+            return
+        self._last_alert[key] = timestamp
+        self._last_alert.move_to_end(key)
+        if len(self._last_alert) > self.max_tracked_alerts:
+            self._last_alert.popitem(last=False)
+        self.stats["alerts"] += 1
+        alerts.append({
+            "kind": kind,
+            "wallet": f"{wallet:016x}",
+            "amount": amount,
+            "timestamp": timestamp
+        })
+
+    def top_wallets(self, k: int = 5) -> dict:
+        """Heaviest windowed receivers and senders: {"inflow": [(wallet, estimate)], "outflow": [...]}."""
+        return {
+            name: [(f"{wallet:016x}", estimate) for wallet, estimate in zip(*(a.tolist() for a in hitters.top(k)))]
+            for name, hitters in (("inflow", self.inflow), ("outflow", self.outflow))
+        }
+
+    @property
+    def nbytes(self) -> int:
+        """Fixed sketch memory (the alert cooldown table is bounded by max_tracked_alerts)."""
+        return self.inflow.nbytes + self.outflow.nbytes
+
+def describe_alert(alert: dict) -> str:
+    labels = {
+        "large_transfer": "Large transfer of",
+        "accumulating": "Wallet accumulated",
+        "dumping": "Wallet dumped"
+    }
+    return f"{labels[alert['kind']]} {alert['amount']:,.0f} ({alert['wallet']})"
+
+def build_whale_detector(params: dict = None) -> WhaleDetector:
+    """Detector configured from "god_awareness" -> "detector" in config/parameters.json."""
+    if params is None:
+        params = load_parameters("god_awareness").get("detector", {})
+    return WhaleDetector(**{**DEFAULTS, **params})
@@ -0,0 +1,87 @@
+"""
+hdr_histogram.py
+
+Fixed-memory, HDR-style latency histogram.
+Values (integer nanoseconds) go into log-linear buckets: 2**precision_bits
+exact buckets for small values, then every power-of-two range is split into
+2**(precision_bits - 1) equal sub-buckets, so any recorded value is known
+to within 1 / 2**(precision_bits - 1) relative error (0.8% at the default 8
+bits) across the whole range. Memory is fixed by the configured maximum
+value (~35 KB for 8 bits up to 60 s), whatever the number of samples.
+
+Counts live in an array.array (cheap scalar increments on the record path)
+with a zero-copy NumPy view for percentile queries.
+"""
+
+from array import array
+
+import numpy as np
+
+class HdrHistogram:
+    def __init__(self, max_value: int = 60_000_000_000, precision_bits: int = 8):
+        self.precision_bits = precision_bits
+        self.sub_count = 1 << precision_bits
+        self.half = self.sub_count >> 1
+        self.max_value = max_value
+        self.n_buckets = self._index(max_value) + 1
+        self._counts = array("q", bytes(8 * self.n_buckets))
+        self.counts = np.frombuffer(self._counts, dtype=np.int64)
+        self.total = 0
+        self.sum = 0
+        self.max = 0
+
+    def _index(self, value: int) -> int:
+        # Values of bit length precision_bits + shift land in sub-bucket
+        # (value >> shift) of their range; ranges are `half` buckets wide,
+        # which simplifies to shift * half + (value >> shift).
+        shift = value.bit_length() - self.precision_bits
+        if shift <= 0:
+            return value
+        return shift * self.half + (value >> shift)
+
+    def record(self, value: int):
+        """Record one value (ns); negative values count as 0, values above max_value clamp to the top bucket."""
+        if value > self.max_value:
+            value = self.max_value
+        elif value < 0:
+            value = 0
+        shift = value.bit_length() - self.precision_bits
+        self._counts[value if shift <= 0 else shift * self.half + (value >> shift)] += 1
+        self.total += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def bucket_upper_bounds(self) -> np.ndarray:
+        """Highest value that maps to each bucket."""
+        idx = np.arange(self.n_buckets, dtype=np.int64)
+        upper = idx.copy()
+        k = idx[self.sub_count:] - self.sub_count
+        shift = k // self.half + 1
+        sub = k % self.half + self.half
+        upper[self.sub_count:] = ((sub + 1) << shift) - 1
+        return upper
+
+    def percentiles(self, quantiles=(0.5, 0.9, 0.99, 0.999)) -> list:
+        """Values at the given quantiles (bucket upper bound, capped at the exact max)."""
+        if self.total == 0:
+            return [0 for _ in quantiles]
+        cumulative = np.cumsum(self.counts)
+        ranks = np.ceil(np.asarray(quantiles, dtype=np.float64) * self.total).clip(1, self.total)
+        buckets = np.searchsorted(cumulative, ranks)
+        upper = self.bucket_upper_bounds()[buckets]
+        return [int(min(u, self.max)) for u in upper]
+
+    def merge(self, other: "HdrHistogram"):
+        if other.n_buckets != self.n_buckets or other.precision_bits != self.precision_bits:
+            raise ValueError("Can only merge histograms with the same layout")
+        self.counts += other.counts
+        self.total += other.total
+        self.sum += other.sum
+        self.max = max(self.max, other.max)
+
+    def reset(self):
+        self.counts[:] = 0
+        self.total = 0
+        self.sum = 0
+        self.max = 0
@@ -0,0 +1,187 @@
+"""
+latency_monitor.py
+
+Per-stage latency instrumentation for the trading cycle.
+Each stage (fetch_sol_price, synergy_conductor_run, execute_trade, ...)
+gets a fixed-memory HdrHistogram of its wall time in nanoseconds, with
+p50 / p90 / p99 / p99.9 / max on demand.
+
+Near-zero cost when disabled: instrument(fn, stage) returns fn itself, and
+begin()/end() return immediately. When enabled the record path is one
+perf_counter_ns() pair plus a bucket increment.
+
+Snapshots can be dumped to a JSON file (periodically, from a daemon thread)
+and/or served on a local HTTP endpoint (GET /latency), so tail-latency
+regressions are visible on a running process.
+
+Configured in config/parameters.json under "latency_monitor".
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+
+from config.config_loader import load_parameters
+from .hdr_histogram import HdrHistogram
+from core.log_core.log_core import get_logger
+
+logger = get_logger("LatencyMonitor")
+
+QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+class LatencyMonitor:
+    def __init__(self, enabled: bool = True, max_value_s: float = 60.0, precision_bits: int = 8):
+        self.enabled = enabled
+        self.max_value = int(max_value_s * 1e9)
+        self.precision_bits = precision_bits
+        self.histograms = {}
+        self._lock = threading.Lock()
+        self._dump_thread = None
+        self._stop = threading.Event()
+        self._http_server = None
+
+    def histogram(self, stage: str) -> HdrHistogram:
+        hist = self.histograms.get(stage)
+        if hist is None:
+            with self._lock:
+                hist = self.histograms.get(stage)
+                if hist is None:
+                    hist = HdrHistogram(self.max_value, self.precision_bits)
+                    self.histograms[stage] = hist
+        return hist
+
+    # ─── Recording ───────────────────────────────────────────────────────
+    def record(self, stage: str, elapsed_ns: int):
+        if self.enabled:
+            self.histogram(stage).record(elapsed_ns)
+
+    def begin(self) -> int:
+        """Start timestamp for end(); 0 when disabled."""
+        return time.perf_counter_ns() if self.enabled else 0
+
+    def end(self, stage: str, t0: int):
+        if self.enabled and t0:
+            self.histogram(stage).record(time.perf_counter_ns() - t0)
+
+    def instrument(self, fn, stage: str = None):
+        """
+        fn wrapped to record its wall time under `stage` (default: its name).
+        Returns fn unchanged when the monitor is disabled.
+        """
+        if not self.enabled:
+            return fn
+        hist = self.histogram(stage or fn.__name__)
+        perf_counter_ns = time.perf_counter_ns
+
+        @functools.wraps(fn)
+        def timed(*args, **kwargs):
+            t0 = perf_counter_ns()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                hist.record(perf_counter_ns() - t0)
+        return timed
+
+    # ─── Reporting ───────────────────────────────────────────────────────
+    def snapshot(self, reset: bool = False) -> dict:
+        """
+        {stage: {"count", "mean_us", "p50_us", "p90_us", "p99_us", "p999_us", "max_us"}}.
+        reset=True starts a fresh interval afterwards.
+        """
+        report = {}
+        for stage, hist in list(self.histograms.items()):
+            p50, p90, p99, p999 = hist.percentiles(QUANTILES)
+            report[stage] = {
+                "count": hist.total,
+                "mean_us": hist.sum / hist.total / 1000 if hist.total else 0.0,
+                "p50_us": p50 / 1000,
+                "p90_us": p90 / 1000,
+                "p99_us": p99 / 1000,
+                "p999_us": p999 / 1000,
+                "max_us": hist.max / 1000
+            }
+            if reset:
+                hist.reset()
+        return report
+
+    def dump(self, path: str, reset: bool = False):
+        """Write a JSON snapshot atomically (tmp file + rename)."""
+        payload = {"timestamp": time.time(), "stages": self.snapshot(reset)}
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2)
+        os.replace(tmp_path, path)
+
+    def start_dumping(self, path: str, interval_s: float = 10.0):
+        """Dump a snapshot to `path` every interval_s seconds from a daemon thread."""
+        if self._dump_thread is not None:
+            return
+
+        def dump_loop():
+            while not self._stop.wait(interval_s):
+                try:
+                    self.dump(path)
+                except OSError as e:
+                    logger.warning("Dump to %s failed: %s", path, e)
+
+        self._dump_thread = threading.Thread(target=dump_loop, name="LatencyDump", daemon=True)
+        self._dump_thread.start()
+
+    def serve_http(self, port: int, host: str = "127.0.0.1"):
+        """Serve GET /latency (JSON snapshot) on a local port from a daemon thread."""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        monitor = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.rstrip("/") != "/latency":
+                    self.send_error(404)
+                    return
+                body = json.dumps({"timestamp": time.time(), "stages": monitor.snapshot()}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._http_server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=self._http_server.serve_forever, name="LatencyHTTP", daemon=True).start()
+        return self._http_server.server_address
+
+    def stop(self, final_dump_path: str = None):
+        self._stop.set()
+        if self._http_server is not None:
+            self._http_server.shutdown()
+            self._http_server = None
+        if final_dump_path:
+            self.dump(final_dump_path)
+
+_params = load_parameters("latency_monitor")
+LOGS_DIR = os.path.join(os.path.dirname(__file__), "../../logs")
+DUMP_PATH = os.path.join(LOGS_DIR, _params.get("dump_file", "latency.json"))
+
+# Process-wide monitor used by the trading loop
+latency_monitor = LatencyMonitor(
+    enabled=_params.get("enabled", False),
+    max_value_s=_params.get("max_value_s", 60.0),
+    precision_bits=_params.get("precision_bits", 8)
+)
+
+def latency_monitor_init():
+    """Start the configured exporters (periodic file dump, HTTP endpoint)."""
+    if not latency_monitor.enabled:
+        logger.info("Disabled.")
+        return
+    if _params.get("dump_interval_s"):
+        latency_monitor.start_dumping(DUMP_PATH, _params["dump_interval_s"])
+    if _params.get("http_port"):
+        host, port = latency_monitor.serve_http(_params["http_port"])
+        logger.info("Serving http://%s:%s/latency", host, port)
+    logger.info("Initialized.")
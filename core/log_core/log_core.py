@@ -0,0 +1,217 @@
+"""
+log_core.py
+
+Shared leveled logging for every module (replaces print() on the hot path).
+- One logger per component ("SynergyConductor", "EGO_CORE", ...), each with
+  its own level from config/parameters.json ("logging" -> "components").
+- Messages use %-style lazy arguments, so a filtered-out call costs one
+  cached level check: nothing is formatted.
+- Records are appended to a bounded in-memory deque (no lock, no thread
+  wake-up) and written by a background thread that drains it every
+  poll_interval_s, so the trading cycle never waits on a slow terminal
+  or pipe. Handler filters run and "msg % args" is interpolated on the
+  caller's thread (so later changes to a mutable argument never reach
+  the log); the record format itself is applied on the writer thread.
+  When the deque is full, new records are dropped (and counted) rather
+  than blocking.
+
+Output keeps the old print format: "[Component] message".
+"""
+
+import atexit
+import contextlib
+import logging
+import re
+import sys
+import threading
+from collections import deque
+
+from config.config_loader import load_parameters
+
+ROOT_LOGGER = "oblivion"
+DEFAULT_FORMAT = "[%(component)s] %(message)s"
+CALLER_FIELDS = re.compile(r"%\((pathname|filename|module|funcName|lineno|stack_info)\)")
+
+_lock = threading.RLock()
+_writer = None
+_handler = None
+log_stats = {"dropped": 0, "written": 0}
+_EXC_FORMATTER = logging.Formatter()
+
+class ComponentFormatter(logging.Formatter):
+    """Adds %(component)s: the logger name below the oblivion root."""
+
+    def format(self, record):
+        record.component = record.name.rpartition(".")[2]
+        return super().format(record)
+
+# stdlib record defaults, restored unless "lean_records" opts out of them
+_RECORD_LOOKUPS = (logging._srcfile, logging.logProcesses, logging.logMultiprocessing)
+
+class DequeHandler(logging.Handler):
+    """
+    Hot-path handler: runs the handler's filters, interpolates the message
+    (like QueueHandler.prepare) and appends the record to a bounded deque.
+    No lock (deque.append is atomic), no thread notification; the writer
+    thread polls the deque. Records beyond queue_size are dropped.
+    """
+
+    def __init__(self, queue_size: int = 10000):
+        super().__init__()
+        self.queue = deque()
+        self.queue_size = queue_size
+
+    def handle(self, record):
+        if not self.filter(record):
+            return False
+        if len(self.queue) >= self.queue_size:
+            log_stats["dropped"] += 1
+            return False
+        self.queue.append(self.prepare(record))
+        return True
+
+    @staticmethod
+    def prepare(record):
+        """Freeze the message (and traceback text) before the record changes threads."""
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _EXC_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    emit = handle
+
+class _Writer:
+    """Background thread that drains a DequeHandler into the real outputs."""
+
+    def __init__(self, handler: DequeHandler, outputs: list, poll_interval_s: float = 0.05):
+        self.handler = handler
+        self.outputs = outputs
+        self.poll_interval_s = poll_interval_s
+        self._drain_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, name="LogWriter", daemon=True)
+        self._thread.start()
+
+    def _loop(self):
+        while not self._stop.wait(self.poll_interval_s):
+            self.drain()
+        self.drain()
+
+    def drain(self):
+        popleft = self.handler.queue.popleft
+        with self._drain_lock:
+            while True:
+                try:
+                    record = popleft()
+                except IndexError:
+                    break
+                for output in self.outputs:
+                    if record.levelno >= output.level:
+                        output.handle(record)
+                log_stats["written"] += 1
+            for output in self.outputs:
+                output.flush()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join(timeout=5.0)
+        self.drain()
+        for output in self.outputs:
+            output.close()
+
+def configure_logging(params: dict = None, stream=None):
+    """
+    (Re)configure the shared logging subsystem; called on first get_logger().
+    params default to the "logging" section of parameters.json:
+        level       default level for every component (e.g. "INFO")
+        components  {component: level} overrides
+        queue_size  bounded queue length (records beyond it are dropped)
+        poll_interval_s  how often the writer thread drains the queue
+        file        optional log file (in addition to the stream)
+        format      record format, default "[%(component)s] %(message)s"
+        sync        true writes from the caller's thread (no queue)
+        lean_records  opt-in: skip the caller stack walk and process
+                    lookups for every record in the process (stdlib
+                    module globals, so it affects every library's logging)
+    """
+    global _writer, _handler
+    params = load_parameters("logging") if params is None else params
+    with _lock:
+        shutdown_logging()
+
+        root = logging.getLogger(ROOT_LOGGER)
+        root.setLevel(params.get("level", "INFO"))
+        root.propagate = False
+        for component, level in params.get("components", {}).items():
+            logging.getLogger(f"{ROOT_LOGGER}.{component}").setLevel(level)
+
+        fmt = params.get("format", DEFAULT_FORMAT)
+        formatter = ComponentFormatter(fmt)
+        srcfile, processes, multiprocessing = _RECORD_LOOKUPS
+        if params.get("lean_records", False):
+            # Process-wide: skip the per-record work the format does not use
+            # (stack walk for the caller's file/line, process lookups)
+            if not CALLER_FIELDS.search(fmt):
+                srcfile = None
+            processes = "%(process" in fmt
+            multiprocessing = "%(processName" in fmt
+        logging._srcfile = srcfile
+        logging.logProcesses = processes
+        logging.logMultiprocessing = multiprocessing
+        outputs = [logging.StreamHandler(stream or sys.stdout)]
+        if params.get("file"):
+            outputs.append(logging.FileHandler(params["file"], encoding="utf-8"))
+        for output in outputs:
+            output.setFormatter(formatter)
+
+        if params.get("sync", False):
+            for output in outputs:
+                root.addHandler(output)
+            _handler = outputs
+        else:
+            _handler = DequeHandler(params.get("queue_size", 10000))
+            root.addHandler(_handler)
+            _writer = _Writer(_handler, outputs, params.get("poll_interval_s", 0.05))
+
+def shutdown_logging():
+    """Flush queued records and detach the handlers."""
+    global _writer, _handler
+    if _writer is not None:
+        _writer.stop()
+        _writer = None
+    root = logging.getLogger(ROOT_LOGGER)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    _handler = None
+
+def get_logger(component: str) -> logging.Logger:
+    """Logger for one component; configures the subsystem on first use."""
+    if _handler is None:
+        with _lock:
+            if _handler is None:
+                configure_logging()
+    return logging.getLogger(f"{ROOT_LOGGER}.{component}")
+
+def set_level(component: str, level):
+    """Change one component's level at runtime (e.g. "DEBUG")."""
+    logging.getLogger(f"{ROOT_LOGGER}.{component}").setLevel(level)
+
+@contextlib.contextmanager
+def quiet(level: int = logging.CRITICAL):
+    """Discard records at or below `level` from every logger (e.g. during backtests)."""
+    previous = logging.root.manager.disable
+    logging.disable(level)
+    try:
+        yield
+    finally:
+        logging.disable(previous)
+
+def flush_logs():
+    """Block until every queued record has been written."""
+    writer = _writer
+    if writer is not None:
+        writer.drain()
+
+atexit.register(shutdown_logging)
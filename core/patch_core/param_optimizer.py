@@ -0,0 +1,438 @@
+"""
+param_optimizer.py
+
+Evidence-backed parameter search behind PATCH_CORE suggestions.
+Candidate parameter sets cover the agents' buy thresholds, the
+SCORING_ENGINE score floor and kill-switch limits. Each candidate is
+scored by replaying the recent trade history's price path:
+ - the conductor's shared vectorized decision step (_decide_batch) runs
+   with the candidate thresholds and the live scoring parameters, on the
+   SCORING_ENGINE features and the EGO_CORE state each trade recorded
+   (features are recomputed from the prices for a history that has none)
+ - the resulting position is marked to market every tick, as main.py does
+ - the replayed trades go through the kill-switch rules with the
+   candidate limits, and the replay stops at the first trip like the live
+   loop
+The objective is replayed PnL minus drawdown_penalty times the max drawdown.
+
+The current parameters follow hot reloads of the "strategy" section: the
+baseline is refreshed from the live values whenever the strategy reloads.
+
+Runs are memoized per (parameter set, history window). The uncached ones
+are sent in chunks to a process pool (spawned workers: the trading
+process runs threads, so forking it is unsafe), and results are
+collected until the time budget runs out. At the deadline, queued chunks are cancelled, while
+chunks already running finish in the background and land in the cache
+for the next request.
+
+Configured in config/parameters.json under "patch_core" -> "optimizer".
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import partial
+
+import numpy as np
+
+from agents.strategy_params import DEFAULTS as STRATEGY_PARAMS_DEFAULTS, strategy
+from config.config_loader import load_parameters
+from agents.synergy_conductor import _decide_batch
+from core.scoring_engine.features import feature_series
+from core.decisions.decisions import DECISION_LABELS, DECISION_UNITS
+from core.ego_core.ego_core import EMOTIONAL_STATES
+from security.kill_switch_rules import KillSwitchEngine
+from core.log_core.log_core import get_logger
+
+logger = get_logger("ParamOptimizer")
+
+# The tunable "strategy" parameters (agent buy thresholds, score floor) and
+# their defaults; runtime settings such as the reload interval are not searched
+STRATEGY_SETTINGS = ("reload_interval_s",)
+STRATEGY_DEFAULTS = {
+    name: value for name, value in STRATEGY_PARAMS_DEFAULTS.items() if name not in STRATEGY_SETTINGS
+}
+
+# Position change per decision code
+UNITS_BY_CODE = np.array([DECISION_UNITS.get(label, 0.0) for label in DECISION_LABELS])
+
+# Search-space keys "kill_switch.<rule name>.<field>" tune a kill-switch rule
+KILL_SWITCH_PREFIX = "kill_switch."
+# Rules driven by live state outside the trade stream cannot be replayed
+UNREPLAYABLE_RULES = ("liquidation_distance",)
+
+DEFAULTS = {
+    "enabled": True,
+    "history_window": 2000,
+    "min_history": 50,
+    "min_interval_s": 60.0,
+    "budget_s": 1.0,
+    "workers": None,
+    "chunk_size": 8,
+    "max_candidates": 128,
+    "drawdown_penalty": 0.5,
+    "min_improvement": 1.0,
+    "cache_size": 4096,
+    "top_k": 5,
+    "seed": 0,
+    "search_space": {}
+}
+
+def _apply_limits(rule_specs, params: dict) -> list:
+    """Replayable rule specs with the candidate's kill-switch limits applied."""
+    specs = [dict(spec) for spec in rule_specs if spec.get("type") not in UNREPLAYABLE_RULES]
+    by_name = {spec.get("name", spec.get("type")): spec for spec in specs}
+    for key, value in params.items():
+        if key.startswith(KILL_SWITCH_PREFIX):
+            name, _, field = key[len(KILL_SWITCH_PREFIX):].rpartition(".")
+            if name in by_name:
+                by_name[name][field] = value
+    return specs
+
+def replay(params: dict, history: dict, rule_specs, drawdown_penalty: float) -> dict:
+    """
+    Replay one parameter set over a history window ({"timestamp",
+    "sol_price", "emotional_state"} arrays and "features" {name: array},
+    as prepared by ParamOptimizer.optimize). Returns the run's metrics.
+    """
+    prices = history["sol_price"]
+    n = len(prices)
+    decisions, _ = _decide_batch(prices, history["emotional_state"], lambda i: {"sol_price": float(prices[i])},
+                                 history["features"], params, history.get("scoring"))
+
+    # Mark the position held since the previous tick, then fill (as main.py)
+    position = np.cumsum(UNITS_BY_CODE[decisions])
+    pnl = np.zeros(n)
+    pnl[1:] = position[:-1] * np.diff(prices)
+
+    halted_at = None
+    tripped = []
+    specs = _apply_limits(rule_specs, params)
+    if specs:
+        engine = KillSwitchEngine(specs)
+        rules = engine.rules
+        timestamps, price_list, pnl_list = history["timestamp"].tolist(), prices.tolist(), pnl.tolist()
+        for t, code in enumerate(decisions.tolist()):
+            engine.on_trade(timestamps[t], DECISION_LABELS[code], price_list[t], pnl_list[t])
+            if any(rule.tripped for rule in rules):
+                halted_at = t
+                tripped = [rule.name for rule in rules if rule.tripped]
+                break
+
+    end = n if halted_at is None else halted_at + 1
+    equity = np.cumsum(pnl[:end])
+    peak = np.maximum.accumulate(np.maximum(equity, 0.0))
+    max_drawdown = float((peak - equity).max()) if end else 0.0
+    total = float(equity[-1]) if end else 0.0
+    return {
+        "objective": total - drawdown_penalty * max_drawdown,
+        "pnl": total,
+        "max_drawdown": max_drawdown,
+        "trades": int(np.count_nonzero(decisions[:end] != 0)),
+        "ticks": end,
+        "halted_at": halted_at,
+        "tripped": tripped
+    }
+
+def _evaluate_chunk(param_sets, history, rule_specs, drawdown_penalty):
+    """Process-pool task: replay a chunk of parameter sets over one history window."""
+    return [replay(params, history, rule_specs, drawdown_penalty) for params in param_sets]
+
+def _params_key(params: dict) -> tuple:
+    return tuple(sorted(params.items()))
+
+def _history_key(timestamps, prices, states, features: dict, scoring: dict = None) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for column in (timestamps, prices, states, *(features[name] for name in sorted(features))):
+        digest.update(column.tobytes())
+    digest.update(repr(scoring).encode())
+    return digest.hexdigest()
+
+class ParamOptimizer:
+    def __init__(self, search_space: dict, baseline: dict, rule_specs, budget_s: float = 1.0,
+                 workers: int = None, chunk_size: int = 8, max_candidates: int = 128,
+                 drawdown_penalty: float = 0.5, min_improvement: float = 1.0,
+                 cache_size: int = 4096, top_k: int = 5, seed: int = 0, strategy_source=None):
+        """
+        search_space: {param: [candidate values]}; baseline: current value of
+        every parameter; rule_specs: kill-switch rules to replay.
+        workers: process count (None = CPU count, 0 = evaluate in-process).
+        strategy_source: StrategyParams whose reloads refresh the strategy
+        baseline (None = keep the baseline as given).
+        """
+        unknown = set(search_space) - set(baseline)
+        if unknown:
+            raise ValueError(f"No current value for search parameters: {sorted(unknown)}")
+        self.search_space = {name: list(values) for name, values in search_space.items()}
+        self.baseline = dict(baseline)
+        self.rule_specs = list(rule_specs)
+        self.budget_s = budget_s
+        self.workers = workers
+        self.chunk_size = max(1, chunk_size)
+        self.max_candidates = max(1, max_candidates)
+        self.drawdown_penalty = drawdown_penalty
+        self.min_improvement = min_improvement
+        self.cache_size = cache_size
+        self.top_k = top_k
+        self.seed = seed
+        self.strategy_source = strategy_source
+        self._strategy_reloads = strategy_source.reloads if strategy_source is not None else None
+        self._cache = OrderedDict()     # (history key, params key) -> metrics, LRU order
+        self._cache_lock = threading.Lock()
+        self._pool = None
+        self.stats = {"runs": 0, "replays": 0, "cache_hits": 0, "timed_out": 0}
+
+    # ─── Candidates ──────────────────────────────────────────────────────
+    def candidates(self) -> list:
+        """
+        The current parameters, then every single-parameter move, then
+        random combinations (seeded), up to max_candidates.
+        """
+        seen = set()
+        result = []
+
+        def add(params):
+            key = _params_key(params)
+            if key not in seen and len(result) < self.max_candidates:
+                seen.add(key)
+                result.append(params)
+
+        add(dict(self.baseline))
+        for name, values in self.search_space.items():
+            for value in values:
+                add({**self.baseline, name: value})
+
+        names = list(self.search_space)
+        n_combinations = 1
+        for values in self.search_space.values():
+            n_combinations *= len(values)
+        rng = np.random.default_rng(self.seed)
+        attempts = 0
+        while len(result) < min(self.max_candidates, n_combinations) and attempts < 20 * self.max_candidates:
+            attempts += 1
+            picks = {name: self.search_space[name][rng.integers(len(self.search_space[name]))] for name in names}
+            add({**self.baseline, **picks})
+        return result
+
+    def _n_changes(self, params: dict) -> int:
+        return sum(1 for name, value in params.items() if value != self.baseline[name])
+
+    # ─── Cache ───────────────────────────────────────────────────────────
+    def _cache_get(self, key):
+        with self._cache_lock:
+            metrics = self._cache.get(key)
+            if metrics is not None:
+                self._cache.move_to_end(key)
+            return metrics
+
+    def _cache_put(self, key, metrics: dict):
+        with self._cache_lock:
+            self._cache[key] = metrics
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _store_chunk(self, history_key: str, chunk: list, future):
+        # Done-callback: also caches chunks that finish after the deadline
+        if future.cancelled() or future.exception() is not None:
+            return
+        for params, metrics in zip(chunk, future.result()):
+            self._cache_put((history_key, _params_key(params)), metrics)
+
+    # ─── Pool ────────────────────────────────────────────────────────────
+    def _get_pool(self):
+        if self._pool is None:
+            # Imported on first use, like the agent pools
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            self._pool = ProcessPoolExecutor(max_workers=self.workers or os.cpu_count(),
+                                             mp_context=multiprocessing.get_context("spawn"))
+        return self._pool
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    # ─── Search ──────────────────────────────────────────────────────────
+    def _live_scoring(self) -> dict:
+        """Scoring parameters to replay with; refreshes the strategy baseline after a reload."""
+        source = self.strategy_source if self.strategy_source is not None else strategy
+        live, scoring = source.snapshot()
+        if self.strategy_source is not None and source.reloads != self._strategy_reloads:
+            self._strategy_reloads = source.reloads
+            for name in STRATEGY_DEFAULTS:
+                if name in self.baseline and name in live:
+                    self.baseline[name] = live[name]
+            logger.info("Strategy reloaded; search baseline refreshed from the live parameters.")
+        return dict(scoring)
+
+    def optimize(self, history: dict, budget_s: float = None) -> dict:
+        """
+        Rank the candidates over a history window ({"timestamp", "sol_price"}
+        arrays, optionally "emotional_state" codes and "features", e.g.
+        TradeHistory.columns(n)) within budget_s seconds.
+        Returns the patch: param_changes ({} if the current parameters win),
+        baseline / best metrics, the top-ranked candidates and run stats.
+        """
+        start = time.perf_counter()
+        deadline = start + (self.budget_s if budget_s is None else budget_s)
+        timestamps = np.ascontiguousarray(history["timestamp"], dtype=np.float64)
+        prices = np.ascontiguousarray(history["sol_price"], dtype=np.float64)
+        states = np.zeros(len(prices), dtype=np.int8)
+        if history.get("emotional_state") is not None:
+            states = np.ascontiguousarray(history["emotional_state"], dtype=np.int8)
+        scoring = self._live_scoring()
+        features = history.get("features")
+        if features is None:
+            features = feature_series(prices)
+        window = {
+            "timestamp": timestamps,
+            "sol_price": prices,
+            "emotional_state": np.asarray(EMOTIONAL_STATES)[states],
+            "features": {name: np.ascontiguousarray(values, dtype=np.float64) for name, values in features.items()},
+            "scoring": scoring
+        }
+        history_key = _history_key(timestamps, prices, states, window["features"], scoring)
+        run = partial(replay, history=window, rule_specs=self.rule_specs, drawdown_penalty=self.drawdown_penalty)
+
+        candidates = self.candidates()
+        results = {}
+        pending = []
+        cache_hits = 0
+        for params in candidates:
+            key = _params_key(params)
+            metrics = self._cache_get((history_key, key))
+            if metrics is not None:
+                results[key] = metrics
+                cache_hits += 1
+            else:
+                pending.append(params)
+
+        # The current parameters are always scored (in-process) as the reference
+        baseline_key = _params_key(self.baseline)
+        if baseline_key not in results:
+            results[baseline_key] = run(self.baseline)
+            self._cache_put((history_key, baseline_key), results[baseline_key])
+            pending = [params for params in pending if _params_key(params) != baseline_key]
+
+        timed_out = self._fan_out(pending, window, history_key, deadline, run, results)
+
+        ranked = sorted(
+            ((params, results[_params_key(params)]) for params in candidates if _params_key(params) in results),
+            # Ties go to the candidate that changes the fewest parameters
+            key=lambda item: (-item[1]["objective"], self._n_changes(item[0]))
+        )
+        baseline_metrics = results[baseline_key]
+        best_params, best_metrics = ranked[0]
+        improvement = best_metrics["objective"] - baseline_metrics["objective"]
+        if improvement < self.min_improvement:
+            best_params, best_metrics, improvement = self.baseline, baseline_metrics, 0.0
+        changes = {
+            name: {"from": self.baseline[name], "to": value}
+            for name, value in best_params.items() if value != self.baseline[name]
+        }
+
+        elapsed = time.perf_counter() - start
+        self.stats["runs"] += 1
+        self.stats["replays"] += len(results) - cache_hits
+        self.stats["cache_hits"] += cache_hits
+        self.stats["timed_out"] += timed_out
+        ticks = len(prices)
+        if changes:
+            reason = (f"Replay of the last {ticks} ticks: objective {best_metrics['objective']:.2f} "
+                      f"vs {baseline_metrics['objective']:.2f} with the current parameters.")
+        else:
+            reason = f"Current parameters rank best over a replay of the last {ticks} ticks."
+        return {
+            "param_changes": changes,
+            "params": dict(best_params),
+            "reason": reason,
+            "improvement": improvement,
+            "baseline": baseline_metrics,
+            "best": best_metrics,
+            "ranked": [{"params": params, **metrics} for params, metrics in ranked[:self.top_k]],
+            "candidates": len(candidates),
+            "evaluated": len(results),
+            "cache_hits": cache_hits,
+            "timed_out": timed_out,
+            "history_ticks": ticks,
+            "elapsed_s": elapsed
+        }
+
+    def _fan_out(self, pending, window, history_key, deadline, run, results) -> int:
+        """Evaluate pending candidates until the deadline; returns how many were not finished."""
+        if not pending:
+            return 0
+        chunks = [pending[i:i + self.chunk_size] for i in range(0, len(pending), self.chunk_size)]
+
+        if self.workers == 0:
+            for i, chunk in enumerate(chunks):
+                if time.perf_counter() >= deadline:
+                    return sum(len(c) for c in chunks[i:])
+                for params in chunk:
+                    key = _params_key(params)
+                    results[key] = run(params)
+                    self._cache_put((history_key, key), results[key])
+            return 0
+
+        from concurrent.futures import wait
+        pool = self._get_pool()
+        futures = {}
+        for chunk in chunks:
+            future = pool.submit(_evaluate_chunk, chunk, window, self.rule_specs, self.drawdown_penalty)
+            future.add_done_callback(partial(self._store_chunk, history_key, chunk))
+            futures[future] = chunk
+
+        done, not_done = wait(futures, timeout=max(0.0, deadline - time.perf_counter()))
+        for future in not_done:
+            future.cancel()
+        for future in done:
+            try:
+                chunk_results = future.result()
+            except Exception as e:
+                logger.warning("Replay chunk failed: %s", e)
+                continue
+            for params, metrics in zip(futures[future], chunk_results):
+                results[_params_key(params)] = metrics
+        return sum(len(futures[future]) for future in not_done)
+
+def build_param_optimizer(params: dict = None) -> ParamOptimizer:
+    """
+    Optimizer configured from "patch_core" -> "optimizer" in parameters.json.
+    Current kill-switch limits come from the live "kill_switch" rules.
+    """
+    if params is None:
+        params = load_parameters("patch_core").get("optimizer", {})
+    params = {**DEFAULTS, **params}
+    rule_specs = [spec for spec in load_parameters("kill_switch").get("rules", []) if spec.get("enabled", True)]
+
+    # Suggestions move away from the live thresholds, not the built-in defaults
+    live = strategy.current()
+    baseline = {name: live.get(name, default) for name, default in STRATEGY_DEFAULTS.items()}
+    search_space = {}
+    for name, values in params["search_space"].items():
+        if name.startswith(KILL_SWITCH_PREFIX):
+            rule_name, _, field = name[len(KILL_SWITCH_PREFIX):].rpartition(".")
+            spec = next((s for s in rule_specs if s.get("name", s.get("type")) == rule_name), None)
+            if spec is None or field not in spec:
+                logger.warning("Search parameter %s matches no kill-switch rule; skipped.", name)
+                continue
+            baseline[name] = spec[field]
+        search_space[name] = values
+
+    return ParamOptimizer(
+        search_space, baseline, rule_specs,
+        budget_s=params["budget_s"],
+        workers=params["workers"],
+        chunk_size=params["chunk_size"],
+        max_candidates=params["max_candidates"],
+        drawdown_penalty=params["drawdown_penalty"],
+        min_improvement=params["min_improvement"],
+        cache_size=params["cache_size"],
+        top_k=params["top_k"],
+        seed=params["seed"],
+        strategy_source=strategy
+    )
@@ -1,28 +1,112 @@
 """
 patch_core.py
 
-PATCH_CORE module for Phase 3 (dummy version).
-Calls GPT (theoretically) to propose code changes or parameter updates
-based on signals from REFLECTION_ENGINE.
+PATCH_CORE module for Phase 3.
+Proposes parameter updates based on signals from REFLECTION_ENGINE.
+Suggestions come from ParamOptimizer (see param_optimizer.py). It replays
+the recent trade history under candidate parameter sets and returns a
+ranked patch backed by the replayed PnL and drawdown. Patches are
+suggested only, never applied automatically.
+
+A search runs on a background thread, never inside the trading cycle:
+request_autopatch() starts one and returns at once, and the loop picks
+the finished patch up on a later cycle with collect_autopatch().
 """
 
+import time
+
+import numpy as np
+
+from config.config_loader import load_parameters
+from .param_optimizer import DEFAULTS, build_param_optimizer
+from core.log_core.log_core import get_logger
+
+logger = get_logger("PatchCore")
+
+_params = {**DEFAULTS, **load_parameters("patch_core").get("optimizer", {})}
+
+# Process-wide optimizer (its process pool starts on the first search)
+param_optimizer = build_param_optimizer(_params)
+
+last_patch = None
+_last_run = None
+_search = None          # Future of the running background search
+_executor = None
+
 def patch_core_init():
-    """Initialize PATCH_CORE (placeholder)."""
-    print("[PatchCore] Initialized.")
+    """Initialize PATCH_CORE."""
+    logger.info("Initialized — optimizing %d parameters (%s).",
+                len(param_optimizer.search_space), "enabled" if _params["enabled"] else "disabled")
+
+def _search_executor():
+    global _executor
+    if _executor is None:
+        # Imported on first use, like the agent pools
+        from concurrent.futures import ThreadPoolExecutor
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ParamSearch")
+    return _executor
+
+def request_autopatch(trade_history=None, budget_s: float = None, optimize: bool = True,
+                      wait: bool = False):
+    """
+    Ask PATCH_CORE for a parameter patch, searched over the last
+    history_window trades of trade_history (default: REFLECTION_ENGINE's).
+    Starts the search in the background and returns the latest finished
+    patch (None before the first one); collect_autopatch() picks the new
+    one up once it is done. No search starts while one is running, less
+    than min_interval_s after the previous one, when the optimizer is
+    disabled (or optimize=False, e.g. in backtests) or without enough
+    history. wait=True blocks until the search is done and returns its
+    patch (for offline callers).
+    """
+    global _last_run, _search
+    logger.info("Autopatch request triggered...")
+    if not optimize or not _params["enabled"]:
+        return None
+    collect_autopatch()
+    if _search is not None:
+        return last_patch
+
+    if trade_history is None:
+        from core.reflection_engine.reflection_engine import trade_history
+    if len(trade_history) < _params["min_history"]:
+        logger.info("Not enough history for a search (%d < %d trades).", len(trade_history), _params["min_history"])
+        return None
+    if _last_run is not None and time.monotonic() - _last_run < _params["min_interval_s"]:
+        return last_patch
+
+    _last_run = time.monotonic()
+    # Copy the window: the trading thread keeps appending to the ring buffer
+    columns = trade_history.columns(_params["history_window"])
+    history = {name: np.array(values) for name, values in columns.items() if name != "features"}
+    if "features" in columns:
+        history["features"] = {name: np.array(values) for name, values in columns["features"].items()}
+    _search = _search_executor().submit(param_optimizer.optimize, history, budget_s)
+    if wait:
+        _search.result()
+    return collect_autopatch()
 
-def request_autopatch():
+def collect_autopatch():
     """
-    Dummy function to simulate a GPT call that suggests changes.
-    In the future, we might do actual LLM calls here.
+    Pick up the background search if it has finished (call once per
+    cycle; never blocks). Returns the latest finished patch.
     """
-    print("[PatchCore] Autopatch request triggered...")
-    # Example suggestion
-    suggestion = {
-        "param": "buy_threshold",
-        "new_value": 18,
-        "reason": "Loss streak detected. Lower buy threshold for better entry."
-    }
-    print(f"[PatchCore] Suggestion: {suggestion}")
-    # We won't actually apply the patch automatically yet in Phase 3.
-    # Just logging the suggestion.
-    return suggestion
+    global last_patch, _search
+    if _search is None or not _search.done():
+        return last_patch
+    search, _search = _search, None
+    try:
+        patch = search.result()
+    except Exception:
+        logger.exception("Parameter search failed.")
+        return last_patch
+    logger.info("Searched %d/%d candidates in %.2fs (%d cached, %d over budget).",
+                patch["evaluated"], patch["candidates"], patch["elapsed_s"],
+                patch["cache_hits"], patch["timed_out"])
+    if patch["param_changes"]:
+        logger.info("Suggestion: %s — %s", patch["param_changes"], patch["reason"])
+    else:
+        logger.info("No change suggested: %s", patch["reason"])
+    # Suggestions are not applied automatically
+    last_patch = patch
+    return patch
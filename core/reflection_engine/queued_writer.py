@@ -0,0 +1,182 @@
+"""
+queued_writer.py
+
+Shared base for REFLECTION_ENGINE's background writers (TradeJournal,
+TradeStore).
+- write() validates the record and appends it to a bounded in-memory
+  deque: no lock, no wakeup and no I/O on the trading hot path. A record
+  that cannot be written (e.g. sol_price=None) is rejected and counted
+  there, instead of failing later on the writer thread.
+- A background thread drains the deque every poll interval and hands it
+  to the subclass in batches. A batch that fails is logged and counted
+  as failed, and the thread carries on with the next one.
+- If the writer thread is gone anyway (e.g. the file or database could
+  not be opened), write() drops and counts records instead of blocking
+  on a queue nobody drains, and flush() returns at once.
+
+Subclasses implement _prepare(...) and _write_batch(batch), and
+optionally _open_writer() and _close_writer() (run on the writer thread)
+and _after_batch(closing) for periodic work such as fsync.
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+
+from core.log_core.log_core import get_logger
+
+logger = get_logger("QueuedWriter")
+
+class QueuedWriter(ABC):
+    """
+    Bounded queue drained by one background writer thread.
+    block_when_full: if the queue is full, wait for the writer (True) or
+    drop the record and count it (False). Never waits on a dead writer.
+    """
+
+    thread_name = "QueuedWriter"
+
+    def __init__(self, queue_size: int = 65536, batch_size: int = 4096,
+                 poll_interval_s: float = 0.05, block_when_full: bool = True):
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.poll_interval_s = poll_interval_s
+        self.block_when_full = block_when_full
+        self._queue = deque()
+        self._wakeup = threading.Event()
+        self._closing = False
+        self._dead_logged = False
+        self._alive = False     # cleared by the writer thread on its way out (cheaper than is_alive())
+        self._thread = None
+        self.stats = {
+            "queued": 0,
+            "written": 0,
+            "dropped": 0,
+            "rejected": 0,
+            "failed": 0,
+            "batches": 0
+        }
+
+    def _start(self):
+        """Start the writer thread (subclasses call this at the end of __init__)."""
+        self._alive = True
+        self._thread = threading.Thread(target=self._run, name=self.thread_name, daemon=True)
+        self._thread.start()
+
+    # ─── Hot path ────────────────────────────────────────────────────────
+    @abstractmethod
+    def _prepare(self, timestamp, decision, sol_price, profit_loss) -> tuple:
+        """The queued tuple for one trade; raise TypeError/ValueError to reject it."""
+
+    def write(self, timestamp: float, decision: str, sol_price: float, profit_loss: float) -> bool:
+        """Queue one record (hot path: no formatting, no I/O). False if it was rejected or dropped."""
+        try:
+            record = self._prepare(timestamp, decision, sol_price, profit_loss)
+        except (TypeError, ValueError) as e:
+            self.stats["rejected"] += 1
+            logger.warning("%s: rejected trade record (%s).", self.thread_name, e)
+            return False
+        if len(self._queue) >= self.queue_size or not self._alive:
+            if not self._wait_for_room():
+                self.stats["dropped"] += 1
+                return False
+        self._queue.append(record)
+        self.stats["queued"] += 1
+        return True
+
+    def _wait_for_room(self) -> bool:
+        if not self._alive:
+            if not self._dead_logged:
+                self._dead_logged = True
+                logger.error("%s is not running; dropping trade records.", self.thread_name)
+            return False
+        if not self.block_when_full:
+            return False
+        self._wakeup.set()
+        while len(self._queue) >= self.queue_size:
+            if not self._alive:
+                return False
+            time.sleep(0.0005)
+        return True
+
+    # ─── Writer thread ───────────────────────────────────────────────────
+    def _open_writer(self):
+        """Per-thread setup, run on the writer thread before the first batch."""
+
+    def _close_writer(self):
+        """Per-thread teardown, run on the writer thread when it exits."""
+
+    @abstractmethod
+    def _write_batch(self, batch: list):
+        """Write one batch of queued records, all or nothing; raise on failure."""
+
+    def _after_batch(self, closing: bool):
+        """Periodic work after each batch and after each drain (e.g. fsync)."""
+
+    def _run(self):
+        try:
+            self._writer_loop()
+        finally:
+            self._alive = False
+
+    def _writer_loop(self):
+        try:
+            self._open_writer()
+        except Exception:
+            logger.exception("%s could not start.", self.thread_name)
+            return
+        popleft = self._queue.popleft
+        try:
+            while True:
+                self._wakeup.wait(self.poll_interval_s)
+                self._wakeup.clear()
+                closing = self._closing
+
+                # Drain everything queued so far, one write per batch
+                while self._queue:
+                    batch = []
+                    while len(batch) < self.batch_size:
+                        try:
+                            batch.append(popleft())
+                        except IndexError:
+                            break
+                    try:
+                        self._write_batch(batch)
+                    except Exception:
+                        # Lose this batch, keep the writer (and the trading loop behind it) alive
+                        self.stats["failed"] += len(batch)
+                        logger.exception("%s failed to write %d records.", self.thread_name, len(batch))
+                    else:
+                        self.stats["written"] += len(batch)
+                        self.stats["batches"] += 1
+                    self._after_batch_safely(False)
+
+                self._after_batch_safely(closing)
+                if closing:
+                    return
+        finally:
+            self._close_writer()
+
+    def _after_batch_safely(self, closing: bool):
+        try:
+            self._after_batch(closing)
+        except Exception:
+            logger.exception("%s periodic maintenance failed.", self.thread_name)
+
+    # ─── Control ─────────────────────────────────────────────────────────
+    def flush(self, timeout: float = 5.0):
+        """Wait until everything queued so far has been written (or has failed)."""
+        self._wakeup.set()
+        deadline = time.monotonic() + timeout
+        stats = self.stats
+        while (stats["written"] + stats["failed"] < stats["queued"] and self._alive
+               and time.monotonic() < deadline):
+            time.sleep(0.001)
+
+    def close(self):
+        """Drain the queue and stop the writer thread."""
+        if self._thread.is_alive():
+            self._closing = True
+            self._wakeup.set()
+            self._thread.join()
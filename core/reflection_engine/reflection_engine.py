@@ -4,39 +4,204 @@ reflection_engine.py
 REFLECTION_ENGINE module for Phase 3.
 Collects trade outcomes, logs them, and checks for repeated mistakes 
 or anomalies to potentially trigger PATCH_CORE.
+
+Outcomes are also persisted to an indexed SQLite TradeStore (see
+trade_store.py). On init, the most recent restore_window trades are
+loaded back into trade_history, so loss streaks and kill-switch windows
+survive a restart. Restart cost does not grow with the stored history.
 """
 
+import atexit
 import os
 import time
+from collections import deque
+
+from config.config_loader import load_parameters
+from core.decisions.decisions import REVERSAL_PREFIX
+from core.reflection_engine.trade_history import TradeHistory
+from core.reflection_engine.trade_journal import TradeJournal, journal_to_markdown
+from core.reflection_engine.trade_store import TradeStore
+from core.log_core.log_core import get_logger
+
+logger = get_logger("ReflectionEngine")
+
+# Bounded columnar ring buffer (flat memory, O(1) rolling aggregates)
+_history_params = load_parameters("trade_history")
+trade_history = TradeHistory(
+    capacity=_history_params.get("capacity", 100_000),
+    pnl_windows=tuple(_history_params.get("pnl_windows", [3, 5]))
+)
+
+# Consecutive losses that trigger a PatchCore request
+LOSS_STREAK_TRIGGER = 3
+
+# Order fills reported back by the execution engine's confirmation tracker
+recent_fills = deque(maxlen=1000)
+fill_counts = {}
+FILLED_STATUSES = ("confirmed", "finalized")
+
+# Orders that ended without a fill, waiting for apply_fill_corrections on the trading thread
+unfilled_orders = deque()
 
-# A simple in-memory store for demonstration
-# (In the future, might read/write from logs/reflection_logs.md)
-trade_history = []
+# Set False to keep outcomes in memory only (e.g. backtests replaying
+# millions of ticks should not append to the trade journal).
+LOG_TO_FILE = True
+
+LOGS_DIR = os.path.join(os.path.dirname(__file__), "../../logs")
+_journal_params = load_parameters("trade_journal")
+JOURNAL_PATH = os.path.join(LOGS_DIR, _journal_params.get("file", "reflection_journal.bin"))
+
+# Background binary journal, opened on first use
+trade_journal = None
+
+_store_params = load_parameters("trade_store")
+STORE_ENABLED = _store_params.get("enabled", True)
+STORE_PATH = os.path.join(LOGS_DIR, _store_params.get("file", "trades.sqlite"))
+
+# Indexed trade store, opened on first use
+trade_store = None
+
+def get_trade_journal() -> TradeJournal:
+    """Return the shared TradeJournal, starting its writer thread on first use."""
+    global trade_journal
+    if trade_journal is None:
+        trade_journal = TradeJournal(
+            JOURNAL_PATH,
+            queue_size=_journal_params.get("queue_size", 65536),
+            batch_size=_journal_params.get("batch_size", 4096),
+            fsync_every=_journal_params.get("fsync_every", 1000),
+            fsync_interval_s=_journal_params.get("fsync_interval_s", 1.0),
+            poll_interval_s=_journal_params.get("poll_interval_s", 0.05)
+        )
+        atexit.register(trade_journal.close)
+    return trade_journal
+
+def get_trade_store() -> TradeStore:
+    """Return the shared TradeStore, starting its writer thread on first use."""
+    global trade_store
+    if trade_store is None:
+        trade_store = TradeStore(
+            STORE_PATH,
+            queue_size=_store_params.get("queue_size", 65536),
+            batch_size=_store_params.get("batch_size", 4096),
+            poll_interval_s=_store_params.get("poll_interval_s", 0.05),
+            synchronous=_store_params.get("synchronous", "NORMAL")
+        )
+        atexit.register(trade_store.close)
+    return trade_store
 
 def reflection_engine_init():
-    """Initialize REFLECTION_ENGINE (placeholder)."""
-    print("[ReflectionEngine] Initialized.")
+    """Initialize REFLECTION_ENGINE and restore recent trades from the store."""
+    restored = restore_trade_history() if STORE_ENABLED else 0
+    logger.info("Initialized — restored %d recent trades.", restored)
 
-def log_trade_outcome(decision: str, sol_price: float, profit_loss: float = 0.0):
+def restore_trade_history(window: int = None) -> int:
+    """
+    Load the last `window` stored trades (default: restore_window from the
+    config, capped at the history capacity) into an empty trade_history,
+    and carry over the lifetime PnL total. Returns the number of trades
+    restored.
+    """
+    if len(trade_history):
+        return 0
+    if window is None:
+        window = _store_params.get("restore_window", 1000)
+    store = trade_store or get_trade_store()
+    records = store.recent(min(window, trade_history.capacity))
+    for timestamp, sol_price, profit_loss, decision in zip(
+        records["timestamp"].tolist(), records["sol_price"].tolist(),
+        records["profit_loss"].tolist(), records["decision"].tolist()
+    ):
+        trade_history.append(timestamp, decision.decode("ascii"), sol_price, profit_loss)
+    trade_history.pnl_total = store.totals()["pnl_total"]
+    return len(records)
+
+def reflection_engine_reset():
+    """
+    Clear the in-memory trade_history (in place, so modules that imported
+    it by name keep seeing the same object). Clearing starts a new history
+    generation, which resets the kill switch's incremental rule state.
+    """
+    trade_history.clear()
+
+def log_trade_outcome(decision: str, sol_price: float, profit_loss: float = 0.0,
+                      timestamp: float = None, emotional_state: str = "neutral",
+                      features: dict = None):
     """
     Log the outcome of a trade (or hold).
-    For demonstration, we store in memory plus append to WAR_LOG or reflection_logs.
+    We store in memory plus queue a record for the background trade journal
+    (see export_reflection_log for the markdown view) and the trade store.
+    timestamp defaults to now; replays pass the recorded tick time.
+    emotional_state / features: what the decision was made with, kept in
+    trade_history for PATCH_CORE's replays.
     """
-    timestamp = time.time()
-    outcome_record = {
-        "timestamp": timestamp,
-        "decision": decision,
-        "sol_price": sol_price,
-        "profit_loss": profit_loss
-    }
-    trade_history.append(outcome_record)
+    if timestamp is None:
+        timestamp = time.time()
+    trade_history.append(timestamp, decision, sol_price, profit_loss, emotional_state, features)
 
-    # Append to logs/reflection_logs.md (just a quick example)
-    logs_dir = os.path.join(os.path.dirname(__file__), "../../logs")
-    reflection_log_path = os.path.join(logs_dir, "reflection_logs.md")
+    if LOG_TO_FILE:
+        (trade_journal or get_trade_journal()).write(timestamp, decision, sol_price, profit_loss)
+        if STORE_ENABLED:
+            (trade_store or get_trade_store()).write(timestamp, decision, sol_price, profit_loss)
 
-    with open(reflection_log_path, "a", encoding="utf-8") as f:
-        f.write(f"Time: {timestamp}, Decision: {decision}, Price: {sol_price}, PnL: {profit_loss}\n")
+def log_fill_outcome(order: dict):
+    """
+    Record a finished order from the confirmation tracker
+    (status: confirmed / finalized / failed / timeout / submit_error).
+    Runs on the tracker thread, so it only does in-memory bookkeeping.
+    """
+    status = order.get("status", "unknown")
+    fill_counts[status] = fill_counts.get(status, 0) + 1
+    recent_fills.append({
+        "order_id": order.get("order_id"),
+        "decision": order.get("decision"),
+        "signature": order.get("signature"),
+        "status": status,
+        "confirm_latency_s": order["finished_at"] - order["submitted_at"] if "submitted_at" in order else None
+    })
+    if status not in FILLED_STATUSES:
+        logger.info("Order %s (%s) ended as %s.", order.get("order_id"), order.get("decision"), status)
+        unfilled_orders.append(order)
+
+def apply_fill_corrections(positions, timestamp: float = None) -> int:
+    """
+    Undo the fills the trading loop booked for orders that then failed,
+    timed out or were never submitted. Call from the trading thread (the
+    position book and trade_history are not shared with the tracker).
+    Each reversal applies the opposite fill at the price the order was
+    booked at, then re-marks at the current mark, so the position and PnL
+    come out as if the order had never been placed. The PnL difference is
+    logged as a "REVERT_<decision>" trade, which the kill switch and the
+    stores see like any other outcome. Returns the number of orders reversed.
+    """
+    reversed_orders = 0
+    while unfilled_orders:
+        order = unfilled_orders.popleft()
+        symbol, price = order.get("symbol", "SOL"), order.get("price")
+        if price is None:
+            logger.warning("Order %s has no booked price; cannot reverse it.", order.get("order_id"))
+            continue
+        decision = REVERSAL_PREFIX + order["decision"]
+        mark = positions.position(symbol)["last_price"] or price
+        pnl_before = positions.total_pnl()
+        positions.apply_decision(symbol, decision, price)
+        positions.mark(symbol, mark)
+        log_trade_outcome(decision, mark, positions.total_pnl() - pnl_before, timestamp)
+        reversed_orders += 1
+    return reversed_orders
+
+def export_reflection_log(md_path: str = None) -> int:
+    """
+    Render the trade journal as a human-readable markdown log
+    (default: logs/reflection_journal.md). Returns the record count.
+    """
+    if md_path is None:
+        md_path = os.path.join(LOGS_DIR, "reflection_journal.md")
+    if trade_journal is not None:
+        trade_journal.flush()
+    if not os.path.exists(JOURNAL_PATH):
+        return 0
+    return journal_to_markdown(JOURNAL_PATH, md_path)
 
 def analyze_history_and_trigger_patch():
     """
@@ -45,14 +210,13 @@ def analyze_history_and_trigger_patch():
     For Phase 3, we'll do a simple check: 
     If we have 3 consecutive trades with negative profit_loss, we trigger a patch request.
     """
-    if len(trade_history) < 3:
+    if len(trade_history) < LOSS_STREAK_TRIGGER:
         return  # Not enough data to analyze
 
-    # Check last 3 trades
-    recent = trade_history[-3:]
-    negative_streak = all(tr["profit_loss"] < 0 for tr in recent)
+    # Loss streak is kept up to date by trade_history on every append
+    negative_streak = trade_history.loss_streak >= LOSS_STREAK_TRIGGER
 
     if negative_streak:
-        print("[ReflectionEngine] Detected 3-loss streak! Triggering PatchCore.")
+        logger.warning("Detected 3-loss streak! Triggering PatchCore.")
         return True  # signal we want to patch
     return False
@@ -0,0 +1,207 @@
+"""
+trade_history.py
+
+Bounded, columnar trade history for REFLECTION_ENGINE.
+A fixed-capacity ring buffer of typed columns (timestamp, price, PnL,
+decision code, EGO_CORE state code and, when the caller passes them, the
+SCORING_ENGINE features the decision saw) so memory stays flat no matter
+how long the process runs. PATCH_CORE replays the recorded features and
+states instead of guessing them.
+Rolling aggregates - windowed PnL sums and the current loss streak - are
+updated in O(1) per append, so the kill switch and streak analysis never
+re-scan the history.
+
+Columns are preallocated array.array buffers (cheap scalar writes on the
+append path) exposed as zero-copy NumPy views for batch reads.
+"""
+
+import itertools
+import math
+from array import array
+
+import numpy as np
+
+from core.decisions.decisions import DECISION_LABELS, MAX_DECISION_LABELS
+from core.ego_core.ego_core import EMOTIONAL_STATE_CODES
+from core.scoring_engine.features import FEATURE_NAMES
+
+# Running window sums are compensated (Neumaier) and additionally re-derived
+# exactly from the buffer this often, so add/subtract drift cannot push a sum
+# across a kill-switch threshold.
+RESYNC_EVERY = 4096
+
+# Every new or cleared history gets a fresh generation, so consumers that
+# follow it incrementally (the kill switch) can tell a refilled history
+# from the one they have already seen
+_generations = itertools.count(1)
+
+class TradeHistory:
+    def __init__(self, capacity: int = 100_000, pnl_windows=(3, 5)):
+        if capacity < max(pnl_windows):
+            raise ValueError("capacity must cover the largest PnL window")
+        self.capacity = capacity
+        self._timestamps = array("d", bytes(8 * capacity))
+        self._prices = array("d", bytes(8 * capacity))
+        self._pnls = array("d", bytes(8 * capacity))
+        self._decisions = array("b", bytes(capacity))
+        self._states = array("b", bytes(capacity))
+        # One row per trade, NaN where no features were recorded
+        self.features = np.full((capacity, len(FEATURE_NAMES)), np.nan)
+        self._featured = False
+        # Zero-copy NumPy views over the same memory
+        self.timestamps = np.frombuffer(self._timestamps, dtype=np.float64)
+        self.prices = np.frombuffer(self._prices, dtype=np.float64)
+        self.pnls = np.frombuffer(self._pnls, dtype=np.float64)
+        self.decisions = np.frombuffer(self._decisions, dtype=np.int8)
+        self.emotional_states = np.frombuffer(self._states, dtype=np.int8)
+
+        self.labels = list(DECISION_LABELS)
+        self.codes = {label: code for code, label in enumerate(self.labels)}
+
+        self.pnl_windows = tuple(pnl_windows)
+        self._sums = [[0.0, 0.0] for _ in self.pnl_windows]  # (total, compensation)
+        self.loss_streak = 0
+        self.total_appended = 0
+        self.size = 0
+        self.pnl_total = 0.0
+        self.generation = next(_generations)
+
+    def __len__(self):
+        return self.size
+
+    def decision_code(self, decision: str) -> int:
+        """Code for a decision label, registering unseen labels on the fly."""
+        code = self.codes.get(decision)
+        if code is None:
+            code = len(self.labels)
+            if code >= MAX_DECISION_LABELS:
+                raise ValueError(f"Too many distinct decision labels (max {MAX_DECISION_LABELS}): {decision!r}")
+            self.labels.append(decision)
+            self.codes[decision] = code
+        return code
+
+    def append(self, timestamp: float, decision: str, sol_price: float, profit_loss: float,
+               emotional_state: str = "neutral", features: dict = None):
+        """
+        Record one trade. emotional_state: the EGO_CORE state it was decided
+        in; features: the SCORING_ENGINE features it saw ({name: value}).
+        """
+        n = self.total_appended
+        capacity = self.capacity
+        idx = n % capacity
+        code = self.codes.get(decision)
+        if code is None:
+            code = self.decision_code(decision)
+        self._timestamps[idx] = timestamp
+        self._prices[idx] = sol_price
+        self._decisions[idx] = code
+        self._states[idx] = EMOTIONAL_STATE_CODES.get(emotional_state, 0)
+        if features is not None:
+            self.features[idx] = [features.get(name, math.nan) for name in FEATURE_NAMES]
+            self._featured = True
+        elif self._featured:
+            self.features[idx] = math.nan
+
+        # Window sums: add the new PnL, drop the one that just left each window
+        pnls = self._pnls
+        profit_loss = float(profit_loss)
+        for w, acc in zip(self.pnl_windows, self._sums):
+            total, comp = acc
+            # Neumaier steps, inlined (hot path): add the new PnL ...
+            t = total + profit_loss
+            if abs(total) >= abs(profit_loss):
+                comp += (total - t) + profit_loss
+            else:
+                comp += (profit_loss - t) + total
+            total = t
+            # ... and subtract the one leaving the window
+            if n >= w:
+                x = -pnls[(n - w) % capacity]
+                t = total + x
+                if abs(total) >= abs(x):
+                    comp += (total - t) + x
+                else:
+                    comp += (x - t) + total
+                total = t
+            acc[0] = total
+            acc[1] = comp
+        pnls[idx] = profit_loss
+
+        self.pnl_total += profit_loss
+        self.loss_streak = self.loss_streak + 1 if profit_loss < 0 else 0
+        self.total_appended = n + 1
+        if self.size < capacity:
+            self.size += 1
+
+        if self.total_appended % RESYNC_EVERY == 0:
+            self._resync()
+
+    def _resync(self):
+        for w, acc in zip(self.pnl_windows, self._sums):
+            acc[0] = math.fsum(self._tail(self.pnls, w))
+            acc[1] = 0.0
+
+    def _tail(self, column, n: int):
+        """Last n values of a column in insertion order (a copy when wrapped)."""
+        n = min(n, len(self))
+        end = self.total_appended % self.capacity
+        if n <= end:
+            return column[end - n:end]
+        return np.concatenate((column[self.capacity - (n - end):], column[:end]))
+
+    def window_sum(self, window: int) -> float:
+        """Sum of the last `window` PnLs (fewer if not enough trades yet)."""
+        if window in self.pnl_windows:
+            acc = self._sums[self.pnl_windows.index(window)]
+            return acc[0] + acc[1]
+        return math.fsum(self._tail(self.pnls, window))
+
+    def record(self, i: int) -> dict:
+        """One trade as the dict shape the old list-of-dicts history used."""
+        n = self.size
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("trade history index out of range")
+        idx = (self.total_appended - n + i) % self.capacity
+        return {
+            "timestamp": self._timestamps[idx],
+            "decision": self.labels[self._decisions[idx]],
+            "sol_price": self._prices[idx],
+            "profit_loss": self._pnls[idx]
+        }
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self.record(i) for i in range(*key.indices(len(self)))]
+        return self.record(key)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.record(i)
+
+    def columns(self, n: int = None) -> dict:
+        """
+        Last n trades (default: all retained) as NumPy columns; "features"
+        ({name: column}) only if any trade recorded them.
+        """
+        n = len(self) if n is None else n
+        columns = {
+            "timestamp": self._tail(self.timestamps, n),
+            "sol_price": self._tail(self.prices, n),
+            "profit_loss": self._tail(self.pnls, n),
+            "decision": self._tail(self.decisions, n),
+            "emotional_state": self._tail(self.emotional_states, n)
+        }
+        if self._featured:
+            rows = self._tail(self.features, n)
+            columns["features"] = {name: rows[:, j] for j, name in enumerate(FEATURE_NAMES)}
+        return columns
+
+    def clear(self):
+        self.generation = next(_generations)
+        self.total_appended = 0
+        self.size = 0
+        self.pnl_total = 0.0
+        self.loss_streak = 0
+        self._sums = [[0.0, 0.0] for _ in self.pnl_windows]
@@ -0,0 +1,170 @@
+"""
+trade_journal.py
+
+Binary trade journal for REFLECTION_ENGINE.
+- TradeJournal: log_trade_outcome appends records to a bounded in-memory
+  queue (a deque: no lock or wakeup on the hot path); a background writer
+  thread drains it every poll interval, packs fixed-width binary records,
+  writes them in batches and fsyncs on a count/interval policy. Nothing on
+  the trading hot path touches the filesystem. The queue and the writer
+  thread come from queued_writer.QueuedWriter.
+- JournalReader: memory-maps the journal as a NumPy structured array, so
+  millions of records can be scanned and filtered without parsing text.
+- journal_to_markdown: renders the human-readable reflection log on demand.
+
+File layout: 16-byte header (magic, version, record size) followed by
+RECORD_SIZE-byte little-endian records.
+
+Convert from the repo root:
+    python -m core.reflection_engine.trade_journal logs/reflection_journal.bin out.md
+"""
+
+import os
+import struct
+import sys
+import time
+
+import numpy as np
+
+from core.reflection_engine.queued_writer import QueuedWriter
+
+MAGIC = b"OBVJ"
+VERSION = 1
+HEADER = struct.Struct("<4sHH8x")     # magic, version, record size
+RECORD = struct.Struct("<ddd16s")     # timestamp, sol_price, profit_loss, decision
+HEADER_SIZE = HEADER.size
+RECORD_SIZE = RECORD.size
+
+RECORD_DTYPE = np.dtype([
+    ("timestamp", "<f8"),
+    ("sol_price", "<f8"),
+    ("profit_loss", "<f8"),
+    ("decision", "S16")
+])
+
+class TradeJournal(QueuedWriter):
+    """
+    Background, batched writer of fixed-width trade records.
+    fsync_every / fsync_interval_s: fsync after that many records or that
+    many seconds since the last fsync, whichever comes first (0 disables
+    the respective trigger; close() always fsyncs).
+    block_when_full: if the queue is full, wait for the writer (True) or
+    drop the record and count it (False).
+    """
+
+    thread_name = "TradeJournalWriter"
+
+    def __init__(self, path: str, queue_size: int = 65536, batch_size: int = 4096,
+                 fsync_every: int = 1000, fsync_interval_s: float = 1.0,
+                 poll_interval_s: float = 0.05, block_when_full: bool = True):
+        super().__init__(queue_size, batch_size, poll_interval_s, block_when_full)
+        self.path = path
+        self.fsync_every = fsync_every
+        self.fsync_interval_s = fsync_interval_s
+        self.stats["fsyncs"] = 0
+        self._since_fsync = 0
+        self._last_fsync = time.monotonic()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._file = open(path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(HEADER.pack(MAGIC, VERSION, RECORD_SIZE))
+            self._file.flush()
+        self._start()
+
+    def _prepare(self, timestamp, decision, sol_price, profit_loss) -> tuple:
+        # Coerce here so a bad value (e.g. sol_price=None) fails the caller's
+        # write(), not struct.pack on the writer thread
+        if not isinstance(decision, str):
+            raise TypeError(f"decision must be a str, got {type(decision).__name__}")
+        return float(timestamp), float(sol_price), float(profit_loss), decision
+
+    def _write_batch(self, batch: list):
+        pack = RECORD.pack
+        self._file.write(b"".join(
+            pack(ts, price, pnl, decision.encode("ascii", "replace")[:16])
+            for ts, price, pnl, decision in batch
+        ))
+        self._file.flush()
+        self._since_fsync += len(batch)
+
+    def _after_batch(self, closing: bool):
+        # Count-based fsync, plus a time-based one for a trickle of records below fsync_every
+        if self._since_fsync and (closing or (self.fsync_every and self._since_fsync >= self.fsync_every)
+                                  or (self.fsync_interval_s and
+                                      time.monotonic() - self._last_fsync >= self.fsync_interval_s)):
+            os.fsync(self._file.fileno())
+            self.stats["fsyncs"] += 1
+            self._since_fsync = 0
+            self._last_fsync = time.monotonic()
+
+    def close(self):
+        """Drain the queue, fsync and close the file."""
+        super().close()
+        if not self._file.closed:
+            self._file.close()
+
+class JournalReader:
+    """Zero-copy, memory-mapped view of a journal file."""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            magic, version, record_size = HEADER.unpack(f.read(HEADER_SIZE))
+        if magic != MAGIC or record_size != RECORD_SIZE:
+            raise ValueError(f"{path} is not a v{VERSION} trade journal")
+        # Ignore a trailing partial record (e.g. crash mid-write)
+        count = (os.path.getsize(path) - HEADER_SIZE) // RECORD_SIZE
+        if count:
+            self.records = np.memmap(path, dtype=RECORD_DTYPE, mode="r",
+                                     offset=HEADER_SIZE, shape=(count,))
+        else:
+            self.records = np.zeros(0, dtype=RECORD_DTYPE)
+
+    def __len__(self):
+        return len(self.records)
+
+    def filter(self, decision: str = None, start: float = None, end: float = None,
+               min_pnl: float = None, max_pnl: float = None):
+        """
+        Records matching every given condition (time range is [start, end)).
+        Returns a NumPy structured array.
+        """
+        recs = self.records
+        mask = np.ones(len(recs), dtype=bool)
+        if decision is not None:
+            mask &= recs["decision"] == decision.encode("ascii")
+        if start is not None:
+            mask &= recs["timestamp"] >= start
+        if end is not None:
+            mask &= recs["timestamp"] < end
+        if min_pnl is not None:
+            mask &= recs["profit_loss"] >= min_pnl
+        if max_pnl is not None:
+            mask &= recs["profit_loss"] <= max_pnl
+        return recs[mask]
+
+def journal_to_markdown(journal_path: str, md_path: str, chunk: int = 100_000) -> int:
+    """
+    Render the journal in the reflection_logs.md line format.
+    Returns the number of records written.
+    """
+    records = JournalReader(journal_path).records
+    with open(md_path, "w", encoding="utf-8") as f:
+        f.write("# reflection_logs.md\n\n")
+        for start in range(0, len(records), chunk):
+            block = records[start:start + chunk]
+            f.writelines(
+                f"Time: {ts}, Decision: {decision.decode('ascii')}, Price: {price}, PnL: {pnl}\n"
+                for ts, price, pnl, decision in zip(
+                    block["timestamp"].tolist(), block["sol_price"].tolist(),
+                    block["profit_loss"].tolist(), block["decision"].tolist()
+                )
+            )
+    return len(records)
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("usage: python -m core.reflection_engine.trade_journal <journal.bin> <out.md>")
+        sys.exit(2)
+    n = journal_to_markdown(sys.argv[1], sys.argv[2])
+    print(f"[TradeJournal] Wrote {n} records to {sys.argv[2]}")
@@ -0,0 +1,180 @@
+"""
+trade_store.py
+
+Indexed, persistent trade store for REFLECTION_ENGINE (SQLite, WAL mode).
+- TradeStore.write appends to a bounded in-memory queue (the shared
+  QueuedWriter, like TradeJournal): no lock, no I/O and no SQL on the hot
+  path. Records with a non-finite number are rejected there; they would
+  violate the NOT NULL columns. A background writer thread drains the
+  queue every poll interval and inserts each batch in one transaction
+  (executemany). The same transaction also updates a one-row
+  running-totals table. A batch that fails (e.g. "database is locked") is
+  rolled back, logged and counted, and the writer carries on.
+- recent(n) reads the last n trades by rowid, and totals() reads the
+  running totals. Their cost does not depend on how many trades are
+  stored, so restoring the window the kill switch and streak analysis
+  need takes constant time as the history grows.
+- query() answers range queries by time, decision and PnL through
+  indexes. Readers use their own connection; WAL lets them run while
+  the writer commits.
+
+Results use trade_journal.RECORD_DTYPE, the same structured layout as
+JournalReader.filter().
+"""
+
+import math
+import os
+import sqlite3
+import threading
+
+import numpy as np
+
+from core.reflection_engine.queued_writer import QueuedWriter
+from core.reflection_engine.trade_journal import RECORD_DTYPE
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS trades (
+    id          INTEGER PRIMARY KEY,
+    timestamp   REAL NOT NULL,
+    decision    TEXT NOT NULL,
+    sol_price   REAL NOT NULL,
+    profit_loss REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS trades_by_time ON trades (timestamp);
+CREATE INDEX IF NOT EXISTS trades_by_decision ON trades (decision, timestamp);
+CREATE INDEX IF NOT EXISTS trades_by_pnl ON trades (profit_loss);
+CREATE TABLE IF NOT EXISTS trade_totals (
+    id        INTEGER PRIMARY KEY CHECK (id = 0),
+    trades    INTEGER NOT NULL,
+    pnl_total REAL NOT NULL
+);
+INSERT OR IGNORE INTO trade_totals VALUES (0, 0, 0.0);
+"""
+
+_COLUMNS = "timestamp, sol_price, profit_loss, decision"     # RECORD_DTYPE order
+_ID_RECORD_DTYPE = np.dtype([("id", "<i8")] + RECORD_DTYPE.descr)
+
+class TradeStore(QueuedWriter):
+    """
+    SQLite trade store with a background batched writer.
+    synchronous: SQLite's synchronous pragma. NORMAL is safe against
+    corruption in WAL mode, but on power loss it can drop the last
+    committed batches. FULL fsyncs every commit.
+    cache_mb: SQLite page cache per connection. Inserts update three
+    indexes, and a cache that holds their hot pages keeps batched commits
+    fast as the table grows.
+    block_when_full: same meaning as in TradeJournal.
+    """
+
+    thread_name = "TradeStoreWriter"
+
+    def __init__(self, path: str, queue_size: int = 65536, batch_size: int = 4096,
+                 poll_interval_s: float = 0.05, synchronous: str = "NORMAL",
+                 cache_mb: int = 64, block_when_full: bool = True):
+        super().__init__(queue_size, batch_size, poll_interval_s, block_when_full)
+        self.path = path
+        self.synchronous = synchronous
+        self.cache_mb = cache_mb
+        self._read_lock = threading.Lock()
+        self._conn = None
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # Create the schema up front so a bad path or file fails here, not on the writer thread
+        self._reader = self._connect(check_same_thread=False)
+        self._reader.executescript(SCHEMA)
+        self._reader.execute("PRAGMA query_only = ON")
+        self._start()
+
+    def _connect(self, **kwargs) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, isolation_level=None, **kwargs)
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute(f"PRAGMA synchronous = {self.synchronous}")
+        conn.execute(f"PRAGMA cache_size = {-1024 * int(self.cache_mb)}")
+        return conn
+
+    def _prepare(self, timestamp, decision, sol_price, profit_loss) -> tuple:
+        if not isinstance(decision, str):
+            raise TypeError(f"decision must be a str, got {type(decision).__name__}")
+        timestamp, sol_price, profit_loss = float(timestamp), float(sol_price), float(profit_loss)
+        # SQLite stores NaN as NULL: reject it here, not as a failed batch on the writer thread
+        if not (math.isfinite(timestamp) and math.isfinite(sol_price) and math.isfinite(profit_loss)):
+            raise ValueError(f"non-finite value in trade ({timestamp}, {sol_price}, {profit_loss})")
+        return timestamp, decision, sol_price, profit_loss
+
+    def _open_writer(self):
+        self._conn = self._connect()
+
+    def _close_writer(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _write_batch(self, batch: list):
+        conn = self._conn
+        pnl = sum(trade[3] for trade in batch)
+        try:
+            conn.execute("BEGIN")
+            conn.executemany(
+                "INSERT INTO trades (timestamp, decision, sol_price, profit_loss) VALUES (?, ?, ?, ?)", batch
+            )
+            conn.execute("UPDATE trade_totals SET trades = trades + ?, pnl_total = pnl_total + ? WHERE id = 0",
+                         (len(batch), pnl))
+            conn.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+
+    def close(self):
+        """Commit the queue and close both connections."""
+        super().close()
+        with self._read_lock:
+            self._reader.close()
+
+    # ─── Reads (committed trades only) ───────────────────────────────────
+    def _records(self, sql: str, params=()) -> np.ndarray:
+        with self._read_lock:
+            rows = self._reader.execute(sql, params).fetchall()
+        return np.array(rows, dtype=RECORD_DTYPE)
+
+    def recent(self, n: int) -> np.ndarray:
+        """The last n trades in insertion order (a rowid range scan, independent of history size)."""
+        return self._records(
+            f"SELECT {_COLUMNS} FROM (SELECT * FROM trades ORDER BY id DESC LIMIT ?) ORDER BY id", (n,)
+        )
+
+    def totals(self) -> dict:
+        """Lifetime trade count and total PnL (one row, kept up to date by the writer)."""
+        with self._read_lock:
+            trades, pnl_total = self._reader.execute(
+                "SELECT trades, pnl_total FROM trade_totals WHERE id = 0").fetchone()
+        return {"trades": trades, "pnl_total": pnl_total}
+
+    def query(self, start: float = None, end: float = None, decision: str = None,
+              min_pnl: float = None, max_pnl: float = None, limit: int = None) -> np.ndarray:
+        """
+        Trades matching every given condition (time range is [start, end)),
+        in time order, at most `limit` of them. Each condition can use an
+        index, and SQLite picks the most selective one.
+        """
+        where, params = [], []
+        for clause, value in (("timestamp >= ?", start), ("timestamp < ?", end), ("decision = ?", decision),
+                              ("profit_loss >= ?", min_pnl), ("profit_loss <= ?", max_pnl)):
+            if value is not None:
+                where.append(clause)
+                params.append(value)
+        condition = " WHERE " + " AND ".join(where) if where else ""
+        if limit is not None:
+            # First `limit` trades by time: let the time index drive the scan
+            return self._records(f"SELECT {_COLUMNS} FROM trades{condition} ORDER BY timestamp, id LIMIT ?",
+                                 params + [limit])
+        # No ORDER BY: it would steer SQLite to the time index even when a PnL
+        # or decision index is far more selective. Sort the matches instead.
+        with self._read_lock:
+            rows = self._reader.execute(f"SELECT id, {_COLUMNS} FROM trades{condition}", params).fetchall()
+        matches = np.array(rows, dtype=_ID_RECORD_DTYPE)
+        order = np.lexsort((matches["id"], matches["timestamp"]))
+        records = np.empty(len(matches), dtype=RECORD_DTYPE)
+        for name in RECORD_DTYPE.names:
+            records[name] = matches[name][order]
+        return records
@@ -0,0 +1,207 @@
+"""
+features.py
+
+Streaming feature layer between the data pipeline and SCORING_ENGINE.
+A FeatureEngine runs a fixed set of indicators (see indicators.py) for
+each symbol it has seen. Each symbol gets a dense id, as in
+PositionManager. Every tick it produces these features:
+
+    ema_fast, ema_slow  fast / slow EMA of price
+    volatility          rolling std of per-tick log returns
+    zscore              price vs. its rolling mean, in rolling stds
+    vwap                rolling volume-weighted average price
+
+The per-tick cost is O(1) per symbol, which keeps it cheap across a whole
+MarketSnapshot universe. warm_up() seeds the state from price history in
+one vectorized pass, so the features are meaningful from the first live
+tick. feature_series() recomputes what the live loop saw, tick by tick,
+for a recorded price path (e.g. PATCH_CORE's replays).
+
+Configured in config/parameters.json under "scoring" -> "features".
+"""
+
+import numpy as np
+
+from config.config_loader import load_parameters
+from .indicators import EMA, RollingStats, RollingVolatility, VWAP
+
+FEATURE_NAMES = ("ema_fast", "ema_slow", "volatility", "zscore", "vwap")
+
+DEFAULTS = {
+    "fast_span": 12,
+    "slow_span": 26,
+    "window": 50
+}
+
+class FeatureEngine:
+    def __init__(self, fast_span: float = 12, slow_span: float = 26, window: int = 50,
+                 initial_capacity: int = 64):
+        capacity = max(1, initial_capacity)
+        self.symbols = []          # symbol id -> symbol
+        self.ids = {}              # symbol -> symbol id
+        self.ema_fast = EMA(fast_span, capacity=capacity)
+        self.ema_slow = EMA(slow_span, capacity=capacity)
+        self.price_stats = RollingStats(window, capacity)
+        self.volatility = RollingVolatility(window, capacity)
+        self.vwap = VWAP(window, capacity)
+        self.capacity = capacity
+
+    def _indicators(self):
+        return (self.ema_fast, self.ema_slow, self.price_stats, self.volatility, self.vwap)
+
+    def _alloc(self, capacity: int):
+        for indicator in self._indicators():
+            indicator.resize(capacity)
+        self.capacity = capacity
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def symbol_id(self, symbol: str) -> int:
+        """Dense id for a symbol, registering it (and growing the state) on first use."""
+        sid = self.ids.get(symbol)
+        if sid is None:
+            sid = len(self.symbols)
+            if sid == self.capacity:
+                self._alloc(self.capacity * 2)
+            self.symbols.append(symbol)
+            self.ids[symbol] = sid
+        return sid
+
+    def register_symbols(self, symbols) -> np.ndarray:
+        """Ids for many symbols at once (e.g. to line up a price vector)."""
+        return np.fromiter((self.symbol_id(s) for s in symbols), dtype=np.int64)
+
+    # ─── Per-tick updates ────────────────────────────────────────────────
+    def update(self, prices, volumes=None) -> dict:
+        """
+        Fold one tick into every symbol's features. prices (and optional
+        volumes) are vectors indexed by symbol id; NaN means no tick for that
+        symbol. Returns {feature: vector} for the registered symbols.
+        """
+        n = len(self.symbols)
+        prices = np.asarray(prices, dtype=np.float64)[:n]
+        self.ema_fast.update(prices)
+        self.ema_slow.update(prices)
+        self.price_stats.update(prices)
+        self.volatility.update(prices)
+        self.vwap.update(prices, None if volumes is None else np.asarray(volumes, dtype=np.float64)[:n])
+        return self.features()
+
+    def features(self, n: int = None) -> dict:
+        """Current {feature: vector} for the first n symbols (default all registered)."""
+        n = len(self.symbols) if n is None else n
+        return {
+            "ema_fast": self.ema_fast.value[:n].copy(),
+            "ema_slow": self.ema_slow.value[:n].copy(),
+            "volatility": self.volatility.value(n),
+            # Latest price vs. the window (volatility tracks the last price per symbol)
+            "zscore": self.price_stats.zscore(self.volatility.last[:n]),
+            "vwap": self.vwap.value(n)
+        }
+
+    def update_snapshot(self, snapshot):
+        """Update from a MarketSnapshot and add the features to it as columns (returns it)."""
+        ids = self.register_symbols(snapshot.symbols)
+        n = len(self.symbols)
+        volume = snapshot.columns.get("volume")
+        if n == len(ids) and np.array_equal(ids, np.arange(n)):
+            # Snapshot rows already in symbol id order
+            features = self.update(snapshot.price, volume)
+        else:
+            prices = np.full(n, np.nan)
+            prices[ids] = snapshot.price
+            volumes = None
+            if volume is not None:
+                volumes = np.full(n, np.nan)
+                volumes[ids] = volume
+            features = {name: values[ids] for name, values in self.update(prices, volumes).items()}
+        snapshot.columns.update(features)
+        return snapshot
+
+    def update_market_data(self, market_data: dict, symbol: str = "SOL") -> dict:
+        """
+        Update one symbol from the legacy market_data dict; returns a copy
+        with the features added. A fallback quote (placeholder, not a market
+        price) is no tick: the indicators see NaN and keep their state.
+        """
+        sid = self.symbol_id(symbol)
+        fallback = market_data.get("fallback", False)
+        prices = np.full(len(self.symbols), np.nan)
+        if not fallback:
+            prices[sid] = market_data.get("sol_price", np.nan)
+        volumes = None
+        if "volume" in market_data and not fallback:
+            volumes = np.full(len(self.symbols), np.nan)
+            volumes[sid] = market_data["volume"]
+        features = self.update(prices, volumes)
+        enriched = dict(market_data)
+        for name, values in features.items():
+            enriched[name] = float(values[sid])
+        return enriched
+
+    def warm_up(self, price_history, volume_history=None, symbols=None):
+        """
+        Seed the features from history: (ticks x symbols) arrays with columns
+        in `symbols` order (default: the registered symbols, in id order).
+        Replaces the state of every symbol.
+        """
+        if symbols is not None:
+            ids = self.register_symbols(symbols)
+            if not np.array_equal(ids, np.arange(len(ids))):
+                raise ValueError("warm_up symbols must be the first registered symbols, in id order")
+        prices = np.asarray(price_history, dtype=np.float64)
+        n_columns = prices.shape[1] if prices.ndim > 1 else 1
+        if n_columns > len(self.symbols):
+            raise ValueError(f"History has {n_columns} columns but only {len(self.symbols)} symbols are registered")
+        self.ema_fast.warm_up(prices)
+        self.ema_slow.warm_up(prices)
+        self.price_stats.warm_up(prices)
+        self.volatility.warm_up(prices)
+        self.vwap.warm_up(prices, volume_history)
+
+def build_feature_engine(params: dict = None) -> FeatureEngine:
+    """Engine configured from "scoring" -> "features" in config/parameters.json."""
+    if params is None:
+        params = load_parameters("scoring").get("features", {})
+    params = {**DEFAULTS, **params}
+    return FeatureEngine(params["fast_span"], params["slow_span"], params["window"])
+
+def feature_series(prices, volumes=None, params: dict = None) -> dict:
+    """
+    Per-tick features of one symbol's recorded price series: what a fresh
+    engine fed one tick at a time (like the live loop) reports after each
+    tick. Returns {feature: array} aligned with prices. The EMAs are
+    stepped tick by tick; the rolling features come from one warm_up()
+    over every tick's trailing window at once (one column per tick).
+    """
+    engine = build_feature_engine(params)
+    prices = np.asarray(prices, dtype=np.float64)
+    n = len(prices)
+    series = {}
+    for name, ema in (("ema_fast", engine.ema_fast), ("ema_slow", engine.ema_slow)):
+        values = np.empty(n)
+        for t in range(n):
+            values[t] = ema.update(prices[t:t + 1])[0]
+        series[name] = values
+
+    # Column t holds the window + 1 prices up to tick t (NaN before the first tick)
+    window = engine.price_stats.window
+    pad = np.full(window, np.nan)
+    trailing = np.lib.stride_tricks.sliding_window_view(np.concatenate((pad, prices)), window + 1).T
+    engine._alloc(max(1, n))
+    engine.volatility.warm_up(trailing)
+    engine.price_stats.warm_up(trailing[1:])
+    if volumes is None:
+        engine.vwap.warm_up(trailing[1:])
+    else:
+        volumes = np.asarray(volumes, dtype=np.float64)
+        trailing_volumes = np.lib.stride_tricks.sliding_window_view(np.concatenate((pad, volumes)), window + 1).T
+        engine.vwap.warm_up(trailing[1:], trailing_volumes[1:])
+    series["volatility"] = engine.volatility.value(n)
+    series["zscore"] = engine.price_stats.zscore(prices)
+    series["vwap"] = engine.vwap.value(n)
+    return series
+
+# Process-wide engine for the live trading loop
+feature_engine = build_feature_engine()
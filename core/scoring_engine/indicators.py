@@ -0,0 +1,309 @@
+"""
+indicators.py
+
+Streaming indicators for SCORING_ENGINE.
+Each indicator keeps its state in NumPy columns indexed by a dense symbol
+id, and each update() folds in one tick for every symbol at O(1) cost per
+symbol. Windows are never re-scanned:
+ - EMA                exponential moving average
+ - RollingStats       mean / std / z-score over the last `window` ticks
+ - RollingVolatility  rolling std of log returns (per observation, not annualized)
+ - VWAP               rolling volume-weighted average price
+
+update() takes one value per symbol id (symbols past the end of the vector
+count as missing). A NaN means "no tick for this symbol". That symbol's
+EMA is left alone, and its rolling windows simply hold one observation
+fewer, the same convention as PositionManager.mark_to_market. warm_up()
+rebuilds the state from a (ticks x symbols) history in one vectorized pass.
+The result is the same as replaying the history tick by tick from a fresh
+state.
+
+Rolling windows are ring buffers shared by all symbols (one row per tick),
+with running sums per symbol. An update is therefore a few contiguous
+vector operations, with no per-symbol indexing. Values are stored
+relative to a per-symbol reference level so that variance does not cancel
+out at high prices. Every `window` ticks the sums are re-added from the
+buffer, which stops floating-point drift (amortized O(1)).
+"""
+
+import numpy as np
+
+def _grow(column: np.ndarray, capacity: int, fill) -> np.ndarray:
+    """Copy of a per-symbol column (last axis = symbol id) resized to capacity."""
+    grown = np.full(column.shape[:-1] + (capacity,), fill, dtype=column.dtype)
+    n = min(column.shape[-1], capacity)
+    grown[..., :n] = column[..., :n]
+    return grown
+
+def _as_history(history) -> np.ndarray:
+    """(ticks,) or (ticks, symbols) history as a 2-D float array."""
+    history = np.asarray(history, dtype=np.float64)
+    return history.reshape(-1, 1) if history.ndim == 1 else history
+
+def _divide(numerator, denominator, valid) -> np.ndarray:
+    """numerator / denominator where valid, NaN elsewhere (no warnings)."""
+    return np.divide(numerator, denominator, out=np.full(np.shape(numerator), np.nan), where=valid)
+
+class EMA:
+    def __init__(self, span: float = None, alpha: float = None, capacity: int = 1):
+        if alpha is None:
+            if not span or span < 1:
+                raise ValueError("EMA needs a span >= 1 or an alpha")
+            alpha = 2.0 / (span + 1.0)
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError(f"EMA alpha must be in (0, 1], got {alpha}")
+        self.alpha = alpha
+        self.value = np.full(0, np.nan)
+        self.resize(capacity)
+
+    def resize(self, capacity: int):
+        self.value = _grow(self.value, capacity, np.nan)
+        self.capacity = capacity
+
+    def update(self, x) -> np.ndarray:
+        """Fold in one tick per symbol; a symbol's first tick seeds its average."""
+        x = np.asarray(x, dtype=np.float64)
+        value = self.value[:len(x)]
+        step = value + self.alpha * (x - value)
+        # NaN step: unseeded symbol (take x) or missing tick (keep value)
+        np.copyto(step, x, where=np.isnan(value))
+        np.copyto(value, step, where=~np.isnan(step))
+        return value
+
+    def warm_up(self, history):
+        """Reset every symbol to the EMA of a (ticks x n) history."""
+        h = _as_history(history)
+        ticks, n = h.shape
+        self.value[:] = np.nan
+        if ticks == 0:
+            return
+        # The EMA of a symbol's K observations x_0..x_{K-1} is
+        #   (1-a)^(K-1) * x_0 + sum_{k>=1} a * (1-a)^(K-1-k) * x_k
+        valid = ~np.isnan(h)
+        later = np.cumsum(valid[::-1], axis=0)[::-1] - valid    # observations after each tick
+        decay = 1.0 - self.alpha
+        weights = np.where(valid, self.alpha * decay ** later, 0.0)
+        observed = valid.any(axis=0)
+        first = np.argmax(valid, axis=0)
+        cols = np.flatnonzero(observed)
+        weights[first[cols], cols] = decay ** later[first[cols], cols]
+        value = np.einsum("ij,ij->j", weights, np.where(valid, h, 0.0))
+        self.value[:n] = np.where(observed, value, np.nan)
+
+class RollingStats:
+    def __init__(self, window: int, capacity: int = 1, squares: bool = True):
+        if window < 2:
+            raise ValueError(f"Rolling window must be >= 2, got {window}")
+        self.window = window
+        self.squares = squares          # False: sums only (no std / z-score)
+        self.buffer = np.zeros((window, 0))                 # value - reference, 0 when missing
+        self.observed = np.zeros((window, 0), dtype=bool)
+        self.reference = np.full(0, np.nan)                 # per-symbol level the buffer is relative to
+        self.count = np.zeros(0, dtype=np.int64)
+        self.sum = np.zeros(0)
+        self.sumsq = np.zeros(0)
+        self.pos = 0                    # ring row the next tick goes into
+        self.size = 0                   # symbols that may hold data
+        self._ticks = 0
+        self.resize(capacity)
+
+    def resize(self, capacity: int):
+        self.buffer = _grow(self.buffer, capacity, 0.0)
+        self.observed = _grow(self.observed, capacity, False)
+        self.reference = _grow(self.reference, capacity, np.nan)
+        self.count = _grow(self.count, capacity, 0)
+        self.sum = _grow(self.sum, capacity, 0.0)
+        self.sumsq = _grow(self.sumsq, capacity, 0.0)
+        self.capacity = capacity
+        self.size = min(self.size, capacity)
+
+    def update(self, x):
+        """Push one tick (one value or NaN per symbol), evicting the tick `window` ago."""
+        x = np.asarray(x, dtype=np.float64)
+        n = len(x)
+        observed = ~np.isnan(x)
+        reference = self.reference[:n]
+        np.copyto(reference, x, where=observed & np.isnan(reference))
+        d = x - reference
+        d[~observed] = 0.0
+
+        old = self.buffer[self.pos, :n]
+        old_observed = self.observed[self.pos, :n]
+        self.sum[:n] += d - old
+        if self.squares:
+            self.sumsq[:n] += d * d - old * old
+        self.count[:n] += observed
+        self.count[:n] -= old_observed
+        old[:] = d
+        old_observed[:] = observed
+        if n < self.size:
+            self._evict(n)
+        else:
+            self.size = n
+
+        self.pos += 1
+        if self.pos == self.window:
+            self.pos = 0
+        self._ticks += 1
+        if self._ticks >= self.window:
+            self._resync()
+
+    def _evict(self, n: int):
+        # Symbols n..size-1 had no tick: drop what falls out of their window
+        old = self.buffer[self.pos, n:self.size]
+        self.sum[n:self.size] -= old
+        self.sumsq[n:self.size] -= old * old
+        self.count[n:self.size] -= self.observed[self.pos, n:self.size]
+        old[:] = 0.0
+        self.observed[self.pos, n:self.size] = False
+
+    def _resync(self):
+        # Re-center every symbol on its current window mean, then re-add the sums
+        size = self.size
+        count = self.count[:size]
+        delta = np.divide(self.sum[:size], count, out=np.zeros(size), where=count > 0)
+        buffer = self.buffer[:, :size]
+        buffer -= self.observed[:, :size] * delta
+        self.reference[:size] += delta
+        self.sum[:size] = buffer.sum(axis=0)
+        if self.squares:
+            self.sumsq[:size] = np.einsum("ij,ij->j", buffer, buffer)
+        self._ticks = 0
+
+    def warm_up(self, history):
+        """Reset the window to the last `window` ticks of a (ticks x n) history."""
+        h = _as_history(history)
+        n = h.shape[1]
+        self.buffer[:] = 0.0
+        self.observed[:] = False
+        self.reference[:] = np.nan
+        self.count[:] = 0
+        self.sum[:] = 0.0
+        self.sumsq[:] = 0.0
+        self.pos = 0
+        self._ticks = 0
+        self.size = n
+
+        last = h[-self.window:]
+        m = len(last)
+        observed = ~np.isnan(last)
+        count = observed.sum(axis=0)
+        reference = np.divide(np.where(observed, last, 0.0).sum(axis=0), count,
+                              out=np.full(n, np.nan), where=count > 0)
+        d = last - reference
+        d[~observed] = 0.0
+        self.buffer[:m, :n] = d
+        self.observed[:m, :n] = observed
+        self.reference[:n] = reference
+        self.count[:n] = count
+        self.sum[:n] = d.sum(axis=0)
+        if self.squares:
+            self.sumsq[:n] = np.einsum("ij,ij->j", d, d)
+        self.pos = m % self.window
+
+    # ─── Read-outs (first n symbols, default all) ────────────────────────
+    def total(self, n: int = None) -> np.ndarray:
+        """Sum of the values in each symbol's window (NaN when empty)."""
+        n = self.capacity if n is None else n
+        count = self.count[:n]
+        total = self.reference[:n] * count + self.sum[:n]
+        total[count == 0] = np.nan
+        return total
+
+    def mean(self, n: int = None) -> np.ndarray:
+        n = self.capacity if n is None else n
+        count = self.count[:n]
+        return self.reference[:n] + _divide(self.sum[:n], count, count > 0)
+
+    def std(self, n: int = None) -> np.ndarray:
+        """Population std over the window (NaN below 2 observations)."""
+        n = self.capacity if n is None else n
+        count = self.count[:n]
+        enough = count > 1
+        mean = _divide(self.sum[:n], count, enough)
+        var = _divide(self.sumsq[:n], count, enough) - mean * mean
+        np.maximum(var, 0.0, out=var)
+        return np.sqrt(var)
+
+    def zscore(self, x) -> np.ndarray:
+        """(x - mean) / std per symbol; 0 for a flat window, NaN without one."""
+        x = np.asarray(x, dtype=np.float64)
+        n = len(x)
+        std = self.std(n)
+        z = _divide(x - self.mean(n), std, std > 0)
+        z[std == 0.0] = 0.0
+        return z
+
+class RollingVolatility:
+    """Rolling std of log returns between a symbol's consecutive observations."""
+
+    def __init__(self, window: int, capacity: int = 1):
+        self.returns = RollingStats(window, capacity)
+        self.last = np.full(0, np.nan)      # last observed price per symbol
+        self.resize(capacity)
+
+    def resize(self, capacity: int):
+        self.returns.resize(capacity)
+        self.last = _grow(self.last, capacity, np.nan)
+        self.capacity = capacity
+
+    def update(self, price):
+        price = np.asarray(price, dtype=np.float64)
+        last = self.last[:len(price)]
+        self.returns.update(self._log_returns(price, last))
+        np.copyto(last, price, where=~np.isnan(price))
+
+    @staticmethod
+    def _log_returns(price, previous) -> np.ndarray:
+        ratio = _divide(price, previous, previous > 0)
+        return np.log(ratio, out=np.full(ratio.shape, np.nan), where=ratio > 0)
+
+    def value(self, n: int = None) -> np.ndarray:
+        return self.returns.std(n)
+
+    def warm_up(self, history):
+        h = _as_history(history)
+        ticks, n = h.shape
+        # Previous observed price before each tick (forward fill, shifted by one)
+        observed = ~np.isnan(h)
+        index = np.where(observed, np.arange(ticks)[:, None], -1)
+        np.maximum.accumulate(index, axis=0, out=index)
+        filled = np.where(index >= 0, h[np.maximum(index, 0), np.arange(n)], np.nan)
+        previous = np.vstack([np.full((1, n), np.nan), filled[:-1]])
+        self.returns.warm_up(self._log_returns(h, previous))
+        self.last[:] = np.nan
+        if ticks:
+            self.last[:n] = filled[-1]
+
+class VWAP:
+    """Rolling volume-weighted average price; without volumes, a rolling mean price."""
+
+    def __init__(self, window: int, capacity: int = 1):
+        self.notional = RollingStats(window, capacity, squares=False)
+        self.volume = RollingStats(window, capacity, squares=False)
+        self.capacity = capacity
+
+    def resize(self, capacity: int):
+        self.notional.resize(capacity)
+        self.volume.resize(capacity)
+        self.capacity = capacity
+
+    def update(self, price, volume=None):
+        price = np.asarray(price, dtype=np.float64)
+        if volume is None:
+            volume = price * 0.0 + 1.0          # 1.0, NaN where the price is missing
+        else:
+            volume = np.asarray(volume, dtype=np.float64) + price * 0.0
+        self.notional.update(price * volume)
+        self.volume.update(volume)
+
+    def value(self, n: int = None) -> np.ndarray:
+        volume = self.volume.total(n)
+        return _divide(self.notional.total(n), volume, volume > 0)
+
+    def warm_up(self, price_history, volume_history=None):
+        prices = _as_history(price_history)
+        volumes = np.ones_like(prices) if volume_history is None else _as_history(volume_history)
+        volumes = volumes + prices * 0.0
+        self.notional.warm_up(prices * volumes)
+        self.volume.warm_up(volumes)
@@ -3,30 +3,165 @@ scoring_engine.py
 
 Phase 4: Introduce a basic SCORING_ENGINE that computes a simple
 risk–reward score for the given market data.
+
+The score is a weighted average of factor sub-scores, each 0-100 (higher =
+more attractive to buy):
+    level           distance of price from a reference "sweet spot" (the original score)
+    trend           fast EMA above slow EMA
+    mean_reversion  price below its rolling mean (negative z-score)
+    vwap            price below the rolling VWAP
+    volatility      calm markets score higher than volatile ones
+The non-level factors read streaming features (see features.py) from the
+market data. A factor whose feature is missing (no feature layer, or still
+warming up) is left out and the weights are re-normalized, so plain
+{"sol_price": ...} data scores exactly as before.
+
+Weights, scales and the reference price live in config/parameters.json
+under "scoring". Edits to the file are picked up at runtime, together with
+the conductor's "strategy" thresholds (see agents/strategy_params.py).
 """
 
+import math
+
+import numpy as np
+
+from config.config_loader import load_parameters
+from core.log_core.log_core import get_logger
+
+logger = get_logger("ScoringEngine")
+
+FACTORS = ("level", "trend", "mean_reversion", "vwap", "volatility")
+
+DEFAULTS = {
+    "ideal_price": 20.0,
+    "level_penalty": 4.0,           # points lost per unit of price away from ideal_price
+    "weights": {"level": 0.4, "trend": 0.2, "mean_reversion": 0.15, "vwap": 0.15, "volatility": 0.1},
+    "trend_scale": 0.01,            # EMA spread (fraction) that moves the trend factor most of the way
+    "zscore_scale": 2.0,
+    "vwap_scale": 0.01,             # discount to VWAP (fraction)
+    "volatility_scale": 0.02        # per-tick log-return std at which the factor is ~37
+}
+
+# market_data keys read by the non-level factors
+FEATURE_KEYS = ("ema_fast", "ema_slow", "zscore", "vwap", "volatility")
+
+def merge_scoring_params(params: dict) -> dict:
+    """A "scoring" config section on top of DEFAULTS (weights merged key by key)."""
+    return {**DEFAULTS, **params, "weights": {**DEFAULTS["weights"], **params.get("weights", {})}}
+
+# Rebound (never mutated) when the strategy watcher reloads parameters.json
+SCORING_PARAMS = merge_scoring_params(load_parameters("scoring"))
+
 def scoring_engine_init():
-    """Initialize SCORING_ENGINE (placeholder)."""
-    print("[ScoringEngine] Initialized.")
+    """Initialize SCORING_ENGINE."""
+    logger.info("Initialized — factor weights: %s", SCORING_PARAMS["weights"])
 
-def compute_score(market_data: dict) -> float:
+def compute_score(market_data: dict, params: dict = None) -> float:
     """
-    Compute a basic risk–reward score based on the current market data.
-    For demonstration, we'll do something naive:
-      - If sol_price is low, reward is high,
-      - If sol_price is high, risk is high.
-    Returns a float 0-100, where higher = more attractive to buy.
+    Multi-factor risk–reward score for one market_data dict (0-100, higher =
+    more attractive to buy). Feature keys (ema_fast, ema_slow, zscore, vwap,
+    volatility) are optional; see the module docstring.
+    A MarketSnapshot (whole universe) returns one score per symbol.
+    params: scoring parameters (default SCORING_PARAMS), e.g. from a
+    strategy snapshot.
     """
+    p = SCORING_PARAMS if params is None else params
+    if not isinstance(market_data, dict):
+        return compute_score_batch(market_data.price, market_data.columns, p)
+    weights = p["weights"]
     sol_price = market_data.get("sol_price", 0.0)
 
-    # Example logic (totally naive):
-    # Let's define a reference "sweet spot" as 20
-    # Score decreases as price moves away from 20
-    ideal_price = 20.0
+    level = level_score(sol_price, p)
+
+    total = weights["level"] * level
+    weight_sum = weights["level"]
+    for factor, sub_score in (
+        ("trend", _trend_score(market_data.get("ema_fast"), market_data.get("ema_slow"), p)),
+        ("mean_reversion", _zscore_score(market_data.get("zscore"), p)),
+        ("vwap", _vwap_score(sol_price, market_data.get("vwap"), p)),
+        ("volatility", _volatility_score(market_data.get("volatility"), p))
+    ):
+        if sub_score is not None and weights[factor]:
+            total += weights[factor] * sub_score
+            weight_sum += weights[factor]
+    if weight_sum == weights["level"]:
+        return level
+    return total / weight_sum
 
-    difference = abs(sol_price - ideal_price)
-    # The further from 20, the lower the score
-    base_score = max(0, 100 - difference * 4)  # each point away from 20 costs 4 points
+def level_score(sol_price: float, params: dict = None) -> float:
+    """The level factor alone: the score of plain {"sol_price": ...} data."""
+    p = SCORING_PARAMS if params is None else params
+    # Score decreases as price moves away from the sweet spot
+    return max(0, 100 - abs(sol_price - p["ideal_price"]) * p["level_penalty"])
+
+def _finite(*values) -> bool:
+    return all(v is not None and math.isfinite(v) for v in values)
+
+def _trend_score(ema_fast, ema_slow, p):
+    if not _finite(ema_fast, ema_slow) or ema_slow <= 0:
+        return None
+    return 50 + 50 * math.tanh((ema_fast / ema_slow - 1) / p["trend_scale"])
+
+def _zscore_score(zscore, p):
+    if not _finite(zscore):
+        return None
+    return 50 - 50 * math.tanh(zscore / p["zscore_scale"])
+
+def _vwap_score(price, vwap, p):
+    if not _finite(price, vwap) or vwap <= 0:
+        return None
+    return 50 + 50 * math.tanh((vwap - price) / vwap / p["vwap_scale"])
+
+def _volatility_score(volatility, p):
+    if not _finite(volatility):
+        return None
+    return 100 * math.exp(-volatility / p["volatility_scale"])
+
+def factor_scores_batch(sol_prices, features: dict = None, params: dict = None) -> dict:
+    """
+    {factor: 0-100 sub-score array} over a price array; factors whose
+    features are absent from `features` (or NaN for a row) are NaN.
+    """
+    p = SCORING_PARAMS if params is None else params
+    sol_prices = np.asarray(sol_prices, dtype=np.float64)
+    features = features or {}
+    scores = {"level": np.maximum(0.0, 100 - np.abs(sol_prices - p["ideal_price"]) * p["level_penalty"])}
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if "ema_fast" in features and "ema_slow" in features:
+            ema_slow = features["ema_slow"]
+            trend = 50 + 50 * np.tanh((features["ema_fast"] / ema_slow - 1) / p["trend_scale"])
+            scores["trend"] = np.where(ema_slow > 0, trend, np.nan)
+        if "zscore" in features:
+            scores["mean_reversion"] = 50 - 50 * np.tanh(features["zscore"] / p["zscore_scale"])
+        if "vwap" in features:
+            vwap = features["vwap"]
+            discount = 50 + 50 * np.tanh((vwap - sol_prices) / vwap / p["vwap_scale"])
+            scores["vwap"] = np.where(vwap > 0, discount, np.nan)
+        if "volatility" in features:
+            scores["volatility"] = 100 * np.exp(-features["volatility"] / p["volatility_scale"])
+    return scores
+
+def compute_score_batch(sol_prices, features: dict = None, params: dict = None):
+    """
+    Vectorized compute_score over a NumPy array of sol_prices (ticks of one
+    symbol or symbols of one tick). features: optional {feature: array}
+    aligned with sol_prices, e.g. FeatureEngine output or MarketSnapshot
+    columns. Same formula as compute_score, one pass over the whole array.
+    """
+    p = SCORING_PARAMS if params is None else params
+    scores = factor_scores_batch(sol_prices, features, p)
+    level = scores.pop("level")
+    weights = p["weights"]
+    scores = {factor: s for factor, s in scores.items() if weights[factor]}
+    if not scores:
+        return level
 
-    # We might add more factors in the future (volume, sentiment, etc.)
-    return base_score
+    total = weights["level"] * level
+    weight_sum = np.full(level.shape, float(weights["level"]))
+    for factor, sub_score in scores.items():
+        present = np.isfinite(sub_score)
+        total += np.where(present, weights[factor] * sub_score, 0.0)
+        weight_sum += np.where(present, weights[factor], 0.0)
+    # Rows with no feature factor keep the plain level score
+    return np.where(weight_sum == weights["level"], level, total / weight_sum)
@@ -6,15 +6,12 @@ Phase 6 ➜ Phase 7-0
 - Adds placeholders for derivatives_engine & position_manager (Phase 7 scaffolds).
 """
 
-print("[Debug] Top-level code in main.py is running!")
-
-import time
-
 # ─── Data & execution modules ──────────────────────────────────────────────
-from pipelines.data_pipeline import data_pipeline_init, fetch_sol_price
+from pipelines.data_pipeline import data_pipeline_init, data_pipeline_close, fetch_sol_price
 from pipelines.execution_engine import (
     execution_engine_init,
-    execute_trade
+    execute_trade,
+    order_tracker_stats
 )
 
 # ─── Phase-6 core modules ──────────────────────────────────────────────────
@@ -25,33 +22,46 @@ from agents.synergy_conductor import (
 from core.reflection_engine.reflection_engine import (
     reflection_engine_init,
     log_trade_outcome,
+    apply_fill_corrections,
     analyze_history_and_trigger_patch,
     trade_history
 )
-from core.patch_core.patch_core import patch_core_init, request_autopatch
+from core.patch_core.patch_core import patch_core_init, request_autopatch, collect_autopatch
+from core.scoring_engine.scoring_engine import scoring_engine_init
+from core.scoring_engine.features import FEATURE_NAMES, feature_engine
 from core.ego_core.ego_core import ego_core_init
 from security.kill_switch import kill_switch_init, check_kill_switch_conditions
 
 from core.concurrency_manager.concurrency_manager import (
     concurrency_manager_init,
     start_god_awareness_thread,
+    subscribe_whale_alerts,
     latest_whale_alert
 )
+from core.concurrency_manager.event_bus import event_latency
+from core.concurrency_manager.tick_scheduler import build_tick_scheduler
 from core.god_awareness.god_awareness import god_awareness_init
+from core.latency_monitor.latency_monitor import latency_monitor_init, latency_monitor, DUMP_PATH
+from core.log_core.log_core import get_logger
+from config.config_loader import load_parameters
 
 # ─── Phase-7 scaffolds (NEW) ───────────────────────────────────────────────
-from core.derivatives_engine.derivatives_engine import derivatives_engine_init
-from pipelines.position_manager import position_manager_init
+from core.derivatives_engine.derivatives_engine import derivatives_engine_init, derivatives_engine
+from pipelines.position_manager import position_manager_init, position_manager
+
+
+logger = get_logger("Main")
 
 
 # ───────────────────────────────────────────────────────────────────────────
 def main():
-    print("[Main] Entered main() function. Starting Phase 6 / 7-0 initialization…")
+    logger.info("Entered main() function. Starting Phase 6 / 7-0 initialization…")
 
     # Phase-6 initializers
     data_pipeline_init()
     execution_engine_init()
     synergy_conductor_init()
+    scoring_engine_init()
     reflection_engine_init()
     patch_core_init()
     ego_core_init()
@@ -62,43 +72,107 @@ def main():
     # Phase-7-0 initializers (scaffolds)
     derivatives_engine_init()
     position_manager_init()
+    latency_monitor_init()
+
+    # Per-stage timing (the plain functions when the latency monitor is disabled)
+    timed = latency_monitor.instrument
+    fetch_price = timed(fetch_sol_price, "fetch_sol_price")
+    update_features = timed(feature_engine.update_market_data, "update_features")
+    conductor_run = timed(synergy_conductor_run, "synergy_conductor_run")
+    execute = timed(execute_trade, "execute_trade")
+    log_outcome = timed(log_trade_outcome, "log_trade_outcome")
+    analyze_history = timed(analyze_history_and_trigger_patch, "analyze_history_and_trigger_patch")
+    check_kill_switch = timed(check_kill_switch_conditions, "check_kill_switch_conditions")
+
+    # Subscribe before starting the scanner so no alert is missed
+    whale_alerts = subscribe_whale_alerts()
 
     # Start background God-Awareness thread
     start_god_awareness_thread()
 
-    emotional_state = "neutral"
-    print("[Main] Starting demo trading loop…")
-
-    for i in range(3):
-        print(f"\n[Main] Trade cycle #{i + 1}")
+    # Cycles fire on a fixed clock with per-cycle deadlines (config "scheduler")
+    scheduler = build_tick_scheduler()
+    max_cycles = load_parameters("scheduler").get("cycles")
 
-        market_data = fetch_sol_price()
-        print(f"[Main] Market data fetched: {market_data}")
+    emotional_state = "neutral"
+    logger.info("Starting demo trading loop…")
+
+    scheduler.start()
+    last_started = scheduler.clock()
+    while max_cycles is None or scheduler.stats["cycles"] < max_cycles:
+        # Next tick on the clock, or right away on a whale alert (at most one
+        # alert cycle per interval; a burst of alerts is one cycle on the latest)
+        tick = scheduler.wait(whale_alerts.get, whale_alerts.poll)
+        alert_event = tick.event
+        logger.info("Trade cycle #%d", tick.index + 1)
+
+        cycle_t0 = latency_monitor.begin()
+        market_data = fetch_price()
+        quoted = market_data is not None
+        if quoted:
+            logger.info("Market data fetched: %s", market_data)
+            # Streaming indicators (EMA, volatility, z-score, VWAP) for the score
+            market_data = update_features(market_data)
 
         # Example whale alert check
-        if latest_whale_alert["whale_alert"]:
+        if alert_event is not None or latest_whale_alert["whale_alert"]:
             emotional_state = "fear"
 
-        decision = synergy_conductor_run(market_data, emotional_state)
-        print(f"[Main] Synergy Conductor Decision: {decision}")
-
-        execute_trade(decision)
-
-        # Mock PnL calculation
-        profit_loss = 5.0 if "BUY" in decision else -10.0
-        sol_price = market_data.get("sol_price", 0.0)
-        log_trade_outcome(decision, sol_price, profit_loss)
-
-        if analyze_history_and_trigger_patch():
-            request_autopatch()
-
-        if check_kill_switch_conditions(trade_history):
-            print("[Main] KILL_SWITCH TRIGGERED! Exiting loop.")
+        if quoted:
+            decision = conductor_run(market_data, emotional_state)
+            logger.info("Synergy Conductor Decision: %s", decision)
+            if alert_event is not None:
+                logger.info("Whale alert -> decision latency: %.2f ms", event_latency(alert_event) * 1000)
+                alert_event = None
+            sol_price = market_data["sol_price"]
+        else:
+            # No quote: no order and no re-mark (no fake price, no fake PnL swing)
+            logger.warning("No live quote this cycle; holding at the last mark.")
+            market_data = {}
+            decision = "HOLD"
+            sol_price = position_manager.position("SOL")["last_price"]
+        execute(decision, sol_price)
+
+        # Cycle PnL = change in book value: re-mark at the new price, then fill
+        pnl_before = position_manager.total_pnl()
+        if quoted:
+            position_manager.mark("SOL", sol_price)
+            position_manager.apply_decision("SOL", decision, sol_price)
+        profit_loss = position_manager.total_pnl() - pnl_before
+        log_outcome(decision, sol_price, profit_loss, emotional_state=emotional_state,
+                    features={name: market_data[name] for name in FEATURE_NAMES if name in market_data})
+        # Orders the tracker reported as failed / timed out since the last cycle
+        apply_fill_corrections(position_manager)
+
+        # Under backpressure, skip the optional parameter search; it runs in
+        # the background and its patch is picked up on a later cycle
+        if analyze_history() and not scheduler.lagging:
+            request_autopatch(trade_history)
+        collect_autopatch()
+
+        # Move the simulated perp venue by the time since the last cycle, then
+        # refresh perp margin / liquidation distances before the risk check
+        derivatives_engine.advance((tick.started - last_started) / 3600)
+        last_started = tick.started
+        derivatives_engine.update()
+        halt = check_kill_switch(trade_history)
+        latency_monitor.end("cycle", cycle_t0)
+        if not scheduler.done(tick):
+            logger.warning("Cycle #%d missed its deadline.", tick.index + 1)
+        if halt:
+            logger.error("KILL_SWITCH TRIGGERED! Exiting loop.")
             break
 
-        time.sleep(3)
-
-    print("[Main] Phase 7-0 loop complete.")
+    logger.info("Positions: %s", position_manager.snapshot())
+    logger.info("Scheduler: %s", scheduler.snapshot())
+    logger.info("Order tracker: %s", order_tracker_stats())
+    data_pipeline_close()
+    if latency_monitor.enabled:
+        latency_monitor.stop(final_dump_path=DUMP_PATH)
+        for stage, stats in latency_monitor.snapshot().items():
+            logger.info("Latency %s: p50=%.0fus p99=%.0fus max=%.0fus (n=%d)",
+                        stage, stats["p50_us"], stats["p99_us"], stats["max_us"], stats["count"])
+    logger.info("Phase 7-0 loop complete.")
 
 
 # ───────────────────────────────────────────────────────────────────────────
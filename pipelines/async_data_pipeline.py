@@ -0,0 +1,265 @@
+"""
+async_data_pipeline.py
+
+Asyncio DATA_PIPELINE.
+Keeps one pooled aiohttp session (persistent keep-alive connections) and fans
+each quote request out to several price sources at once. A quote is the
+first or the median valid price that arrives within a latency budget; there
+is no fake fallback price - if nothing valid arrives in time, no tick is
+produced. Pass a QuoteCache to share/coalesce quotes with other callers.
+
+Usage:
+    async with AsyncMarketDataPipeline() as pipeline:
+        quote = await pipeline.fetch_quote()
+        async for tick in pipeline.stream_ticks(interval=1.0):
+            ...
+
+Synchronous callers (the main trading loop) use BlockingQuotePipeline:
+one daemon thread runs an event loop that owns the pipeline and its
+pooled session, and fetch_quote() blocks on it for at most the latency
+budget.
+"""
+
+import asyncio
+import concurrent.futures
+import statistics
+import threading
+import time
+
+import aiohttp
+
+from pipelines.quote_cache import QuoteUnavailable
+from core.log_core.log_core import get_logger
+
+logger = get_logger("AsyncDataPipeline")
+
+# Each source: name, url, query params and the JSON key path to the USD price.
+DEFAULT_PRICE_SOURCES = [
+    {
+        "name": "coingecko",
+        "url": "https://api.coingecko.com/api/v3/simple/price",
+        "params": {"ids": "solana", "vs_currencies": "usd"},
+        "path": ["solana", "usd"]
+    },
+    {
+        "name": "binance",
+        "url": "https://api.binance.com/api/v3/ticker/price",
+        "params": {"symbol": "SOLUSDT"},
+        "path": ["price"]
+    },
+    {
+        "name": "coinbase",
+        "url": "https://api.coinbase.com/v2/prices/SOL-USD/spot",
+        "params": {},
+        "path": ["data", "amount"]
+    }
+]
+
+def extract_price(payload, path):
+    """Walk the JSON payload along path; return a positive float or None."""
+    value = payload
+    try:
+        for key in path:
+            value = value[key]
+        price = float(value)
+    except (KeyError, IndexError, TypeError, ValueError):
+        return None
+    if price > 0:
+        return price
+    return None
+
+class AsyncMarketDataPipeline:
+    """
+    Pooled, multi-source asyncio price pipeline.
+    mode: 'median' waits (up to latency_budget) for all sources and returns
+          the median of the valid quotes; 'first' returns the first valid one.
+    """
+
+    def __init__(self, sources=None, latency_budget: float = 1.0, mode: str = "median",
+                 pool_size: int = 20, keepalive_timeout: float = 30.0,
+                 cache=None, symbol: str = "SOL"):
+        if mode not in ("median", "first"):
+            raise ValueError(f"Unknown quote mode: {mode}")
+        self.sources = sources if sources is not None else DEFAULT_PRICE_SOURCES
+        self.latency_budget = latency_budget
+        self.mode = mode
+        self.pool_size = pool_size
+        self.keepalive_timeout = keepalive_timeout
+        self.cache = cache
+        self.symbol = symbol
+        self.session = None
+        self.stats = {
+            "requests": 0,
+            "quotes": 0,
+            "misses": 0,
+            "source_errors": 0,
+            "last_latency_s": 0.0,
+            "total_latency_s": 0.0
+        }
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def start(self):
+        """Open the pooled session (idempotent)."""
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=300
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.latency_budget)
+            )
+            logger.info("Started with %d sources, mode=%s.", len(self.sources), self.mode)
+
+    async def close(self):
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+    async def _fetch_source(self, source: dict):
+        """Fetch one source; return (name, price) or (name, None) on any failure."""
+        try:
+            async with self.session.get(source["url"], params=source.get("params")) as resp:
+                if resp.status != 200:
+                    self.stats["source_errors"] += 1
+                    return source["name"], None
+                payload = await resp.json(content_type=None)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # One bad source must never take the whole quote down with it
+            self.stats["source_errors"] += 1
+            if not isinstance(e, (aiohttp.ClientError, asyncio.TimeoutError, ValueError)):
+                logger.warning("Source %s failed: %r", source["name"], e)
+            return source["name"], None
+        price = extract_price(payload, source["path"])
+        if price is None:
+            self.stats["source_errors"] += 1
+        return source["name"], price
+
+    async def fetch_quote(self):
+        """
+        Fan out to every source and build one quote within latency_budget.
+        Returns {"sol_price", "timestamp", "sources", "latency_s"} or None
+        if no source produced a valid price in time.
+        With a cache, fresh quotes are reused and concurrent calls coalesce.
+        """
+        if self.cache is None:
+            return await self._fetch_quote_uncached()
+        try:
+            return await self.cache.aget(self.symbol, self._fetch_quote_uncached)
+        except QuoteUnavailable:
+            return None
+
+    async def _fetch_quote_uncached(self):
+        if self.session is None:
+            await self.start()
+        self.stats["requests"] += 1
+        t0 = time.perf_counter()
+
+        tasks = [asyncio.ensure_future(self._fetch_source(src)) for src in self.sources]
+        prices = {}
+        try:
+            pending = set(tasks)
+            deadline = t0 + self.latency_budget
+            while pending:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    name, price = task.result()
+                    if price is not None:
+                        prices[name] = price
+                if self.mode == "first" and prices:
+                    break
+        finally:
+            losers = [task for task in tasks if not task.done()]
+            for task in losers:
+                task.cancel()
+            # Reap the cancelled tasks so none is destroyed while still pending
+            if losers:
+                await asyncio.gather(*losers, return_exceptions=True)
+
+        latency = time.perf_counter() - t0
+        self.stats["last_latency_s"] = latency
+        self.stats["total_latency_s"] += latency
+
+        if not prices:
+            self.stats["misses"] += 1
+            logger.warning("No valid quote within latency budget.")
+            return None
+
+        self.stats["quotes"] += 1
+        if self.mode == "first":
+            sol_price = next(iter(prices.values()))
+        else:
+            sol_price = statistics.median(prices.values())
+        return {
+            "sol_price": sol_price,
+            "timestamp": time.time(),
+            "sources": prices,
+            "latency_s": latency
+        }
+
+    async def stream_ticks(self, interval: float = 1.0, max_ticks: int = None):
+        """
+        Async iterator of quotes, one attempt every `interval` seconds
+        (measured start to start). Misses are skipped, not faked.
+        """
+        loop = asyncio.get_running_loop()
+        emitted = 0
+        next_at = loop.time()
+        while max_ticks is None or emitted < max_ticks:
+            quote = await self.fetch_quote()
+            if quote is not None:
+                emitted += 1
+                yield quote
+            next_at += interval
+            delay = next_at - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                next_at = loop.time()
+
+class BlockingQuotePipeline:
+    """
+    Blocking facade over an AsyncMarketDataPipeline for threaded code.
+    The pipeline (and its keep-alive connections) lives on a private event
+    loop thread, so every call reuses the same pooled session.
+    """
+
+    def __init__(self, pipeline: AsyncMarketDataPipeline, thread_name: str = "QuotePipeline"):
+        self.pipeline = pipeline
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name=thread_name, daemon=True)
+        self._thread.start()
+
+    def fetch_quote(self):
+        """One quote (see AsyncMarketDataPipeline.fetch_quote), or None if none arrived in time."""
+        future = asyncio.run_coroutine_threadsafe(self.pipeline.fetch_quote(), self._loop)
+        try:
+            # The pipeline enforces the budget itself; the margin only covers a stalled loop
+            return future.result(self.pipeline.latency_budget + 1.0)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            logger.warning("Quote pipeline did not answer within its latency budget.")
+            return None
+
+    def close(self):
+        """Close the pooled session and stop the loop thread."""
+        if not self._thread.is_alive():
+            return
+        asyncio.run_coroutine_threadsafe(self.pipeline.close(), self._loop).result(5.0)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
@@ -0,0 +1,203 @@
+"""
+backtest_engine.py
+
+Historical backtest harness.
+Replays a recorded tick file through the same steps as main.py's trading
+loop (synergy_conductor_run -> execute_trade -> log_trade_outcome ->
+analyze_history_and_trigger_patch -> check_kill_switch_conditions),
+with a mock execute_trade, no sleeping and no network calls.
+
+Tick file format (CSV, header row required):
+    timestamp,sol_price[,whale_alert]
+whale_alert is optional (0/1); like main.py, the first alert flips the
+emotional state to 'fear' for the rest of the run. Binary tick files
+(see pipelines/tick_source.py) are also accepted and are memory-mapped
+instead of parsed.
+
+Run from the repo root:
+    python -m pipelines.backtest_engine ticks.csv
+    python -m pipelines.backtest_engine ticks.bin
+"""
+
+import sys
+import time
+from contextlib import nullcontext
+
+import numpy as np
+
+from agents.synergy_conductor import (
+    synergy_conductor_run,
+    synergy_conductor_run_batch,
+    DECISION_LABELS
+)
+import core.reflection_engine.reflection_engine as reflection_engine
+from core.reflection_engine.reflection_engine import (
+    log_trade_outcome,
+    analyze_history_and_trigger_patch,
+    reflection_engine_reset,
+    trade_history
+)
+from core.patch_core.patch_core import request_autopatch
+from security.kill_switch import check_kill_switch_conditions
+from core.log_core.log_core import get_logger, quiet as quiet_logging
+from pipelines.tick_source import is_tick_file, read_tick_records
+
+logger = get_logger("BacktestEngine")
+
+def backtest_engine_init():
+    logger.info("Initialized.")
+
+def load_tick_file(path: str):
+    """
+    Load a recorded tick CSV or binary tick file.
+    Returns (timestamps, sol_prices, whale_alerts) as NumPy arrays
+    (memory-mapped views for binary files).
+    """
+    if is_tick_file(path):
+        records = read_tick_records(path)
+        return records["timestamp"], records["sol_price"], records["whale_alert"] != 0
+
+    with open(path, "r", encoding="utf-8") as f:
+        header = [col.strip() for col in f.readline().split(",")]
+
+    data = np.loadtxt(path, delimiter=",", skiprows=1, ndmin=2)
+    timestamps = data[:, header.index("timestamp")]
+    sol_prices = data[:, header.index("sol_price")]
+    if "whale_alert" in header:
+        whale_alerts = data[:, header.index("whale_alert")] != 0
+    else:
+        whale_alerts = np.zeros(len(sol_prices), dtype=bool)
+    return timestamps, sol_prices, whale_alerts
+
+def write_tick_file(path: str, timestamps, sol_prices, whale_alerts=None):
+    """Record ticks in the CSV format load_tick_file() reads."""
+    columns = [np.asarray(timestamps, dtype=np.float64), np.asarray(sol_prices, dtype=np.float64)]
+    header = "timestamp,sol_price"
+    fmt = ["%.6f", "%.6f"]
+    if whale_alerts is not None:
+        columns.append(np.asarray(whale_alerts, dtype=np.int8))
+        header += ",whale_alert"
+        fmt.append("%d")
+    np.savetxt(path, np.column_stack(columns), delimiter=",", header=header, comments="", fmt=fmt)
+
+def mock_profit_loss(decision: str) -> float:
+    """Same mock PnL as main.py: +5 for any BUY flavour, -10 otherwise."""
+    return 5.0 if "BUY" in decision else -10.0
+
+def run_backtest(timestamps, sol_prices, whale_alerts=None,
+                 emotional_state: str = "neutral",
+                 vectorized: bool = True,
+                 halt_on_kill_switch: bool = True,
+                 pnl_fn=mock_profit_loss,
+                 quiet: bool = True) -> dict:
+    """
+    Replay ticks through the main.py cycle and return a report dict.
+
+    vectorized=True precomputes every decision with
+    synergy_conductor_run_batch (identical results); False calls
+    synergy_conductor_run tick by tick.
+    halt_on_kill_switch=True stops at the first trip like main.py;
+    False keeps going and counts every cycle that trips.
+    quiet=True discards the modules' log output for the duration of the run.
+    """
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+    sol_prices = np.asarray(sol_prices, dtype=np.float64)
+    n_ticks = len(sol_prices)
+
+    # Emotional state per tick: sticky 'fear' after the first whale alert
+    if whale_alerts is None:
+        whale_alerts = np.zeros(n_ticks, dtype=bool)
+    feared = np.logical_or.accumulate(np.asarray(whale_alerts, dtype=bool))
+    states = np.where(feared, "fear", emotional_state)
+
+    report = {
+        "ticks": n_ticks,
+        "cycles": 0,
+        "pnl_total": 0.0,
+        "trade_counts": {label: 0 for label in DECISION_LABELS},
+        "patch_requests": 0,
+        "kill_switch_trips": 0,
+        "halted_at": None,
+        "elapsed_s": 0.0,
+        "ticks_per_s": 0.0
+    }
+    trade_counts = report["trade_counts"]
+    pnl_total = 0.0
+    patch_requests = 0
+    kill_switch_trips = 0
+
+    reflection_engine_reset()
+    log_to_file = reflection_engine.LOG_TO_FILE
+    reflection_engine.LOG_TO_FILE = False
+
+    t0 = time.perf_counter()
+    try:
+        with quiet_logging() if quiet else nullcontext():
+            if vectorized:
+                codes = synergy_conductor_run_batch(sol_prices, states)
+                decisions = np.asarray(DECISION_LABELS, dtype=object)[codes].tolist()
+            else:
+                decisions = None
+
+            ts_list = timestamps.tolist()
+            price_list = sol_prices.tolist()
+            state_list = states.tolist()
+
+            cycle = 0
+            for cycle in range(n_ticks):
+                sol_price = price_list[cycle]
+                if decisions is not None:
+                    decision = decisions[cycle]
+                else:
+                    decision = synergy_conductor_run({"sol_price": sol_price}, state_list[cycle])
+
+                # Mock execute_trade: just count the order
+                trade_counts[decision] = trade_counts.get(decision, 0) + 1
+
+                profit_loss = pnl_fn(decision)
+                pnl_total += profit_loss
+                log_trade_outcome(decision, sol_price, profit_loss, ts_list[cycle])
+
+                if analyze_history_and_trigger_patch():
+                    # Count the request only: a parameter search per trigger
+                    # would dominate the replay
+                    request_autopatch(optimize=False)
+                    patch_requests += 1
+
+                if check_kill_switch_conditions(trade_history):
+                    kill_switch_trips += 1
+                    if halt_on_kill_switch:
+                        report["halted_at"] = cycle
+                        break
+            report["cycles"] = cycle + 1 if n_ticks else 0
+    finally:
+        elapsed = time.perf_counter() - t0
+        reflection_engine.LOG_TO_FILE = log_to_file
+
+    report["pnl_total"] = pnl_total
+    report["patch_requests"] = patch_requests
+    report["kill_switch_trips"] = kill_switch_trips
+    report["elapsed_s"] = elapsed
+    report["ticks_per_s"] = report["cycles"] / elapsed if elapsed > 0 else 0.0
+    return report
+
+def run_backtest_file(path: str, **kwargs) -> dict:
+    """Load a tick file and run_backtest() over it."""
+    timestamps, sol_prices, whale_alerts = load_tick_file(path)
+    return run_backtest(timestamps, sol_prices, whale_alerts, **kwargs)
+
+def print_report(report: dict):
+    print(f"[BacktestEngine] Cycles run:        {report['cycles']} / {report['ticks']}")
+    print(f"[BacktestEngine] Total PnL:         {report['pnl_total']:.2f}")
+    print(f"[BacktestEngine] Trade counts:      {report['trade_counts']}")
+    print(f"[BacktestEngine] Patch requests:    {report['patch_requests']}")
+    print(f"[BacktestEngine] Kill-switch trips: {report['kill_switch_trips']}"
+          f" (halted at {report['halted_at']})")
+    print(f"[BacktestEngine] Elapsed:           {report['elapsed_s']:.3f}s"
+          f" ({report['ticks_per_s']:,.0f} ticks/s)")
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("usage: python -m pipelines.backtest_engine <ticks.csv|ticks.bin> [--no-halt]")
+        sys.exit(2)
+    print_report(run_backtest_file(sys.argv[1], halt_on_kill_switch="--no-halt" not in sys.argv))
@@ -5,43 +5,154 @@ DATA_PIPELINE module.
 In Phase 2, we'll fetch a simple price feed from an external API
 (or use mock data if you prefer). This data will later expand
 to more advanced feeds (orderbooks, socials, whales, etc.).
+
+Live SOL quotes come from the pooled multi-source AsyncMarketDataPipeline
+(see async_data_pipeline.py), run on its own event loop thread: persistent
+keep-alive connections, every source asked at once, and a latency budget.
+When no valid price arrives in time there is no quote (None), never a
+placeholder price. Quotes go through a shared QuoteCache (TTL + request
+coalescing), so several components asking for the price within ttl_s
+share one round trip. aiohttp / asyncio (and requests, for the universe
+snapshot) are imported on the first fetch, not at import time.
+Configured in config/parameters.json under "quote_pipeline".
+
+fetch_sol_price() can instead read a simulated or recorded tick feed
+(see tick_source.py), chosen by "tick_source" in config/parameters.json.
+The OBLIVION_TICK_SOURCE environment variable overrides it
+(live / simulated / recorded).
 """
 
-import requests
+import os
 import time
 
+from config.config_loader import load_parameters
+from pipelines.quote_cache import QuoteCache, QuoteUnavailable
+from pipelines.market_snapshot import MarketSnapshot
+from pipelines.tick_source import build_tick_source, TickSourceExhausted
+from core.log_core.log_core import get_logger
+
+logger = get_logger("DataPipeline")
+
+_cache_params = load_parameters("quote_cache")
+quote_cache = QuoteCache(
+    ttl_s=_cache_params.get("ttl_s", 1.0),
+    max_staleness_s=_cache_params.get("max_staleness_s", 10.0)
+)
+
+LOGS_DIR = os.path.join(os.path.dirname(__file__), "../logs")
+_tick_params = load_parameters("tick_source")
+TICK_SOURCE = os.environ.get("OBLIVION_TICK_SOURCE") or _tick_params.get("source", "live")
+
+# Simulated / recorded feed, opened on first use (None: live quotes)
+tick_source = None
+
+QUOTE_PIPELINE_DEFAULTS = {
+    "mode": "median",
+    "latency_budget_s": 1.0,
+    "pool_size": 20,
+    "keepalive_timeout_s": 30.0
+}
+
+# Live quote pipeline, started on the first live fetch
+quote_pipeline = None
+
+def get_quote_pipeline():
+    """The process-wide BlockingQuotePipeline (pooled session on a loop thread)."""
+    global quote_pipeline
+    if quote_pipeline is None:
+        from pipelines.async_data_pipeline import AsyncMarketDataPipeline, BlockingQuotePipeline
+
+        params = {**QUOTE_PIPELINE_DEFAULTS, **load_parameters("quote_pipeline")}
+        quote_pipeline = BlockingQuotePipeline(AsyncMarketDataPipeline(
+            latency_budget=params["latency_budget_s"],
+            mode=params["mode"],
+            pool_size=params["pool_size"],
+            keepalive_timeout=params["keepalive_timeout_s"],
+            cache=quote_cache,
+            symbol="SOL"
+        ))
+    return quote_pipeline
+
+def get_tick_source():
+    global tick_source
+    if tick_source is None and TICK_SOURCE != "live":
+        tick_source = build_tick_source({**_tick_params, "source": TICK_SOURCE}, LOGS_DIR)
+    return tick_source
+
 def data_pipeline_init():
     """
     Initialize any needed configurations or API keys (placeholder).
     """
-    print("[DataPipeline] Initialized.")
+    source = get_tick_source()
+    logger.info("Initialized — %s ticks.", type(source).__name__ if source else "live")
 
 def fetch_sol_price():
     """
-    Fetch current Solana price from CoinGecko (as an example).
-    Return a dict with relevant data.
-    If real calls are undesirable, just mock the data.
+    Fetch current Solana price (through the shared quote cache).
+    Return a dict with relevant data ({"sol_price", "timestamp", ...}),
+    or None if no source produced a valid price within the latency budget
+    and the cached quote is too stale.
+    With a simulated or recorded tick source, returns its next tick
+    instead (no network call).
+    """
+    global TICK_SOURCE, tick_source
+    source = get_tick_source()
+    if source is not None:
+        try:
+            return source.fetch()
+        except TickSourceExhausted:
+            logger.warning("Recorded tick feed exhausted; switching to live quotes.")
+            TICK_SOURCE, tick_source = "live", None
+    quote = get_quote_pipeline().fetch_quote()
+    if quote is None:
+        logger.warning("No SOL quote within the latency budget.")
+    return quote
+
+def data_pipeline_close():
+    """Close the live quote pipeline's pooled session (if it was started)."""
+    global quote_pipeline
+    if quote_pipeline is not None:
+        quote_pipeline.close()
+        quote_pipeline = None
+
+def _request_universe(coin_ids):
+    """
+    Prices and 24h volumes for many tokens in one CoinGecko request.
+    Tokens missing from the reply get NaN. Raises on HTTP / JSON failure.
     """
+    import requests
+
+    url = "https://api.coingecko.com/api/v3/simple/price"
+    params = {
+        "ids": ",".join(coin_ids),
+        "vs_currencies": "usd",
+        "include_24hr_vol": "true"
+    }
+    response = requests.get(url, params=params, timeout=5)
+    data = response.json()
+    # Example: {'solana': {'usd': 19.52, 'usd_24h_vol': 4.1e8}, ...}
+    nan = float("nan")
+    snapshot = MarketSnapshot(
+        coin_ids,
+        [data.get(c, {}).get("usd", nan) for c in coin_ids],
+        time.time(),
+        volume=[data.get(c, {}).get("usd_24h_vol", nan) for c in coin_ids]
+    )
+    return {"snapshot": snapshot, "timestamp": snapshot.timestamp}
+
+def fetch_market_snapshot(coin_ids):
+    """
+    Columnar MarketSnapshot (symbol, price, volume) for a token universe,
+    through the shared quote cache. Returns None if no quote is available.
+    """
+    coin_ids = list(coin_ids)
     try:
-        url = "https://api.coingecko.com/api/v3/simple/price"
-        params = {
-            "ids": "solana",
-            "vs_currencies": "usd"
-        }
-        response = requests.get(url, params=params, timeout=5)
-        data = response.json()
-        # Example: {'solana': {'usd': 19.52}}
-        sol_price = data.get("solana", {}).get("usd", 0.0)
-
-        return {
-            "sol_price": sol_price,
-            "timestamp": time.time()
-        }
-
-    except Exception as e:
-        print(f"[DataPipeline] Error fetching SOL price: {e}")
-        # Return a fallback or mock data
-        return {
-            "sol_price": 999.99,  # placeholder fallback
-            "timestamp": time.time()
-        }
+        quote = quote_cache.get("universe:" + ",".join(coin_ids), lambda: _request_universe(coin_ids))
+        return quote["snapshot"]
+    except QuoteUnavailable as e:
+        logger.warning("Error fetching market snapshot: %s", e)
+        return None
+
+def quote_cache_stats():
+    """Hit / miss / coalesce / stale counters of the shared quote cache."""
+    return quote_cache.snapshot_stats()
@@ -5,55 +5,90 @@ Phase 6 (latest solana>=0.36.x).
 Two modes:
  - 'mock': placeholder prints
  - 'real_devnet': a minimal devnet transaction (we'll do an airdrop example).
+
+In 'real_devnet' mode execute_trade only enqueues the order; the
+OrderTracker worker sends it and tracks confirmation in the background,
+reporting fills to REFLECTION_ENGINE.
+
+The mode comes from config/parameters.json ("execution" -> "mode"), and the
+OBLIVION_MODE environment variable overrides it. The wallet / RPC modules
+(and with them solders, solana and requests) are only imported by the
+real_devnet path, so mock runs and backtests never load the Solana stack.
 """
 
-from security.secure_wallet import load_keypair, get_solana_client
+import os
+
+from config.config_loader import load_parameters
+from pipelines.order_tracker import OrderTracker
+from core.reflection_engine.reflection_engine import log_fill_outcome
+from core.log_core.log_core import get_logger
+
+logger = get_logger("ExecutionEngine")
+
+MODE = os.environ.get("OBLIVION_MODE") or load_parameters("execution").get("mode", "real_devnet")  # or "mock"
 
-MODE = "real_devnet"  # or "mock"
+# Background submit/confirm worker, started on the first real order
+order_tracker = None
 
 def execution_engine_init():
-    print("[ExecutionEngine] Initialized.")
+    logger.info("Initialized (mode: %s).", MODE)
 
-def execute_trade(decision: str):
+def execute_trade(decision: str, sol_price: float = None):
     """
     If MODE == 'mock', do placeholder prints.
-    If MODE == 'real_devnet', sign & send a devnet transaction (airdrop).
+    If MODE == 'real_devnet', queue a devnet transaction (airdrop) and return
+    immediately; the OrderTracker sends and confirms it in the background.
+    sol_price is the price the loop books the fill at; it travels with the
+    order so REFLECTION_ENGINE can reverse the fill if the order fails.
     """
     if MODE == "mock":
         if decision == "BUY":
-            print("[ExecutionEngine] (MOCK) Executing BUY order.")
+            logger.info("(MOCK) Executing BUY order.")
         elif decision == "SELL":
-            print("[ExecutionEngine] (MOCK) Executing SELL order.")
+            logger.info("(MOCK) Executing SELL order.")
         else:
-            print("[ExecutionEngine] (MOCK) Decision is HOLD. No action taken.")
+            logger.debug("(MOCK) Decision is HOLD. No action taken.")
     elif MODE == "real_devnet":
         if decision in ["BUY", "SELL"]:
-            perform_devnet_transaction(decision)
+            order_id = get_order_tracker().submit(decision, "SOL", sol_price)
+            logger.info("(REAL) Queued devnet %s order #%s.", decision, order_id)
         else:
-            print("[ExecutionEngine] (REAL) Decision is HOLD. No action taken.")
+            logger.debug("(REAL) Decision is HOLD. No action taken.")
 
-def perform_devnet_transaction(decision: str):
+def get_order_tracker() -> OrderTracker:
+    global order_tracker
+    if order_tracker is None:
+        from security.rpc_session import get_rpc_session
+        rpc = get_rpc_session(network="devnet")
+        order_tracker = OrderTracker(
+            submit_fn=perform_devnet_transaction,
+            status_fn=rpc.get_signature_statuses,
+            on_fill=log_fill_outcome
+        )
+    return order_tracker
+
+def order_tracker_stats() -> dict:
+    """In-flight orders, confirmation latency and timeout counts."""
+    if order_tracker is None:
+        return {}
+    return order_tracker.stats()
+
+def perform_devnet_transaction(decision: str) -> str:
     """
     Example devnet transaction - simply request an airdrop to show on-chain calls.
     Not an actual DEX trade, just a scaffold for demonstration.
+    Runs on the OrderTracker worker; returns the signature to track
+    (errors propagate to the tracker, which records a submit_error).
     """
-    print(f"[ExecutionEngine] (REAL) Attempting a devnet {decision} transaction...")
-
-    try:
-        kp = load_keypair()  # solders.keypair.Keypair
-        client = get_solana_client(network="devnet")
-
-        print("[ExecutionEngine] Requesting 1 SOL airdrop (devnet)...")
-        airdrop_sig = client.request_airdrop(kp.pubkey(), int(1e9))  # 1 SOL in lamports
-        print(f"[ExecutionEngine] Airdrop signature: {airdrop_sig}")
+    from security.secure_wallet import get_wallet
+    from security.rpc_session import get_rpc_session
 
-        # Wait/confirm the transaction
-        import time
-        time.sleep(2)
+    logger.info("(REAL) Attempting a devnet %s transaction...", decision)
 
-        balance_resp = client.get_balance(kp.pubkey())
-        lamports = balance_resp["result"]["value"]
-        print(f"[ExecutionEngine] Post-airdrop balance: {lamports} lamports")
+    kp = get_wallet()  # cached solders.keypair.Keypair
+    rpc = get_rpc_session(network="devnet")  # pooled, long-lived session
 
-    except Exception as e:
-        print(f"[ExecutionEngine] Error in perform_devnet_transaction: {e}")
+    logger.info("Requesting 1 SOL airdrop (devnet)...")
+    airdrop_sig = rpc.request_airdrop(str(kp.pubkey()), int(1e9))  # 1 SOL in lamports
+    logger.info("Airdrop signature: %s", airdrop_sig)
+    return airdrop_sig
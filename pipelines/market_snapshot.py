@@ -0,0 +1,62 @@
+"""
+market_snapshot.py
+
+Columnar market data for a whole token universe at one tick.
+Instead of a single market_data["sol_price"] scalar, a MarketSnapshot holds
+one NumPy column per field (price, volume, ...) aligned with a symbol array,
+so agents, SCORING_ENGINE and the synergy conductor evaluate every symbol in
+one vectorized pass.
+
+The legacy single-symbol dict still works everywhere; from_market_data()
+lifts it into a one-row snapshot and row() goes the other way for agents
+that only have scalar logic.
+"""
+
+import time
+
+import numpy as np
+
+class MarketSnapshot:
+    def __init__(self, symbols, price, timestamp: float = None, **columns):
+        self.symbols = np.asarray(symbols, dtype=object)
+        self.columns = {"price": np.asarray(price, dtype=np.float64)}
+        for name, values in columns.items():
+            self.columns[name] = np.asarray(values, dtype=np.float64)
+        for name, values in self.columns.items():
+            if values.shape != self.symbols.shape:
+                raise ValueError(f"Column '{name}' has {values.shape[0]} rows, expected {len(self.symbols)}")
+        self.timestamp = time.time() if timestamp is None else timestamp
+
+    @classmethod
+    def from_market_data(cls, market_data: dict, symbol: str = "SOL"):
+        """One-row snapshot from the legacy {"sol_price": ..., "timestamp": ...} dict."""
+        return cls([symbol], [market_data.get("sol_price", 0.0)], market_data.get("timestamp"))
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    @property
+    def price(self) -> np.ndarray:
+        return self.columns["price"]
+
+    def column(self, name: str, default: float = np.nan) -> np.ndarray:
+        """A column, or a constant column of `default` if the snapshot lacks it."""
+        if name in self.columns:
+            return self.columns[name]
+        return np.full(len(self), default, dtype=np.float64)
+
+    def row(self, i: int) -> dict:
+        """Row i in the legacy market_data shape (price also under "sol_price")."""
+        data = {name: float(values[i]) for name, values in self.columns.items()}
+        data["symbol"] = self.symbols[i]
+        data["sol_price"] = data["price"]
+        data["timestamp"] = self.timestamp
+        return data
+
+    def select(self, mask_or_index):
+        """Sub-universe by boolean mask or index array (copies the columns)."""
+        columns = {name: values[mask_or_index] for name, values in self.columns.items() if name != "price"}
+        return MarketSnapshot(self.symbols[mask_or_index], self.price[mask_or_index], self.timestamp, **columns)
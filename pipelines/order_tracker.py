@@ -0,0 +1,162 @@
+"""
+order_tracker.py
+
+Non-blocking order submission with asynchronous confirmation tracking.
+submit() only enqueues an order and returns its id; a background worker
+thread sends it (submit_fn -> signature), then polls the status of every
+in-flight signature in one batched call (status_fn) with exponential
+backoff until it is confirmed, fails, or times out. Finished orders are
+handed to the on_fill callbacks (e.g. REFLECTION_ENGINE).
+
+The trading loop's cycle time therefore no longer depends on chain
+confirmation latency. stats() exposes in-flight count, confirmation
+latency and timeout counts.
+"""
+
+import itertools
+import threading
+import time
+from collections import deque
+
+from core.log_core.log_core import get_logger
+
+logger = get_logger("OrderTracker")
+
+CONFIRMED_STATUSES = ("confirmed", "finalized")
+
+class OrderTracker:
+    def __init__(self, submit_fn, status_fn, on_fill=None,
+                 poll_initial_s: float = 0.25, poll_max_s: float = 4.0, backoff: float = 2.0,
+                 timeout_s: float = 60.0):
+        """
+        submit_fn(decision) -> signature (blocking RPC call, runs in the worker)
+        status_fn([signatures]) -> [status dict or None], RPC getSignatureStatuses shape
+        on_fill(order) is called for every finished order.
+        """
+        self.submit_fn = submit_fn
+        self.status_fn = status_fn
+        self.on_fill = [on_fill] if callable(on_fill) else list(on_fill or [])
+        self.poll_initial_s = poll_initial_s
+        self.poll_max_s = poll_max_s
+        self.backoff = backoff
+        self.timeout_s = timeout_s
+
+        self._ids = itertools.count(1)
+        self._queue = deque()
+        self._in_flight = {}      # order_id -> order dict (worker thread only)
+        self._cond = threading.Condition()
+        self._closing = False
+        self._latencies = deque(maxlen=1000)
+        self.counts = {
+            "submitted": 0,
+            "submit_errors": 0,
+            "confirmed": 0,
+            "failed": 0,
+            "timeouts": 0
+        }
+
+        self._thread = threading.Thread(target=self._worker_loop, name="OrderTracker", daemon=True)
+        self._thread.start()
+
+    def submit(self, decision: str, symbol: str = "SOL", price: float = None) -> int:
+        """
+        Enqueue an order; returns immediately with its order id.
+        symbol / price: where the trading loop booked the fill, handed back
+        with the finished order so an unfilled one can be reversed.
+        """
+        order_id = next(self._ids)
+        with self._cond:
+            self._queue.append({"order_id": order_id, "decision": decision, "symbol": symbol, "price": price,
+                                "queued_at": time.monotonic()})
+            self._cond.notify()
+        return order_id
+
+    # ─── Worker ──────────────────────────────────────────────────────────
+    def _worker_loop(self):
+        while True:
+            with self._cond:
+                if not self._queue:
+                    if self._closing and not self._in_flight:
+                        return
+                    self._cond.wait(self._next_poll_delay())
+                new_orders = list(self._queue)
+                self._queue.clear()
+
+            for order in new_orders:
+                self._send(order)
+            self._poll_due()
+
+    def _next_poll_delay(self):
+        if not self._in_flight:
+            return None
+        next_at = min(order["next_poll_at"] for order in self._in_flight.values())
+        return max(0.0, next_at - time.monotonic())
+
+    def _send(self, order: dict):
+        try:
+            order["signature"] = self.submit_fn(order["decision"])
+        except Exception as e:
+            self.counts["submit_errors"] += 1
+            self._finish(order, "submit_error", str(e))
+            return
+        now = time.monotonic()
+        order["submitted_at"] = now
+        order["poll_interval"] = self.poll_initial_s
+        order["next_poll_at"] = now + self.poll_initial_s
+        self.counts["submitted"] += 1
+        self._in_flight[order["order_id"]] = order
+
+    def _poll_due(self):
+        now = time.monotonic()
+        due = [order for order in self._in_flight.values() if order["next_poll_at"] <= now]
+        if not due:
+            return
+        try:
+            statuses = self.status_fn([order["signature"] for order in due])
+        except Exception as e:
+            logger.warning("Status poll failed: %s", e)
+            statuses = [None] * len(due)
+
+        now = time.monotonic()
+        for order, status in zip(due, statuses):
+            if status is not None and status.get("err") is not None:
+                self.counts["failed"] += 1
+                self._finish(order, "failed", status["err"])
+            elif status is not None and status.get("confirmationStatus") in CONFIRMED_STATUSES:
+                self.counts["confirmed"] += 1
+                self._latencies.append(now - order["submitted_at"])
+                self._finish(order, status["confirmationStatus"], None)
+            elif now - order["submitted_at"] >= self.timeout_s:
+                self.counts["timeouts"] += 1
+                self._finish(order, "timeout", None)
+            else:
+                order["poll_interval"] = min(order["poll_interval"] * self.backoff, self.poll_max_s)
+                order["next_poll_at"] = now + order["poll_interval"]
+
+    def _finish(self, order: dict, status: str, error):
+        self._in_flight.pop(order["order_id"], None)
+        order["status"] = status
+        order["error"] = error
+        order["finished_at"] = time.monotonic()
+        for callback in self.on_fill:
+            try:
+                callback(order)
+            except Exception as e:
+                logger.error("on_fill callback failed: %s", e)
+
+    # ─── Introspection / shutdown ────────────────────────────────────────
+    def stats(self) -> dict:
+        latencies = sorted(self._latencies)
+        stats = dict(self.counts)
+        stats["queued"] = len(self._queue)
+        stats["in_flight"] = len(self._in_flight)
+        stats["confirm_p50_s"] = latencies[len(latencies) // 2] if latencies else None
+        stats["confirm_max_s"] = latencies[-1] if latencies else None
+        return stats
+
+    def close(self, timeout: float = None):
+        """Stop accepting work; wait (up to timeout) for in-flight orders to finish."""
+        with self._cond:
+            self._closing = True
+            self._cond.notify()
+        self._thread.join(timeout)
@@ -1,8 +1,167 @@
 """
 position_manager.py
 
-Phase 7 – scaffold only.
+Phase 7 – multi-symbol position book.
+Positions are stored column-wise in NumPy arrays indexed by a dense symbol
+id (quantity, average entry price, realized / unrealized PnL, last mark),
+so re-marking every position against a price vector is a single vectorized
+pass and portfolio exposure is a couple of reductions - cheap each tick
+even with thousands of symbols.
+
+Fills are applied per symbol (average-price accounting: adding to a
+position moves the average entry, reducing it realizes PnL, crossing
+through zero flips the position at the fill price).
 """
 
+import numpy as np
+
+from core.decisions.decisions import position_units
+from core.log_core.log_core import get_logger
+
+logger = get_logger("PositionManager")
+
+class PositionManager:
+    def __init__(self, initial_capacity: int = 64):
+        self.symbols = []          # symbol id -> symbol
+        self.ids = {}              # symbol -> symbol id
+        self._alloc(max(1, initial_capacity))
+
+    def _alloc(self, capacity: int):
+        n = len(self.symbols)
+        old = getattr(self, "qty", None)
+        columns = {}
+        for name in ("qty", "avg_price", "realized", "unrealized", "last_price"):
+            column = np.zeros(capacity, dtype=np.float64)
+            if old is not None:
+                column[:n] = getattr(self, name)[:n]
+            columns[name] = column
+        self.qty = columns["qty"]
+        self.avg_price = columns["avg_price"]
+        self.realized = columns["realized"]
+        self.unrealized = columns["unrealized"]
+        self.last_price = columns["last_price"]
+        self.capacity = capacity
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def symbol_id(self, symbol: str) -> int:
+        """Dense id for a symbol, registering it (and growing the arrays) on first use."""
+        sid = self.ids.get(symbol)
+        if sid is None:
+            sid = len(self.symbols)
+            if sid == self.capacity:
+                self._alloc(self.capacity * 2)
+            self.symbols.append(symbol)
+            self.ids[symbol] = sid
+        return sid
+
+    def register_symbols(self, symbols) -> np.ndarray:
+        """Ids for many symbols at once (e.g. to line up a price vector)."""
+        return np.fromiter((self.symbol_id(s) for s in symbols), dtype=np.int64)
+
+    # ─── Fills ───────────────────────────────────────────────────────────
+    def apply_fill(self, symbol: str, quantity: float, price: float) -> float:
+        """
+        Apply a signed fill (quantity > 0 buys, < 0 sells) at price.
+        Returns the PnL realized by this fill.
+        """
+        sid = self.symbol_id(symbol)
+        qty = self.qty[sid]
+        avg = self.avg_price[sid]
+        realized = 0.0
+
+        if qty == 0.0 or (qty > 0) == (quantity > 0):
+            # Opening or adding: volume-weighted average entry
+            new_qty = qty + quantity
+            self.avg_price[sid] = (qty * avg + quantity * price) / new_qty if new_qty else 0.0
+        else:
+            # Reducing, closing or flipping
+            closed = min(abs(quantity), abs(qty))
+            realized = closed * (price - avg) * (1.0 if qty > 0 else -1.0)
+            new_qty = qty + quantity
+            if new_qty == 0.0:
+                self.avg_price[sid] = 0.0
+            elif (new_qty > 0) != (qty > 0):
+                self.avg_price[sid] = price
+
+        self.qty[sid] = new_qty
+        self.realized[sid] += realized
+        self.last_price[sid] = price
+        self.unrealized[sid] = new_qty * (price - self.avg_price[sid])
+        return realized
+
+    def apply_decision(self, symbol: str, decision: str, price: float, unit_size: float = 1.0) -> float:
+        """
+        Translate a conductor decision into a fill (HOLD is a no-op).
+        "REVERT_<decision>" applies the opposite fill, to undo an order
+        that was booked here but never filled on chain.
+        """
+        units = position_units(decision)
+        if units == 0.0:
+            return 0.0
+        return self.apply_fill(symbol, units * unit_size, price)
+
+    # ─── Marking ─────────────────────────────────────────────────────────
+    def mark_to_market(self, prices) -> float:
+        """
+        Re-mark every position against `prices`, a vector indexed by symbol
+        id (length >= number of symbols). NaN prices keep the previous mark.
+        Returns total unrealized PnL.
+        """
+        n = len(self.symbols)
+        prices = np.asarray(prices, dtype=np.float64)[:n]
+        last = self.last_price[:n]
+        np.copyto(last, prices, where=~np.isnan(prices))
+        np.multiply(self.qty[:n], last - self.avg_price[:n], out=self.unrealized[:n])
+        return float(self.unrealized[:n].sum())
+
+    def mark(self, symbol: str, price: float) -> float:
+        """Re-mark a single symbol; returns its unrealized PnL."""
+        sid = self.symbol_id(symbol)
+        self.last_price[sid] = price
+        self.unrealized[sid] = self.qty[sid] * (price - self.avg_price[sid])
+        return self.unrealized[sid]
+
+    # ─── Portfolio views ─────────────────────────────────────────────────
+    def exposure(self) -> dict:
+        """Gross / net / long / short notional at the last marks."""
+        n = len(self.symbols)
+        notional = np.multiply(self.qty[:n], self.last_price[:n])
+        net = float(notional.sum())
+        gross = float(np.abs(notional, out=notional).sum())
+        long_ = (gross + net) / 2.0
+        return {"gross": gross, "net": net, "long": long_, "short": net - long_}
+
+    def total_pnl(self) -> float:
+        n = len(self.symbols)
+        return float(self.realized[:n].sum() + self.unrealized[:n].sum())
+
+    def position(self, symbol: str) -> dict:
+        sid = self.ids.get(symbol)
+        if sid is None:
+            return {"symbol": symbol, "qty": 0.0, "avg_price": 0.0, "realized": 0.0,
+                    "unrealized": 0.0, "last_price": 0.0}
+        return {
+            "symbol": symbol,
+            "qty": float(self.qty[sid]),
+            "avg_price": float(self.avg_price[sid]),
+            "realized": float(self.realized[sid]),
+            "unrealized": float(self.unrealized[sid]),
+            "last_price": float(self.last_price[sid])
+        }
+
+    def snapshot(self) -> dict:
+        return {
+            "symbols": len(self.symbols),
+            "open_positions": int(np.count_nonzero(self.qty[:len(self.symbols)])),
+            "realized": float(self.realized[:len(self.symbols)].sum()),
+            "unrealized": float(self.unrealized[:len(self.symbols)].sum()),
+            "exposure": self.exposure()
+        }
+
+# Process-wide book used by the trading loop
+position_manager = PositionManager()
+
 def position_manager_init():
-    print("[PositionManager] Placeholder init — Phase 7 scaffold loaded.")
+    logger.info("Initialized — array-backed book, capacity %d symbols.", position_manager.capacity)
@@ -0,0 +1,173 @@
+"""
+quote_cache.py
+
+Shared TTL quote cache with request coalescing for the DATA_PIPELINE.
+- A quote younger than ttl_s is served from memory (hit).
+- Concurrent requests for the same symbol share one in-flight fetch
+  (coalesced) instead of each doing their own HTTP round trip.
+- If a fetch fails, the last quote is served as long as it is younger than
+  max_staleness_s (stale); otherwise QuoteUnavailable is raised.
+Works from threads (get) and from asyncio (aget); asyncio is only imported
+by aget, so thread-only users do not pay for it at startup.
+"""
+
+import threading
+import time
+
+class QuoteUnavailable(Exception):
+    """No fresh quote could be fetched and the cached one is too stale."""
+
+class _InFlight:
+    """One pending fetch that concurrent threads wait on."""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+class QuoteCache:
+    def __init__(self, ttl_s: float = 1.0, max_staleness_s: float = 10.0, clock=time.monotonic):
+        self.ttl_s = ttl_s
+        self.max_staleness_s = max_staleness_s
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._entries = {}          # symbol -> (quote, fetched_at)
+        self._inflight = {}         # symbol -> _InFlight (threads)
+        self._async_inflight = {}   # symbol -> asyncio.Future
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "stale": 0,
+            "errors": 0
+        }
+
+    def _fresh(self, symbol: str):
+        """Return the cached quote if within TTL (caller holds the lock)."""
+        entry = self._entries.get(symbol)
+        if entry is not None and self.clock() - entry[1] <= self.ttl_s:
+            self.stats["hits"] += 1
+            return entry[0]
+        return None
+
+    def _store(self, symbol: str, quote: dict):
+        with self._lock:
+            self._entries[symbol] = (quote, self.clock())
+
+    def _stale_or_raise(self, symbol: str, error: Exception):
+        with self._lock:
+            entry = self._entries.get(symbol)
+            if entry is not None and self.clock() - entry[1] <= self.max_staleness_s:
+                self.stats["stale"] += 1
+                return dict(entry[0], stale=True)
+        raise QuoteUnavailable(f"No quote for {symbol}: {error}") from error
+
+    def get(self, symbol: str, fetch_fn):
+        """
+        Thread-safe cached fetch. fetch_fn() returns a quote dict, or raises /
+        returns None on failure.
+        """
+        with self._lock:
+            quote = self._fresh(symbol)
+            if quote is not None:
+                return dict(quote)
+            flight = self._inflight.get(symbol)
+            leader = flight is None
+            if leader:
+                flight = _InFlight()
+                self._inflight[symbol] = flight
+                self.stats["misses"] += 1
+            else:
+                self.stats["coalesced"] += 1
+
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                return self._stale_or_raise(symbol, flight.error)
+            return dict(flight.result)
+
+        try:
+            quote = fetch_fn()
+            if quote is None:
+                raise QuoteUnavailable(f"Fetch returned no quote for {symbol}")
+        except Exception as e:
+            flight.error = e
+            with self._lock:
+                self.stats["errors"] += 1
+                del self._inflight[symbol]
+            flight.event.set()
+            return self._stale_or_raise(symbol, e)
+
+        self._store(symbol, quote)
+        flight.result = quote
+        with self._lock:
+            del self._inflight[symbol]
+        flight.event.set()
+        return dict(quote)
+
+    async def aget(self, symbol: str, fetch_coro_fn):
+        """
+        asyncio flavour of get(): tasks on the same loop share one in-flight
+        fetch. fetch_coro_fn() is awaited and returns a quote dict or None.
+        The first caller runs the fetch; if it fails or is cancelled, the
+        waiters get the error (or the stale quote) instead of hanging.
+        """
+        import asyncio
+
+        with self._lock:
+            quote = self._fresh(symbol)
+            if quote is not None:
+                return dict(quote)
+            future = self._async_inflight.get(symbol)
+            leader = future is None
+            if leader:
+                future = asyncio.get_running_loop().create_future()
+                self._async_inflight[symbol] = future
+                self.stats["misses"] += 1
+            else:
+                self.stats["coalesced"] += 1
+
+        if not leader:
+            try:
+                # shield: a cancelled waiter must not cancel the shared fetch
+                quote = await asyncio.shield(future)
+            except Exception as e:
+                return self._stale_or_raise(symbol, e)
+            return dict(quote)
+
+        try:
+            quote = await fetch_coro_fn()
+            if quote is None:
+                raise QuoteUnavailable(f"Fetch returned no quote for {symbol}")
+        except Exception as e:
+            self.stats["errors"] += 1
+            future.set_exception(e)
+            return self._stale_or_raise(symbol, e)
+        else:
+            self._store(symbol, quote)
+            future.set_result(quote)
+        finally:
+            with self._lock:
+                self._async_inflight.pop(symbol, None)
+            if not future.done():
+                # The leader was cancelled mid-fetch: release the waiters instead of stranding them
+                future.set_exception(QuoteUnavailable(f"Fetch for {symbol} was cancelled"))
+            # Waiters (if any) read the error themselves; don't log it as never retrieved
+            future.exception()
+        return dict(quote)
+
+    def invalidate(self, symbol: str = None):
+        """Drop one symbol (or everything) from the cache."""
+        with self._lock:
+            if symbol is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(symbol, None)
+
+    def snapshot_stats(self) -> dict:
+        """Counters plus the derived hit ratio (hits + coalesced over all lookups)."""
+        with self._lock:
+            stats = dict(self.stats)
+        lookups = stats["hits"] + stats["misses"] + stats["coalesced"]
+        stats["saved_ratio"] = (stats["hits"] + stats["coalesced"]) / lookups if lookups else 0.0
+        return stats
@@ -0,0 +1,291 @@
+"""
+tick_source.py
+
+Machine-speed tick feeds for DATA_PIPELINE, replay tooling and load tests.
+- MarketSimulator: deterministic, seeded price process. It is a
+  mean-reverting random walk on log price with random jumps and
+  whale-dump regimes (a steady slide on heavy volume, flagged with
+  whale_alert on the tick a dump starts). It generates whole chunks with
+  NumPy, at millions of ticks per second.
+- Binary tick files: a 16-byte header (magic, version, record size)
+  followed by fixed-width little-endian TICK_DTYPE records. They are
+  written once and read zero-copy through np.memmap (the same layout as
+  the trade journal and transfer recordings).
+- SimulatedTickSource / RecordedTickSource: fetch() returns one tick in
+  the fetch_sol_price() dict format ({"sol_price", "timestamp"}, plus
+  "volume" and "whale_alert"). next_batch() returns up to n ticks as a
+  TICK_DTYPE array for vectorized consumers.
+
+Record a simulated feed from the repo root:
+    python -m pipelines.tick_source logs/ticks.bin 1000000 [seed]
+"""
+
+import os
+import struct
+import sys
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+MAGIC = b"OBVK"
+VERSION = 1
+HEADER = struct.Struct("<4sHH8x")     # magic, version, record size
+HEADER_SIZE = HEADER.size
+
+TICK_DTYPE = np.dtype({
+    "names": ["timestamp", "sol_price", "volume", "whale_alert"],
+    "formats": ["<f8", "<f8", "<f4", "u1"],
+    "offsets": [0, 8, 16, 20],
+    "itemsize": 24
+})
+
+class TickSourceExhausted(Exception):
+    """A non-looping recorded feed has no ticks left."""
+
+def is_tick_file(path: str) -> bool:
+    """True if path starts with the binary tick file header."""
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+def write_tick_records(path: str, ticks: np.ndarray, append: bool = False) -> int:
+    """
+    Write (or append) a TICK_DTYPE array to a binary tick file.
+    Returns the number of ticks written.
+    """
+    ticks = np.ascontiguousarray(ticks, dtype=TICK_DTYPE)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    new_file = not append or not os.path.exists(path) or os.path.getsize(path) == 0
+    with open(path, "wb" if new_file else "ab") as f:
+        if new_file:
+            f.write(HEADER.pack(MAGIC, VERSION, TICK_DTYPE.itemsize))
+        f.write(ticks.tobytes())
+    return len(ticks)
+
+def read_tick_records(path: str) -> np.ndarray:
+    """Zero-copy, memory-mapped view of a binary tick file."""
+    with open(path, "rb") as f:
+        magic, version, record_size = HEADER.unpack(f.read(HEADER_SIZE))
+    if magic != MAGIC or record_size != TICK_DTYPE.itemsize:
+        raise ValueError(f"{path} is not a v{VERSION} tick file")
+    # Ignore a trailing partial record (e.g. crash mid-write)
+    count = (os.path.getsize(path) - HEADER_SIZE) // TICK_DTYPE.itemsize
+    if not count:
+        return np.zeros(0, dtype=TICK_DTYPE)
+    return np.memmap(path, dtype=TICK_DTYPE, mode="r", offset=HEADER_SIZE, shape=(count,))
+
+class MarketSimulator:
+    """
+    Seeded tick generator; the same seed and sequence of generate() sizes
+    always yields the same ticks. Per tick, with y = log(price / start_price):
+        y <- (1 - reversion) * y + N(drift, volatility)
+             [+ N(0, jump_scale) with probability jump_chance]
+             [+ log(1 - dump_drop) / dump_ticks while a dump is running]
+    A dump starts with probability dump_chance per tick and lasts
+    dump_ticks ticks, with volume_mean * dump_volume volume.
+    """
+
+    _BLOCK = 1024       # ticks per closed-form reversion step (keeps (1 - r)^-k small)
+
+    def __init__(self, seed: int = 21, start_price: float = 20.0, volatility: float = 0.002,
+                 drift: float = 0.0, reversion: float = 0.0002, jump_chance: float = 0.001,
+                 jump_scale: float = 0.02, dump_chance: float = 0.0002, dump_ticks: int = 300,
+                 dump_drop: float = 0.15, volume_mean: float = 1000.0, dump_volume: float = 5.0,
+                 tick_s: float = 1.0, start: float = 1.7e9):
+        if not 0.0 <= reversion < 1.0 or not 0.0 <= dump_drop < 1.0 or dump_ticks < 1:
+            raise ValueError("MarketSimulator needs 0 <= reversion < 1, 0 <= dump_drop < 1, dump_ticks >= 1")
+        self.rng = np.random.default_rng(seed)
+        self.start_price = start_price
+        self.volatility = volatility
+        self.drift = drift
+        self.reversion = reversion
+        self.jump_chance = jump_chance
+        self.jump_scale = jump_scale
+        self.dump_chance = dump_chance
+        self.dump_ticks = dump_ticks
+        self.dump_step = np.log1p(-dump_drop) / dump_ticks
+        self.volume_mean = volume_mean
+        self.dump_volume = dump_volume
+        self.tick_s = tick_s
+        self.clock = start
+        self.level = 0.0                # log(price / start_price) of the last tick
+        self.dump_left = 0              # ticks left in the running dump
+
+    def generate(self, n: int) -> np.ndarray:
+        """The next n ticks as a TICK_DTYPE array."""
+        rng = self.rng
+        ticks = np.empty(n, dtype=TICK_DTYPE)
+        if not n:
+            return ticks
+
+        # Dump regimes: a tick is in a dump if one started within dump_ticks ticks
+        starts = rng.random(n) < self.dump_chance
+        started = np.cumsum(starts)
+        expired = np.zeros(n, dtype=started.dtype)
+        if self.dump_ticks < n:
+            expired[self.dump_ticks:] = started[:-self.dump_ticks]
+        dumping = started > expired
+        dumping[:self.dump_left] = True
+        first = np.flatnonzero(starts)
+        self.dump_left = max(self.dump_left - n, int(first[-1]) + self.dump_ticks - n if len(first) else 0, 0)
+
+        returns = rng.normal(self.drift, self.volatility, n)
+        jumps = rng.random(n) < self.jump_chance
+        returns[jumps] += rng.normal(0.0, self.jump_scale, int(jumps.sum()))
+        returns[dumping] += self.dump_step
+        levels = self._integrate(returns)
+
+        ticks["timestamp"] = self.clock + self.tick_s * np.arange(n)
+        ticks["sol_price"] = self.start_price * np.exp(levels)
+        ticks["volume"] = (self.volume_mean * rng.lognormal(-0.125, 0.5, n)
+                           * np.where(dumping, self.dump_volume, 1.0))
+        ticks["whale_alert"] = starts
+        self.clock += self.tick_s * n
+        return ticks
+
+    def _integrate(self, returns: np.ndarray) -> np.ndarray:
+        # y_t = a^t * (y_0 + sum_{k<=t} a^-k * r_k) with a = 1 - reversion, blockwise
+        if self.reversion == 0.0:
+            levels = self.level + np.cumsum(returns)
+            self.level = float(levels[-1])
+            return levels
+        levels = np.empty_like(returns)
+        powers = (1.0 - self.reversion) ** np.arange(1, self._BLOCK + 1)
+        for start in range(0, len(returns), self._BLOCK):
+            r = returns[start:start + self._BLOCK]
+            p = powers[:len(r)]
+            block = p * (self.level + np.cumsum(r / p))
+            levels[start:start + len(r)] = block
+            self.level = float(block[-1])
+        return levels
+
+class _TickFeed(ABC):
+    """fetch() / next_batch() over the chunks returned by _next_chunk(n)."""
+
+    def __init__(self, chunk: int):
+        self.chunk = chunk
+        self._batch = np.zeros(0, dtype=TICK_DTYPE)
+        self._rows = []
+        self._pos = 0
+
+    @abstractmethod
+    def _next_chunk(self, n: int):
+        """Up to n more ticks as a TICK_DTYPE array, or None when the feed has ended."""
+
+    def fetch(self) -> dict:
+        """The next tick in the fetch_sol_price() format."""
+        if self._pos >= len(self._batch):
+            batch = self._next_chunk(self.chunk)
+            if batch is None or not len(batch):
+                raise TickSourceExhausted("tick feed exhausted")
+            # One bulk conversion per chunk instead of NumPy scalars per tick
+            self._batch = batch
+            self._rows = list(zip(*(batch[name].tolist() for name in TICK_DTYPE.names)))
+            self._pos = 0
+        timestamp, sol_price, volume, whale_alert = self._rows[self._pos]
+        self._pos += 1
+        return {
+            "sol_price": sol_price,
+            "timestamp": timestamp,
+            "volume": volume,
+            "whale_alert": bool(whale_alert)
+        }
+
+    def next_batch(self, n: int = None):
+        """
+        Up to n ticks (default: one chunk) as a TICK_DTYPE array, continuing
+        after the last fetch(); None at the end of a recorded feed.
+        """
+        n = self.chunk if n is None else n
+        if self._pos < len(self._batch):
+            batch = self._batch[self._pos:self._pos + n]
+            self._pos += len(batch)
+            return batch
+        batch = self._next_chunk(n)
+        return batch if batch is not None and len(batch) else None
+
+    def __iter__(self):
+        while True:
+            batch = self.next_batch()
+            if batch is None:
+                return
+            yield batch
+
+class SimulatedTickSource(_TickFeed):
+    """An endless MarketSimulator feed."""
+
+    def __init__(self, simulator: MarketSimulator = None, chunk: int = 65536):
+        super().__init__(chunk)
+        self.simulator = simulator if simulator is not None else MarketSimulator()
+
+    def _next_chunk(self, n: int):
+        return self.simulator.generate(n)
+
+class RecordedTickSource(_TickFeed):
+    """
+    A binary tick file, in order. Batches are zero-copy memmap slices,
+    except on later passes of a looping feed, where timestamps are shifted
+    forward so the clock keeps increasing.
+    """
+
+    def __init__(self, path: str, chunk: int = 65536, loop: bool = False):
+        super().__init__(chunk)
+        self.path = path
+        self.records = read_tick_records(path)
+        self.loop = loop
+        self.offset = 0
+        self.passes = 0
+        n = len(self.records)
+        if n:
+            first, last = float(self.records["timestamp"][0]), float(self.records["timestamp"][-1])
+            self._span = last - first + (last - first) / max(n - 1, 1)
+        else:
+            self._span = 0.0
+
+    def __len__(self):
+        return len(self.records)
+
+    def _next_chunk(self, n: int):
+        if self.offset >= len(self.records):
+            if not self.loop or not len(self.records):
+                return None
+            self.offset = 0
+            self.passes += 1
+        batch = self.records[self.offset:self.offset + n]
+        self.offset += len(batch)
+        if self.passes:
+            batch = np.array(batch)
+            batch["timestamp"] += self.passes * self._span
+        return batch
+
+DEFAULTS = {
+    "source": "live",
+    "file": "ticks.bin",
+    "loop": True,
+    "chunk": 65536,
+    "simulator": {}
+}
+
+def build_tick_source(params: dict, logs_dir: str = "."):
+    """
+    Feed for a "tick_source" config section, or None for "live" (network
+    quotes). Relative tick file paths are resolved against logs_dir.
+    """
+    params = {**DEFAULTS, **params}
+    if params["source"] == "live":
+        return None
+    if params["source"] == "simulated":
+        return SimulatedTickSource(MarketSimulator(**params["simulator"]), params["chunk"])
+    if params["source"] == "recorded":
+        return RecordedTickSource(os.path.join(logs_dir, params["file"]), params["chunk"], params["loop"])
+    raise ValueError(f"Unknown tick source {params['source']!r} (live, simulated or recorded)")
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (3, 4):
+        print("usage: python -m pipelines.tick_source <out.bin> <n_ticks> [seed]")
+        sys.exit(2)
+    out, total = sys.argv[1], int(sys.argv[2])
+    simulator = MarketSimulator(seed=int(sys.argv[3])) if len(sys.argv) == 4 else MarketSimulator()
+    written = 0
+    while written < total:
+        written += write_tick_records(out, simulator.generate(min(1 << 20, total - written)), append=written > 0)
+    print(f"[TickSource] Wrote {written} simulated ticks to {out}")
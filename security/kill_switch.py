@@ -4,27 +4,63 @@ kill_switch.py
 Phase 4: Minimal KILL_SWITCH logic.
 We'll define a function that checks certain conditions (fake or real)
 and can return True if the system needs to freeze.
+
+The conditions are the rules in config/parameters.json ("kill_switch"),
+evaluated incrementally by KillSwitchEngine (see kill_switch_rules.py).
 """
 
+from config.config_loader import load_parameters
+from security.kill_switch_rules import KillSwitchEngine
+from core.log_core.log_core import get_logger
+
+logger = get_logger("KillSwitch")
+
+# Original Phase 4 rule, used when the config defines none
+DEFAULT_RULES = [
+    {"name": "pnl_last_5", "type": "window_pnl", "window": 5, "min_pnl": -50}
+]
+
+kill_switch_engine = KillSwitchEngine(load_parameters("kill_switch").get("rules", DEFAULT_RULES))
+
 def kill_switch_init():
     """Initialize kill switch (placeholder)."""
-    print("[KillSwitch] Initialized.")
+    logger.info("Initialized with %d rules.", len(kill_switch_engine.rules))
 
 def check_kill_switch_conditions(trade_history):
     """
     Check for conditions that require a kill switch.
-    Example: if sum of last N trades' profit_loss < -50, or any other meltdown logic.
+    Trades appended to trade_history since the last call are fed to every
+    rule (normally one per cycle), then any breached rule trips the switch.
     Return True if we need to halt, False otherwise.
     """
     if len(trade_history) == 0:
         return False
 
-    # Example: If total PnL in last 5 trades < -50, we kill it
-    recent_trades = trade_history[-5:] if len(trade_history) >= 5 else trade_history
-    total_pnl = sum(t["profit_loss"] for t in recent_trades)
+    engine = kill_switch_engine
+    total = getattr(trade_history, "total_appended", len(trade_history))
+    generation = getattr(trade_history, "generation", None)
+    if generation != engine.generation or total < engine.trades_seen:
+        # A new or cleared history (e.g. a new backtest run), even if refilled past trades_seen
+        engine.reset()
+        engine.generation = generation
+
+    new_trades = min(total - engine.trades_seen, len(trade_history))
+    for k in range(new_trades, 0, -1):
+        trade = trade_history[-k]
+        engine.on_trade(trade["timestamp"], trade["decision"], trade["sol_price"], trade["profit_loss"])
+    engine.trades_seen = total
 
-    if total_pnl < -50:
-        print("[KillSwitch] Condition met! Total PnL in last 5 trades below -50.")
+    tripped = engine.tripped_rules()
+    if tripped:
+        for rule in tripped:
+            logger.warning("Condition met! %s: %s.", rule.name, rule.describe())
         return True
 
     return False
+
+def kill_switch_status() -> dict:
+    """Current state of every rule: {name: {"tripped": bool, "detail": str}}."""
+    return {
+        rule.name: {"tripped": rule.tripped, "detail": rule.describe()}
+        for rule in kill_switch_engine.rules
+    }
@@ -0,0 +1,203 @@
+"""
+kill_switch_rules.py
+
+Incremental rule engine behind the KILL_SWITCH.
+Every rule keeps its own running state and is updated in O(1) (amortized)
+per trade, so checking dozens of limits never re-scans the trade history.
+Rules are declared in config/parameters.json under "kill_switch" -> "rules":
+
+    {"name": "pnl_last_5", "type": "window_pnl", "window": 5, "min_pnl": -50}
+    {"name": "drawdown",   "type": "drawdown", "max_drawdown": 250}
+    {"name": "streak",     "type": "loss_streak", "max_streak": 10}
+    {"name": "sol_exp",    "type": "exposure", "symbol": "SOL", "max_abs_exposure": 5000}
+    {"name": "rate",       "type": "trade_rate", "window_s": 60, "max_trades": 30}
+    {"name": "liq",        "type": "liquidation_distance", "min_distance": 0.05}
+
+A rule with "enabled": false is skipped.
+"""
+
+from collections import deque
+
+from core.decisions.decisions import DECISION_UNITS, position_units
+
+class WindowPnLRule:
+    """Sum of the last `window` PnLs must not drop below min_pnl."""
+
+    def __init__(self, name: str, window: int, min_pnl: float):
+        self.name = name
+        self.window = window
+        self.min_pnl = min_pnl
+        self.pnls = deque()
+        self.total = 0.0
+        self.comp = 0.0     # Neumaier compensation, keeps add/subtract exact enough at the limit
+        self.tripped = False
+
+    def _add(self, x: float):
+        t = self.total + x
+        if abs(self.total) >= abs(x):
+            self.comp += (self.total - t) + x
+        else:
+            self.comp += (x - t) + self.total
+        self.total = t
+
+    def update(self, timestamp, decision, sol_price, profit_loss, symbol):
+        self.pnls.append(profit_loss)
+        self._add(profit_loss)
+        if len(self.pnls) > self.window:
+            self._add(-self.pnls.popleft())
+        self.tripped = self.total + self.comp < self.min_pnl
+
+    def describe(self) -> str:
+        return f"PnL over last {self.window} trades {self.total + self.comp:.2f} < {self.min_pnl}"
+
+class DrawdownRule:
+    """Cumulative PnL must not fall more than max_drawdown below its peak."""
+
+    def __init__(self, name: str, max_drawdown: float):
+        self.name = name
+        self.max_drawdown = max_drawdown
+        self.equity = 0.0
+        self.peak = 0.0
+        self.tripped = False
+
+    def update(self, timestamp, decision, sol_price, profit_loss, symbol):
+        self.equity += profit_loss
+        if self.equity > self.peak:
+            self.peak = self.equity
+        self.tripped = self.peak - self.equity > self.max_drawdown
+
+    def describe(self) -> str:
+        return f"drawdown {self.peak - self.equity:.2f} > {self.max_drawdown}"
+
+class LossStreakRule:
+    """No more than max_streak consecutive losing trades."""
+
+    def __init__(self, name: str, max_streak: int):
+        self.name = name
+        self.max_streak = max_streak
+        self.streak = 0
+        self.tripped = False
+
+    def update(self, timestamp, decision, sol_price, profit_loss, symbol):
+        self.streak = self.streak + 1 if profit_loss < 0 else 0
+        self.tripped = self.streak > self.max_streak
+
+    def describe(self) -> str:
+        return f"loss streak {self.streak} > {self.max_streak}"
+
+class ExposureRule:
+    """
+    Absolute notional exposure in one symbol must stay within
+    max_abs_exposure. Tracks the net position in units (BUYs and SELLs
+    net out) and marks it at the latest price, so the exposure follows
+    the market instead of summing entry notionals.
+    """
+
+    def __init__(self, name: str, symbol: str, max_abs_exposure: float):
+        self.name = name
+        self.symbol = symbol
+        self.max_abs_exposure = max_abs_exposure
+        self.units = 0.0
+        self.price = 0.0
+        self.exposure = 0.0
+        self.tripped = False
+
+    def update(self, timestamp, decision, sol_price, profit_loss, symbol):
+        if symbol == self.symbol:
+            self.units += position_units(decision)
+            if sol_price > 0:   # also False for NaN
+                self.price = sol_price
+            self.exposure = self.units * self.price
+            self.tripped = abs(self.exposure) > self.max_abs_exposure
+
+    def describe(self) -> str:
+        return f"{self.symbol} exposure {self.exposure:.2f} beyond +/-{self.max_abs_exposure}"
+
+class TradeRateRule:
+    """No more than max_trades orders (non-HOLD decisions) in any window_s seconds."""
+
+    def __init__(self, name: str, window_s: float, max_trades: int):
+        self.name = name
+        self.window_s = window_s
+        self.max_trades = max_trades
+        self.times = deque()
+        self.tripped = False
+
+    def update(self, timestamp, decision, sol_price, profit_loss, symbol):
+        times = self.times
+        if decision in DECISION_UNITS:
+            times.append(timestamp)
+        cutoff = timestamp - self.window_s
+        while times and times[0] <= cutoff:
+            times.popleft()
+        self.tripped = len(times) > self.max_trades
+
+    def describe(self) -> str:
+        return f"{len(self.times)} trades in {self.window_s}s > {self.max_trades}"
+
+class LiquidationDistanceRule:
+    """
+    Closest perp position must stay at least min_distance (relative price
+    move) away from its liquidation price. Polls the cached value from
+    DERIVATIVES_ENGINE's last update, so it costs O(1) per check.
+    """
+
+    def __init__(self, name: str, min_distance: float):
+        self.name = name
+        self.min_distance = min_distance
+        self.distance = float("inf")
+        self.tripped = False
+        self._derivatives = None    # module, bound on first update (avoids an import cycle)
+
+    def update(self, timestamp, decision, sol_price, profit_loss, symbol):
+        if self._derivatives is None:
+            import core.derivatives_engine.derivatives_engine as derivatives
+            self._derivatives = derivatives
+        self.distance = self._derivatives.derivatives_engine.min_distance
+        self.tripped = self.distance < self.min_distance
+
+    def describe(self) -> str:
+        return f"distance to liquidation {self.distance:.2%} < {self.min_distance:.2%}"
+
+RULE_TYPES = {
+    "window_pnl": (WindowPnLRule, ("window", "min_pnl")),
+    "drawdown": (DrawdownRule, ("max_drawdown",)),
+    "loss_streak": (LossStreakRule, ("max_streak",)),
+    "exposure": (ExposureRule, ("symbol", "max_abs_exposure")),
+    "trade_rate": (TradeRateRule, ("window_s", "max_trades")),
+    "liquidation_distance": (LiquidationDistanceRule, ("min_distance",))
+}
+
+def build_rule(spec: dict):
+    """Instantiate one rule from its config dict."""
+    rule_type = spec.get("type")
+    if rule_type not in RULE_TYPES:
+        raise ValueError(f"Unknown kill switch rule type: {rule_type}")
+    cls, fields = RULE_TYPES[rule_type]
+    name = spec.get("name", rule_type)
+    try:
+        return cls(name, *(spec[field] for field in fields))
+    except KeyError as e:
+        raise ValueError(f"Kill switch rule '{name}' is missing {e}") from None
+
+class KillSwitchEngine:
+    """Holds the configured rules and feeds each new trade to all of them."""
+
+    def __init__(self, rule_specs):
+        self.rule_specs = [spec for spec in rule_specs if spec.get("enabled", True)]
+        self.generation = None      # trade history generation the rule state belongs to
+        self.reset()
+
+    def reset(self):
+        self.rules = [build_rule(spec) for spec in self.rule_specs]
+        self.trades_seen = 0
+
+    def on_trade(self, timestamp: float, decision: str, sol_price: float,
+                 profit_loss: float, symbol: str = "SOL"):
+        for rule in self.rules:
+            rule.update(timestamp, decision, sol_price, profit_loss, symbol)
+        self.trades_seen += 1
+
+    def tripped_rules(self):
+        """Rules whose limit is currently breached."""
+        return [rule for rule in self.rules if rule.tripped]
@@ -0,0 +1,120 @@
+"""
+rpc_session.py
+
+Long-lived Solana JSON-RPC sessions for the execution path.
+One RpcSession per network keeps a pooled requests.Session (keep-alive
+connections reused across orders) and can send several JSON-RPC calls in
+one HTTP round trip (batch), e.g. balance + signature status together.
+Plain JSON-RPC over HTTP, so it can be pointed at a local fake RPC server.
+requests is imported when the first session is created.
+"""
+
+import itertools
+import threading
+
+RPC_URLS = {
+    "devnet": "https://api.devnet.solana.com",
+    "mainnet-beta": "https://api.mainnet-beta.solana.com"
+}
+
+class RpcError(Exception):
+    """JSON-RPC error object returned by the node."""
+
+class RpcSession:
+    def __init__(self, url: str, pool_size: int = 10, timeout: float = 5.0):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.url = url
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Content-Type": "application/json"})
+        self._ids = itertools.count(1)
+        self.stats = {"requests": 0, "calls": 0, "errors": 0}
+
+    def _post(self, body):
+        self.stats["requests"] += 1
+        response = self.session.post(self.url, json=body, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def _result(self, reply: dict):
+        if "error" in reply:
+            self.stats["errors"] += 1
+            raise RpcError(reply["error"])
+        return reply.get("result")
+
+    def call(self, method: str, params=None):
+        """One JSON-RPC call; returns its result or raises RpcError."""
+        self.stats["calls"] += 1
+        body = {"jsonrpc": "2.0", "id": next(self._ids), "method": method, "params": params or []}
+        return self._result(self._post(body))
+
+    def batch(self, calls):
+        """
+        Several JSON-RPC calls in one HTTP request.
+        calls: [(method, params), ...]; returns results in the same order
+        (an RpcError instance in place of a failed call's result).
+        """
+        ids = [next(self._ids) for _ in calls]
+        body = [
+            {"jsonrpc": "2.0", "id": call_id, "method": method, "params": params or []}
+            for call_id, (method, params) in zip(ids, calls)
+        ]
+        self.stats["calls"] += len(calls)
+        replies = {reply.get("id"): reply for reply in self._post(body)}
+        results = []
+        for call_id in ids:
+            try:
+                results.append(self._result(replies.get(call_id, {"error": "missing reply"})))
+            except RpcError as e:
+                results.append(e)
+        return results
+
+    # ─── Convenience wrappers ────────────────────────────────────────────
+    def get_balance(self, pubkey: str) -> int:
+        return self.call("getBalance", [pubkey])["value"]
+
+    def request_airdrop(self, pubkey: str, lamports: int) -> str:
+        return self.call("requestAirdrop", [pubkey, int(lamports)])
+
+    def get_signature_statuses(self, signatures):
+        return self.call("getSignatureStatuses", [list(signatures), {"searchTransactionHistory": False}])["value"]
+
+    def balance_and_statuses(self, pubkey: str, signatures):
+        """Balance and signature statuses in a single round trip."""
+        balance, statuses = self.batch([
+            ("getBalance", [pubkey]),
+            ("getSignatureStatuses", [list(signatures), {"searchTransactionHistory": False}])
+        ])
+        for result in (balance, statuses):
+            if isinstance(result, RpcError):
+                raise result
+        return balance["value"], statuses["value"]
+
+    def close(self):
+        self.session.close()
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+def get_rpc_session(network: str = "devnet", url: str = None) -> RpcSession:
+    """Shared RpcSession per network (or explicit url), created on first use."""
+    key = url or network
+    rpc = _sessions.get(key)
+    if rpc is None:
+        with _sessions_lock:
+            rpc = _sessions.get(key)
+            if rpc is None:
+                rpc = RpcSession(url or RPC_URLS.get(network, RPC_URLS["mainnet-beta"]))
+                _sessions[key] = rpc
+    return rpc
+
+def close_rpc_sessions():
+    with _sessions_lock:
+        for rpc in _sessions.values():
+            rpc.close()
+        _sessions.clear()
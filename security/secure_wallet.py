@@ -2,43 +2,115 @@
 secure_wallet.py
 
 For solana>=0.36.x, we use solders.keypair/keypub directly.
+get_wallet() / get_solana_client() cache the parsed keypair and the Client
+per network, so the execution path does not re-read the keyfile or open a
+new connection on every order. Without a keyfile, get_wallet() uses one
+ephemeral devnet key for the whole process; an unreadable keyfile raises.
+
+solders / solana are imported on first use, so importing this module (e.g.
+in mock mode or backtests) does not load the Solana stack.
 """
 
 import os
 import json
-from solders.keypair import Keypair
-from solana.rpc.api import Client
+import threading
+from typing import TYPE_CHECKING
+
+from core.log_core.log_core import get_logger
+
+if TYPE_CHECKING:
+    from solana.rpc.api import Client
+    from solders.keypair import Keypair
+
+logger = get_logger("SecureWallet")
+
+DEFAULT_KEYFILE = "~/.config/solana/id.json"
+
+_wallets = {}
+_clients = {}
+_cache_lock = threading.Lock()
 
 def secure_wallet_init():
     """Initialize secure wallet (placeholder)."""
-    print("[SecureWallet] Initialized.")
+    logger.info("Initialized.")
 
-def load_keypair(keyfile_path="~/.config/solana/id.json") -> Keypair:
+def load_keypair(keyfile_path=DEFAULT_KEYFILE) -> "Keypair":
     """
     Load a solders-based Keypair from a JSON file (typical Solana CLI).
     If file not found or error occurs, return a random ephemeral Keypair.
     """
-    expanded_path = os.path.expanduser(keyfile_path)
-    if not os.path.exists(expanded_path):
-        print(f"[SecureWallet] Key file not found at {expanded_path}. Using random devnet key.")
+    from solders.keypair import Keypair
+
+    try:
+        kp = _read_keypair(keyfile_path)
+    except ValueError as e:
+        logger.error("%s", e)
+        return Keypair()
+    if kp is None:
+        logger.warning("Key file not found at %s. Using random devnet key.", os.path.expanduser(keyfile_path))
         return Keypair()  # ephemeral
+    return kp
+
+def _read_keypair(keyfile_path) -> "Keypair":
+    """The keypair in the keyfile; None if there is no file, ValueError if it cannot be parsed."""
+    from solders.keypair import Keypair
 
+    expanded_path = os.path.expanduser(keyfile_path)
+    if not os.path.exists(expanded_path):
+        return None
     try:
         with open(expanded_path, "r", encoding="utf-8") as f:
             byte_list = json.loads(f.read())  # typical 64-byte array
             secret_bytes = bytes(byte_list)
-            kp = Keypair.from_bytes(secret_bytes)
-            return kp
+            return Keypair.from_bytes(secret_bytes)
     except Exception as e:
-        print(f"[SecureWallet] Error loading keypair: {e}")
-        return Keypair()
+        raise ValueError(f"Error loading keypair from {expanded_path}: {e}") from e
 
-def get_solana_client(network="devnet") -> Client:
+def get_wallet(keyfile_path=DEFAULT_KEYFILE) -> "Keypair":
+    """
+    Long-lived keypair: loaded from the keyfile once, then served from memory.
+    - No keyfile: one random devnet key is made, cached for the life of
+      the process (every order signs with the same key) and warned about
+      once.
+    - A keyfile that cannot be parsed (e.g. caught mid-write) raises
+      ValueError and is not cached, so the next call reads it again.
+      Orders never silently sign with a throwaway key.
+    """
+    kp = _wallets.get(keyfile_path)
+    if kp is None:
+        with _cache_lock:
+            kp = _wallets.get(keyfile_path)
+            if kp is None:
+                kp = _read_keypair(keyfile_path)
+                if kp is None:
+                    from solders.keypair import Keypair
+                    logger.warning("Key file not found at %s. Using one random devnet key for this process.",
+                                   os.path.expanduser(keyfile_path))
+                    kp = Keypair()  # ephemeral
+                _wallets[keyfile_path] = kp
+    return kp
+
+def get_solana_client(network="devnet") -> "Client":
     """
     Return a solana.rpc.api Client pointing to devnet or mainnet-beta.
+    One Client (and its HTTP connection pool) is kept per network.
     """
-    if network == "devnet":
-        url = "https://api.devnet.solana.com"
-    else:
-        url = "https://api.mainnet-beta.solana.com"
-    return Client(url)
+    client = _clients.get(network)
+    if client is None:
+        with _cache_lock:
+            client = _clients.get(network)
+            if client is None:
+                from solana.rpc.api import Client
+                if network == "devnet":
+                    url = "https://api.devnet.solana.com"
+                else:
+                    url = "https://api.mainnet-beta.solana.com"
+                client = Client(url)
+                _clients[network] = client
+    return client
+
+def clear_wallet_cache():
+    """Forget cached keypairs/clients (e.g. after rotating the keyfile)."""
+    with _cache_lock:
+        _wallets.clear()
+        _clients.clear()
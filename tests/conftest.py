@@ -0,0 +1,15 @@
+"""
+conftest.py
+
+Shared pytest setup: stop LOG_CORE's background writer while pytest's
+captured stdout (the stream it writes to) is still open.
+"""
+
+import pytest
+
+from core.log_core.log_core import shutdown_logging
+
+@pytest.fixture(scope="session", autouse=True)
+def _stop_log_writer():
+    yield
+    shutdown_logging()
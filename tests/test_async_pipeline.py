@@ -0,0 +1,101 @@
+"""
+test_async_pipeline.py
+
+AsyncMarketDataPipeline against the local stub price server
+(benchmarks/stub_price_server.py): median / first quote selection,
+a quote miss when no source answers within the latency budget, and
+per-source errors that must not take the quote down. Also the blocking
+facade the live loop uses.
+
+Run from the repo root:
+    python -m pytest -q tests
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from benchmarks.stub_price_server import start_stub_server, stub_sources
+from pipelines.async_data_pipeline import AsyncMarketDataPipeline, BlockingQuotePipeline
+from pipelines.quote_cache import QuoteCache
+
+PRICES = {"coingecko": 20.0, "binance": 21.0, "coinbase": 25.0}
+
+def quote_from_stub(server_kwargs: dict, **pipeline_kwargs):
+    """(quote, pipeline stats) for one fetch against a fresh stub server."""
+    async def run():
+        runner, base_url = await start_stub_server(**server_kwargs)
+        try:
+            async with AsyncMarketDataPipeline(stub_sources(base_url), **pipeline_kwargs) as pipeline:
+                return await pipeline.fetch_quote(), dict(pipeline.stats)
+        finally:
+            await runner.cleanup()
+    return asyncio.run(run())
+
+def test_median_of_every_source():
+    quote, stats = quote_from_stub({"prices": PRICES}, latency_budget=2.0, mode="median")
+    assert quote["sol_price"] == pytest.approx(21.0)
+    assert quote["sources"] == pytest.approx(PRICES)
+    assert stats["quotes"] == 1 and stats["source_errors"] == 0
+
+def test_first_does_not_wait_for_slow_sources():
+    quote, _ = quote_from_stub({"prices": PRICES, "delays": {"coingecko": 0.5, "binance": 0.5}},
+                               latency_budget=2.0, mode="first")
+    assert quote["sol_price"] == pytest.approx(25.0)
+    assert list(quote["sources"]) == ["coinbase"]
+    assert quote["latency_s"] < 0.4
+
+def test_median_drops_sources_past_the_latency_budget():
+    quote, _ = quote_from_stub({"prices": PRICES, "delays": {"coinbase": 1.0}},
+                               latency_budget=0.3, mode="median")
+    assert set(quote["sources"]) == {"coingecko", "binance"}
+    assert quote["sol_price"] == pytest.approx(20.5)
+    assert quote["latency_s"] < 0.8
+
+def test_no_source_within_the_budget_is_a_miss():
+    slow = {name: 1.0 for name in PRICES}
+    quote, stats = quote_from_stub({"delays": slow}, latency_budget=0.2)
+    assert quote is None
+    assert stats["misses"] == 1 and stats["quotes"] == 0
+
+def test_failing_sources_are_counted_and_skipped():
+    quote, stats = quote_from_stub({"prices": PRICES, "statuses": {"binance": 503, "coinbase": 429}},
+                                   latency_budget=2.0)
+    assert quote["sol_price"] == pytest.approx(20.0)
+    assert list(quote["sources"]) == ["coingecko"]
+    assert stats["source_errors"] == 2
+
+def test_every_source_failing_is_no_quote_not_a_fake_price():
+    statuses = {name: 503 for name in PRICES}
+    quote, stats = quote_from_stub({"statuses": statuses}, latency_budget=1.0)
+    assert quote is None
+    assert stats["source_errors"] == 3 and stats["misses"] == 1
+
+def serve_on_thread(loop) -> threading.Thread:
+    """Run the stub's loop on its own thread while the test thread blocks on quotes."""
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    return thread
+
+def test_blocking_pipeline_reuses_one_session():
+    loop = asyncio.new_event_loop()
+    runner, base_url = loop.run_until_complete(start_stub_server(prices=PRICES))
+    server = serve_on_thread(loop)
+    # A zero TTL sends every call to the sources
+    blocking = BlockingQuotePipeline(AsyncMarketDataPipeline(
+        stub_sources(base_url), latency_budget=2.0, cache=QuoteCache(ttl_s=0.0)))
+    try:
+        first = blocking.fetch_quote()
+        session = blocking.pipeline.session
+        quotes = [first] + [blocking.fetch_quote() for _ in range(4)]
+        assert [q["sol_price"] for q in quotes] == pytest.approx([21.0] * 5)
+        assert blocking.pipeline.session is session
+        assert blocking.pipeline.stats["requests"] == 5
+    finally:
+        blocking.close()
+        asyncio.run_coroutine_threadsafe(runner.cleanup(), loop).result(5.0)
+        loop.call_soon_threadsafe(loop.stop)
+        server.join()
+        loop.close()
+    assert blocking.pipeline.session is None
@@ -0,0 +1,144 @@
+"""
+test_derivatives_engine.py
+
+DERIVATIVES_ENGINE against the local SimulatedPerpVenue: liquidation-price
+maths, funding accrual, and the kill switch's liquidation_distance rule.
+
+Run from the repo root:
+    python -m pytest -q tests
+"""
+
+import numpy as np
+import pytest
+
+import core.derivatives_engine.derivatives_engine as derivatives
+import security.kill_switch as kill_switch
+from core.derivatives_engine.derivatives_engine import DerivativesEngine
+from core.derivatives_engine.sim_perp_venue import SimulatedPerpVenue
+from core.reflection_engine.trade_history import TradeHistory
+from security.kill_switch_rules import KillSwitchEngine, LiquidationDistanceRule
+
+MM = 0.05
+LIQUIDATION_RULE = {"name": "liquidation_distance", "type": "liquidation_distance", "min_distance": 0.05}
+
+def flat_venue(mark: float = 20.0, funding_rate_per_hour: float = 0.0) -> SimulatedPerpVenue:
+    return SimulatedPerpVenue({"SOL-PERP": mark}, funding_rate_per_hour=funding_rate_per_hour,
+                              volatility=0.0, slippage_bps=0.0)
+
+@pytest.fixture
+def engine(monkeypatch):
+    """An engine on a flat venue, installed as the process-wide one the rule polls."""
+    engine = DerivativesEngine(flat_venue(), maintenance_margin=MM, leverage=5.0)
+    monkeypatch.setattr(derivatives, "derivatives_engine", engine)
+    return engine
+
+def test_long_liquidation_price(engine):
+    pid = engine.open_position(0, 10.0, 20.0, 40.0)
+    engine.update()
+    # 10 * (p - 20) + 40 = 10 * p * 0.05  =>  p = 160 / 9.5
+    assert engine.liq_price[pid] == pytest.approx(160.0 / 9.5)
+    assert engine.margin_ratio[pid] == pytest.approx(40.0 / 200.0)
+    assert engine.distance[pid] == pytest.approx((20.0 - 160.0 / 9.5) / 20.0)
+
+def test_short_liquidation_price(engine):
+    pid = engine.open_position(0, -10.0, 20.0, 40.0)
+    engine.update()
+    # -10 * (p - 20) + 40 = 10 * p * 0.05  =>  p = 240 / 10.5
+    assert engine.liq_price[pid] == pytest.approx(240.0 / 10.5)
+    assert engine.distance[pid] == pytest.approx((240.0 / 10.5 - 20.0) / 20.0)
+
+def test_equity_hits_maintenance_exactly_at_liquidation_price():
+    rng = np.random.default_rng(13)
+    engine = DerivativesEngine(maintenance_margin=MM)
+    n = 200
+    sizes = rng.uniform(0.5, 5.0, n) * rng.choice([-1.0, 1.0], n)
+    entries = rng.uniform(10.0, 40.0, n)
+    for size, entry in zip(sizes, entries):
+        engine.open_position(0, size, entry, abs(size) * entry / rng.uniform(2.0, 10.0),
+                             funding_index=rng.uniform(-0.5, 0.5))
+    funding = np.array([0.3])
+    engine.update(np.array([25.0]), funding)
+    liq = engine.liq_price[:n].copy()
+
+    # Re-mark each position at its own liquidation price: margin ratio == maintenance
+    for pid in range(n):
+        engine.update(np.array([liq[pid]]), funding)
+        assert engine.margin_ratio[pid] == pytest.approx(MM, rel=1e-9)
+        assert engine.distance[pid] == pytest.approx(0.0, abs=1e-12)
+
+def test_funding_accrues_against_the_payer():
+    venue = flat_venue(funding_rate_per_hour=0.001)
+    engine = DerivativesEngine(venue, maintenance_margin=MM)
+    long_pid = engine.open_long("SOL-PERP", 10.0, collateral=40.0)
+    short_pid = engine.open_short("SOL-PERP", 10.0, collateral=40.0)
+    engine.update()
+    before = engine.liq_price[[long_pid, short_pid]].copy()
+
+    venue.step(10.0)    # 10 hours at 0.1%/h of a 20.0 mark
+    engine.update()
+    assert venue.funding_index[0] == pytest.approx(0.2)
+    assert engine.funding[long_pid] == pytest.approx(-2.0)     # positive funding: longs pay
+    assert engine.funding[short_pid] == pytest.approx(2.0)
+    # Paying funding pulls the long's liquidation price up, receiving pushes the short's away
+    assert engine.liq_price[long_pid] > before[0]
+    assert engine.liq_price[short_pid] > before[1]
+
+def test_crossing_the_liquidation_price_makes_a_position_liquidatable(engine):
+    pid = engine.open_long("SOL-PERP", 10.0, collateral=40.0)
+    engine.update()
+    liq = engine.liq_price[pid]
+    engine.update(np.array([liq * 1.001]))
+    assert pid not in engine.liquidatable()
+    engine.update(np.array([liq * 0.999]))
+    assert pid in engine.liquidatable()
+
+def test_closed_positions_do_not_count(engine):
+    pid = engine.open_long("SOL-PERP", 10.0)
+    engine.update()
+    assert np.isfinite(engine.min_distance)
+    engine.close_position(pid, 20.0)
+    assert engine.update() == np.inf
+
+def test_rule_trips_below_min_distance(engine):
+    rule = LiquidationDistanceRule("liq", 0.05)
+    rule.update(0.0, "HOLD", 20.0, 0.0, "SOL")
+    assert not rule.tripped and rule.distance == np.inf     # no positions
+
+    pid = engine.open_long("SOL-PERP", 10.0, collateral=40.0)
+    engine.update()
+    rule.update(1.0, "HOLD", 20.0, 0.0, "SOL")
+    assert not rule.tripped     # about 15.8% away
+
+    engine.update(np.array([engine.liq_price[pid] * 1.04]))
+    rule.update(2.0, "HOLD", 20.0, 0.0, "SOL")
+    assert rule.tripped
+    assert "distance to liquidation" in rule.describe()
+
+def test_kill_switch_halts_before_a_short_is_liquidated(engine, monkeypatch):
+    monkeypatch.setattr(kill_switch, "kill_switch_engine", KillSwitchEngine([LIQUIDATION_RULE]))
+    venue = engine.venue
+    pid = engine.open_short("SOL-PERP", 10.0, collateral=40.0)
+    history = TradeHistory(capacity=1000, pnl_windows=(5,))
+
+    for tick in range(1, 200):
+        venue.step(1.0, shocks=np.array([0.005]))    # steady rally against the short
+        engine.update()
+        history.append(float(tick), "HOLD", float(venue.marks[0]), 0.0)
+        if kill_switch.check_kill_switch_conditions(history):
+            break
+    else:
+        pytest.fail("kill switch never tripped")
+
+    assert 0.0 < engine.distance[pid] < LIQUIDATION_RULE["min_distance"]
+    assert pid not in engine.liquidatable()
+
+def test_main_loop_advance_moves_the_simulated_venue():
+    venue = SimulatedPerpVenue({"SOL-PERP": 20.0}, volatility=0.01, seed=5)
+    engine = DerivativesEngine(venue)
+    pid = engine.open_long("SOL-PERP", 1.0)
+    engine.update()
+    mark = engine.mark[pid]
+    engine.advance(0.5 / 3600)
+    engine.update()
+    assert engine.mark[pid] != mark
+    assert venue.funding_index[0] > 0.0
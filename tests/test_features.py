@@ -0,0 +1,42 @@
+"""
+test_features.py
+
+FeatureEngine.update_market_data: a fallback quote (placeholder price,
+not a market price) must not enter the indicators' state, so the next
+real tick sees the same features as if the fallback cycle never happened.
+
+Run from the repo root:
+    python -m pytest -q tests
+"""
+
+import pytest
+
+from core.scoring_engine.features import FEATURE_NAMES, FeatureEngine
+
+FALLBACK_QUOTE = {"sol_price": 999.99, "timestamp": 0.0, "fallback": True}
+
+def warmed_engine() -> FeatureEngine:
+    engine = FeatureEngine()
+    for i in range(40):
+        engine.update_market_data({"sol_price": 20.0 + 0.01 * (i % 3), "volume": 1000.0})
+    return engine
+
+def test_fallback_quote_does_not_touch_indicator_state():
+    clean, hit = warmed_engine(), warmed_engine()
+    hit.update_market_data(FALLBACK_QUOTE)
+
+    tick = {"sol_price": 20.0, "volume": 1000.0}
+    expected = clean.update_market_data(tick)
+    after = hit.update_market_data(tick)
+    for name in FEATURE_NAMES:
+        assert after[name] == pytest.approx(expected[name], rel=1e-12), name
+    assert after["ema_fast"] == pytest.approx(20.0, abs=0.05)
+    assert after["vwap"] == pytest.approx(20.0, abs=0.05)
+
+def test_fallback_quote_reports_the_last_features():
+    engine = warmed_engine()
+    last = engine.update_market_data({"sol_price": 20.01, "volume": 1000.0})
+    enriched = engine.update_market_data(FALLBACK_QUOTE)
+    assert enriched["fallback"] and enriched["sol_price"] == 999.99
+    assert enriched["ema_fast"] == pytest.approx(last["ema_fast"])
+    assert enriched["vwap"] == pytest.approx(last["vwap"])
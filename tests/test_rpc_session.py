@@ -0,0 +1,102 @@
+"""
+test_rpc_session.py
+
+Execution-path caching against the local fake JSON-RPC server
+(benchmarks/fake_rpc_server.py): one pooled RpcSession per network,
+balance + signature status batched into one HTTP round trip, and
+get_wallet / get_solana_client serving one object per keyfile / network.
+The wallet and client checks need solders / solana and are skipped
+without them.
+
+Run from the repo root:
+    python -m pytest -q tests
+"""
+
+import json
+
+import pytest
+
+from benchmarks.fake_rpc_server import start_fake_rpc_server
+from security.rpc_session import RpcError, RpcSession, close_rpc_sessions, get_rpc_session
+
+PUBKEY = "FakePubkey1111111111111111111111111111111111"
+
+@pytest.fixture
+def fake_rpc():
+    server, url, state = start_fake_rpc_server(confirm_after=1)
+    yield url, state
+    close_rpc_sessions()
+    server.shutdown()
+
+@pytest.fixture
+def wallet_cache():
+    secure_wallet = pytest.importorskip("security.secure_wallet")
+    pytest.importorskip("solders")
+    secure_wallet.clear_wallet_cache()
+    yield secure_wallet
+    secure_wallet.clear_wallet_cache()
+
+def test_one_session_per_network_or_url(fake_rpc):
+    url, _ = fake_rpc
+    assert get_rpc_session(url=url) is get_rpc_session(url=url)
+    assert get_rpc_session("devnet") is get_rpc_session("devnet")
+    assert get_rpc_session("devnet") is not get_rpc_session("mainnet-beta")
+
+def test_balance_and_status_in_one_round_trip(fake_rpc):
+    url, state = fake_rpc
+    rpc = get_rpc_session(url=url)
+    signature = rpc.request_airdrop(PUBKEY, 10**9)
+
+    before = state.requests
+    balance, statuses = rpc.balance_and_statuses(PUBKEY, [signature, "unknownsig"])
+    assert state.requests - before == 1
+    assert balance == 10**9
+    assert statuses[0]["confirmationStatus"] == "processed"     # confirm_after=1
+    assert statuses[1] is None
+
+    _, statuses = rpc.balance_and_statuses(PUBKEY, [signature])
+    assert statuses[0]["confirmationStatus"] == "confirmed"
+    assert state.requests - before == 2
+
+def test_batch_reports_a_failed_call_in_place(fake_rpc):
+    url, _ = fake_rpc
+    rpc = RpcSession(url)
+    try:
+        balance, missing = rpc.batch([("getBalance", [PUBKEY]), ("noSuchMethod", [])])
+        assert balance["value"] == 0
+        assert isinstance(missing, RpcError)
+        assert rpc.stats == {"requests": 1, "calls": 2, "errors": 1}
+    finally:
+        rpc.close()
+
+def test_wallet_is_loaded_once(wallet_cache, tmp_path):
+    from solders.keypair import Keypair
+
+    secret = bytes(Keypair())
+    keyfile = tmp_path / "id.json"
+    keyfile.write_text(json.dumps(list(secret)), encoding="utf-8")
+    wallet = wallet_cache.get_wallet(str(keyfile))
+    assert bytes(wallet) == secret
+    keyfile.unlink()    # served from memory from now on
+    assert wallet_cache.get_wallet(str(keyfile)) is wallet
+
+def test_missing_keyfile_pins_one_ephemeral_key(wallet_cache, tmp_path):
+    missing = str(tmp_path / "missing.json")
+    assert wallet_cache.get_wallet(missing) is wallet_cache.get_wallet(missing)
+
+def test_unreadable_keyfile_raises_and_is_retried(wallet_cache, tmp_path):
+    from solders.keypair import Keypair
+
+    keyfile = tmp_path / "flaky.json"
+    keyfile.write_text("[1, 2,", encoding="utf-8")     # caught mid-write
+    with pytest.raises(ValueError):
+        wallet_cache.get_wallet(str(keyfile))
+    secret = bytes(Keypair())
+    keyfile.write_text(json.dumps(list(secret)), encoding="utf-8")
+    assert bytes(wallet_cache.get_wallet(str(keyfile))) == secret
+
+def test_one_client_per_network(wallet_cache):
+    pytest.importorskip("solana")
+    devnet = wallet_cache.get_solana_client("devnet")
+    assert wallet_cache.get_solana_client("devnet") is devnet
+    assert wallet_cache.get_solana_client("mainnet-beta") is not devnet
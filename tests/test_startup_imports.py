@@ -0,0 +1,39 @@
+"""
+test_startup_imports.py
+
+Importing main (mock mode) must not load the Solana / HTTP stack: those
+modules are only imported by the code paths that need them. Each check
+runs in a fresh interpreter, since the test process itself may already
+have imported some of them.
+
+Run from the repo root:
+    python -m pytest -q tests
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks.bench_startup import FORBIDDEN_AT_STARTUP, REPO_ROOT
+
+def modules_after_import(target: str) -> set:
+    """Top-level module names loaded by `import target` in a fresh interpreter."""
+    proc = subprocess.run(
+        [sys.executable, "-c", f"import sys, {target}; print('\\n'.join(sys.modules))"],
+        cwd=REPO_ROOT, env=dict(os.environ, OBLIVION_MODE="mock"),
+        capture_output=True, text=True, check=True
+    )
+    return {line.split(".")[0] for line in proc.stdout.splitlines()}
+
+@pytest.mark.parametrize("target", ["main", "pipelines.backtest_engine"])
+def test_startup_does_not_import_forbidden_modules(target):
+    loaded = modules_after_import(target)
+    assert target.split(".")[0] in loaded
+    assert sorted(loaded & set(FORBIDDEN_AT_STARTUP)) == []
+
+def test_secure_wallet_import_does_not_load_the_solana_stack():
+    """Keypair / Client are imported for type checkers only (TYPE_CHECKING), never at runtime."""
+    loaded = modules_after_import("security.secure_wallet")
+    assert not loaded & {"solana", "solders"}